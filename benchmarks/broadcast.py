@@ -0,0 +1,94 @@
+"""
+Measures the time to send a scheduled announcement to every configured guild, comparing one
+guild at a time with the channel requested over HTTP, like the timelines job did, against the
+broadcast engine with the channels taken from the cache.
+
+Every request to discord answers after a fixed round trip.
+
+Run it with:
+    poetry run python -m benchmarks.broadcast --guilds 10 100 500 --latency-ms 50
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import Mock
+
+import discord
+
+from otter_welcome_buddy.common.utils.broadcast import BroadcastEngine
+from otter_welcome_buddy.common.utils.broadcast import BroadcastStatus
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+
+
+def _make_bot(guilds: int, latency: float) -> Mock:
+    async def _round_trip(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(latency)
+
+    channels: dict[int, Mock] = {}
+    for guild_id in range(guilds):
+        channel = Mock(spec=discord.TextChannel)
+        channel.send = Mock(side_effect=_round_trip)
+        channels[guild_id] = channel
+
+    async def _fetch_channel(channel_id: int) -> Mock:
+        await _round_trip()
+        return channels[channel_id]
+
+    guild = Mock()
+    guild.fetch_channel = Mock(side_effect=_fetch_channel)
+
+    async def _fetch_guild(_guild_id: int) -> Mock:
+        await _round_trip()
+        return guild
+
+    bot = Mock()
+    bot.get_channel = Mock(side_effect=channels.get)
+    bot.fetch_guild = Mock(side_effect=_fetch_guild)
+    return bot
+
+
+async def _send_sequentially(bot: Mock, targets: list[ChannelConfigView]) -> float:
+    start = time.perf_counter()
+    for target in targets:
+        guild = await bot.fetch_guild(target.guild_id)
+        channel = await guild.fetch_channel(target.channel_id)
+        await channel.send("Announcement")
+    return time.perf_counter() - start
+
+
+async def _broadcast(bot: Mock, targets: list[ChannelConfigView], concurrency: int) -> float:
+    report = await BroadcastEngine(max_concurrency=concurrency).broadcast(
+        bot,
+        targets,
+        content="Announcement",
+    )
+    assert report.count(BroadcastStatus.SENT) == len(targets)
+    return report.elapsed
+
+
+def _report(name: str, elapsed: float) -> None:
+    print(f"  {name:<16} elapsed={elapsed:8.2f}s", flush=True)
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guilds", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50])
+    args = parser.parse_args()
+
+    for guilds in args.guilds:
+        print(f"{guilds} guilds")
+        targets = [ChannelConfigView(guild_id=index, channel_id=index) for index in range(guilds)]
+        bot = _make_bot(guilds, args.latency_ms / 1000)
+        _report("sequential", asyncio.run(_send_sequentially(bot, targets)))
+        for concurrency in args.concurrency:
+            _report(
+                f"concurrency={concurrency}",
+                asyncio.run(_broadcast(bot, targets, concurrency)),
+            )
+
+
+if __name__ == "__main__":
+    main()
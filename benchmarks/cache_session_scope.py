@@ -0,0 +1,77 @@
+"""
+Measures the throughput of short cache sessions, comparing an engine and session factory
+created on every call against the shared ones kept per database path.
+
+Run it with:
+    poetry run python -m benchmarks.cache_session_scope --sessions 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from otter_welcome_buddy.common.utils.database import create_cache_session
+from otter_welcome_buddy.common.utils.database import dispose_cache_engines
+from otter_welcome_buddy.common.utils.database import get_cache_connection_string
+from otter_welcome_buddy.common.utils.database import get_cache_engine
+
+
+def _create_unshared_session(db_path: str) -> Session:
+    """How the sessions were created before the engine was shared"""
+    engine = create_engine(get_cache_connection_string(db_path=db_path))
+    return sessionmaker(bind=engine)()
+
+
+def _run(create_session: Callable[[str], Session], db_path: str, sessions: int) -> float:
+    start = time.perf_counter()
+    for index in range(sessions):
+        session = create_session(db_path)
+        try:
+            session.execute(text("INSERT INTO bench (value) VALUES (:value)"), {"value": index})
+            session.execute(text("SELECT value FROM bench WHERE id = :id"), {"id": index})
+            session.commit()
+        finally:
+            session.close()
+    return time.perf_counter() - start
+
+
+def _report(name: str, elapsed: float, sessions: int) -> None:
+    print(
+        f"{name:<8} total={elapsed * 1000:8.1f}ms  "
+        f"per session={elapsed / sessions * 1_000_000:7.1f}us  "
+        f"throughput={sessions / elapsed:8.0f} sessions/s",
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "benchmark.db")
+        with get_cache_engine(db_path=db_path).begin() as connection:
+            connection.execute(
+                text("CREATE TABLE bench (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)"),
+            )
+
+        try:
+            _report(
+                "unshared",
+                _run(_create_unshared_session, db_path, args.sessions),
+                args.sessions,
+            )
+            _report("shared", _run(create_cache_session, db_path, args.sessions), args.sessions)
+        finally:
+            dispose_cache_engines()
+
+
+if __name__ == "__main__":
+    main()
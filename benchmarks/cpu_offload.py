@@ -0,0 +1,117 @@
+"""
+Measures the event loop lag seen by the reactions of other guilds while a big interview match
+run pairs its participants and renders the pairs image, comparing the work done inline in the
+coroutine against the work sent to the CPU executor.
+
+Run it with:
+    poetry run python -m benchmarks.cpu_offload --participants 5000 --weeks 12
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Coroutine
+from typing import Any
+
+from benchmarks.pairing import _make_history
+from otter_welcome_buddy.common.utils.cpu_executor import CPU_EXECUTOR
+from otter_welcome_buddy.common.utils.image import create_match_images
+from otter_welcome_buddy.common.utils.pairing import pair_participants
+
+_PROBE_INTERVAL_S: float = 0.005
+_STAFF_RATIO: int = 5
+
+
+async def _probe_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """Sleep on a fixed interval and record how late the loop woke us up"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + _PROBE_INTERVAL_S
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+def _make_run(
+    participants: int,
+    weeks: int,
+    offload: bool,
+) -> Callable[[], Coroutine[Any, Any, None]]:
+    participant_ids: list[int] = list(range(participants))
+    staff_ids: set[int] = set(range(0, participants, _STAFF_RATIO))
+    past_pairs = _make_history(participants, weeks)
+
+    async def _run() -> None:
+        if offload:
+            pairs = await CPU_EXECUTOR.run_in_process(
+                pair_participants,
+                participant_ids,
+                staff_ids,
+                past_pairs,
+            )
+            name_pairs = [(f"Otter {first}", f"Otter {second}") for first, second in pairs]
+            await CPU_EXECUTOR.run_in_thread(create_match_images, name_pairs)
+        else:
+            pairs = pair_participants(participant_ids, staff_ids, past_pairs)
+            name_pairs = [(f"Otter {first}", f"Otter {second}") for first, second in pairs]
+            create_match_images(name_pairs)
+
+    return _run
+
+
+async def _measure(run: Callable[[], Awaitable[None]]) -> tuple[float, list[float]]:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_lag(samples, stop))
+    await asyncio.sleep(_PROBE_INTERVAL_S * 2)
+
+    start = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return elapsed, samples
+
+
+def _report(name: str, elapsed: float, samples: list[float]) -> None:
+    ordered = sorted(samples) or [0.0]
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<8} run={elapsed * 1000:8.1f}ms  "
+        f"lag mean={statistics.mean(ordered) * 1000:7.1f}ms  "
+        f"p95={p95 * 1000:7.1f}ms  max={ordered[-1] * 1000:7.1f}ms  "
+        f"probes={len(samples)}",
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--participants", type=int, default=5000)
+    parser.add_argument("--weeks", type=int, default=12)
+    args = parser.parse_args()
+
+    try:
+        # Start the workers before measuring, they are long lived in the bot
+        asyncio.run(_make_run(2, 0, offload=True)())
+        _report(
+            "inline",
+            *asyncio.run(_measure(_make_run(args.participants, args.weeks, offload=False))),
+        )
+        _report(
+            "executor",
+            *asyncio.run(_measure(_make_run(args.participants, args.weeks, offload=True))),
+        )
+        stats = CPU_EXECUTOR.stats()
+        print(
+            f"executor tasks={stats.completed}  failed={stats.failed}  "
+            f"timed out={stats.timed_out}  max wait={stats.max_wait * 1000:.1f}ms",
+        )
+    finally:
+        CPU_EXECUTOR.shutdown()
+
+
+if __name__ == "__main__":
+    main()
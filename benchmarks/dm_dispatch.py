@@ -0,0 +1,85 @@
+"""
+Measures the wall clock time of sending the interview match messages to every participant,
+comparing one direct message at a time against the dispatcher with bounded concurrency.
+
+The recipients answer after a fixed round trip, and a share of them block direct messages.
+
+Run it with:
+    poetry run python -m benchmarks.dm_dispatch --participants 100 500 --latency-ms 100
+"""
+import argparse
+import asyncio
+import time
+from unittest.mock import Mock
+
+import discord
+
+from otter_welcome_buddy.common.utils.dm_dispatcher import DmDeliveryReport
+from otter_welcome_buddy.common.utils.dm_dispatcher import DmDispatcher
+
+_BLOCKED_RATIO: int = 20
+
+
+def _make_recipients(participants: int, latency: float) -> list[Mock]:
+    forbidden_response = Mock(status=403, reason="Forbidden")
+
+    def _make_send(recipient_id: int):  # type: ignore[no-untyped-def]
+        async def _send(_content: str) -> None:
+            await asyncio.sleep(latency)
+            if recipient_id % _BLOCKED_RATIO == 0:
+                raise discord.Forbidden(forbidden_response, "Cannot send messages to this user")
+
+        return _send
+
+    recipients: list[Mock] = []
+    for recipient_id in range(participants):
+        recipient = Mock()
+        recipient.id = recipient_id
+        recipient.send = _make_send(recipient_id)
+        recipients.append(recipient)
+    return recipients
+
+
+async def _send_sequentially(recipients: list[Mock]) -> float:
+    start = time.perf_counter()
+    for recipient in recipients:
+        try:
+            await recipient.send("Hello")
+        except discord.HTTPException:
+            pass
+    return time.perf_counter() - start
+
+
+async def _send_dispatched(recipients: list[Mock], concurrency: int) -> DmDeliveryReport:
+    dm_dispatcher = DmDispatcher(max_concurrency=concurrency)
+    return await dm_dispatcher.dispatch((recipient, "Hello") for recipient in recipients)
+
+
+def _report(name: str, elapsed: float, report: DmDeliveryReport | None = None) -> None:
+    details: str = (
+        f"  sent={report.sent}  failed={report.failed}  blocked={len(report.blocked_ids)}"
+        if report is not None
+        else ""
+    )
+    print(f"  {name:<16} elapsed={elapsed:8.2f}s{details}", flush=True)
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--participants", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[5, 10])
+    args = parser.parse_args()
+
+    for participants in args.participants:
+        print(f"{participants} participants")
+        recipients = _make_recipients(participants, args.latency_ms / 1000)
+        _report("sequential", asyncio.run(_send_sequentially(recipients)))
+        for concurrency in args.concurrency:
+            report = asyncio.run(_send_dispatched(recipients, concurrency))
+            _report(f"concurrency={concurrency}", report.elapsed, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Measures the event loop lag while a burst of reactions is processed, comparing the blocking
+database handlers against the awaitable ones that run in the database executor.
+
+Run it with:
+    poetry run python -m benchmarks.event_loop_lag --reactions 200 --latency-ms 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from unittest.mock import patch
+
+from mongoengine import connect as mongo_connect
+from mongoengine import disconnect as mongo_disconnect
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.db_executor import shutdown_db_executor
+from otter_welcome_buddy.database.handlers.db_role_config_handler import AsyncDbRoleConfigHandler
+from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+
+_PROBE_INTERVAL_S: float = 0.005
+_GUILD_ID: int = 1
+
+
+async def _probe_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """Sleep on a fixed interval and record how late the loop woke us up"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + _PROBE_INTERVAL_S
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _sync_reaction() -> None:
+    DbRoleConfigHandler.get_base_role_config(guild_id=_GUILD_ID)
+    await asyncio.sleep(0)
+
+
+async def _async_reaction() -> None:
+    await AsyncDbRoleConfigHandler.get_base_role_config(guild_id=_GUILD_ID)
+    await asyncio.sleep(0)
+
+
+async def _run_burst(
+    reaction: Callable[[], Awaitable[None]],
+    reactions: int,
+) -> tuple[float, list[float]]:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_lag(samples, stop))
+    await asyncio.sleep(_PROBE_INTERVAL_S * 2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(reaction() for _ in range(reactions)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return elapsed, samples
+
+
+def _report(name: str, elapsed: float, samples: list[float]) -> None:
+    ordered = sorted(samples) or [0.0]
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<8} burst={elapsed * 1000:8.1f}ms  "
+        f"lag mean={statistics.mean(ordered) * 1000:7.1f}ms  "
+        f"p95={p95 * 1000:7.1f}ms  max={ordered[-1] * 1000:7.1f}ms  "
+        f"probes={len(samples)}",
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reactions", type=int, default=200)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=20.0,
+        help="Simulated round trip to Mongo",
+    )
+    args = parser.parse_args()
+
+    mongo_connect("benchmark", host="mongodb://localhost", mongo_client_class=MongoClient)
+    GuildModel(guild_id=_GUILD_ID).save()
+    BaseRoleConfigModel(guild=_GUILD_ID, message_ids=[1, 2, 3]).save()
+
+    original_get = DbRoleConfigHandler.get_base_role_config
+
+    def _slow_get(guild_id: int) -> BaseRoleConfigModel | None:
+        time.sleep(args.latency_ms / 1000)
+        return original_get(guild_id=guild_id)
+
+    try:
+        with patch.object(DbRoleConfigHandler, "get_base_role_config", side_effect=_slow_get):
+            _report("blocking", *asyncio.run(_run_burst(_sync_reaction, args.reactions)))
+            _report("executor", *asyncio.run(_run_burst(_async_reaction, args.reactions)))
+    finally:
+        shutdown_db_executor()
+        mongo_disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measures the memory retained by the members of a guild, comparing the default mode, where
+discord.py chunks and caches every member, against the low memory mode, where only the
+members the bot works with are kept in the size bounded LRU.
+
+The members are built from gateway payloads with the state of a client that never connects,
+and every member of the guild is touched once, the worst case for the LRU.
+
+Run it with:
+    poetry run python -m benchmarks.member_cache --members 10000 100000 --cache-size 1000
+"""
+import argparse
+import functools
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import cast
+from typing import TYPE_CHECKING
+
+import discord
+
+from otter_welcome_buddy.common.utils.member_cache import MemberCache
+from otter_welcome_buddy.settings import MEMBER_CACHE_SIZE
+from otter_welcome_buddy.startup.intents import get_registered_intents
+
+if TYPE_CHECKING:
+    # The payload types are only meant for type checking, importing them fails at runtime
+    from discord.types.guild import Guild as GuildPayload
+    from discord.types.member import MemberWithUser as MemberWithUserPayload
+
+_GUILD_ID: int = 1
+_FIRST_MEMBER_ID: int = 10**17
+
+
+def _make_member_payload(index: int) -> "MemberWithUserPayload":
+    return {
+        "user": {
+            "id": str(_FIRST_MEMBER_ID + index),
+            "username": f"otter{index}",
+            "discriminator": "0",
+            "global_name": f"Otter {index}",
+            "avatar": f"{index:032x}",
+        },
+        "roles": [str(_FIRST_MEMBER_ID - 1)],
+        "joined_at": "2024-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def _make_guild() -> discord.Guild:
+    client = discord.Client(intents=get_registered_intents())
+    # discord.py fills in the defaults of every field that the benchmark doesn't need
+    guild_payload = cast(
+        "GuildPayload",
+        {"id": str(_GUILD_ID), "name": "benchmark", "roles": [], "emojis": [], "stickers": []},
+    )
+    return discord.Guild(
+        data=guild_payload,
+        state=client._connection,  # pylint: disable=protected-access
+    )
+
+
+def _cache_every_member(guild: discord.Guild, members: int) -> Callable[[], int]:
+    """What the chunking at startup does with the default member cache flags"""
+    state = guild._state  # pylint: disable=protected-access
+    for index in range(members):
+        member = discord.Member(data=_make_member_payload(index), guild=guild, state=state)
+        guild._add_member(member)  # pylint: disable=protected-access
+    return lambda: len(guild.members)
+
+
+def _cache_used_members(guild: discord.Guild, members: int, cache_size: int) -> Callable[[], int]:
+    """What the low memory mode keeps after every member was resolved once"""
+    member_cache = MemberCache(max_size=cache_size)
+    state = guild._state  # pylint: disable=protected-access
+    for index in range(members):
+        member = discord.Member(data=_make_member_payload(index), guild=guild, state=state)
+        member_cache.put(member)
+    return lambda: member_cache.stats().size
+
+
+def _measure(build: Callable[[discord.Guild], Callable[[], int]]) -> tuple[int, int]:
+    """Return the memory retained by the cache once built, and the number of members held"""
+    guild = _make_guild()
+    gc.collect()
+    tracemalloc.start()
+    count = build(guild)
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, count()
+
+
+def _report(name: str, members: int, retained: int, count: int) -> None:
+    print(
+        f"  {name:<12} retained={retained / 2**20:8.2f}MiB  "
+        f"per 10k members={retained / 2**20 / members * 10_000:6.2f}MiB  cached={count}",
+        flush=True,
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cache-size", type=int, default=MEMBER_CACHE_SIZE)
+    args = parser.parse_args()
+
+    for members in args.members:
+        print(f"{members} members")
+        _report(
+            "full",
+            members,
+            *_measure(functools.partial(_cache_every_member, members=members)),
+        )
+        _report(
+            "low memory",
+            members,
+            *_measure(
+                functools.partial(
+                    _cache_used_members,
+                    members=members,
+                    cache_size=args.cache_size,
+                ),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
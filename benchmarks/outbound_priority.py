@@ -0,0 +1,100 @@
+"""
+Measures the latency of the replies to the commands while a daily challenge broadcast is being
+sent to every guild, comparing a single queue shared by every send, where the replies wait
+behind the broadcast, against the outbound scheduler with its interactive and bulk lanes.
+
+Both use the same scheduler, and so the same rate limits, the shared queue sends the replies
+through the bulk lane too. Every send answers after a fixed round trip.
+
+Run it with:
+    poetry run python -m benchmarks.outbound_priority --guilds 500 --replies 50 --latency-ms 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundScheduler
+
+_MAX_IN_FLIGHT: int = 10
+_REPLY_INTERVAL_S: float = 0.2
+_REPLY_CHANNELS: int = 100
+
+
+async def _send(
+    outbound_scheduler: OutboundScheduler,
+    lane: OutboundLane,
+    route: str,
+    latency: float,
+) -> float:
+    start = time.perf_counter()
+    async with outbound_scheduler.turn(lane, route):
+        await asyncio.sleep(latency)
+    return time.perf_counter() - start
+
+
+async def _send_reply(
+    outbound_scheduler: OutboundScheduler,
+    reply_lane: OutboundLane,
+    reply: int,
+    latency: float,
+) -> float:
+    await asyncio.sleep(_REPLY_INTERVAL_S * reply)
+    route: str = f"channel:reply{reply % _REPLY_CHANNELS}"
+    return await _send(outbound_scheduler, reply_lane, route, latency)
+
+
+async def _run(
+    reply_lane: OutboundLane,
+    guilds: int,
+    replies: int,
+    latency: float,
+) -> tuple[float, list[float]]:
+    outbound_scheduler = OutboundScheduler(max_in_flight=_MAX_IN_FLIGHT)
+    broadcast = asyncio.gather(
+        *(
+            _send(outbound_scheduler, OutboundLane.BULK, f"channel:{guild}", latency)
+            for guild in range(guilds)
+        ),
+    )
+    reply_latencies: list[float] = await asyncio.gather(
+        *(
+            _send_reply(outbound_scheduler, reply_lane, reply, latency)
+            for reply in range(1, replies + 1)
+        ),
+    )
+    broadcast_latencies: list[float] = await broadcast
+    return max(broadcast_latencies), reply_latencies
+
+
+def _report(name: str, broadcast_elapsed: float, reply_latencies: list[float]) -> None:
+    ordered = sorted(reply_latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"  {name:<10} broadcast={broadcast_elapsed:6.2f}s  "
+        f"reply mean={statistics.mean(ordered) * 1000:7.1f}ms  "
+        f"p95={p95 * 1000:7.1f}ms  max={ordered[-1] * 1000:7.1f}ms",
+        flush=True,
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guilds", type=int, default=500)
+    parser.add_argument("--replies", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    latency: float = args.latency_ms / 1000
+    print(f"{args.guilds} guilds, {args.replies} replies")
+    _report("shared", *asyncio.run(_run(OutboundLane.BULK, args.guilds, args.replies, latency)))
+    _report(
+        "lanes",
+        *asyncio.run(_run(OutboundLane.INTERACTIVE, args.guilds, args.replies, latency)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures the time needed to pair the participants of the interview match activity, and how
+many of the pairs are repeats or don't mix a collaborator with a member.
+
+The history holds a random pairing of every participant for each of the past weeks, so every
+participant has a repeat to avoid per week of history.
+
+Run it with:
+    poetry run python -m benchmarks.pairing --participants 100 1000 5000 --weeks 12
+"""
+import argparse
+import time
+
+import numpy as np
+
+from otter_welcome_buddy.common.utils.pairing import pair_participants
+
+_STAFF_RATIO: int = 5
+_SEED: int = 0
+
+
+def _make_history(participants: int, weeks: int) -> dict[tuple[int, int], int]:
+    rng = np.random.default_rng(_SEED)
+    past_pairs: dict[tuple[int, int], int] = {}
+    for weeks_ago in range(weeks, 0, -1):
+        for first, second in rng.permutation(participants).reshape(-1, 2).tolist():
+            past_pairs[(first, second)] = weeks_ago
+    return past_pairs
+
+
+def _report(participants: int, weeks: int) -> None:
+    participant_ids: list[int] = list(range(participants))
+    staff_ids: set[int] = set(range(0, participants, _STAFF_RATIO))
+    past_pairs = _make_history(participants, weeks)
+
+    start = time.perf_counter()
+    pairs = pair_participants(participant_ids, staff_ids, past_pairs, seed=_SEED)
+    elapsed = time.perf_counter() - start
+
+    repeats: int = sum(
+        1
+        for first, second in pairs
+        if (first, second) in past_pairs or (second, first) in past_pairs
+    )
+    same_class: int = sum(
+        1 for first, second in pairs if (first in staff_ids) == (second in staff_ids)
+    )
+    unavoidable_same_class: int = abs(participants - 2 * len(staff_ids)) // 2
+    print(
+        f"  {participants:>6} participants  time={elapsed * 1000:8.1f}ms  repeats={repeats:<5} "
+        f"same class={same_class} (at least {unavoidable_same_class})",
+        flush=True,
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--participants", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--weeks", type=int, default=12)
+    args = parser.parse_args()
+
+    print(f"{args.weeks} weeks of history")
+    for participants in args.participants:
+        _report(participants, args.weeks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Measures the time and memory needed to read all the configs of a collection, comparing the
+full mongoengine documents against the projected read-only views.
+
+Mongo is replaced by mongomock, so the absolute numbers include its overhead, which is the
+same for both paths.
+
+Run it with:
+    poetry run python -m benchmarks.read_models --rows 10000 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from mongoengine import connect as mongo_connect
+from mongoengine import disconnect as mongo_disconnect
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.handlers.db_interview_match_handler import (
+    DbInterviewMatchHandler,
+)
+from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+
+_WEEKDAY: int = 0
+
+
+def _populate(rows: int) -> None:
+    """Insert the raw documents directly, the setup is not part of the measurement"""
+    BaseRoleConfigModel.drop_collection()
+    InterviewMatchModel.drop_collection()
+    BaseRoleConfigModel._get_collection().insert_many(  # pylint: disable=protected-access
+        [{"_id": guild_id, "message_ids": [guild_id, guild_id + 1]} for guild_id in range(rows)],
+    )
+    InterviewMatchModel._get_collection().insert_many(  # pylint: disable=protected-access
+        [
+            {
+                "_id": guild_id,
+                "author_id": guild_id,
+                "channel_id": guild_id,
+                # All of them on the same day, so the day filter returns every row
+                "day_of_the_week": _WEEKDAY,
+                "emoji": "👍",
+                "message_id": guild_id,
+            }
+            for guild_id in range(rows)
+        ],
+    )
+
+
+def _measure(read: Callable[[], list[Any]]) -> tuple[float, int, int, int]:
+    """Return the time, the peak and retained memory of the read, and the number of results"""
+    # Timed without tracemalloc, it slows down every allocation
+    gc.collect()
+    start = time.perf_counter()
+    count = len(read())
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    results = read()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return elapsed, peak, retained, count
+
+
+def _report(name: str, elapsed: float, peak: int, retained: int, count: int) -> None:
+    print(
+        f"  {name:<30} time={elapsed * 1000:9.1f}ms  "
+        f"peak={peak / 2**20:7.1f}MiB  retained={retained / 2**20:7.1f}MiB  rows={count}",
+        flush=True,
+    )
+
+
+def main() -> None:
+    """Entry point of the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    mongo_connect("benchmark", host="mongodb://localhost", mongo_client_class=MongoClient)
+    # pylint: disable=protected-access
+    paths: list[tuple[str, Callable[[], list[Any]]]] = [
+        ("base role configs (documents)", DbRoleConfigHandler._fetch_all_base_role_configs),
+        ("base role configs (views)", DbRoleConfigHandler._fetch_base_role_config_views),
+        (
+            "interview matches (documents)",
+            lambda: [
+                interview_match_model
+                for interview_match_model in DbInterviewMatchHandler._fetch_all_interview_matches()
+                if interview_match_model.day_of_the_week == _WEEKDAY
+            ],
+        ),
+        (
+            "interview matches (views)",
+            lambda: DbInterviewMatchHandler._fetch_day_interview_match_views(_WEEKDAY),
+        ),
+    ]
+    try:
+        for rows in args.rows:
+            _populate(rows)
+            print(f"{rows} rows")
+            for name, read in paths:
+                _report(name, *_measure(read))
+    finally:
+        mongo_disconnect()
+
+
+if __name__ == "__main__":
+    main()
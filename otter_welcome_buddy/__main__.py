@@ -49,6 +49,8 @@ async def main() -> None:
     bot: Bot = Bot(
         command_prefix=when_mentioned_or(COMMAND_PREFIX),
         intents=intents.get_registered_intents(),
+        member_cache_flags=intents.get_member_cache_flags(),
+        chunk_guilds_at_startup=intents.should_chunk_guilds(),
     )
 
     async with bot:
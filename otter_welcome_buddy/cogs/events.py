@@ -4,12 +4,21 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Bot
 
+from otter_welcome_buddy.cogs.roles import Roles
 from otter_welcome_buddy.common.constants import OTTER_ROLE
-from otter_welcome_buddy.common.constants import WELCOME_MESSAGES
-from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
+from otter_welcome_buddy.common.constants import WELCOME_MESSAGES_FEATURE
+from otter_welcome_buddy.common.utils.member_cache import MEMBER_CACHE
+from otter_welcome_buddy.common.utils.reaction_router import REACTION_ROUTER
+from otter_welcome_buddy.common.utils.role_grant_queue import ROLE_GRANT_QUEUE
+from otter_welcome_buddy.common.utils.role_resolver import ROLE_RESOLVER
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.handlers.db_guild_handler import AsyncDbGuildHandler
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 from otter_welcome_buddy.formatters import debug
 from otter_welcome_buddy.startup.database import init_guild_table
+from otter_welcome_buddy.startup.database import mark_guild_synced
+from otter_welcome_buddy.startup.database import sync_config_replicas
+from otter_welcome_buddy.startup.database import upgrade_database_schema
 
 
 logger = logging.getLogger(__name__)
@@ -25,53 +34,95 @@ class BotEvents(commands.Cog):
     ) -> None:
         self.bot: Bot = bot
         self.debug_formatter: type[debug.Formatter] = debug_dependency
+        # The guilds without welcome messages give the role when reacting to any message
+        REACTION_ROUTER.register(
+            WELCOME_MESSAGES_FEATURE,
+            self._add_member_role,
+            handle_unconfigured_guilds=True,
+        )
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Ready Event"""
-        init_guild_table(self.bot)
+        await run_db_operation(upgrade_database_schema)
+        await run_db_operation(init_guild_table, self.bot)
+        # The startup used the local replica, reload what changed while the bot was offline
+        if await run_db_operation(sync_config_replicas):
+            Roles.init_welcome_messages()
 
         logger.info(self.debug_formatter.bot_is_ready())
+        # Give the role to the users that reacted while the bot was offline
+        Roles.start_welcome_reconciliation(self.bot)
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Event fired when a guild is either created or the bot join into"""
-        if DbGuildHandler.get_guild(guild_id=guild.id) is None:
-            guild_model: GuildModel = GuildModel(guild_id=guild.id)
-            DbGuildHandler.insert_guild(guild_model=guild_model)
+        guild_model: GuildModel = GuildModel(guild_id=guild.id)
+        await AsyncDbGuildHandler.insert_guild(guild_model=guild_model)
+        mark_guild_synced(guild.id, is_stored=True)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild) -> None:
         """Event fired when a guild is deleted or the bot is removed from it"""
-        DbGuildHandler.delete_guild(guild_id=guild.id)
+        await AsyncDbGuildHandler.delete_guild(guild_id=guild.id)
+        mark_guild_synced(guild.id, is_stored=False)
+        REACTION_ROUTER.forget_guild(guild.id)
+        ROLE_RESOLVER.invalidate(guild.id)
+        MEMBER_CACHE.forget_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        """Event fired when a member leaves a guild, even if it was not cached"""
+        MEMBER_CACHE.discard(payload.guild_id, payload.user.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        """Event fired when a role is created, the roles of the guild are indexed again"""
+        ROLE_RESOLVER.invalidate(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Event fired when a role is updated, the roles are indexed again if renamed or moved"""
+        if before.name != after.name or before.position != after.position:
+            ROLE_RESOLVER.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Event fired when a role is deleted, the roles of the guild are indexed again"""
+        ROLE_RESOLVER.invalidate(role.guild.id)
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
-        """Event fired when a user react to the welcome message, giving the entry role to him"""
+        """Event fired when a user react to a message, only the watched messages are handled"""
+        # Keep the member around, the event of the reaction removed doesn't include it
+        if payload.member is not None and REACTION_ROUTER.route(
+            payload.member.guild.id,
+            payload.message_id,
+        ):
+            MEMBER_CACHE.put(payload.member)
+        await REACTION_ROUTER.dispatch(payload)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent) -> None:
+        """Event fired when a user remove a reaction, only the watched messages are handled"""
+        await REACTION_ROUTER.dispatch(payload)
+
+    async def _add_member_role(self, payload: discord.RawReactionActionEvent) -> None:
+        """Give the entry role to the user that reacted to the welcome message"""
+        # The entry role is kept when the reaction is removed
+        if payload.event_type != "REACTION_ADD":
+            return
         # Check if the user and guild to add the role is valid
         if payload.member is None or payload.guild_id is None:
             logger.warning("Missing data to add role in %s", __name__)
             return
 
-        if (
-            WELCOME_MESSAGES.get(payload.guild_id) is None
-            or payload.message_id in WELCOME_MESSAGES[payload.guild_id]
-        ):
-            try:
-                guild = next(guild for guild in self.bot.guilds if guild.id == payload.guild_id)
-                member_role = discord.utils.get(guild.roles, name=OTTER_ROLE)
-                if member_role is None:
-                    logger.warning("Not role found in %s for guild %s", __name__, guild.name)
-                    return
-                await discord.Member.add_roles(payload.member, member_role)
-            except StopIteration:
-                logger.warning("Not guild found in %s", __name__)
-            except discord.Forbidden:
-                logger.error("Not permissions to add the role in %s", __name__)
-            except discord.HTTPException:
-                logger.error("Adding roles failed in %s", __name__)
-            except Exception:
-                logger.error("Exception in %s", __name__)
+        guild = payload.member.guild
+        member_role = ROLE_RESOLVER.get_role(guild, OTTER_ROLE)
+        if member_role is None:
+            logger.warning("Not role found in %s for guild %s", __name__, guild.name)
+            return
+        ROLE_GRANT_QUEUE.submit(payload.member, member_role)
 
 
 async def setup(bot: Bot) -> None:
@@ -1,6 +1,5 @@
 import logging
 
-import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from discord import TextChannel
 from discord.ext import commands
@@ -10,11 +9,12 @@ from discord.ext.commands import Context
 from otter_welcome_buddy.common.constants import CronExpressions
 from otter_welcome_buddy.common.constants import OTTER_ADMIN
 from otter_welcome_buddy.common.constants import OTTER_MODERATOR
+from otter_welcome_buddy.common.utils.broadcast import BROADCAST_ENGINE
+from otter_welcome_buddy.common.utils.broadcast import BroadcastReport
 from otter_welcome_buddy.common.utils.dates import DateUtils
 from otter_welcome_buddy.common.utils.discord_ import send_plain_message
-from otter_welcome_buddy.common.utils.types.common import DiscordChannelType
 from otter_welcome_buddy.database.handlers.db_announcements_config_handler import (
-    DbAnnouncementsConfigHandler,
+    AsyncDbAnnouncementsConfigHandler,
 )
 from otter_welcome_buddy.database.models.external.announcements_config_model import (
     AnnouncementsConfigModel,
@@ -81,7 +81,7 @@ class Timelines(commands.Cog):
         )
 
         try:
-            DbAnnouncementsConfigHandler.insert_announcements_config(
+            await AsyncDbAnnouncementsConfigHandler.insert_announcements_config(
                 announcements_config_model=announcements_config_model,
             )
             await send_plain_message(
@@ -106,12 +106,14 @@ class Timelines(commands.Cog):
             return
 
         try:
-            announcements_config = DbAnnouncementsConfigHandler.get_announcements_config(
+            announcements_config = await AsyncDbAnnouncementsConfigHandler.get_announcements_config(
                 guild_id=ctx.guild.id,
             )
             msg: str = ""
             if announcements_config is not None:
-                DbAnnouncementsConfigHandler.delete_announcements_config(guild_id=ctx.guild.id)
+                await AsyncDbAnnouncementsConfigHandler.delete_announcements_config(
+                    guild_id=ctx.guild.id,
+                )
                 msg = "**Announcement config** removed!"
             else:
                 msg = "No config set! 😱"
@@ -125,25 +127,15 @@ class Timelines(commands.Cog):
             DateUtils.get_current_month(),
         )
 
-    async def _send_message_on_channel(self) -> None:
+    async def _send_message_on_channel(self) -> BroadcastReport:
         """
         Check the database to see which guilds send the message to at the start of the month
         """
-        for entry in DbAnnouncementsConfigHandler.get_all_announcements_configs():
-            try:
-                guild: discord.Guild = await self.bot.fetch_guild(entry.guild.id)
-                channel: DiscordChannelType = await guild.fetch_channel(entry.channel_id)
-                if not isinstance(channel, discord.TextChannel):
-                    raise TypeError("Not valid channel to send the message in")
-                await channel.send(self._get_hiring_events())
-            except discord.NotFound:
-                logger.error("Fail getting channel %s in guild %s", entry.channel_id, guild.id)
-            except discord.Forbidden:
-                logger.exception("Not enough permissions to fetch the data in %s", __name__)
-            except discord.HTTPException:
-                logger.error("Not guild found in %s", __name__)
-            except Exception:
-                logger.exception("Error while sending the announcement in %s", __name__)
+        return await BROADCAST_ENGINE.broadcast(
+            self.bot,
+            await AsyncDbAnnouncementsConfigHandler.get_announcements_config_views(),
+            content=self._get_hiring_events(),
+        )
 
     @timelines.group(  # type: ignore
         brief="Commands related to trigger manually the timeline announcement",
@@ -1,7 +1,7 @@
 import asyncio
 import datetime
+import io
 import logging
-import random
 
 import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -10,14 +10,36 @@ from discord.ext import commands
 from discord.ext.commands import Bot
 from discord.ext.commands import Context
 
+from otter_welcome_buddy.common.constants import INTERVIEW_MATCH_FEATURE
 from otter_welcome_buddy.common.constants import OTTER_ADMIN
 from otter_welcome_buddy.common.constants import OTTER_MODERATOR
 from otter_welcome_buddy.common.constants import OTTER_ROLE
+from otter_welcome_buddy.common.constants import RoleClass
+from otter_welcome_buddy.common.utils.broadcast import BROADCAST_ENGINE
+from otter_welcome_buddy.common.utils.broadcast import BroadcastReport
+from otter_welcome_buddy.common.utils.broadcast import BroadcastStatus
+from otter_welcome_buddy.common.utils.cpu_executor import CPU_EXECUTOR
 from otter_welcome_buddy.common.utils.discord_ import send_plain_message
-from otter_welcome_buddy.common.utils.image import create_match_image
-from otter_welcome_buddy.common.utils.types.common import DiscordChannelType
-from otter_welcome_buddy.database.handlers.db_interview_match_handler import DbInterviewMatchHandler
+from otter_welcome_buddy.common.utils.dm_dispatcher import DM_DISPATCHER
+from otter_welcome_buddy.common.utils.dm_dispatcher import DmDeliveryReport
+from otter_welcome_buddy.common.utils.image import MATCH_IMAGE_FILENAME
+from otter_welcome_buddy.common.utils.image import MAX_IMAGES_PER_MESSAGE
+from otter_welcome_buddy.common.utils.image import render_match_images
+from otter_welcome_buddy.common.utils.member_cache import MEMBER_CACHE
+from otter_welcome_buddy.common.utils.outbound_scheduler import OUTBOUND_SCHEDULER
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.common.utils.pairing import pair_participants
+from otter_welcome_buddy.common.utils.reaction_router import REACTION_ROUTER
+from otter_welcome_buddy.common.utils.role_resolver import ROLE_RESOLVER
+from otter_welcome_buddy.database.handlers.db_interview_match_handler import (
+    AsyncDbInterviewMatchHandler,
+)
+from otter_welcome_buddy.database.handlers.db_interview_match_participant_handler import (
+    AsyncDbInterviewMatchParticipantHandler,
+)
+from otter_welcome_buddy.database.handlers.db_pair_history_handler import AsyncDbPairHistoryHandler
 from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
 from otter_welcome_buddy.settings import BOT_TIMEZONE
 
 
@@ -26,6 +48,10 @@ logger = logging.getLogger(__name__)
 
 _CRONJOB_HOUR: int = 12
 _DEFAULT_DAY_OF_THE_WEEK: int = 2
+# Weeks of pairs that are avoided when making the new ones
+_PAIR_HISTORY_WEEKS: int = 12
+# A discord message is limited to 2000 characters, the mentions past it are left out
+_MAX_MESSAGE_LENGTH: int = 2000
 
 
 class InterviewMatch(commands.Cog):
@@ -61,6 +87,15 @@ class InterviewMatch(commands.Cog):
         "743138942035034164/859236992403374110"
     )
 
+    _DELIVERY_SUMMARY_MESSAGE: str = (
+        "The pairs of the week of **{guild_name}** were sent.\n"
+        "Delivered: {sent}, failed: {failed}, with direct messages closed: {blocked}\n"
+        "Took {elapsed:.1f}s, {average_latency:.2f}s per message on average "
+        "and {max_latency:.2f}s the slowest one"
+    )
+
+    _BLOCKED_MEMBERS_MESSAGE: str = "\nThese members don't accept direct messages: {mentions}"
+
     def __init__(self, bot: Bot) -> None:
         """
         Interview Match command constructor
@@ -68,6 +103,13 @@ class InterviewMatch(commands.Cog):
         self.bot: Bot = bot
         self.scheduler: AsyncIOScheduler = AsyncIOScheduler()
         self.emoji: str = "👍"
+        # Emoji of the activity by weekly message, the reactions on them are recorded as they
+        # happen so the check doesn't have to page through them
+        self._weekly_emojis: dict[int, str] = {}
+        # The database operations run concurrently, so the writes of the participants of a
+        # weekly message are applied one at a time in the order that the events arrived
+        self._participant_locks: dict[int, asyncio.Lock] = {}
+        REACTION_ROUTER.register(INTERVIEW_MATCH_FEATURE, self._track_participant)
 
         self.scheduler.add_job(
             self._send_weekly_message,
@@ -81,6 +123,109 @@ class InterviewMatch(commands.Cog):
         )
         self.scheduler.start()
 
+    async def cog_load(self) -> None:
+        """Watch the weekly messages of every guild with the activity"""
+        interview_match_views = await AsyncDbInterviewMatchHandler.get_interview_match_views()
+        self._weekly_emojis = {
+            entry.message_id: entry.emoji
+            for entry in interview_match_views
+            if entry.message_id is not None and entry.emoji is not None
+        }
+        REACTION_ROUTER.reset(
+            INTERVIEW_MATCH_FEATURE,
+            {
+                entry.guild_id: [entry.message_id]
+                for entry in interview_match_views
+                if entry.message_id in self._weekly_emojis
+            },
+        )
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """The reactions added or removed while the bot was offline are not recorded"""
+        await AsyncDbInterviewMatchParticipantHandler.mark_tracking_incomplete()
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear(self, payload: discord.RawReactionClearEvent) -> None:
+        """Event fired when every reaction of a message is removed"""
+        if payload.message_id in self._weekly_emojis and payload.guild_id is not None:
+            async with self._get_participant_lock(payload.message_id):
+                await AsyncDbInterviewMatchParticipantHandler.replace_participants(
+                    guild_id=payload.guild_id,
+                    message_id=payload.message_id,
+                    user_ids=[],
+                )
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear_emoji(
+        self,
+        payload: discord.RawReactionClearEmojiEvent,
+    ) -> None:
+        """Event fired when every reaction with an emoji is removed from a message"""
+        if (
+            str(payload.emoji) == self._weekly_emojis.get(payload.message_id)
+            and payload.guild_id is not None
+        ):
+            async with self._get_participant_lock(payload.message_id):
+                await AsyncDbInterviewMatchParticipantHandler.replace_participants(
+                    guild_id=payload.guild_id,
+                    message_id=payload.message_id,
+                    user_ids=[],
+                )
+
+    async def _track_participant(self, payload: discord.RawReactionActionEvent) -> None:
+        """Record the reaction to the weekly message, or forget it when it is removed"""
+        if payload.guild_id is None:
+            return
+        if str(payload.emoji) != self._weekly_emojis.get(payload.message_id):
+            return
+        # Taken before any await, so a reaction removed right after being added is not undone
+        async with self._get_participant_lock(payload.message_id):
+            if payload.event_type == "REACTION_REMOVE":
+                await AsyncDbInterviewMatchParticipantHandler.remove_participant(
+                    message_id=payload.message_id,
+                    user_id=payload.user_id,
+                )
+            elif payload.member is not None and not payload.member.bot:
+                await AsyncDbInterviewMatchParticipantHandler.add_participant(
+                    guild_id=payload.guild_id,
+                    message_id=payload.message_id,
+                    user_id=payload.user_id,
+                )
+
+    def _get_participant_lock(self, message_id: int) -> asyncio.Lock:
+        """Return the lock that keeps in order the writes of the participants of a message"""
+        lock: asyncio.Lock | None = self._participant_locks.get(message_id)
+        if lock is None:
+            lock = self._participant_locks[message_id] = asyncio.Lock()
+        return lock
+
+    async def _start_tracking(self, guild_id: int, message_id: int, emoji: str) -> None:
+        """Record the reactions to a new weekly message from the moment it is sent"""
+        # Watched before the first await, so no reaction is missed
+        self._watch_weekly_message(guild_id, message_id, emoji)
+        try:
+            await AsyncDbInterviewMatchParticipantHandler.start_tracking(
+                guild_id=guild_id,
+                message_id=message_id,
+            )
+        except Exception:
+            logger.exception("Fail tracking the reactions of the weekly message")
+
+    def _watch_weekly_message(self, guild_id: int, message_id: int, emoji: str) -> None:
+        """Replace the weekly message of a guild whose reactions are recorded"""
+        self._unwatch_weekly_message(guild_id)
+        self._weekly_emojis[message_id] = emoji
+        REACTION_ROUTER.watch(INTERVIEW_MATCH_FEATURE, guild_id, [message_id])
+
+    def _unwatch_weekly_message(self, guild_id: int) -> None:
+        """Stop recording the reactions to the weekly message of a guild"""
+        watched_messages = REACTION_ROUTER.get_watched_messages(INTERVIEW_MATCH_FEATURE)
+        for message_id in watched_messages.get(guild_id, ()):
+            self._weekly_emojis.pop(message_id, None)
+            self._participant_locks.pop(message_id, None)
+        REACTION_ROUTER.watch(INTERVIEW_MATCH_FEATURE, guild_id, ())
+
     @commands.group(
         brief="Commands related to Interview Match activity!",
         invoke_without_command=True,
@@ -91,46 +236,51 @@ class InterviewMatch(commands.Cog):
         """
         await ctx.send_help(ctx.command)
 
-    async def _send_weekly_message(self) -> None:
+    async def _send_weekly_message(self) -> BroadcastReport:
         """
         Check the database to see if any guild is candidate to receive the weekly message,
         if any, send it and store the message id on the database
         """
         weekday: int = datetime.datetime.today().weekday()
-        for entry in DbInterviewMatchHandler.get_day_interview_matches(
+        entries: list[InterviewMatchView] = []
+        for entry in await AsyncDbInterviewMatchHandler.get_day_interview_match_views(
             weekday=weekday,
         ):
-            guild: discord.Guild | None = None
-            role: discord.Role | None = None
-            try:
-                guild = next(guild for guild in self.bot.guilds if guild.id == entry.guild.id)
-                role = discord.utils.get(guild.roles, name=OTTER_ROLE)
-                if role is None:
-                    logger.warning("Not role found in %s for guild %s", __name__, guild.name)
-            except StopIteration:
-                logger.error("Not guild found in %s", __name__)
-            finally:
-                interview_buddy_message: str = self._ACTIVITY_MESSAGE.format(
-                    role_to_mention=role.mention if role is not None else "",
-                    emoji=entry.emoji,
-                )
-                channel: DiscordChannelType | None = self.bot.get_channel(entry.channel_id)
-                if channel is None:
-                    logger.error("Fail getting the channel to send the weekly message")
-                if not isinstance(channel, discord.TextChannel):
-                    raise TypeError("Not valid channel to send the message in")
-
-                message: discord.Message = await channel.send(
-                    interview_buddy_message,
-                )
-                await message.add_reaction(entry.emoji)
-                entry.message_id = message.id
-                try:
-                    DbInterviewMatchHandler.insert_interview_match(
-                        interview_match_model=entry,
-                    )
-                except Exception:
-                    logger.exception("Fail updating the entry on the database")
+            if entry.emoji is None:
+                logger.error("Missing emoji for the activity of guild %s", entry.guild_id)
+                continue
+            entries.append(entry)
+        return await BROADCAST_ENGINE.run(self.bot, entries, self._send_guild_weekly_message)
+
+    async def _send_guild_weekly_message(
+        self,
+        channel: discord.TextChannel,
+        entry: InterviewMatchView,
+    ) -> None:
+        """Send the weekly message of a guild and store its id on the database"""
+        emoji: str = entry.emoji or self.emoji
+        role: discord.Role | None = ROLE_RESOLVER.get_role(channel.guild, OTTER_ROLE)
+        if role is None:
+            logger.warning("Not role found in %s for guild %s", __name__, channel.guild.name)
+        interview_buddy_message: str = self._ACTIVITY_MESSAGE.format(
+            role_to_mention=role.mention if role is not None else "",
+            emoji=emoji,
+        )
+
+        message: discord.Message = await OUTBOUND_SCHEDULER.send(
+            OutboundLane.BULK,
+            channel,
+            interview_buddy_message,
+        )
+        await self._start_tracking(entry.guild_id, message.id, emoji)
+        await message.add_reaction(emoji)
+        try:
+            await AsyncDbInterviewMatchHandler.update_interview_match_message(
+                guild_id=entry.guild_id,
+                message_id=message.id,
+            )
+        except Exception:
+            logger.exception("Fail updating the entry on the database")
 
     async def _process_weekly_message(
         self,
@@ -142,21 +292,32 @@ class InterviewMatch(commands.Cog):
         Process the candidates from the weekly message to make the pairs and send the
         messages about the activity to them
         """
+        past_pairs: dict[tuple[int, int], int] = {}
+        try:
+            past_pairs = await AsyncDbPairHistoryHandler.get_recent_pairs(
+                guild_id=channel.guild.id,
+                weeks=_PAIR_HISTORY_WEEKS,
+            )
+        except Exception:
+            logger.exception("Fail reading the pairs of the last weeks")
+
         try:
-            week_otter_pairs: list[tuple[discord.Member, discord.Member]] = self._make_pairs(
+            week_otter_pairs: list[tuple[discord.Member, discord.Member]] = await self._make_pairs(
                 week_otter_pool,
                 placeholder,
+                past_pairs,
             )
-            _img, img_path = create_match_image(week_otter_pairs)
-            for otter_one, otter_two in week_otter_pairs:
-                await self._send_pair_message(
-                    otter_one=otter_one,
-                    otter_two=otter_two,
-                )
-                await self._send_pair_message(
-                    otter_one=otter_two,
-                    otter_two=otter_one,
+            await self._store_pairs(channel.guild.id, week_otter_pairs)
+            match_images: list[io.BytesIO] = await render_match_images(week_otter_pairs)
+            delivery_report: DmDeliveryReport = await DM_DISPATCHER.dispatch(
+                message
+                for otter_one, otter_two in week_otter_pairs
+                for message in (
+                    (otter_one, self._make_pair_message(recipient=otter_one, partner=otter_two)),
+                    (otter_two, self._make_pair_message(recipient=otter_two, partner=otter_one)),
                 )
+            )
+            await self._send_delivery_summary(channel.guild, placeholder, delivery_report)
 
             week_otter_pool.sort(
                 key=lambda user: user.display_name,
@@ -166,7 +327,19 @@ class InterviewMatch(commands.Cog):
             )
             message: str = self._NOTIFICATION_MESSAGE
             message += f"\n{users_mentions}"
-            await channel.send(message, file=discord.File(img_path))
+            files: list[discord.File] = [
+                discord.File(image_bytes, filename=MATCH_IMAGE_FILENAME.format(page=page))
+                for page, image_bytes in enumerate(match_images, start=1)
+            ]
+            await OUTBOUND_SCHEDULER.send(
+                OutboundLane.BULK,
+                channel,
+                message,
+                files=files[:MAX_IMAGES_PER_MESSAGE],
+            )
+            for start in range(MAX_IMAGES_PER_MESSAGE, len(files), MAX_IMAGES_PER_MESSAGE):
+                end: int = start + MAX_IMAGES_PER_MESSAGE
+                await OUTBOUND_SCHEDULER.send(OutboundLane.BULK, channel, files=files[start:end])
 
         except discord.Forbidden:
             logger.exception("Not enough permissions to send the weekly message")
@@ -174,8 +347,25 @@ class InterviewMatch(commands.Cog):
             logger.exception("Sending the message failed")
         except ValueError:
             logger.exception("The weekly pairs image doesn't have the appropriate size")
+        except asyncio.TimeoutError:
+            logger.exception("Pairing or rendering the weekly pairs took too long")
+
+    async def _store_pairs(
+        self,
+        guild_id: int,
+        week_otter_pairs: list[tuple[discord.Member, discord.Member]],
+    ) -> None:
+        """Store the pairs of the week, so they are avoided the next weeks"""
+        try:
+            await AsyncDbPairHistoryHandler.insert_pairs(
+                guild_id=guild_id,
+                week=datetime.datetime.utcnow(),
+                pairs=[(otter_one.id, otter_two.id) for otter_one, otter_two in week_otter_pairs],
+            )
+        except Exception:
+            logger.exception("Fail storing the pairs of the week")
 
-    async def _check_weekly_message(self, weekday: int | None = None) -> None:
+    async def _check_weekly_message(self, weekday: int | None = None) -> BroadcastReport | None:
         """
         Check the database to see if any guild is candidate to check the weekly message, if any,
         get the weekly message, get the reactions and process the candidates to make the pairs
@@ -183,62 +373,70 @@ class InterviewMatch(commands.Cog):
         weekday = (datetime.datetime.today().weekday() - 1 + 7) % 7 if weekday is None else weekday
 
         try:
-            for entry in DbInterviewMatchHandler.get_day_interview_matches(
+            entries = await AsyncDbInterviewMatchHandler.get_day_interview_match_views(
                 weekday=weekday,
-            ):
-                fetched_values: tuple | None = await self._get_weekly_message(
-                    channel_id=entry.channel_id,
-                    message_id=entry.message_id,
-                    author_id=entry.author_id,
-                )
-                if fetched_values is None:
-                    return
-                channel: discord.TextChannel
-                cache_message: discord.Message
-                placeholder: discord.Member
-                channel, cache_message, placeholder = fetched_values
-
-                week_otter_pool: list[discord.Member] = await self._get_weekly_pool(
-                    message=cache_message,
-                    emoji=entry.emoji,
-                )
-                if not week_otter_pool:
-                    await channel.send("No one wanted to practice 😟")
-                    logger.info("Empty pool for Interview Match")
-                    continue
-
-                await self._process_weekly_message(
-                    channel=channel,
-                    week_otter_pool=week_otter_pool,
-                    placeholder=placeholder,
-                )
-
+            )
         except Exception as ex:
             logger.exception("Exception %s in %s", ex, __name__)
+            return None
+        return await BROADCAST_ENGINE.run(self.bot, entries, self._check_guild_weekly_message)
+
+    async def _check_guild_weekly_message(
+        self,
+        channel: discord.TextChannel,
+        entry: InterviewMatchView,
+    ) -> BroadcastStatus | None:
+        """Get the reactions to the weekly message of a guild and make the pairs"""
+        if entry.emoji is None or entry.message_id is None:
+            logger.warning("No weekly message to check for guild %s", entry.guild_id)
+            return BroadcastStatus.SKIPPED
+        fetched_values: tuple[
+            discord.Message,
+            discord.Member,
+        ] | None = await self._get_weekly_message(
+            channel=channel,
+            message_id=entry.message_id,
+            author_id=entry.author_id,
+        )
+        if fetched_values is None:
+            return BroadcastStatus.SKIPPED
+        cache_message, placeholder = fetched_values
+
+        week_otter_pool: list[discord.Member] = await self._get_weekly_pool(
+            message=cache_message,
+            emoji=entry.emoji,
+        )
+        if not week_otter_pool:
+            await OUTBOUND_SCHEDULER.send(OutboundLane.BULK, channel, "No one wanted to practice 😟")
+            logger.info("Empty pool for Interview Match")
+            return None
+
+        await self._process_weekly_message(
+            channel=channel,
+            week_otter_pool=week_otter_pool,
+            placeholder=placeholder,
+        )
+        return None
 
     async def _get_weekly_message(
         self,
-        channel_id: int,
+        channel: discord.TextChannel,
         message_id: int,
         author_id: int,
-    ) -> tuple[discord.TextChannel, discord.Message, discord.Member] | None:
+    ) -> tuple[discord.Message, discord.Member] | None:
         try:
-            channel: DiscordChannelType | None = self.bot.get_channel(channel_id)
-            if channel is None:
-                logger.error("No channel to check the weekly message")
-                return None
-            if not isinstance(channel, discord.TextChannel):
-                logger.warning("Not valid channel to send the message in")
-                return None
             cache_message = await channel.fetch_message(message_id)
 
-            placeholder: discord.Member | None = channel.guild.get_member(author_id)
+            # The placeholder is fetched when the members of the guild are not cached
+            placeholder: discord.Member | None = await MEMBER_CACHE.get_member(
+                channel.guild,
+                author_id,
+            )
             if placeholder is None:
-                # TODO: add a fallback when no placeholder
                 logger.error("No placeholder found for weekly check")
                 return None
 
-            return channel, cache_message, placeholder
+            return cache_message, placeholder
 
         except discord.NotFound:
             logger.exception("No message found to be checked")
@@ -254,92 +452,143 @@ class InterviewMatch(commands.Cog):
         message: discord.Message,
         emoji: str,
     ) -> list[discord.Member]:
-        week_otter_pool_unique: set[discord.Member] = set()
+        if message.guild is None:
+            return []
+        participant_ids: list[int] | None = None
+        try:
+            participant_ids = await AsyncDbInterviewMatchParticipantHandler.get_participant_ids(
+                message_id=message.id,
+            )
+        except Exception:
+            logger.exception("Fail reading the participants of the weekly message")
+
+        users: list[discord.abc.Snowflake]
+        if participant_ids is not None:
+            users = [discord.Object(id=user_id) for user_id in participant_ids]
+        else:
+            # Some reactions may not be recorded, read them all from discord
+            users = await self._reconcile_weekly_reactions(message, message.guild, emoji)
+        if not users:
+            return []
+
+        # The users that are not found as members no longer belong to the guild, so we don't
+        # want to include them
+        week_otter_pool: list[discord.Member] = await MEMBER_CACHE.resolve_members(
+            message.guild,
+            users,
+        )
+
+        return week_otter_pool
+
+    async def _reconcile_weekly_reactions(
+        self,
+        message: discord.Message,
+        guild: discord.Guild,
+        emoji: str,
+    ) -> list[discord.abc.Snowflake]:
+        """Page through the reactions of the weekly message, storing them as its participants"""
+        users: list[discord.abc.Snowflake] = []
         for reaction in message.reactions:
             if reaction.emoji != emoji:
                 continue
             async for user in reaction.users():
-                # If the user is not an instance of Member, it almost sure means that
-                # no longer belongs to the guild so we don't want to include it
-                if isinstance(user, discord.Member) and not user.bot:
-                    week_otter_pool_unique.add(user)
+                if not user.bot:
+                    users.append(user)
+        try:
+            await AsyncDbInterviewMatchParticipantHandler.replace_participants(
+                guild_id=guild.id,
+                message_id=message.id,
+                user_ids=[user.id for user in users],
+            )
+        except Exception:
+            logger.exception("Fail storing the participants of the weekly message")
+        return users
 
-        week_otter_pool: list[discord.Member] = list(
-            week_otter_pool_unique,
+    def _make_pair_message(self, recipient: discord.Member, partner: discord.Member) -> str:
+        """
+        Make the message about the activity to a member of a pair, letting them know who is
+        their matched pair and how to do the activity
+        """
+        return self._PRIVATE_MESSAGE.format(
+            username_one=f"{recipient.name}#{recipient.discriminator}",
+            username_two=f"{partner.name}#{partner.discriminator}",
         )
 
-        return week_otter_pool
-
-    async def _send_pair_message(
+    async def _send_delivery_summary(
         self,
-        otter_one: discord.Member,
-        otter_two: discord.Member,
+        guild: discord.Guild,
+        moderator: discord.Member,
+        delivery_report: DmDeliveryReport,
     ) -> None:
         """
-        Receive a pair for the activity, send the message about the activity to them letting
-        them know who is their matched pair and how to do the activity
+        Send the moderator that started the activity how the messages to the pairs were
+        delivered, mentioning the members that don't accept direct messages
         """
-        username_one: str = f"{otter_one.name}#{otter_one.discriminator}"
-        username_two: str = f"{otter_two.name}#{otter_two.discriminator}"
-        message: str = self._PRIVATE_MESSAGE.format(
-            username_one=username_one,
-            username_two=username_two,
+        logger.info(
+            "Interview match messages of %s: %s sent, %s failed, %s blocked in %.2fs",
+            guild.id,
+            delivery_report.sent,
+            delivery_report.failed,
+            len(delivery_report.blocked_ids),
+            delivery_report.elapsed,
+        )
+        summary: str = self._DELIVERY_SUMMARY_MESSAGE.format(
+            guild_name=guild.name,
+            sent=delivery_report.sent,
+            failed=delivery_report.failed,
+            blocked=len(delivery_report.blocked_ids),
+            elapsed=delivery_report.elapsed,
+            average_latency=delivery_report.average_latency,
+            max_latency=delivery_report.max_latency,
         )
+        if delivery_report.blocked_ids:
+            summary += self._BLOCKED_MEMBERS_MESSAGE.format(
+                mentions=", ".join(f"<@{member_id}>" for member_id in delivery_report.blocked_ids),
+            )
         try:
-            await otter_one.send(message)
+            await OUTBOUND_SCHEDULER.send(
+                OutboundLane.BULK,
+                moderator,
+                summary[:_MAX_MESSAGE_LENGTH],
+            )
         except discord.Forbidden:
-            logger.exception("Not enough permissions to send the message to %s", username_one)
+            logger.exception("Not enough permissions to send the delivery summary")
         except discord.HTTPException:
-            logger.exception("Sending the message to %s failed", username_one)
+            logger.exception("Sending the delivery summary failed")
 
-    def _make_pairs(
+    async def _make_pairs(
         self,
         week_otter_pool: list[discord.Member],
         placeholder: discord.Member,
+        past_pairs: dict[tuple[int, int], int] | None = None,
+        seed: int | None = None,
     ) -> list[tuple[discord.Member, discord.Member]]:
         """
         Receive a list of users, if it's odd, add the wildcard user (usually the user who started
-        the activity) and do the pairs shuffling the list and picking the users in consecutive order
+        the activity) and pair them avoiding the pairs of the last weeks, and preferring to pair
+        a collaborator with a member
         """
-        week_otter_pairs: list[tuple[discord.Member, discord.Member]] = []
-        week_otter_collaborator: list[discord.Member] = []
-        week_otter_member: list[discord.Member] = []
         if len(week_otter_pool) % 2 == 1:
-            week_otter_pool.append(placeholder)
-
-        for otter in week_otter_pool:
-            otter_roles: list[str] = [str(otter_role) for otter_role in otter.roles]
-            if OTTER_MODERATOR in otter_roles or OTTER_ADMIN in otter_roles:
-                week_otter_collaborator.append(otter)
+            if placeholder in week_otter_pool:
+                # The wildcard user reacted, so it sits out instead
+                week_otter_pool.remove(placeholder)
             else:
-                week_otter_member.append(otter)
-
-        random.shuffle(week_otter_collaborator)
-        random.shuffle(week_otter_member)
-
-        # Pair interviewees with collaborators
-        collaborator_index = 0
-        member_index = 0
-        while collaborator_index < len(week_otter_collaborator) and member_index < len(
-            week_otter_member,
-        ):
-            week_otter_pairs.append(
-                (week_otter_collaborator[collaborator_index], week_otter_member[member_index]),
-            )
-            collaborator_index += 1
-            member_index += 1
-
-        # Pair additional collaborators
-        for idx in range(collaborator_index, len(week_otter_collaborator), 2):
-            week_otter_pairs.append(
-                (week_otter_collaborator[idx], week_otter_collaborator[idx + 1]),
-            )
-
-        # Pair additional members
-        for idx in range(member_index, len(week_otter_member), 2):
-            week_otter_pairs.append((week_otter_member[idx], week_otter_member[idx + 1]))
-
-        return week_otter_pairs
+                week_otter_pool.append(placeholder)
+
+        otters: dict[int, discord.Member] = {otter.id: otter for otter in week_otter_pool}
+        # Pairing a big pool is pure Python work, so it runs in a process of the CPU executor
+        week_otter_pairs: list[tuple[int, int]] = await CPU_EXECUTOR.run_in_process(
+            pair_participants,
+            list(otters),
+            {
+                otter.id
+                for otter in week_otter_pool
+                if ROLE_RESOLVER.has_role_class(otter, RoleClass.STAFF)
+            },
+            past_pairs,
+            seed,
+        )
+        return [(otters[otter_one], otters[otter_two]) for otter_one, otter_two in week_otter_pairs]
 
     @interview_match.command(  # type: ignore
         brief="Start interview match activity",
@@ -395,7 +644,7 @@ class InterviewMatch(commands.Cog):
         )
 
         try:
-            DbInterviewMatchHandler.insert_interview_match(
+            await AsyncDbInterviewMatchHandler.insert_interview_match(
                 interview_match_model=interview_match_model,
             )
             await send_plain_message(
@@ -415,12 +664,14 @@ class InterviewMatch(commands.Cog):
             if ctx.guild is None:
                 logger.warning("No guild on context")
                 return
-            interview_match_model = DbInterviewMatchHandler.get_interview_match(
+            interview_match_model = await AsyncDbInterviewMatchHandler.get_interview_match(
                 guild_id=ctx.guild.id,
             )
             msg: str = ""
             if interview_match_model is not None:
-                DbInterviewMatchHandler.delete_interview_match(guild_id=ctx.guild.id)
+                await AsyncDbInterviewMatchHandler.delete_interview_match(guild_id=ctx.guild.id)
+                self._unwatch_weekly_message(ctx.guild.id)
+                await AsyncDbInterviewMatchParticipantHandler.stop_tracking(guild_id=ctx.guild.id)
                 msg = "**Interview Match** activity stopped!"
             else:
                 msg = "No activity was running! 😱"
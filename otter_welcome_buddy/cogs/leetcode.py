@@ -4,7 +4,6 @@ import logging
 from discord import Color
 from discord import Embed
 from discord import TextChannel
-from discord.abc import Messageable
 from discord.ext import commands
 from discord.ext import tasks
 from discord.ext.commands import Bot
@@ -12,9 +11,12 @@ from discord.ext.commands import Context
 
 from otter_welcome_buddy.common.constants import OTTER_ADMIN
 from otter_welcome_buddy.common.constants import OTTER_MODERATOR
+from otter_welcome_buddy.common.utils.broadcast import BROADCAST_ENGINE
+from otter_welcome_buddy.common.utils.broadcast import BroadcastReport
 from otter_welcome_buddy.common.utils.discord_ import send_plain_message
-from otter_welcome_buddy.common.utils.types.common import DiscordChannelType
-from otter_welcome_buddy.database.handlers.db_leetcode_config_handler import DbLeetcodeConfigHandler
+from otter_welcome_buddy.database.handlers.db_leetcode_config_handler import (
+    AsyncDbLeetcodeConfigHandler,
+)
 from otter_welcome_buddy.database.models.external.leetcode_config_model import LeetcodeConfigModel
 from otter_welcome_buddy.gql_service.handlers.gql_leetcode_handler import GqlLeetcodeHandler
 from otter_welcome_buddy.gql_service.models.gql_leetcode_model import LeetcodeQuestionModel
@@ -105,7 +107,7 @@ class Leetcode(commands.Cog):
         embed.set_footer(text=f"Date: {daily_challenge.date}")
         return embed
 
-    async def _process_daily_challenge(self) -> None:
+    async def _process_daily_challenge(self) -> BroadcastReport | None:
         """
         Asynchronously processes the daily challenge by generating an embed and sending it to
         configured channels retrieved from the database.
@@ -113,22 +115,13 @@ class Leetcode(commands.Cog):
         embed: Embed | None = await self._get_daily_challenge_embed()
         if embed is None:
             logger.warning("Embed generation failed for daily challenge")
-            return
-        leetcode_config_models: list[
-            LeetcodeConfigModel
-        ] = DbLeetcodeConfigHandler.get_all_leetcode_configs()
-        for leetcode_config_model in leetcode_config_models:
-            channel: DiscordChannelType | None = self.bot.get_channel(
-                leetcode_config_model.channel_id,
-            )
-            if channel is None:
-                logger.warning("Channel not found for guild %s", leetcode_config_model.guild.id)
-                continue
-            if isinstance(channel, Messageable):
-                await channel.send(
-                    "New **daily challenge** has appeared, you have **24hrs** to solve it!",
-                    embed=embed,
-                )
+            return None
+        return await BROADCAST_ENGINE.broadcast(
+            self.bot,
+            await AsyncDbLeetcodeConfigHandler.get_leetcode_config_views(),
+            content="New **daily challenge** has appeared, you have **24hrs** to solve it!",
+            embed=embed,
+        )
 
     @leetcode.group(invoke_without_command=True, aliases=["daily"])  # type: ignore
     @commands.has_any_role(OTTER_ADMIN, OTTER_MODERATOR)
@@ -153,19 +146,13 @@ class Leetcode(commands.Cog):
             logger.warning("No guild on context to start")
             return
 
-        leetcode_config_model: LeetcodeConfigModel | None = (
-            DbLeetcodeConfigHandler.get_leetcode_config(
-                guild_id=ctx.guild.id,
-            )
+        leetcode_config_model = LeetcodeConfigModel(
+            guild=ctx.guild.id,
+            channel_id=channel.id,
         )
-        if leetcode_config_model is None:
-            leetcode_config_model = LeetcodeConfigModel(
-                guild=ctx.guild.id,
-            )
-        leetcode_config_model.channel_id = channel.id
 
         try:
-            DbLeetcodeConfigHandler.insert_leetcode_config(
+            await AsyncDbLeetcodeConfigHandler.insert_leetcode_config(
                 leetcode_config_model=leetcode_config_model,
             )
             await send_plain_message(
@@ -184,12 +171,12 @@ class Leetcode(commands.Cog):
             return
 
         try:
-            leetcode_config = DbLeetcodeConfigHandler.get_leetcode_config(
+            leetcode_config = await AsyncDbLeetcodeConfigHandler.get_leetcode_config(
                 guild_id=ctx.guild.id,
             )
             msg: str = ""
             if leetcode_config is not None:
-                DbLeetcodeConfigHandler.delete_leetcode_config(guild_id=ctx.guild.id)
+                await AsyncDbLeetcodeConfigHandler.delete_leetcode_config(guild_id=ctx.guild.id)
                 msg = "**Leetcode config** removed!"
             else:
                 msg = "No config set! 😱"
@@ -1,10 +1,32 @@
+import asyncio
+import logging
+from datetime import datetime
+from datetime import timezone
+
+import discord
 from discord.ext import commands
 from discord.ext.commands import Bot
 from discord.ext.commands import Context
 
+from otter_welcome_buddy.common.utils.outbound_scheduler import OUTBOUND_SCHEDULER
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.database.handlers.db_member_join_handler import AsyncDbMemberJoinHandler
+from otter_welcome_buddy.database.models.external.member_join_model import MemberJoinModel
 from otter_welcome_buddy.formatters import messages
 
 
+logger = logging.getLogger(__name__)
+
+# Seconds the joins of a guild are held before the welcome goes out, the members joining in
+# the meantime share the same post
+_JOIN_BATCH_WINDOW: float = 5.0
+# A discord message is limited to 2000 characters, a mention takes around 22
+_MAX_MENTIONS_PER_MESSAGE: int = 50
+# Past this many members in a single window the welcome is posted once without the mentions,
+# so a raid doesn't turn into dozens of messages pinging everyone that joined
+_MAX_MENTIONED_JOINS: int = 200
+
+
 class Greetings(commands.Cog):
     """When a user joins, sends reactionable message"""
 
@@ -15,15 +37,104 @@ class Greetings(commands.Cog):
     ) -> None:
         self.bot: Bot = bot
         self.messages_formatter: type[messages.Formatter] = messages_dependency
+        self._pending_joins: dict[int, list[tuple[discord.Member, datetime]]] = {}
+        self._flush_tasks: dict[int, asyncio.Task[None]] = {}
+        self._welcome_message: str | None = None
 
     def _command_message(self) -> str:
         return self.messages_formatter.welcome_message()
 
+    def _get_welcome_message(self) -> str:
+        """Render the welcome once, it is the same for every guild and every join"""
+        if self._welcome_message is None:
+            self._welcome_message = self._command_message()
+        return self._welcome_message
+
+    async def cog_unload(self) -> None:
+        """Send the welcomes that were waiting for their window to end"""
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        for guild_id in list(self._pending_joins):
+            await self._flush_joins(guild_id)
+
     @commands.command()
     async def hello(self, ctx: Context) -> None:
         """Sends welcome message with !hello"""
         await ctx.send(self._command_message())
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        """Event fired when a member joins a guild, the welcome is sent once the window ends"""
+        if member.bot:
+            return
+        guild_id: int = member.guild.id
+        self._pending_joins.setdefault(guild_id, []).append(
+            (member, datetime.now(tz=timezone.utc)),
+        )
+        if guild_id not in self._flush_tasks:
+            self._flush_tasks[guild_id] = asyncio.create_task(self._flush_joins_later(guild_id))
+
+    async def _flush_joins_later(self, guild_id: int) -> None:
+        await asyncio.sleep(_JOIN_BATCH_WINDOW)
+        self._flush_tasks.pop(guild_id, None)
+        await self._flush_joins(guild_id)
+
+    async def _flush_joins(self, guild_id: int) -> None:
+        """Record the joins of the window with a single insert and welcome them together"""
+        pending_joins = self._pending_joins.pop(guild_id, [])
+        if not pending_joins:
+            return
+
+        try:
+            await AsyncDbMemberJoinHandler.insert_member_joins(
+                member_join_models=[
+                    MemberJoinModel(guild=guild_id, member_id=member.id, joined_at=joined_at)
+                    for member, joined_at in pending_joins
+                ],
+            )
+        except Exception:
+            logger.exception("Error while recording the joins in %s", __name__)
+
+        members: list[discord.Member] = [member for member, _ in pending_joins]
+        channel: discord.TextChannel | None = members[0].guild.system_channel
+        if channel is None:
+            return
+        try:
+            await self._send_welcome(channel, members)
+        except discord.Forbidden:
+            logger.error("Not permissions to send the welcome in %s", __name__)
+        except discord.HTTPException:
+            logger.exception("Error while sending the welcome in %s", __name__)
+
+    async def _send_welcome(
+        self,
+        channel: discord.TextChannel,
+        members: list[discord.Member],
+    ) -> None:
+        welcome_message: str = self._get_welcome_message()
+        if len(members) > _MAX_MENTIONED_JOINS:
+            await OUTBOUND_SCHEDULER.send(
+                OutboundLane.BULK,
+                channel,
+                f"{welcome_message}\n{len(members)} new members joined",
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
+            return
+        for start in range(0, len(members), _MAX_MENTIONS_PER_MESSAGE):
+            end: int = start + _MAX_MENTIONS_PER_MESSAGE
+            mentions: str = " ".join(member.mention for member in members[start:end])
+            await OUTBOUND_SCHEDULER.send(
+                OutboundLane.BULK,
+                channel,
+                f"{welcome_message}\n{mentions}",
+                allowed_mentions=discord.AllowedMentions(
+                    everyone=False,
+                    users=True,
+                    roles=False,
+                ),
+            )
+
 
 async def setup(bot: Bot) -> None:
     """Required setup method"""
@@ -1,5 +1,8 @@
+import asyncio
 import logging
+from dataclasses import replace
 
+import discord
 from discord.ext import commands
 from discord.ext.commands import Bot
 from discord.ext.commands import Context
@@ -7,14 +10,41 @@ from discord.ext.commands import Context
 from otter_welcome_buddy.common.constants import OTTER_ADMIN
 from otter_welcome_buddy.common.constants import OTTER_MODERATOR
 from otter_welcome_buddy.common.constants import OTTER_ROLE
-from otter_welcome_buddy.common.constants import WELCOME_MESSAGES
+from otter_welcome_buddy.common.constants import REACTION_ROLES_FEATURE
+from otter_welcome_buddy.common.constants import WELCOME_MESSAGES_FEATURE
 from otter_welcome_buddy.common.utils.discord_ import send_plain_message
+from otter_welcome_buddy.common.utils.member_cache import MEMBER_CACHE
+from otter_welcome_buddy.common.utils.reaction_roles import REACTION_ROLES
+from otter_welcome_buddy.common.utils.reaction_router import REACTION_ROUTER
+from otter_welcome_buddy.common.utils.role_grant_queue import ROLE_GRANT_QUEUE
+from otter_welcome_buddy.common.utils.role_resolver import ROLE_RESOLVER
+from otter_welcome_buddy.database.handlers.db_role_config_handler import AsyncDbRoleConfigHandler
 from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
+from otter_welcome_buddy.database.handlers.db_welcome_reconciliation_handler import (
+    AsyncDbWelcomeReconciliationHandler,
+)
 from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.external.role_config_model import ReactionRoleModel
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+from otter_welcome_buddy.database.models.view.role_config_view import ReactionRoleView
+from otter_welcome_buddy.database.models.view.welcome_reconciliation_view import (
+    WelcomeReconciliationView,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Reactions processed between two checkpoints of a welcome message
+_RECONCILIATION_PAGE_SIZE: int = 100
+
+_reconciliation_lock: asyncio.Lock = asyncio.Lock()
+
+
+class _ReconciliationState:
+    """Holds the reconciliation of the welcome reactions started when the bot is first ready"""
+
+    task: asyncio.Task[None] | None = None
+
 
 class Roles(commands.Cog):
     """
@@ -23,10 +53,14 @@ class Roles(commands.Cog):
     Commands:
         roles welcome add
         roles welcome remove
+        roles welcome reconcile
+        roles reaction add
+        roles reaction remove
     """
 
     def __init__(self, bot: Bot):
         self.bot: Bot = bot
+        REACTION_ROUTER.register(REACTION_ROLES_FEATURE, self._apply_reaction_role)
 
     @commands.group(
         brief="Commands related to give roles to the users",
@@ -41,20 +75,244 @@ class Roles(commands.Cog):
     @staticmethod
     def init_welcome_messages() -> None:
         """
-        Initialize the welcome messages from the database
+        Initialize the welcome messages and the reaction roles from the database
+        """
+        base_role_config_views: list[
+            BaseRoleConfigView
+        ] = DbRoleConfigHandler.get_base_role_config_views()
+        # A guild with a config only gives the role on its welcome messages, none if empty
+        REACTION_ROUTER.reset(
+            WELCOME_MESSAGES_FEATURE,
+            {
+                base_role_config_view.guild_id: base_role_config_view.message_ids
+                for base_role_config_view in base_role_config_views
+            },
+        )
+        REACTION_ROLES.clear()
+        REACTION_ROUTER.reset(
+            REACTION_ROLES_FEATURE,
+            {
+                base_role_config_view.guild_id: REACTION_ROLES.set_guild(
+                    base_role_config_view.guild_id,
+                    base_role_config_view.reaction_roles,
+                )
+                for base_role_config_view in base_role_config_views
+            },
+        )
+
+    @staticmethod
+    def _update_welcome_messages(
+        guild_id: int,
+        base_role_config_model: BaseRoleConfigModel | None,
+    ) -> None:
+        """
+        Update the welcome messages for a guild, the same way they are loaded on startup: a
+        guild without config gives the role on any reaction, and one with a config only on
+        its welcome messages
+        """
+        if base_role_config_model is None:
+            REACTION_ROUTER.unwatch(WELCOME_MESSAGES_FEATURE, guild_id)
+        else:
+            REACTION_ROUTER.watch(
+                WELCOME_MESSAGES_FEATURE,
+                guild_id,
+                base_role_config_model.message_ids,
+            )
+
+    @staticmethod
+    def _update_reaction_roles(
+        guild_id: int,
+        base_role_config_model: BaseRoleConfigModel | None,
+    ) -> None:
+        """
+        Update the reaction roles for a guild
         """
-        base_role_config_models: list[
-            BaseRoleConfigModel
-        ] = DbRoleConfigHandler.get_all_base_role_configs()
-        for base_role_config_model in base_role_config_models:
-            WELCOME_MESSAGES[base_role_config_model.guild.id] = base_role_config_model.message_ids
+        reaction_roles: tuple[ReactionRoleView, ...] = (
+            BaseRoleConfigView.from_document(base_role_config_model).reaction_roles
+            if base_role_config_model is not None
+            else ()
+        )
+        REACTION_ROUTER.watch(
+            REACTION_ROLES_FEATURE,
+            guild_id,
+            REACTION_ROLES.set_guild(guild_id, reaction_roles),
+        )
+
+    async def _apply_reaction_role(self, payload: discord.RawReactionActionEvent) -> None:
+        """Give the role of the reaction to the user, or remove it when the reaction is removed"""
+        if payload.guild_id is None:
+            return
+        role_id: int | None = REACTION_ROLES.get_role_id(
+            payload.guild_id,
+            payload.message_id,
+            str(payload.emoji),
+        )
+        guild: discord.Guild | None = self.bot.get_guild(payload.guild_id)
+        if role_id is None or guild is None:
+            return
+        # The member is only sent when the reaction is added
+        member: discord.Member | None = payload.member or await MEMBER_CACHE.get_member(
+            guild,
+            payload.user_id,
+        )
+        role: discord.Role | None = guild.get_role(role_id)
+        if member is None or role is None:
+            logger.warning("Not member or role found in %s for guild %s", __name__, guild.name)
+            return
+        if member.bot:
+            return
+        ROLE_GRANT_QUEUE.submit(member, role, revoke=payload.event_type == "REACTION_REMOVE")
 
     @staticmethod
-    def _update_welcome_messages(guild_id: int, message_ids: list[int]) -> None:
+    def start_welcome_reconciliation(bot: Bot) -> bool:
         """
-        Update the welcome messages for a guild
+        Reconcile the welcome reactions in the background the first time the bot is ready,
+        returning whether it was started. The reconnections skip it, unless it failed, since
+        the reactions that arrive while connected are handled as they happen.
         """
-        WELCOME_MESSAGES[guild_id] = message_ids
+        if _ReconciliationState.task is not None:
+            return False
+        _ReconciliationState.task = asyncio.create_task(Roles._reconcile_on_startup(bot))
+        return True
+
+    @staticmethod
+    async def _reconcile_on_startup(bot: Bot) -> None:
+        try:
+            await Roles.reconcile_welcome_reactions(bot)
+        except Exception:
+            logger.exception("Reconciliation of the welcome reactions failed in %s", __name__)
+            # Tried again on the next ready
+            _ReconciliationState.task = None
+
+    @staticmethod
+    async def reconcile_welcome_reactions(bot: Bot) -> int:
+        """
+        Give the entry role to the members that reacted to the welcome messages while the bot
+        was offline, returning how many grants were queued. The progress of every message is
+        stored after each page of reactions, so an interrupted run resumes where it stopped.
+        """
+        if _reconciliation_lock.locked():
+            logger.info("Reconciliation of the welcome reactions already running")
+            return 0
+
+        queued_grants: int = 0
+        async with _reconciliation_lock:
+            watched_messages = REACTION_ROUTER.get_watched_messages(WELCOME_MESSAGES_FEATURE)
+            for guild_id, message_ids in watched_messages.items():
+                guild: discord.Guild | None = bot.get_guild(guild_id)
+                if guild is None:
+                    continue
+                role: discord.Role | None = ROLE_RESOLVER.get_role(guild, OTTER_ROLE)
+                if role is None:
+                    logger.warning("Not role found in %s for guild %s", __name__, guild.name)
+                    continue
+                for message_id in message_ids:
+                    try:
+                        queued_grants += await Roles._reconcile_welcome_message(
+                            guild,
+                            role,
+                            message_id,
+                        )
+                    except discord.HTTPException:
+                        logger.exception("Reconciling the welcome message %s failed", message_id)
+        logger.info("Reconciliation of the welcome reactions queued %s grants", queued_grants)
+        return queued_grants
+
+    @staticmethod
+    async def _reconcile_welcome_message(
+        guild: discord.Guild,
+        role: discord.Role,
+        message_id: int,
+    ) -> int:
+        """
+        Page through the reactions of a welcome message, queueing the role for the reactors
+        that don't hold it yet
+        """
+        checkpoint: WelcomeReconciliationView | None = (
+            await AsyncDbWelcomeReconciliationHandler.get_checkpoint(message_id=message_id)
+        )
+        if checkpoint is None:
+            checkpoint = WelcomeReconciliationView(message_id=message_id, guild_id=guild.id)
+        message: discord.Message | None = await Roles._fetch_welcome_message(
+            guild,
+            message_id,
+            checkpoint.channel_id,
+        )
+        if message is None:
+            logger.warning("Not welcome message %s found in guild %s", message_id, guild.name)
+            await AsyncDbWelcomeReconciliationHandler.delete_checkpoint(message_id=message_id)
+            return 0
+        checkpoint = replace(checkpoint, channel_id=message.channel.id)
+
+        queued_grants: int = 0
+        for reaction in message.reactions:
+            emoji: str = str(reaction.emoji)
+            if emoji in checkpoint.done_emojis:
+                continue
+            after: discord.Object | None = None
+            if checkpoint.emoji == emoji and checkpoint.last_user_id is not None:
+                after = discord.Object(id=checkpoint.last_user_id)
+            else:
+                checkpoint = replace(checkpoint, emoji=emoji, last_user_id=None)
+
+            page: list[discord.User | discord.Member] = []
+            async for user in reaction.users(limit=None, after=after):
+                page.append(user)
+                if len(page) == _RECONCILIATION_PAGE_SIZE:
+                    queued_grants += await Roles._grant_welcome_role(guild, role, page)
+                    checkpoint = replace(checkpoint, last_user_id=user.id)
+                    await AsyncDbWelcomeReconciliationHandler.save_checkpoint(checkpoint=checkpoint)
+                    page = []
+            queued_grants += await Roles._grant_welcome_role(guild, role, page)
+
+            checkpoint = replace(
+                checkpoint,
+                emoji=None,
+                last_user_id=None,
+                done_emojis=(*checkpoint.done_emojis, emoji),
+            )
+            await AsyncDbWelcomeReconciliationHandler.save_checkpoint(checkpoint=checkpoint)
+
+        # Fully processed, the next run scans it from the start to catch the new reactions
+        await AsyncDbWelcomeReconciliationHandler.delete_checkpoint(message_id=message_id)
+        return queued_grants
+
+    @staticmethod
+    async def _grant_welcome_role(
+        guild: discord.Guild,
+        role: discord.Role,
+        users: list[discord.User | discord.Member],
+    ) -> int:
+        """Queue the role for the users of a page that don't hold it, returning how many"""
+        # The users that are not found as members no longer belong to the guild
+        members: list[discord.Member] = await MEMBER_CACHE.resolve_members(
+            guild,
+            [user for user in users if not user.bot],
+        )
+        return sum(
+            1
+            for member in members
+            if member.get_role(role.id) is None and ROLE_GRANT_QUEUE.submit(member, role)
+        )
+
+    @staticmethod
+    async def _fetch_welcome_message(
+        guild: discord.Guild,
+        message_id: int,
+        channel_id: int | None,
+    ) -> discord.Message | None:
+        """Fetch the welcome message, looking for it in every text channel if it is unknown"""
+        channels: list[discord.TextChannel] = guild.text_channels
+        if channel_id is not None:
+            channel = guild.get_channel(channel_id)
+            if isinstance(channel, discord.TextChannel):
+                channels = [channel]
+        for channel in channels:
+            try:
+                return await channel.fetch_message(message_id)
+            except (discord.NotFound, discord.Forbidden):
+                continue
+        return None
 
     @roles.group(  # type: ignore
         brief="Commands related to give the otter role to the users "
@@ -82,25 +340,16 @@ class Roles(commands.Cog):
             return
 
         try:
-            base_role_config_model = DbRoleConfigHandler.get_base_role_config(
-                guild_id=ctx.guild.id,
-            )
-            if base_role_config_model is not None:
-                message_ids.extend(base_role_config_model.message_ids)
-                base_role_config_model.message_ids = list(set(message_ids))
-            else:
-                base_role_config_model = BaseRoleConfigModel(
-                    guild=ctx.guild.id,
-                    message_ids=message_ids,
+            base_role_config_model = (
+                await AsyncDbRoleConfigHandler.add_messages_to_base_role_config(
+                    guild_id=ctx.guild.id,
+                    input_message_ids=message_ids,
                 )
-
-            base_role_config_model = DbRoleConfigHandler.insert_base_role_config(
-                base_role_config_model=base_role_config_model,
             )
 
             self._update_welcome_messages(
-                guild_id=base_role_config_model.guild.id,
-                message_ids=base_role_config_model.message_ids,
+                guild_id=ctx.guild.id,
+                base_role_config_model=base_role_config_model,
             )
             await send_plain_message(
                 ctx,
@@ -121,28 +370,27 @@ class Roles(commands.Cog):
             return
 
         try:
-            base_role_config_model = DbRoleConfigHandler.get_base_role_config(
+            base_role_config_model = await AsyncDbRoleConfigHandler.get_base_role_config(
                 guild_id=ctx.guild.id,
             )
             if base_role_config_model is not None:
                 if message_id is None:
-                    DbRoleConfigHandler.delete_base_role_config(guild_id=ctx.guild.id)
+                    # The reaction roles are kept in the same config
+                    base_role_config_model = await AsyncDbRoleConfigHandler.delete_welcome_messages(
+                        guild_id=ctx.guild.id,
+                    )
                     msg = "**Welcome messages** removed!"
-                    message_ids = []
                 else:
                     base_role_config_model = (
-                        DbRoleConfigHandler.delete_message_from_base_role_config(
+                        await AsyncDbRoleConfigHandler.delete_message_from_base_role_config(
                             guild_id=ctx.guild.id,
                             input_message_id=message_id,
                         )
                     )
-                    message_ids = (
-                        base_role_config_model.message_ids if base_role_config_model else []
-                    )
                     msg = "**Welcome message** deleted!"
                 self._update_welcome_messages(
                     guild_id=ctx.guild.id,
-                    message_ids=message_ids,
+                    base_role_config_model=base_role_config_model,
                 )
             else:
                 msg = "No welcome messages set! 😱"
@@ -150,6 +398,93 @@ class Roles(commands.Cog):
         except Exception:
             logger.exception("Error while inserting into database")
 
+    @welcome.command()  # type: ignore
+    @commands.has_any_role(OTTER_ADMIN, OTTER_MODERATOR)
+    async def reconcile(self, ctx: Context) -> None:
+        """
+        Give the role to the users that reacted to the welcome messages while the bot was offline
+        """
+        queued_grants: int = await self.reconcile_welcome_reactions(self.bot)
+        await send_plain_message(
+            ctx,
+            f"**{queued_grants}** users will receive the role **{OTTER_ROLE}**",
+        )
+
+    @roles.group(  # type: ignore
+        brief="Commands related to give roles to the users when reacting to a message",
+        invoke_without_command=True,
+    )
+    @commands.has_any_role(OTTER_ADMIN, OTTER_MODERATOR)
+    async def reaction(self, ctx: Context) -> None:
+        """
+        Reaction roles will send the help when no final command is invoked
+        """
+        await ctx.send_help(ctx.command)
+
+    @reaction.command(name="add", usage="<message_id> <emoji> <role>")  # type: ignore
+    @commands.has_any_role(OTTER_ADMIN, OTTER_MODERATOR)
+    async def add_reaction_role(
+        self,
+        ctx: Context,
+        message_id: int,
+        emoji: str,
+        role: discord.Role,
+    ) -> None:
+        """
+        Give the role to the users that react to the message with the emoji,
+        removing it when they remove the reaction
+        """
+        if ctx.guild is None:
+            logger.warning("No guild on context to save the reaction role")
+            return
+
+        try:
+            base_role_config_model = await AsyncDbRoleConfigHandler.set_reaction_role(
+                guild_id=ctx.guild.id,
+                reaction_role_model=ReactionRoleModel(
+                    message_id=message_id,
+                    emoji=emoji,
+                    role_id=role.id,
+                ),
+            )
+            self._update_reaction_roles(ctx.guild.id, base_role_config_model)
+            self._update_welcome_messages(ctx.guild.id, base_role_config_model)
+            # Setting the first reaction role creates the config, as it happens on startup
+            self._update_welcome_messages(ctx.guild.id, base_role_config_model)
+            await send_plain_message(
+                ctx,
+                f"**Reaction role** saved! React with {emoji} to get the role **{role.name}**",
+            )
+        except Exception:
+            logger.exception("Error while inserting into database")
+
+    @reaction.command(name="remove", usage="<message_id> [emoji]")  # type: ignore
+    @commands.has_any_role(OTTER_ADMIN, OTTER_MODERATOR)
+    async def remove_reaction_role(
+        self,
+        ctx: Context,
+        message_id: int,
+        emoji: str | None = None,
+    ) -> None:
+        """
+        Remove the reaction role of the emoji in the message.
+        If no emoji is provided, all the reaction roles of the message will be removed
+        """
+        if ctx.guild is None:
+            logger.warning("No guild on context to remove the reaction role")
+            return
+
+        try:
+            base_role_config_model = await AsyncDbRoleConfigHandler.delete_reaction_role(
+                guild_id=ctx.guild.id,
+                message_id=message_id,
+                emoji=emoji,
+            )
+            self._update_reaction_roles(ctx.guild.id, base_role_config_model)
+            await send_plain_message(ctx, "**Reaction role** removed!")
+        except Exception:
+            logger.exception("Error while deleting from database")
+
 
 async def setup(bot: Bot) -> None:
     """Required setup method"""
@@ -31,7 +31,20 @@ OTTER_ADMIN: str = "ROOT"
 # Discord role that give access to moderator role based commands
 OTTER_MODERATOR: str = "Collaborator"
 # Discord role that give access to the remaining channels and is
-# given when the user react to WELCOME_MESSAGES
+# given when the user react to the welcome messages
 OTTER_ROLE: str = "Interviewee"
 
-WELCOME_MESSAGES: dict[int, list[int]] = {}
+
+class RoleClass(Enum):
+    """Groups of discord roles that are treated the same way"""
+
+    STAFF: tuple[str, ...] = (OTTER_ADMIN, OTTER_MODERATOR)
+    MEMBER: tuple[str, ...] = (OTTER_ROLE,)
+
+
+# Feature of the reaction router that watches the welcome messages
+WELCOME_MESSAGES_FEATURE: str = "welcome_messages"
+# Feature of the reaction router that watches the messages with reaction roles
+REACTION_ROLES_FEATURE: str = "reaction_roles"
+# Feature of the reaction router that watches the weekly messages of the interview match
+INTERVIEW_MATCH_FEATURE: str = "interview_match"
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Protocol
+from typing import TypeVar
+
+import discord
+from discord.ext.commands import Bot
+
+from otter_welcome_buddy.common.utils.outbound_scheduler import OUTBOUND_SCHEDULER
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.common.utils.types.common import DiscordChannelType
+
+
+logger = logging.getLogger(__name__)
+
+# Every guild has its own rate limits on its channels, so a few sends in flight keep the
+# broadcast time nearly flat without hitting the global limit of the bot
+_BROADCAST_MAX_CONCURRENCY: int = 10
+
+
+class BroadcastTarget(Protocol):
+    """Channel of a guild that receives a broadcast, like the views of the channel configs"""
+
+    @property
+    def guild_id(self) -> int:
+        """Identifier of the guild"""
+
+    @property
+    def channel_id(self) -> int:
+        """Identifier of the channel where to send the messages"""
+
+
+TargetT = TypeVar("TargetT", bound=BroadcastTarget)
+
+
+class BroadcastStatus(Enum):
+    """Outcome of a broadcast in a guild"""
+
+    SENT = "sent"
+    SKIPPED = "skipped"
+    CHANNEL_NOT_FOUND = "channel_not_found"
+    INVALID_CHANNEL = "invalid_channel"
+    FORBIDDEN = "forbidden"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class BroadcastResult:
+    """
+    Outcome of a broadcast in a guild.
+
+    Attributes:
+        guild_id (int):             Identifier of the guild
+        channel_id (int):           Identifier of the channel the broadcast was sent to
+        status (BroadcastStatus):   What happened with the broadcast in the guild
+        latency (float):            Seconds from the start of the broadcast to its end in the guild
+    """
+
+    guild_id: int
+    channel_id: int
+    status: BroadcastStatus
+    latency: float
+
+
+@dataclass(frozen=True)
+class BroadcastReport:
+    """
+    Outcome of a broadcast in every guild.
+
+    Attributes:
+        results (tuple[BroadcastResult, ...]):  Outcome by guild, in the order of the targets
+        elapsed (float):                        Seconds to broadcast to every guild
+    """
+
+    results: tuple[BroadcastResult, ...]
+    elapsed: float
+
+    def count(self, status: BroadcastStatus) -> int:
+        """Return the number of guilds where the broadcast ended with the status"""
+        return sum(result.status is status for result in self.results)
+
+
+BroadcastJob = Callable[[discord.TextChannel, TargetT], Awaitable[BroadcastStatus | None]]
+
+
+class BroadcastEngine:
+    """
+    Runs a job on the channel of every guild with a bounded number of guilds in flight, shared
+    by every broadcast, so the total time stays nearly flat as the number of guilds grows.
+
+    The channels are taken from the cache of discord.py, and only the missing ones are
+    requested to discord. An error in a guild is logged and reported without stopping the
+    broadcast in the rest.
+    """
+
+    def __init__(self, max_concurrency: int = _BROADCAST_MAX_CONCURRENCY) -> None:
+        self.max_concurrency: int = max_concurrency
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def broadcast(
+        self,
+        bot: Bot,
+        targets: Iterable[BroadcastTarget],
+        content: str | None = None,
+        embed: discord.Embed | None = None,
+    ) -> BroadcastReport:
+        """Send the same message, rendered once by the caller, to the channel of every guild"""
+
+        async def _send(channel: discord.TextChannel, _: BroadcastTarget) -> None:
+            if embed is None:
+                await OUTBOUND_SCHEDULER.send(OutboundLane.BULK, channel, content)
+            else:
+                await OUTBOUND_SCHEDULER.send(OutboundLane.BULK, channel, content, embed=embed)
+
+        return await self.run(bot, targets, _send)
+
+    async def run(
+        self,
+        bot: Bot,
+        targets: Iterable[TargetT],
+        job: BroadcastJob[TargetT],
+    ) -> BroadcastReport:
+        """
+        Run the job with the channel of every guild, the job can return the status of the
+        broadcast in the guild, it's considered sent when it doesn't
+        """
+        started_at: float = time.monotonic()
+        results: list[BroadcastResult] = await asyncio.gather(
+            *(self._run_target(bot, target, job, started_at) for target in targets),
+        )
+        report = BroadcastReport(results=tuple(results), elapsed=time.monotonic() - started_at)
+        logger.info(
+            "Broadcast to %s guilds in %.2fs: %s sent, %s skipped, %s failed",
+            len(results),
+            report.elapsed,
+            report.count(BroadcastStatus.SENT),
+            report.count(BroadcastStatus.SKIPPED),
+            len(results)
+            - report.count(BroadcastStatus.SENT)
+            - report.count(BroadcastStatus.SKIPPED),
+        )
+        return report
+
+    async def resolve_channel(self, bot: Bot, channel_id: int) -> DiscordChannelType:
+        """Return the channel from the cache, requesting it to discord when it's not cached"""
+        channel: DiscordChannelType | None = bot.get_channel(channel_id)
+        if channel is None:
+            channel = await bot.fetch_channel(channel_id)
+        return channel
+
+    async def _run_target(
+        self,
+        bot: Bot,
+        target: TargetT,
+        job: BroadcastJob[TargetT],
+        started_at: float,
+    ) -> BroadcastResult:
+        async with self._slots:
+            status: BroadcastStatus = await self._run_job(bot, target, job)
+        return BroadcastResult(
+            guild_id=target.guild_id,
+            channel_id=target.channel_id,
+            status=status,
+            latency=time.monotonic() - started_at,
+        )
+
+    async def _run_job(
+        self,
+        bot: Bot,
+        target: TargetT,
+        job: BroadcastJob[TargetT],
+    ) -> BroadcastStatus:
+        """Run the job in a guild, turning its errors into the status of the guild"""
+        try:
+            channel: DiscordChannelType = await self.resolve_channel(bot, target.channel_id)
+            if not isinstance(channel, discord.TextChannel):
+                logger.error("Not valid channel to broadcast in guild %s", target.guild_id)
+                return BroadcastStatus.INVALID_CHANNEL
+            return await job(channel, target) or BroadcastStatus.SENT
+        except discord.NotFound:
+            logger.error("Fail getting channel %s in guild %s", target.channel_id, target.guild_id)
+            return BroadcastStatus.CHANNEL_NOT_FOUND
+        except discord.Forbidden:
+            logger.error("Not enough permissions to broadcast in guild %s", target.guild_id)
+            return BroadcastStatus.FORBIDDEN
+        except Exception:
+            logger.exception("Error while broadcasting in guild %s", target.guild_id)
+            return BroadcastStatus.FAILED
+
+
+BROADCAST_ENGINE: BroadcastEngine = BroadcastEngine()
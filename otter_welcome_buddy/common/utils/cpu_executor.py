@@ -0,0 +1,252 @@
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import TypeVar
+
+from otter_welcome_buddy.settings import CPU_PROCESS_WORKERS
+from otter_welcome_buddy.settings import CPU_TASK_TIMEOUT
+from otter_welcome_buddy.settings import CPU_THREAD_WORKERS
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CPU_EXECUTOR_THREAD_PREFIX: str = "otter-cpu"
+
+
+@dataclass(frozen=True)
+class CpuExecutorStats:
+    """
+    Snapshot of the counters of the CPU executor.
+
+    Attributes:
+        thread_queue_depth (int):   Tasks waiting for a thread
+        process_queue_depth (int):  Tasks waiting for a process
+        in_flight (int):            Tasks running in a thread or a process
+        completed (int):            Tasks that returned a value
+        failed (int):               Tasks that raised an exception
+        timed_out (int):            Tasks not awaited anymore because they ran out of time
+        average_wait (float):       Mean seconds a task waited for a worker
+        max_wait (float):           Slowest seconds a task waited for a worker
+        average_latency (float):    Mean seconds from the submission to the result of a task
+        max_latency (float):        Slowest seconds from the submission to the result of a task
+    """
+
+    thread_queue_depth: int
+    process_queue_depth: int
+    in_flight: int
+    completed: int
+    failed: int
+    timed_out: int
+    average_wait: float
+    max_wait: float
+    average_latency: float
+    max_latency: float
+
+
+class _CpuLane:
+    """
+    Pool of workers of a kind, where the tasks queue on the loop until a worker is free so
+    the depth of the queue and the time spent on it can be measured
+    """
+
+    def __init__(self, max_workers: int, create_executor: Callable[[int], Executor]) -> None:
+        self.max_workers: int = max_workers
+        self._create_executor: Callable[[int], Executor] = create_executor
+        self._executor: Executor | None = None
+        self._executor_lock: threading.Lock = threading.Lock()
+        self.slots: asyncio.Semaphore = asyncio.Semaphore(max_workers)
+        self.waiting: int = 0
+
+    def get_executor(self) -> Executor:
+        """Return the executor of the lane, creating it the first time a task runs"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = self._create_executor(self.max_workers)
+            return self._executor
+
+    def shutdown(self, wait: bool) -> None:
+        """Shutdown the executor, a new one is created on the next task"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+        self.slots = asyncio.Semaphore(self.max_workers)
+        self.waiting = 0
+
+
+class CpuExecutor:
+    """
+    Runs the CPU heavy work of the cogs outside the event loop, so a big weekly run in a guild
+    doesn't delay the gateway events of the rest.
+
+    The work that releases the GIL (Pillow, zlib, numpy kernels) or that returns objects that
+    can't be pickled goes to the thread pool, and the pure Python work goes to the process
+    pool, where it doesn't compete with the loop for the GIL. The functions sent to the
+    process pool, their arguments and their results must be picklable. Without process workers
+    that work runs in the thread pool instead.
+
+    A task that runs out of time is no longer awaited, but the worker can't be interrupted, so
+    its slot is freed only once the work ends.
+    """
+
+    def __init__(
+        self,
+        thread_workers: int = CPU_THREAD_WORKERS,
+        process_workers: int = CPU_PROCESS_WORKERS,
+        timeout: float = CPU_TASK_TIMEOUT,
+    ) -> None:
+        self.timeout: float = timeout
+        self._thread_lane: _CpuLane = _CpuLane(
+            max(thread_workers, 1),
+            lambda max_workers: ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=_CPU_EXECUTOR_THREAD_PREFIX,
+            ),
+        )
+        # A forked worker would inherit the locks held by the threads of the bot, spawning it
+        # starts a clean interpreter that only imports the module of the function it runs
+        self._process_lane: _CpuLane | None = (
+            _CpuLane(
+                process_workers,
+                lambda max_workers: ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ),
+            )
+            if process_workers > 0
+            else None
+        )
+        self._in_flight: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._timed_out: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    async def run_in_thread(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """
+        Run the function in the thread pool and return its result, raising asyncio.TimeoutError
+        when it doesn't finish within the timeout (by default, the one of the executor)
+        """
+        return await self._run(self._thread_lane, func, args, timeout)
+
+    async def run_in_process(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """
+        Run the function in the process pool and return its result, raising asyncio.TimeoutError
+        when it doesn't finish within the timeout (by default, the one of the executor)
+        """
+        return await self._run(self._process_lane or self._thread_lane, func, args, timeout)
+
+    def stats(self) -> CpuExecutorStats:
+        """Return a snapshot of the counters of the executor"""
+        finished: int = self._completed + self._failed
+        return CpuExecutorStats(
+            thread_queue_depth=self._thread_lane.waiting,
+            process_queue_depth=self._process_lane.waiting if self._process_lane else 0,
+            in_flight=self._in_flight,
+            completed=self._completed,
+            failed=self._failed,
+            timed_out=self._timed_out,
+            average_wait=self._total_wait / finished if finished else 0.0,
+            max_wait=self._max_wait,
+            average_latency=self._total_latency / finished if finished else 0.0,
+            max_latency=self._max_latency,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the pools, dropping the tasks not started yet"""
+        self._thread_lane.shutdown(wait=wait)
+        if self._process_lane is not None:
+            self._process_lane.shutdown(wait=wait)
+
+    async def _run(
+        self,
+        lane: _CpuLane,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        timeout: float | None,
+    ) -> T:
+        submitted_at: float = time.monotonic()
+        slots: asyncio.Semaphore = lane.slots
+        lane.waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            lane.waiting -= 1
+        wait: float = time.monotonic() - submitted_at
+
+        try:
+            future: concurrent.futures.Future[T] = lane.get_executor().submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        self._in_flight += 1
+        # The slot is held by the worker, not by the caller, so it's freed when the work ends
+        # even if the caller stopped waiting for it
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: self._on_task_done(loop, slots))
+
+        try:
+            result: T = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            logger.warning(
+                "%s ran out of time in the CPU executor",
+                getattr(func, "__name__", func),
+            )
+            raise
+        except Exception:
+            self._failed += 1
+            self._record_latency(wait, submitted_at)
+            raise
+        self._completed += 1
+        self._record_latency(wait, submitted_at)
+        return result
+
+    def _on_task_done(self, loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+        """Free the slot of a finished task, called from the worker thread"""
+        try:
+            loop.call_soon_threadsafe(self._release_slot, slots)
+        except RuntimeError:
+            # The loop is closed, so nothing is waiting for the slot anymore
+            pass
+
+    def _release_slot(self, slots: asyncio.Semaphore) -> None:
+        self._in_flight -= 1
+        slots.release()
+
+    def _record_latency(self, wait: float, submitted_at: float) -> None:
+        latency: float = time.monotonic() - submitted_at
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+
+CPU_EXECUTOR: CpuExecutor = CpuExecutor()
@@ -1,21 +1,110 @@
+import threading
+from typing import Any
+
+from mongoengine import Document
 from sqlalchemy import create_engine
 from sqlalchemy import Engine
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 
+from otter_welcome_buddy.settings import CACHE_MAX_OVERFLOW
+from otter_welcome_buddy.settings import CACHE_POOL_SIZE
+from otter_welcome_buddy.settings import CACHE_POOL_TIMEOUT
+
+# Applied to every new connection, WAL lets the readers work while another connection writes
+_SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    # Negative values are in KiB, so ~20MB of page cache per connection
+    "cache_size": -20000,
+    "mmap_size": 256 * 1024 * 1024,
+    "busy_timeout": 5000,
+}
+
+_cache_engines: dict[str, Engine] = {}
+_cache_session_factories: dict[str, sessionmaker[Session]] = {}
+_cache_engines_lock: threading.Lock = threading.Lock()
+
 
 def get_cache_connection_string(db_path: str) -> str:
     """Returns the path to the database formatted as a sqlite connection"""
     return f"sqlite:///{db_path}"
 
 
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Configure the sqlite connection when it is opened by the pool"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in _SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
 def get_cache_engine(db_path: str) -> Engine:
-    """Initializes the SQLAlchemy engine"""
-    return create_engine(get_cache_connection_string(db_path=db_path))
+    """Returns the SQLAlchemy engine of the database, creating it only the first time"""
+    with _cache_engines_lock:
+        engine: Engine | None = _cache_engines.get(db_path)
+        if engine is None:
+            engine = create_engine(
+                get_cache_connection_string(db_path=db_path),
+                pool_size=CACHE_POOL_SIZE,
+                max_overflow=CACHE_MAX_OVERFLOW,
+                pool_timeout=CACHE_POOL_TIMEOUT,
+            )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
+            _cache_engines[db_path] = engine
+        return engine
+
+
+def get_cache_session_factory(db_path: str) -> sessionmaker[Session]:
+    """Returns the session factory bound to the engine of the database"""
+    session_factory: sessionmaker[Session] | None = _cache_session_factories.get(db_path)
+    if session_factory is None:
+        session_factory = sessionmaker(bind=get_cache_engine(db_path=db_path))
+        _cache_session_factories[db_path] = session_factory
+    return session_factory
 
 
 def create_cache_session(db_path: str) -> Session:
     """Get a session to be used for transaction on the database"""
-    engine = get_cache_engine(db_path=db_path)
-    session_factory = sessionmaker(bind=engine)
+    session_factory = get_cache_session_factory(db_path=db_path)
     return session_factory()
+
+
+def dispose_cache_engines() -> None:
+    """Close the connections of every engine, new ones are created on the next use"""
+    with _cache_engines_lock:
+        for engine in _cache_engines.values():
+            engine.dispose()
+        _cache_engines.clear()
+        _cache_session_factories.clear()
+
+
+def upsert_document(document: Document) -> Document:
+    """
+    Insert or update the document in a single atomic statement, setting its fields instead
+    of replacing the whole record as save() does
+    """
+    document.validate()
+    son: dict[str, Any] = document.to_mongo().to_dict()
+    document_id: Any = son.pop("_id")
+    db_fields: set[str] = {
+        field.db_field
+        for field in document._fields.values()  # pylint: disable=protected-access
+        if field.db_field != "_id"
+    }
+    update: dict[str, dict[str, Any]] = {"$setOnInsert": {"_id": document_id}}
+    if son:
+        update["$set"] = son
+    unset_fields: dict[str, str] = {db_field: "" for db_field in db_fields - son.keys()}
+    if unset_fields:
+        update["$unset"] = unset_fields
+
+    document._get_collection().update_one(  # pylint: disable=protected-access
+        {"_id": document_id},
+        update,
+        upsert=True,
+    )
+    return document
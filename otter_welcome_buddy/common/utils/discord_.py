@@ -3,6 +3,9 @@ import logging
 import discord
 from discord.ext.commands import Context
 
+from otter_welcome_buddy.common.utils.outbound_scheduler import OUTBOUND_SCHEDULER
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +13,11 @@ logger = logging.getLogger(__name__)
 async def send_plain_message(ctx: Context, message: str) -> None:
     """Send a message as embed, this allows to use more markdown features"""
     try:
-        await ctx.send(embed=discord.Embed(description=message, color=discord.Color.teal()))
+        await OUTBOUND_SCHEDULER.send(
+            OutboundLane.INTERACTIVE,
+            ctx,
+            embed=discord.Embed(description=message, color=discord.Color.teal()),
+        )
     except discord.Forbidden:
         logger.exception("Not enough permissions to send the message")
     except discord.HTTPException:
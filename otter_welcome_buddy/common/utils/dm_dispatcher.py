@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import discord
+
+from otter_welcome_buddy.common.utils.outbound_scheduler import OUTBOUND_SCHEDULER
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+
+
+logger = logging.getLogger(__name__)
+
+# Discord doesn't publish the limits of the direct messages, a few in flight keep a big batch
+# moving without being flagged as spam
+_DM_MAX_CONCURRENCY: int = 5
+_DM_MAX_RETRIES: int = 3
+_DM_RETRY_DELAY: float = 1.0
+_RATE_LIMITED_STATUS: int = 429
+
+DmRecipient = discord.Member | discord.User
+
+
+@dataclass(frozen=True)
+class DmDeliveryReport:
+    """
+    Summary of the delivery of a batch of direct messages.
+
+    Attributes:
+        sent (int):                     Messages delivered
+        failed (int):                   Messages given up on after the retries
+        blocked_ids (tuple[int, ...]):  Recipients that don't accept direct messages from the bot
+        retries (int):                  Messages sent again after a transient error
+        elapsed (float):                Seconds to deliver the whole batch
+        average_latency (float):        Mean seconds to deliver a message, retries included
+        max_latency (float):            Slowest seconds to deliver a message, retries included
+    """
+
+    sent: int
+    failed: int
+    blocked_ids: tuple[int, ...]
+    retries: int
+    elapsed: float
+    average_latency: float
+    max_latency: float
+
+
+@dataclass(frozen=True)
+class _DmResult:
+    recipient_id: int
+    is_sent: bool
+    is_blocked: bool
+    retries: int
+    latency: float
+
+
+class DmDispatcher:
+    """
+    Sends batches of direct messages with a bounded number of them in flight, shared by every
+    batch, so the time of a batch depends on the concurrency and not on its size.
+
+    The transient errors are retried with a backoff, a rate limit pauses every direct message
+    until discord allows them again, and the recipients that block the direct messages of the
+    bot are reported instead of retried.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = _DM_MAX_CONCURRENCY,
+        max_retries: int = _DM_MAX_RETRIES,
+        retry_delay: float = _DM_RETRY_DELAY,
+    ) -> None:
+        self.max_concurrency: int = max_concurrency
+        self.max_retries: int = max_retries
+        self.retry_delay: float = retry_delay
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._resume_at: float = 0.0
+
+    async def dispatch(self, messages: Iterable[tuple[DmRecipient, str]]) -> DmDeliveryReport:
+        """Send every message to its recipient and return the summary of the delivery"""
+        started_at: float = time.monotonic()
+        results: list[_DmResult] = await asyncio.gather(
+            *(self._deliver(recipient, content) for recipient, content in messages),
+        )
+        latencies: list[float] = [result.latency for result in results]
+        return DmDeliveryReport(
+            sent=sum(result.is_sent for result in results),
+            failed=sum(not result.is_sent and not result.is_blocked for result in results),
+            blocked_ids=tuple(
+                dict.fromkeys(result.recipient_id for result in results if result.is_blocked),
+            ),
+            retries=sum(result.retries for result in results),
+            elapsed=time.monotonic() - started_at,
+            average_latency=sum(latencies) / len(latencies) if latencies else 0.0,
+            max_latency=max(latencies, default=0.0),
+        )
+
+    async def _deliver(self, recipient: DmRecipient, content: str) -> _DmResult:
+        """Send a message, retrying while the error is transient"""
+        async with self._slots:
+            started_at: float = time.monotonic()
+            retries: int = 0
+            is_sent: bool = False
+            is_blocked: bool = False
+            for attempt in range(self.max_retries + 1):
+                await self._wait_rate_limit()
+                try:
+                    await OUTBOUND_SCHEDULER.send(OutboundLane.BULK, recipient, content)
+                except discord.Forbidden:
+                    is_blocked = True
+                    break
+                except discord.RateLimited as ex:
+                    self._pause(ex.retry_after)
+                except discord.HTTPException as ex:
+                    if ex.status != _RATE_LIMITED_STATUS and ex.status < 500:
+                        logger.error("Sending the direct message to %s failed", recipient.id)
+                        break
+                    self._pause(self.retry_delay * 2**attempt)
+                else:
+                    is_sent = True
+                    break
+                if attempt < self.max_retries:
+                    retries += 1
+            else:
+                logger.warning("Giving up on the direct message to %s", recipient.id)
+            return _DmResult(
+                recipient_id=recipient.id,
+                is_sent=is_sent,
+                is_blocked=is_blocked,
+                retries=retries,
+                latency=time.monotonic() - started_at,
+            )
+
+    async def _wait_rate_limit(self) -> None:
+        """Sleep while the direct messages are rate limited"""
+        delay: float = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _pause(self, delay: float) -> None:
+        """Hold every direct message until the delay given by discord is over"""
+        logger.warning("Direct messages rate limited, retrying in %.2fs", delay)
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
+DM_DISPATCHER: DmDispatcher = DmDispatcher()
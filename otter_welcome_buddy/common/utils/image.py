@@ -1,4 +1,7 @@
-import os
+import functools
+import io
+import threading
+from collections.abc import Sequence
 
 from discord import Member
 from PIL import Image
@@ -9,44 +12,67 @@ from PIL.ImageDraw import ImageDraw as ImageDrawType
 from PIL.ImageFont import FreeTypeFont
 
 from otter_welcome_buddy.common.constants import FONT_PATH
+from otter_welcome_buddy.common.utils.cpu_executor import CPU_EXECUTOR
 
-_DEFAULT_IMAGE_PATH: str = os.path.dirname(os.path.realpath(__file__)) + "/image.jpg"
 _COLOR_TEXT: str = "black"
 _COLOR_OUTLINE: str = "gray"
 _COLOR_BACKGROUND: str = "white"
 _FONT_SIZE: int = 16
 _MARGIN_RIGHT: int = 30
 _MARGIN_TOP: int = 10
+_IMAGE_FORMAT: str = "PNG"
+# Keeps every page readable in the discord preview, and far from the size limits of Pillow
+PAIRS_PER_IMAGE: int = 50
+# Discord allows up to 10 attachments per message
+MAX_IMAGES_PER_MESSAGE: int = 10
+MATCH_IMAGE_FILENAME: str = "interview_match_{page}.png"
+
+# The text is only measured on it, so a single pixel is enough and it's never drawn
+_MEASURE_CANVAS: ImageDrawType = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+# The cached font and canvas are shared by the rendering threads, and a FreeType face can't
+# be used by two threads at once, only the encoding of the images runs in parallel
+_FONT_LOCK: threading.Lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(size: int = _FONT_SIZE) -> FreeTypeFont:
+    """
+    Load the font once per size, reading the font file every time is most of the rendering
+    """
+    return ImageFont.truetype(FONT_PATH, size)
 
 
 def _get_size(txt: str, font: FreeTypeFont) -> tuple[int, int]:
     """
     Get the size (height, width) of the text provided based on the font in píxels
     """
-    temp_img: ImageType = Image.new("RGB", (1, 1))
-    temp_draw: ImageDrawType = ImageDraw.Draw(temp_img)
-    _, _, text_width, text_height = temp_draw.textbbox((0, 0), txt, font)
+    _, _, text_width, text_height = _MEASURE_CANVAS.textbbox((0, 0), txt, font)
     return text_width, text_height
 
 
-def create_match_image(
-    week_otter_pairs: list[tuple[Member, Member]],
-) -> tuple[ImageType, str]:
+def create_match_image(name_pairs: Sequence[tuple[str, str]]) -> io.BytesIO:
     """
-    Create a jpg image with the pairs of participants
+    Create a png image with the names of the pairs of participants, returned as the encoded
+    bytes so it can be sent without touching the disk
     """
-    first_list, second_list = zip(*week_otter_pairs)
-    first_column: str = "\n".join(
-        list(map(lambda user: f"{user.display_name}", first_list)),
-    )
-    second_column: str = "\n".join(
-        list(
-            map(lambda user: f"{user.display_name}", second_list),
-        ),
-    )
+    first_list, second_list = zip(*name_pairs)
+    first_column: str = "\n".join(first_list)
+    second_column: str = "\n".join(second_list)
+
+    with _FONT_LOCK:
+        img: ImageType = _draw_match_image(first_column, second_column)
+
+    image_bytes = io.BytesIO()
+    img.save(image_bytes, format=_IMAGE_FORMAT)
+    image_bytes.seek(0)
+    return image_bytes
 
-    # TODO: except image creation errors
-    font: FreeTypeFont = ImageFont.truetype(FONT_PATH, _FONT_SIZE)
+
+def _draw_match_image(first_column: str, second_column: str) -> ImageType:
+    """
+    Draw the two columns of names on an image just big enough for them
+    """
+    font: FreeTypeFont = _get_font()
 
     width, height = _get_size(first_column, font)
     width2, height2 = _get_size(second_column, font)
@@ -82,7 +108,33 @@ def create_match_image(
         ),
         outline=_COLOR_OUTLINE,
     )
+    return img
 
-    img.save(_DEFAULT_IMAGE_PATH)
 
-    return img, _DEFAULT_IMAGE_PATH
+def create_match_images(
+    name_pairs: Sequence[tuple[str, str]],
+    pairs_per_image: int = PAIRS_PER_IMAGE,
+) -> list[io.BytesIO]:
+    """
+    Create the images with the pairs of participants, one per page of pairs, so a big pool
+    doesn't turn into a single image too tall to read or to render
+    """
+    images: list[io.BytesIO] = []
+    for start in range(0, len(name_pairs), pairs_per_image):
+        end: int = start + pairs_per_image
+        images.append(create_match_image(name_pairs[start:end]))
+    return images
+
+
+async def render_match_images(
+    week_otter_pairs: Sequence[tuple[Member, Member]],
+) -> list[io.BytesIO]:
+    """
+    Render the images with the pairs of participants in the threads of the CPU executor,
+    Pillow does the drawing and the encoding without holding the event loop
+    """
+    name_pairs: list[tuple[str, str]] = [
+        (otter_one.display_name, otter_two.display_name)
+        for otter_one, otter_two in week_otter_pairs
+    ]
+    return await CPU_EXECUTOR.run_in_thread(create_match_images, name_pairs)
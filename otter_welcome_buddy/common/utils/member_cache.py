@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import discord
+
+from otter_welcome_buddy.settings import MEMBER_CACHE_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+# Discord answers a gateway query with at most 100 members
+_QUERY_MEMBERS_LIMIT: int = 100
+
+
+@dataclass(frozen=True)
+class MemberCacheStats:
+    """
+    Snapshot of the counters of the member cache.
+
+    Attributes:
+        size (int):         Members held by the cache
+        hits (int):         Members found in the cache of the guild or in this one
+        misses (int):       Members requested to discord
+        not_found (int):    Members requested to discord that are no longer in the guild
+    """
+
+    size: int
+    hits: int
+    misses: int
+    not_found: int
+
+
+class MemberCache:
+    """
+    Size bounded LRU of the members the bot works with, keyed by (guild_id, member_id).
+
+    When the bot runs without chunking the guilds, discord.py doesn't hold the members, so
+    the ones that react or that are needed by an activity are kept here, and the rest are
+    requested to discord on demand. When every member is cached by discord.py, the cache of
+    the guild is used first and this one stays empty.
+    """
+
+    def __init__(self, max_size: int = MEMBER_CACHE_SIZE) -> None:
+        self.max_size: int = max_size
+        self._members: OrderedDict[tuple[int, int], discord.Member] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._not_found: int = 0
+
+    def get(self, guild: discord.Guild, member_id: int) -> discord.Member | None:
+        """Return the member if it is cached, without requesting it to discord"""
+        member: discord.Member | None = guild.get_member(member_id)
+        if member is None:
+            key = (guild.id, member_id)
+            member = self._members.get(key)
+            if member is None:
+                return None
+            self._members.move_to_end(key)
+        self._hits += 1
+        return member
+
+    def put(self, member: discord.Member) -> None:
+        """Cache the member, evicting the least recently used one when the cache is full"""
+        if self.max_size <= 0:
+            return
+        key = (member.guild.id, member.id)
+        self._members[key] = member
+        self._members.move_to_end(key)
+        while len(self._members) > self.max_size:
+            self._members.popitem(last=False)
+
+    def discard(self, guild_id: int, member_id: int) -> None:
+        """Drop a member, the next time it is needed it is requested to discord again"""
+        self._members.pop((guild_id, member_id), None)
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop every member of a guild"""
+        for key in [key for key in self._members if key[0] == guild_id]:
+            del self._members[key]
+
+    def clear(self) -> None:
+        """Drop every member"""
+        self._members.clear()
+
+    def stats(self) -> MemberCacheStats:
+        """Return a snapshot of the counters of the cache"""
+        return MemberCacheStats(
+            size=len(self._members),
+            hits=self._hits,
+            misses=self._misses,
+            not_found=self._not_found,
+        )
+
+    async def get_member(self, guild: discord.Guild, member_id: int) -> discord.Member | None:
+        """Return the member, fetching it when it is not cached"""
+        member: discord.Member | None = self.get(guild, member_id)
+        if member is not None:
+            return member
+        self._misses += 1
+        try:
+            member = await guild.fetch_member(member_id)
+        except discord.NotFound:
+            self._not_found += 1
+            return None
+        self.put(member)
+        return member
+
+    async def resolve_members(
+        self,
+        guild: discord.Guild,
+        users: Iterable[discord.abc.Snowflake],
+    ) -> list[discord.Member]:
+        """
+        Return the members of the guild among the users (or any object with their id), in the
+        same order. The users that are not cached are requested with a gateway query per 100
+        users, and the ones that are no longer in the guild are left out.
+        """
+        members: dict[int, discord.Member | None] = {}
+        missing_ids: list[int] = []
+        for user in users:
+            if user.id in members:
+                continue
+            if isinstance(user, discord.Member):
+                members[user.id] = user
+                continue
+            members[user.id] = self.get(guild, user.id)
+            if members[user.id] is None:
+                missing_ids.append(user.id)
+
+        for start in range(0, len(missing_ids), _QUERY_MEMBERS_LIMIT):
+            end: int = start + _QUERY_MEMBERS_LIMIT
+            user_ids: list[int] = missing_ids[start:end]
+            self._misses += len(user_ids)
+            try:
+                queried_members: list[discord.Member] = await guild.query_members(
+                    user_ids=user_ids,
+                    limit=len(user_ids),
+                    cache=False,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Querying %s members of %s timed out", len(user_ids), guild.id)
+                queried_members = []
+            for member in queried_members:
+                self.put(member)
+                members[member.id] = member
+            self._not_found += len(user_ids) - len(queried_members)
+
+        return [member for member in members.values() if member is not None]
+
+
+MEMBER_CACHE: MemberCache = MemberCache()
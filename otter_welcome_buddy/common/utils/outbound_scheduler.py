@@ -0,0 +1,298 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import discord
+from discord.ext.commands import Context
+
+
+logger = logging.getLogger(__name__)
+
+# Discord allows around 50 requests per second to a bot, the bulk sends are kept under it so
+# there is always room left for the replies to the commands
+_MAX_IN_FLIGHT: int = 10
+_BULK_MAX_IN_FLIGHT: int = 8
+_BULK_RATE: float = 40.0
+# Discord allows around 5 messages every 5 seconds in a channel
+_ROUTE_RATE: float = 1.0
+_ROUTE_BURST: float = 5.0
+# The buckets that are full again are dropped once there are more routes than this
+_MAX_ROUTES: int = 10_000
+
+
+class OutboundLane(Enum):
+    """Priority of a message sent by the bot, the interactive ones always go first"""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at a constant rate up to its capacity, a request takes a token
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._tokens: float = capacity
+        self._updated_at: float = time.monotonic()
+
+    def get_delay(self, now: float) -> float:
+        """Return the seconds until a token is available, 0 when there is one already"""
+        self._refill(now)
+        return 0.0 if self._tokens >= 1.0 else (1.0 - self._tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """Take a token, the bucket can go below zero to be paid back by the next refills"""
+        self._refill(now)
+        self._tokens -= 1.0
+
+    def is_full(self, now: float) -> bool:
+        """Return whether the bucket refilled up to its capacity"""
+        self._refill(now)
+        return self._tokens >= self.capacity
+
+    def _refill(self, now: float) -> None:
+        # A bucket created after the caller read the clock is already up to date
+        if now <= self._updated_at:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+@dataclass(frozen=True)
+class OutboundLaneStats:
+    """
+    Snapshot of the counters of a lane of the outbound scheduler.
+
+    Attributes:
+        queue_depth (int):      Messages waiting for their turn
+        in_flight (int):        Messages being sent to discord
+        sent (int):             Messages that got their turn
+        throttled (int):        Times a message waited for the rate of its route or lane
+        average_wait (float):   Mean seconds a message waited for its turn
+        max_wait (float):       Slowest seconds a message waited for its turn
+    """
+
+    queue_depth: int
+    in_flight: int
+    sent: int
+    throttled: int
+    average_wait: float
+    max_wait: float
+
+
+@dataclass
+class _Waiter:
+    route: str
+    future: asyncio.Future[None]
+    enqueued_at: float
+    is_throttled: bool = False
+
+
+@dataclass
+class _LaneCounters:
+    in_flight: int = 0
+    sent: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class OutboundScheduler:
+    """
+    Gives the messages of the bot their turn to be sent, with an interactive lane for the
+    replies to the commands and a bulk lane for the scheduled and batch sends.
+
+    A waiting interactive message always goes before any bulk one, and some of the requests in
+    flight are reserved for the interactive lane, so a reply doesn't wait for a broadcast to
+    drain. Every route (a channel or the direct messages of a user) has a token bucket, and a
+    throttled route doesn't hold the messages to the rest behind it. The bulk lane has a bucket
+    of its own, kept under the global rate limit of discord.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        bulk_max_in_flight: int = _BULK_MAX_IN_FLIGHT,
+        bulk_rate: float = _BULK_RATE,
+        route_rate: float = _ROUTE_RATE,
+        route_burst: float = _ROUTE_BURST,
+    ) -> None:
+        self.max_in_flight: int = max_in_flight
+        self.bulk_max_in_flight: int = min(bulk_max_in_flight, max_in_flight)
+        self.route_rate: float = route_rate
+        self.route_burst: float = route_burst
+        self._bulk_bucket: TokenBucket = TokenBucket(bulk_rate, bulk_rate)
+        self._route_buckets: dict[str, TokenBucket] = {}
+        self._waiters: dict[OutboundLane, deque[_Waiter]] = {lane: deque() for lane in OutboundLane}
+        self._counters: dict[OutboundLane, _LaneCounters] = {
+            lane: _LaneCounters() for lane in OutboundLane
+        }
+        self._wake_handle: asyncio.TimerHandle | None = None
+
+    async def send(
+        self,
+        lane: OutboundLane,
+        destination: discord.abc.Messageable,
+        *args: Any,
+        **kwargs: Any,
+    ) -> discord.Message:
+        """Send the message to the destination once it's its turn in the lane"""
+        async with self.turn(lane, get_route(destination)):
+            return await destination.send(*args, **kwargs)
+
+    @asynccontextmanager
+    async def turn(self, lane: OutboundLane, route: str) -> AsyncIterator[None]:
+        """Wait for the turn of a request to the route, that lasts until the block ends"""
+        await self._acquire(lane, route)
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    def stats(self, lane: OutboundLane) -> OutboundLaneStats:
+        """Return a snapshot of the counters of a lane"""
+        counters = self._counters[lane]
+        return OutboundLaneStats(
+            queue_depth=len(self._waiters[lane]),
+            in_flight=counters.in_flight,
+            sent=counters.sent,
+            throttled=counters.throttled,
+            average_wait=counters.total_wait / counters.sent if counters.sent else 0.0,
+            max_wait=counters.max_wait,
+        )
+
+    async def _acquire(self, lane: OutboundLane, route: str) -> None:
+        waiter = _Waiter(
+            route=route,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        self._waiters[lane].append(waiter)
+        self._wake()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The turn was given right when the caller was cancelled
+                self._release(lane)
+            elif waiter in self._waiters[lane]:
+                # Otherwise the waiter was already popped and its turn given back
+                self._waiters[lane].remove(waiter)
+            raise
+
+    def _release(self, lane: OutboundLane) -> None:
+        self._counters[lane].in_flight -= 1
+        self._wake()
+
+    def _in_flight(self) -> int:
+        return sum(counters.in_flight for counters in self._counters.values())
+
+    def _wake(self) -> None:
+        """Give the turn to the waiting requests while there is room in flight for them"""
+        now: float = time.monotonic()
+        next_delay: float | None = None
+        for lane in OutboundLane:
+            while self._in_flight() < self._get_max_in_flight(lane):
+                waiter, delay = self._pop_ready_waiter(lane, now)
+                if waiter is None:
+                    if delay is not None:
+                        next_delay = delay if next_delay is None else min(next_delay, delay)
+                    break
+                self._grant(lane, waiter, now)
+        self._schedule_wake(next_delay)
+
+    def _get_max_in_flight(self, lane: OutboundLane) -> int:
+        return self.max_in_flight if lane is OutboundLane.INTERACTIVE else self.bulk_max_in_flight
+
+    def _pop_ready_waiter(
+        self,
+        lane: OutboundLane,
+        now: float,
+    ) -> tuple[_Waiter | None, float | None]:
+        """
+        Return the first waiter of the lane whose route has a token, or the seconds until one
+        of them has it
+        """
+        waiters = self._waiters[lane]
+        if not waiters:
+            return None, None
+        if lane is OutboundLane.BULK:
+            lane_delay: float = self._bulk_bucket.get_delay(now)
+            if lane_delay > 0:
+                self._mark_throttled(lane, waiters[0])
+                return None, lane_delay
+        min_delay: float | None = None
+        for index, waiter in enumerate(waiters):
+            delay: float = self._get_route_bucket(waiter.route).get_delay(now)
+            if delay == 0:
+                del waiters[index]
+                return waiter, None
+            self._mark_throttled(lane, waiter)
+            min_delay = delay if min_delay is None else min(min_delay, delay)
+        return None, min_delay
+
+    def _grant(self, lane: OutboundLane, waiter: _Waiter, now: float) -> None:
+        self._get_route_bucket(waiter.route).take(now)
+        if lane is OutboundLane.BULK:
+            self._bulk_bucket.take(now)
+        counters = self._counters[lane]
+        wait: float = now - waiter.enqueued_at
+        counters.in_flight += 1
+        counters.sent += 1
+        counters.total_wait += wait
+        counters.max_wait = max(counters.max_wait, wait)
+        if not waiter.future.done():
+            waiter.future.set_result(None)
+        else:
+            # The caller stopped waiting, so the turn is given back
+            counters.in_flight -= 1
+
+    def _mark_throttled(self, lane: OutboundLane, waiter: _Waiter) -> None:
+        if not waiter.is_throttled:
+            waiter.is_throttled = True
+            self._counters[lane].throttled += 1
+
+    def _get_route_bucket(self, route: str) -> TokenBucket:
+        bucket: TokenBucket | None = self._route_buckets.get(route)
+        if bucket is None:
+            if len(self._route_buckets) >= _MAX_ROUTES:
+                self._drop_full_buckets()
+            bucket = TokenBucket(self.route_rate, self.route_burst)
+            self._route_buckets[route] = bucket
+        return bucket
+
+    def _drop_full_buckets(self) -> None:
+        now: float = time.monotonic()
+        for route in [
+            route for route, bucket in self._route_buckets.items() if bucket.is_full(now)
+        ]:
+            del self._route_buckets[route]
+
+    def _schedule_wake(self, delay: float | None) -> None:
+        """Wake up again when the next throttled request gets a token"""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+        if delay is not None:
+            self._wake_handle = asyncio.get_running_loop().call_later(delay, self._wake)
+
+
+def get_route(destination: discord.abc.Messageable) -> str:
+    """Return the route of the rate limits of discord that a message to the destination uses"""
+    if isinstance(destination, Context):
+        return f"channel:{destination.channel.id}"
+    if isinstance(destination, (discord.Member, discord.User)):
+        return f"dm:{destination.id}"
+    return f"channel:{getattr(destination, 'id', None)}"
+
+
+OUTBOUND_SCHEDULER: OutboundScheduler = OutboundScheduler()
@@ -0,0 +1,175 @@
+from collections.abc import Collection
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+# Pairing two collaborators or two members is allowed, but a mixed pair is always preferred
+_SAME_CLASS_COST: float = 1.0
+# Pairing two participants that met the last week, divided by the weeks since they met, so an
+# old repeat is still better than a recent one but worse than a mixed pair that never met
+_REPEAT_COST: float = 10.0
+# Random noise added to the costs to choose among the equally good partners, lower than any
+# real difference between two costs
+_TIE_BREAK_NOISE: float = 0.1
+_MAX_IMPROVEMENT_PASSES: int = 2
+
+
+class _PairingCosts:
+    """
+    Costs of pairing the participants, by their position.
+
+    The full matrix would take n² floats, so only the rows are built on demand from the class
+    of every participant and the sparse repeats.
+    """
+
+    def __init__(
+        self,
+        is_staff: npt.NDArray[np.bool_],
+        past_pairs: Mapping[tuple[int, int], int],
+    ) -> None:
+        self.is_staff: npt.NDArray[np.bool_] = is_staff
+        self._repeat_costs: dict[tuple[int, int], float] = {}
+        for (first, second), weeks_ago in past_pairs.items():
+            key = (min(first, second), max(first, second))
+            # The most recent meeting of the pair is the one that counts
+            self._repeat_costs[key] = max(
+                self._repeat_costs.get(key, 0.0),
+                _REPEAT_COST / max(weeks_ago, 1),
+            )
+        repeat_partners: dict[int, list[tuple[int, float]]] = {}
+        for (first, second), cost in self._repeat_costs.items():
+            repeat_partners.setdefault(first, []).append((second, cost))
+            repeat_partners.setdefault(second, []).append((first, cost))
+        self._repeat_rows: dict[int, tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]] = {
+            position: (
+                np.fromiter((partner for partner, _ in partners), dtype=np.intp),
+                np.fromiter((cost for _, cost in partners), dtype=np.float64),
+            )
+            for position, partners in repeat_partners.items()
+        }
+
+    def row(self, position: int) -> npt.NDArray[np.float64]:
+        """Cost of pairing the participant with every participant"""
+        row: npt.NDArray[np.float64] = np.where(
+            self.is_staff == self.is_staff[position],
+            _SAME_CLASS_COST,
+            0.0,
+        )
+        repeat_row = self._repeat_rows.get(position)
+        if repeat_row is not None:
+            partners, costs = repeat_row
+            row[partners] += costs
+        return row
+
+    def pair(self, first: int, second: int) -> float:
+        """Cost of pairing two participants"""
+        cost: float = _SAME_CLASS_COST if self.is_staff[first] == self.is_staff[second] else 0.0
+        return cost + self._repeat_costs.get((min(first, second), max(first, second)), 0.0)
+
+
+def pair_participants(
+    participant_ids: Sequence[int],
+    staff_ids: Collection[int],
+    past_pairs: Mapping[tuple[int, int], int] | None = None,
+    seed: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Pair the participants minimizing the repeats, and preferring a collaborator with a member.
+
+    Parameters:
+        participant_ids (Sequence[int]):    Participants to pair, an even number of them
+        staff_ids (Collection[int]):        Participants that are collaborators
+        past_pairs (Mapping):               Weeks since every pair of participants last met,
+                                            1 being the last week
+        seed (int | None):                  Seed of the random choices, the same seed and
+                                            participants give the same pairs
+
+    Every participant is paired in a random order with the cheapest partner left, and then the
+    pairs with a cost are swapped with another pair whenever it lowers the total cost.
+    """
+    unique_ids: list[int] = list(dict.fromkeys(participant_ids))
+    if len(unique_ids) % 2 == 1:
+        raise ValueError("An even number of participants is needed to pair them")
+    if not unique_ids:
+        return []
+
+    positions: dict[int, int] = {
+        participant_id: position for position, participant_id in enumerate(unique_ids)
+    }
+    costs = _PairingCosts(
+        is_staff=np.fromiter(
+            (participant_id in staff_ids for participant_id in unique_ids),
+            dtype=np.bool_,
+            count=len(unique_ids),
+        ),
+        past_pairs={
+            (positions[first], positions[second]): weeks_ago
+            for (first, second), weeks_ago in (past_pairs or {}).items()
+            if first in positions and second in positions and first != second
+        },
+    )
+    rng = np.random.default_rng(seed)
+
+    pairs: npt.NDArray[np.intp] = _pair_greedily(costs, rng)
+    _improve_pairs(costs, pairs)
+    return [(unique_ids[first], unique_ids[second]) for first, second in pairs.tolist()]
+
+
+def _pair_greedily(costs: _PairingCosts, rng: np.random.Generator) -> npt.NDArray[np.intp]:
+    """Pair every participant, in a random order, with the cheapest partner left"""
+    participants: int = len(costs.is_staff)
+    is_paired: npt.NDArray[np.bool_] = np.zeros(participants, dtype=np.bool_)
+    pairs: npt.NDArray[np.intp] = np.empty((participants // 2, 2), dtype=np.intp)
+    pair_count: int = 0
+    for position in rng.permutation(participants).tolist():
+        if is_paired[position]:
+            continue
+        is_paired[position] = True
+        row = costs.row(position) + rng.random(participants) * _TIE_BREAK_NOISE
+        row[is_paired] = np.inf
+        partner = int(np.argmin(row))
+        is_paired[partner] = True
+        pairs[pair_count] = (position, partner)
+        pair_count += 1
+    return pairs
+
+
+def _improve_pairs(costs: _PairingCosts, pairs: npt.NDArray[np.intp]) -> None:
+    """
+    Swap the partners of a pair with a cost and the ones of any other pair when it lowers
+    the total cost, the pairs are updated in place
+    """
+    firsts: npt.NDArray[np.intp] = pairs[:, 0]
+    seconds: npt.NDArray[np.intp] = pairs[:, 1]
+    pair_costs: npt.NDArray[np.float64] = np.fromiter(
+        (costs.pair(first, second) for first, second in pairs.tolist()),
+        dtype=np.float64,
+        count=len(pairs),
+    )
+    for _ in range(_MAX_IMPROVEMENT_PASSES):
+        has_improved: bool = False
+        for pair_index in np.flatnonzero(pair_costs > 0).tolist():
+            first, second = int(firsts[pair_index]), int(seconds[pair_index])
+            first_row, second_row = costs.row(first), costs.row(second)
+            # (first, other first) + (second, other second), or the crossed partners
+            straight = first_row[firsts] + second_row[seconds]
+            crossed = first_row[seconds] + second_row[firsts]
+            gains = pair_costs[pair_index] + pair_costs - np.minimum(straight, crossed)
+            gains[pair_index] = 0.0
+            other_index = int(np.argmax(gains))
+            if gains[other_index] <= 1e-9:
+                continue
+
+            other_first, other_second = int(firsts[other_index]), int(seconds[other_index])
+            if straight[other_index] > crossed[other_index]:
+                other_first, other_second = other_second, other_first
+            pairs[pair_index] = (first, other_first)
+            pairs[other_index] = (second, other_second)
+            pair_costs[pair_index] = costs.pair(first, other_first)
+            pair_costs[other_index] = costs.pair(second, other_second)
+            has_improved = True
+        if not has_improved:
+            return
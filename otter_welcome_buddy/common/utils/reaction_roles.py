@@ -0,0 +1,43 @@
+from collections.abc import Iterable
+
+from otter_welcome_buddy.database.models.view.role_config_view import ReactionRoleView
+
+
+class ReactionRoleIndex:
+    """
+    Roles given by reacting to a message with an emoji, keyed by (guild_id, message_id) and
+    then by emoji, so resolving the role of a reaction costs two dict lookups.
+    """
+
+    def __init__(self) -> None:
+        self._role_ids: dict[tuple[int, int], dict[str, int]] = {}
+        self._guild_message_ids: dict[int, frozenset[int]] = {}
+
+    def set_guild(
+        self,
+        guild_id: int,
+        reaction_roles: Iterable[ReactionRoleView],
+    ) -> frozenset[int]:
+        """Replace the reaction roles of a guild, returning the messages that have any"""
+        for message_id in self._guild_message_ids.pop(guild_id, frozenset()):
+            del self._role_ids[(guild_id, message_id)]
+        message_ids: set[int] = set()
+        for reaction_role in reaction_roles:
+            role_ids = self._role_ids.setdefault((guild_id, reaction_role.message_id), {})
+            role_ids[reaction_role.emoji] = reaction_role.role_id
+            message_ids.add(reaction_role.message_id)
+        self._guild_message_ids[guild_id] = frozenset(message_ids)
+        return self._guild_message_ids[guild_id]
+
+    def get_role_id(self, guild_id: int, message_id: int, emoji: str) -> int | None:
+        """Return the role given by reacting to the message with the emoji"""
+        role_ids: dict[str, int] | None = self._role_ids.get((guild_id, message_id))
+        return role_ids.get(emoji) if role_ids is not None else None
+
+    def clear(self) -> None:
+        """Drop the reaction roles of every guild"""
+        self._role_ids.clear()
+        self._guild_message_ids.clear()
+
+
+REACTION_ROLES: ReactionRoleIndex = ReactionRoleIndex()
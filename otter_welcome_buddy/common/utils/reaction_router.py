@@ -0,0 +1,117 @@
+import logging
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Iterable
+from typing import Any
+
+import discord
+
+
+logger = logging.getLogger(__name__)
+
+ReactionHandler = Callable[[discord.RawReactionActionEvent], Coroutine[Any, Any, None]]
+
+
+class ReactionRouter:
+    """
+    Index of the messages watched by the features of the bot, keyed by (guild_id, message_id).
+
+    The features register their handler once, and update the messages they watch per guild
+    whenever their config changes, so a reaction on any other message is dropped after a
+    single dict lookup.
+
+    A feature can also handle the reactions on every message of the guilds where it doesn't
+    watch any message yet, which are the guilds it was never configured in.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[tuple[int, int], tuple[str, ...]] = {}
+        self._watched_messages: dict[str, dict[int, frozenset[int]]] = {}
+        self._handlers: dict[str, ReactionHandler] = {}
+        self._unconfigured_guild_features: set[str] = set()
+
+    def register(
+        self,
+        feature: str,
+        handler: ReactionHandler,
+        handle_unconfigured_guilds: bool = False,
+    ) -> None:
+        """Register the handler of a feature, replacing the previous one"""
+        self._handlers[feature] = handler
+        if handle_unconfigured_guilds:
+            self._unconfigured_guild_features.add(feature)
+        else:
+            self._unconfigured_guild_features.discard(feature)
+
+    def watch(self, feature: str, guild_id: int, message_ids: Iterable[int]) -> None:
+        """Replace the messages watched by a feature in a guild, updating only what changed"""
+        guild_messages = self._watched_messages.setdefault(feature, {})
+        previous_message_ids: frozenset[int] = guild_messages.get(guild_id, frozenset())
+        new_message_ids: frozenset[int] = frozenset(message_ids)
+        guild_messages[guild_id] = new_message_ids
+
+        for message_id in previous_message_ids - new_message_ids:
+            key = (guild_id, message_id)
+            features = tuple(
+                watching_feature
+                for watching_feature in self._index.get(key, ())
+                if watching_feature != feature
+            )
+            if features:
+                self._index[key] = features
+            else:
+                self._index.pop(key, None)
+        for message_id in new_message_ids - previous_message_ids:
+            key = (guild_id, message_id)
+            self._index[key] = (*self._index.get(key, ()), feature)
+
+    def unwatch(self, feature: str, guild_id: int) -> None:
+        """Forget a guild for a feature, leaving it as a guild where it was never configured"""
+        guild_messages = self._watched_messages.get(feature, {})
+        if guild_id in guild_messages:
+            self.watch(feature, guild_id, ())
+            del guild_messages[guild_id]
+
+    def reset(self, feature: str, watched_messages: dict[int, Iterable[int]]) -> None:
+        """Replace all the messages watched by a feature, forgetting the guilds not given"""
+        guild_messages = self._watched_messages.setdefault(feature, {})
+        for guild_id in set(guild_messages) - set(watched_messages):
+            self.unwatch(feature, guild_id)
+        for guild_id, message_ids in watched_messages.items():
+            self.watch(feature, guild_id, message_ids)
+
+    def get_watched_messages(self, feature: str) -> dict[int, frozenset[int]]:
+        """Return the messages watched by a feature, by guild"""
+        return dict(self._watched_messages.get(feature, {}))
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Stop watching the messages of a guild for every feature"""
+        for feature in self._watched_messages:
+            self.unwatch(feature, guild_id)
+
+    def route(self, guild_id: int, message_id: int) -> list[ReactionHandler]:
+        """Return the handlers of the features interested in a reaction on the message"""
+        features: Iterable[str] = self._index.get((guild_id, message_id), ())
+        if self._unconfigured_guild_features:
+            features = (
+                *features,
+                *(
+                    feature
+                    for feature in self._unconfigured_guild_features
+                    if guild_id not in self._watched_messages.get(feature, {})
+                ),
+            )
+        return [self._handlers[feature] for feature in features if feature in self._handlers]
+
+    async def dispatch(self, payload: discord.RawReactionActionEvent) -> None:
+        """Run the handlers interested in the reaction, an error in one doesn't stop the rest"""
+        if payload.guild_id is None:
+            return
+        for handler in self.route(payload.guild_id, payload.message_id):
+            try:
+                await handler(payload)
+            except Exception:
+                logger.exception("Error while handling the reaction in %s", __name__)
+
+
+REACTION_ROUTER: ReactionRouter = ReactionRouter()
@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+import discord
+
+from otter_welcome_buddy.common.utils.member_cache import MEMBER_CACHE
+
+
+logger = logging.getLogger(__name__)
+
+# Discord limits the role changes per guild, a couple of grants in flight keep the queue
+# moving without hitting the limit on every burst of reactions
+_ROLE_GRANT_MAX_CONCURRENCY: int = 2
+_ROLE_GRANT_MAX_RETRIES: int = 3
+_ROLE_GRANT_RETRY_DELAY: float = 1.0
+_RATE_LIMITED_STATUS: int = 429
+
+
+@dataclass(frozen=True)
+class RoleGrantStats:
+    """
+    Snapshot of the counters of the role grant queue.
+
+    Attributes:
+        queue_depth (int):          Grants waiting for a worker
+        deferred (int):             Grants waiting for the rate limit of their guild to be over
+        in_flight (int):            Grants being sent to discord
+        granted (int):              Roles given or removed
+        skipped (int):              Requests for members that already had the role, or lacked
+                                    the role to remove
+        deduplicated (int):         Requests for a member and role with a grant already pending
+        retries (int):              Grants sent again after being rate limited
+        failed (int):               Grants given up on
+        average_latency (float):    Mean seconds from the request to the role being changed
+        max_latency (float):        Slowest seconds from the request to the role being changed
+    """
+
+    queue_depth: int
+    deferred: int
+    in_flight: int
+    granted: int
+    skipped: int
+    deduplicated: int
+    retries: int
+    failed: int
+    average_latency: float
+    max_latency: float
+
+
+@dataclass
+class _PendingGrant:
+    member: discord.Member
+    role: discord.Role
+    revoke: bool
+    requested_at: float
+    attempts: int = 0
+
+
+class RoleGrantQueue:
+    """
+    Queue that gives (or removes) roles to members with a bounded number of requests in flight.
+
+    The members that already hold the role are skipped using the roles cached by discord.py,
+    and a member can have a single pending grant per role, the last request deciding whether
+    the role is given or removed, so a burst of reactions turns into one request per member.
+    The grants of a rate limited guild are set aside until discord allows it again, leaving
+    the workers free for the grants of the other guilds.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = _ROLE_GRANT_MAX_CONCURRENCY,
+        max_retries: int = _ROLE_GRANT_MAX_RETRIES,
+        retry_delay: float = _ROLE_GRANT_RETRY_DELAY,
+    ) -> None:
+        self.max_concurrency: int = max_concurrency
+        self.max_retries: int = max_retries
+        self.retry_delay: float = retry_delay
+        self._pending: dict[tuple[int, int, int], _PendingGrant] = {}
+        self._queue: asyncio.Queue[tuple[int, int, int]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._guild_resume_at: dict[int, float] = {}
+        self._deferred: dict[int, list[tuple[int, int, int]]] = {}
+        self._resume_handles: dict[int, asyncio.TimerHandle] = {}
+        self._resumed: asyncio.Event = asyncio.Event()
+        self._in_flight: int = 0
+        self._granted: int = 0
+        self._skipped: int = 0
+        self._deduplicated: int = 0
+        self._retries: int = 0
+        self._failed: int = 0
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    def submit(self, member: discord.Member, role: discord.Role, revoke: bool = False) -> bool:
+        """
+        Request the role for the member, or its removal when revoke is set, returning whether
+        a new grant was queued
+        """
+        key = (member.guild.id, member.id, role.id)
+        pending_grant: _PendingGrant | None = self._pending.get(key)
+        if pending_grant is not None:
+            pending_grant.revoke = revoke
+            self._deduplicated += 1
+            return False
+        if (member.get_role(role.id) is None) is revoke:
+            self._skipped += 1
+            return False
+
+        queue = self._ensure_workers()
+        self._pending[key] = _PendingGrant(
+            member=member,
+            role=role,
+            revoke=revoke,
+            requested_at=time.monotonic(),
+        )
+        queue.put_nowait(key)
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued grant is done"""
+        while self._queue is not None:
+            await self._queue.join()
+            if not self._deferred:
+                return
+            self._resumed.clear()
+            await self._resumed.wait()
+
+    async def close(self) -> None:
+        """Stop the workers, dropping the grants not sent yet"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        for handle in self._resume_handles.values():
+            handle.cancel()
+        self._resume_handles.clear()
+        self._deferred.clear()
+        self._workers.clear()
+        self._queue = None
+        self._pending.clear()
+        # Wake up the callers of join, nothing is left to wait for
+        self._resumed.set()
+
+    def stats(self) -> RoleGrantStats:
+        """Return a snapshot of the counters of the queue"""
+        return RoleGrantStats(
+            queue_depth=self._queue.qsize() if self._queue is not None else 0,
+            deferred=sum(len(keys) for keys in self._deferred.values()),
+            in_flight=self._in_flight,
+            granted=self._granted,
+            skipped=self._skipped,
+            deduplicated=self._deduplicated,
+            retries=self._retries,
+            failed=self._failed,
+            average_latency=self._total_latency / self._granted if self._granted else 0.0,
+            max_latency=self._max_latency,
+        )
+
+    def _ensure_workers(self) -> asyncio.Queue[tuple[int, int, int]]:
+        """Start the workers on the running loop the first time a grant is queued"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._resumed = asyncio.Event()
+            self._workers = [
+                asyncio.create_task(self._work(self._queue)) for _ in range(self.max_concurrency)
+            ]
+        return self._queue
+
+    async def _work(self, queue: asyncio.Queue[tuple[int, int, int]]) -> None:
+        while True:
+            key = await queue.get()
+            try:
+                pending_grant = self._pending.get(key)
+                if pending_grant is not None and not self._defer(key):
+                    self._in_flight += 1
+                    try:
+                        should_retry: bool = await self._grant(pending_grant)
+                    finally:
+                        self._in_flight -= 1
+                    if not should_retry:
+                        self._pending.pop(key, None)
+                    elif not self._defer(key):
+                        queue.put_nowait(key)
+            except Exception:
+                logger.exception("Error while granting the role in %s", __name__)
+                self._pending.pop(key, None)
+            finally:
+                queue.task_done()
+
+    async def _grant(self, pending_grant: _PendingGrant) -> bool:
+        """
+        Give or remove the role, returning whether it has to be sent again once the rate limit
+        of the guild is over
+        """
+        member = pending_grant.member
+        guild_id: int = member.guild.id
+        # The role could change some other way while the grant was queued
+        if (member.get_role(pending_grant.role.id) is None) is pending_grant.revoke:
+            self._skipped += 1
+            return False
+        try:
+            if pending_grant.revoke:
+                await member.remove_roles(pending_grant.role)
+            else:
+                await member.add_roles(pending_grant.role)
+        except discord.Forbidden:
+            logger.error("Not permissions to change the role in %s", __name__)
+        except discord.RateLimited as ex:
+            self._pause_guild(guild_id, ex.retry_after)
+            return self._should_retry(pending_grant)
+        except discord.HTTPException as ex:
+            if ex.status == _RATE_LIMITED_STATUS or ex.status >= 500:
+                self._pause_guild(guild_id, self.retry_delay * 2**pending_grant.attempts)
+                return self._should_retry(pending_grant)
+            logger.error("Changing roles failed in %s", __name__)
+        else:
+            # The cached member still has the roles it had before the change
+            MEMBER_CACHE.discard(guild_id, member.id)
+            latency: float = time.monotonic() - pending_grant.requested_at
+            self._granted += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            return False
+
+        self._give_up(pending_grant)
+        return False
+
+    def _should_retry(self, pending_grant: _PendingGrant) -> bool:
+        """Count a new attempt of the grant, giving up once the retries are exhausted"""
+        if pending_grant.attempts >= self.max_retries:
+            self._give_up(pending_grant)
+            return False
+        pending_grant.attempts += 1
+        self._retries += 1
+        return True
+
+    def _give_up(self, pending_grant: _PendingGrant) -> None:
+        self._failed += 1
+        logger.warning(
+            "Giving up on changing the role of %s in %s",
+            pending_grant.member.id,
+            pending_grant.member.guild.id,
+        )
+
+    def _defer(self, key: tuple[int, int, int]) -> bool:
+        """
+        Set the grant aside while its guild is rate limited, returning whether it was deferred.
+        The deferred grants of a guild are queued again when the limit is over.
+        """
+        guild_id: int = key[0]
+        resume_at: float | None = self._guild_resume_at.get(guild_id)
+        if resume_at is None:
+            return False
+        delay: float = resume_at - time.monotonic()
+        if delay <= 0:
+            del self._guild_resume_at[guild_id]
+            return False
+        self._deferred.setdefault(guild_id, []).append(key)
+        if guild_id not in self._resume_handles:
+            self._resume_handles[guild_id] = asyncio.get_running_loop().call_later(
+                delay,
+                self._resume_guild,
+                guild_id,
+            )
+        return True
+
+    def _resume_guild(self, guild_id: int) -> None:
+        """Queue again the grants deferred while the guild was rate limited"""
+        self._resume_handles.pop(guild_id, None)
+        keys: list[tuple[int, int, int]] = self._deferred.pop(guild_id, [])
+        if self._queue is not None:
+            for key in keys:
+                self._queue.put_nowait(key)
+        self._resumed.set()
+
+    def _pause_guild(self, guild_id: int, delay: float) -> None:
+        """Hold every grant of the guild until the delay given by discord is over"""
+        logger.warning("Role grants rate limited in %s, retrying in %.2fs", guild_id, delay)
+        self._guild_resume_at[guild_id] = max(
+            self._guild_resume_at.get(guild_id, 0.0),
+            time.monotonic() + delay,
+        )
+
+
+ROLE_GRANT_QUEUE: RoleGrantQueue = RoleGrantQueue()
@@ -0,0 +1,58 @@
+import discord
+
+from otter_welcome_buddy.common.constants import RoleClass
+
+
+class RoleResolver:
+    """
+    Index of the roles of every guild by name, and of the role ids of every role class.
+
+    A guild is indexed the first time one of its roles is resolved, and dropped whenever one
+    of its roles is created, updated or deleted, so the next lookup indexes it again.
+    """
+
+    def __init__(self) -> None:
+        self._roles_by_name: dict[int, dict[str, discord.Role]] = {}
+        self._role_class_ids: dict[int, dict[RoleClass, frozenset[int]]] = {}
+
+    def _index_guild(self, guild: discord.Guild) -> dict[str, discord.Role]:
+        """Index the roles of the guild, keeping the first one when several share a name"""
+        roles_by_name: dict[str, discord.Role] = {}
+        for role in guild.roles:
+            roles_by_name.setdefault(role.name, role)
+        self._roles_by_name[guild.id] = roles_by_name
+        self._role_class_ids[guild.id] = {
+            role_class: frozenset(role.id for role in guild.roles if role.name in role_class.value)
+            for role_class in RoleClass
+        }
+        return roles_by_name
+
+    def get_role(self, guild: discord.Guild, name: str) -> discord.Role | None:
+        """Return the role of the guild with the given name"""
+        roles_by_name = self._roles_by_name.get(guild.id)
+        if roles_by_name is None:
+            roles_by_name = self._index_guild(guild)
+        return roles_by_name.get(name)
+
+    def get_role_class_ids(self, guild: discord.Guild, role_class: RoleClass) -> frozenset[int]:
+        """Return the ids of the roles of the guild that belong to the role class"""
+        role_class_ids = self._role_class_ids.get(guild.id)
+        if role_class_ids is None:
+            self._index_guild(guild)
+            role_class_ids = self._role_class_ids[guild.id]
+        return role_class_ids[role_class]
+
+    def has_role_class(self, member: discord.Member, role_class: RoleClass) -> bool:
+        """Whether the member has any of the roles of the role class"""
+        return any(
+            member.get_role(role_id) is not None
+            for role_id in self.get_role_class_ids(member.guild, role_class)
+        )
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drop the index of a guild, it is built again on the next lookup"""
+        self._roles_by_name.pop(guild_id, None)
+        self._role_class_ids.pop(guild_id, None)
+
+
+ROLE_RESOLVER: RoleResolver = RoleResolver()
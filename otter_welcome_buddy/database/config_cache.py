@@ -0,0 +1,318 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+from mongoengine import Document
+from pymongo.errors import ConnectionFailure
+
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.config_replica import is_config_replica_enabled
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=Document)
+V = TypeVar("V")
+
+_DEFAULT_MAX_SIZE: int = 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of the counters of a config cache.
+
+    Attributes:
+        hits (int):         Reads served from memory
+        misses (int):       Reads that needed a round trip to the database
+        evictions (int):    Entries dropped because the cache was full
+        size (int):         Entries currently stored
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+@dataclass
+class _CacheCounters:
+    """Counters of a config cache, updated while holding its lock"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # Bumped on every write so a slow read doesn't overwrite a newer value
+    version: int = 0
+
+    def reset_stats(self) -> None:
+        """Reset the counters reported by the stats, the version keeps increasing"""
+        self.hits = self.misses = self.evictions = 0
+
+
+class ConfigCache(Generic[T]):
+    """
+    Read-through LRU cache of guild configs keyed by guild id.
+
+    The absence of a config is cached too, so guilds without the feature configured don't hit
+    the database on every read. The handlers keep it up to date on every write, and the result
+    of reading the whole collection is kept as a snapshot while it fits in the cache.
+
+    When a replica is given, every write is copied to it and the reads fall back to it while
+    the database is unreachable.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        replica: ConfigReplica[T] | None = None,
+        max_size: int = _DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.name: str = name
+        self.max_size: int = max_size
+        self._replica: ConfigReplica[T] | None = replica
+        self._entries: OrderedDict[int, T | None] = OrderedDict()
+        self._snapshot: dict[int, T] | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: _CacheCounters = _CacheCounters()
+        _CONFIG_CACHES[name] = self
+
+    def get(self, guild_id: int, loader: Callable[[int], T | None]) -> T | None:
+        """Return the config of the guild, calling the loader only when it is not cached"""
+        with self._lock:
+            if guild_id in self._entries:
+                self._entries.move_to_end(guild_id)
+                self._counters.hits += 1
+                return self._entries[guild_id]
+            if self._snapshot is not None:
+                self._counters.hits += 1
+                value: T | None = self._snapshot.get(guild_id)
+                self._store(guild_id, value)
+                return value
+            self._counters.misses += 1
+            version: int = self._counters.version
+
+        try:
+            value = loader(guild_id)
+        except ConnectionFailure as ex:
+            if self._replica is None or not is_config_replica_enabled():
+                raise
+            logger.warning(
+                "Reading the %s of %s from the local replica: %s",
+                self.name,
+                guild_id,
+                ex,
+            )
+            return self._replica.get(guild_id)
+        with self._lock:
+            if version == self._counters.version:
+                self._store(guild_id, value)
+        return value
+
+    def get_all(self, loader: Callable[[], list[T]]) -> list[T]:
+        """Return all the configs, calling the loader only when there is no snapshot"""
+        with self._lock:
+            if self._snapshot is not None:
+                self._counters.hits += 1
+                return list(self._snapshot.values())
+            self._counters.misses += 1
+            version: int = self._counters.version
+
+        try:
+            values: list[T] = loader()
+        except ConnectionFailure as ex:
+            if self._replica is None:
+                raise
+            replica_values: list[T] | None = self._replica.get_all()
+            if replica_values is None:
+                raise
+            logger.warning("Reading all the %s from the local replica: %s", self.name, ex)
+            return replica_values
+        if self._replica is not None:
+            self._replica.store_all(values)
+        with self._lock:
+            if version == self._counters.version:
+                self._store_snapshot(values)
+        return values
+
+    def get_all_views(
+        self,
+        loader: Callable[[], list[V]],
+        to_view: Callable[[T], V],
+    ) -> list[V]:
+        """
+        Return a read-only view of all the configs. They are built from the snapshot when
+        there is one, otherwise the loader is expected to read them with a projection.
+        Nothing is stored, the views are cheaper to read again than keeping documents around.
+        """
+        with self._lock:
+            snapshot: list[T] | None = (
+                list(self._snapshot.values()) if self._snapshot is not None else None
+            )
+            if snapshot is not None:
+                self._counters.hits += 1
+            else:
+                self._counters.misses += 1
+        if snapshot is not None:
+            return [to_view(value) for value in snapshot]
+
+        try:
+            return loader()
+        except ConnectionFailure as ex:
+            if self._replica is None:
+                raise
+            replica_values: list[T] | None = self._replica.get_all()
+            if replica_values is None:
+                raise
+            logger.warning("Reading all the %s from the local replica: %s", self.name, ex)
+            return [to_view(value) for value in replica_values]
+
+    def refresh(self, loader: Callable[[], list[T]]) -> list[T]:
+        """Read all the configs with the loader, replacing the cached ones and the replica"""
+        values: list[T] = loader()
+        if self._replica is not None:
+            self._replica.store_all(values)
+        with self._lock:
+            self._counters.version += 1
+            self._entries.clear()
+            self._snapshot = None
+            self._store_snapshot(values)
+        return values
+
+    def warm(self) -> bool:
+        """Load the snapshot from the replica, returning whether it was ever synced"""
+        if self._replica is None:
+            return False
+        values: list[T] | None = self._replica.get_all()
+        if values is None:
+            return False
+        with self._lock:
+            self._counters.version += 1
+            self._store_snapshot(values)
+        return True
+
+    def put(self, guild_id: int, value: T | None) -> None:
+        """Store the latest version of the config of a guild, None meaning it doesn't exist"""
+        if self._replica is not None:
+            self._replica.store(guild_id, value)
+        with self._lock:
+            self._counters.version += 1
+            self._store(guild_id, value)
+            if self._snapshot is not None:
+                if value is None:
+                    self._snapshot.pop(guild_id, None)  # type: ignore[arg-type]
+                else:
+                    self._snapshot[guild_id] = value
+                if len(self._snapshot) > self.max_size:
+                    self._snapshot = None
+
+    def write_through(self, document: T, writer: Callable[[T], T]) -> T:
+        """Write the config with the writer and keep the cache in sync with the result"""
+        guild_id: int | None = get_document_id(document)
+        try:
+            document = writer(document)
+        except Exception:
+            # The document could have been modified in place before failing
+            if guild_id is not None:
+                self.invalidate(guild_id)
+            raise
+        if guild_id is not None:
+            self.put(guild_id, document)
+        return document
+
+    def update(self, guild_id: int, writer: Callable[[], T | None]) -> T | None:
+        """Run a write on the config of a guild and store the resulting version"""
+        try:
+            value: T | None = writer()
+        except Exception:
+            self.invalidate(guild_id)
+            raise
+        self.put(guild_id, value)
+        return value
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drop any knowledge about the config of a guild"""
+        with self._lock:
+            self._counters.version += 1
+            self._entries.pop(guild_id, None)
+            self._snapshot = None
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the counters"""
+        with self._lock:
+            self._counters.version += 1
+            self._entries.clear()
+            self._snapshot = None
+            self._counters.reset_stats()
+
+    def stats(self) -> CacheStats:
+        """Return the counters of the cache"""
+        with self._lock:
+            return CacheStats(
+                hits=self._counters.hits,
+                misses=self._counters.misses,
+                evictions=self._counters.evictions,
+                size=len(self._entries),
+            )
+
+    def _store_snapshot(self, values: list[T]) -> None:
+        """Keep the whole collection in memory if it fits in the cache"""
+        if len(values) > self.max_size:
+            return
+        self._snapshot = {}
+        self._entries.clear()
+        for value in values:
+            guild_id: int | None = get_document_id(value)
+            if guild_id is not None:
+                self._snapshot[guild_id] = value
+                self._store(guild_id, value)
+
+    def _store(self, guild_id: int, value: T | None) -> None:
+        """Insert the entry as the most recently used, evicting the oldest one if full"""
+        self._entries[guild_id] = value
+        self._entries.move_to_end(guild_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._counters.evictions += 1
+
+
+_CONFIG_CACHES: dict[str, ConfigCache] = {}
+
+
+def get_document_id(document: Document) -> int | None:
+    """Return the primary key of the document without dereferencing any reference field"""
+    document_id = document.to_mongo().get("_id")
+    return int(document_id) if document_id is not None else None
+
+
+def invalidate_guild_configs(guild_id: int) -> None:
+    """Drop the configs of a guild from every cache, e.g. when the guild is removed"""
+    for config_cache in _CONFIG_CACHES.values():
+        config_cache.invalidate(guild_id)
+
+
+def remove_guild_configs(guild_id: int) -> None:
+    """Mark the configs of a guild as deleted in every cache and replica"""
+    for config_cache in _CONFIG_CACHES.values():
+        config_cache.put(guild_id, None)
+
+
+def warm_config_caches() -> None:
+    """Load every cache from its replica, so the first reads don't wait on the database"""
+    for config_cache in _CONFIG_CACHES.values():
+        if config_cache.warm():
+            logger.info("Loaded the %s from the local replica", config_cache.name)
+
+
+def clear_config_caches() -> None:
+    """Drop the entries of every cache"""
+    for config_cache in _CONFIG_CACHES.values():
+        config_cache.clear()
+
+
+def get_config_cache_stats() -> dict[str, CacheStats]:
+    """Return the counters of every cache by its name"""
+    return {name: config_cache.stats() for name, config_cache in _CONFIG_CACHES.items()}
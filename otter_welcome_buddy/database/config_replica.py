@@ -0,0 +1,158 @@
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from mongoengine import Document
+from sqlalchemy import delete
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from otter_welcome_buddy.database.dbconn import cache_session_scope
+from otter_welcome_buddy.database.models.cache.replica_sync_cache_model import ReplicaSyncCacheModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=Document)
+
+
+class _ReplicaSettings:
+    """Holds the path of the SQLite database that keeps the replicas, None while disabled"""
+
+    db_path: str | None = None
+
+
+class ConfigReplica(Generic[T]):
+    """
+    Local copy of a Mongo collection in the SQLite cache, keyed by guild id.
+
+    The guild_id column of the cache model maps to the _id of the document and every other
+    column to the field with the same name. Errors of the local database are logged and never
+    reach the caller, the replica is only used to warm the caches and as a fallback for Mongo.
+    """
+
+    def __init__(self, name: str, document_type: type[T], cache_model: type[Any]) -> None:
+        self.name: str = name
+        self.document_type: type[T] = document_type
+        self.cache_model: type[Any] = cache_model
+        self._columns: list[str] = [
+            column.name for column in cache_model.__table__.columns if column.name != "guild_id"
+        ]
+
+    def get(self, guild_id: int) -> T | None:
+        """Read the document of a guild, None if it is not in the replica"""
+        if _ReplicaSettings.db_path is None:
+            return None
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                row: Any = session.get(self.cache_model, guild_id)
+                return self._to_document(row) if row is not None else None
+        except SQLAlchemyError as ex:
+            logger.warning("Error while reading the %s replica: %s", self.name, ex)
+            return None
+
+    def get_all(self) -> list[T] | None:
+        """Read all the documents, None if the replica was never fully synced"""
+        if _ReplicaSettings.db_path is None:
+            return None
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                if session.get(ReplicaSyncCacheModel, self.name) is None:
+                    return None
+                rows: list[Any] = list(session.scalars(select(self.cache_model)))
+                return [self._to_document(row) for row in rows]
+        except SQLAlchemyError as ex:
+            logger.warning("Error while reading the %s replica: %s", self.name, ex)
+            return None
+
+    def store(self, guild_id: int, document: T | None) -> None:
+        """Write the latest version of the document of a guild, None meaning it doesn't exist"""
+        if _ReplicaSettings.db_path is None:
+            return
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                if document is None:
+                    session.execute(
+                        delete(self.cache_model).where(self.cache_model.guild_id == guild_id),
+                    )
+                else:
+                    session.merge(self._to_row(document))
+        except SQLAlchemyError as ex:
+            logger.warning("Error while writing the %s replica: %s", self.name, ex)
+
+    def store_many(self, documents: Iterable[T]) -> None:
+        """Write the latest version of several documents in a single transaction"""
+        if _ReplicaSettings.db_path is None:
+            return
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                for document in documents:
+                    session.merge(self._to_row(document))
+        except SQLAlchemyError as ex:
+            logger.warning("Error while writing the %s replica: %s", self.name, ex)
+
+    def remove_many(self, guild_ids: Iterable[int]) -> None:
+        """Delete the documents of several guilds in a single transaction"""
+        if _ReplicaSettings.db_path is None:
+            return
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                session.execute(
+                    delete(self.cache_model).where(self.cache_model.guild_id.in_(list(guild_ids))),
+                )
+        except SQLAlchemyError as ex:
+            logger.warning("Error while writing the %s replica: %s", self.name, ex)
+
+    def store_all(self, documents: Iterable[T]) -> None:
+        """Replace the content of the replica with the documents, marking it as synced"""
+        if _ReplicaSettings.db_path is None:
+            return
+        try:
+            with cache_session_scope(db_path=_ReplicaSettings.db_path) as session:
+                session.execute(delete(self.cache_model))
+                session.add_all([self._to_row(document) for document in documents])
+                session.merge(
+                    ReplicaSyncCacheModel(name=self.name, synced_at=datetime.now(timezone.utc)),
+                )
+        except SQLAlchemyError as ex:
+            logger.warning("Error while writing the %s replica: %s", self.name, ex)
+
+    def _to_row(self, document: T) -> Any:
+        """Build the row of the cache model from the stored representation of the document"""
+        son: dict[str, Any] = document.to_mongo().to_dict()
+        return self.cache_model(
+            guild_id=son["_id"],
+            **{column: son.get(column) for column in self._columns},
+        )
+
+    def _to_document(self, row: Any) -> T:
+        """Build the document from the row, leaving its references as not dereferenced"""
+        son: dict[str, Any] = {"_id": row.guild_id}
+        for column in self._columns:
+            value: Any = getattr(row, column)
+            if value is not None:
+                son[column] = value
+        document: T = self.document_type._from_son(  # pylint: disable=protected-access
+            son,
+            _auto_dereference=False,
+            created=False,
+        )
+        return document
+
+
+def enable_config_replicas(db_path: str) -> None:
+    """Start keeping the replicas in the SQLite database, its tables must already exist"""
+    _ReplicaSettings.db_path = db_path
+
+
+def disable_config_replicas() -> None:
+    """Stop reading and writing the replicas"""
+    _ReplicaSettings.db_path = None
+
+
+def is_config_replica_enabled() -> bool:
+    """Whether the replicas are being kept in the SQLite database"""
+    return _ReplicaSettings.db_path is not None
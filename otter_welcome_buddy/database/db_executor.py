@@ -0,0 +1,59 @@
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec
+from typing import TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# pymongo keeps its own connection pool, so a few threads are enough to hide the network
+# latency while keeping the pressure on the database bounded
+_DB_EXECUTOR_MAX_WORKERS: int = 4
+_DB_EXECUTOR_THREAD_PREFIX: str = "otter-db"
+
+
+class _DbExecutorHolder:
+    """Holds the executor shared by every database operation, created on the first one"""
+
+    executor: ThreadPoolExecutor | None = None
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Returns the executor used to run the blocking database operations, creating it if needed"""
+    if _DbExecutorHolder.executor is None:
+        _DbExecutorHolder.executor = ThreadPoolExecutor(
+            max_workers=_DB_EXECUTOR_MAX_WORKERS,
+            thread_name_prefix=_DB_EXECUTOR_THREAD_PREFIX,
+        )
+    return _DbExecutorHolder.executor
+
+
+def shutdown_db_executor(wait: bool = True) -> None:
+    """Shutdown the database executor, a new one is created on the next operation"""
+    executor: ThreadPoolExecutor | None = _DbExecutorHolder.executor
+    if executor is not None:
+        _DbExecutorHolder.executor = None
+        executor.shutdown(wait=wait)
+
+
+async def run_db_operation(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run a blocking database operation in the database executor so the event loop is free
+    to keep processing the gateway events while the round trip to the database is done.
+
+    Args:
+        func (Callable): The blocking function to execute, usually a Db*Handler method.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        T: The value returned by the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), functools.partial(func, *args, **kwargs))
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 from contextlib import contextmanager
 
 from sqlalchemy.orm import declarative_base
@@ -14,7 +15,7 @@ BaseModel = declarative_base()
 
 
 @contextmanager
-def cache_session_scope(db_path: str = DATA_FILE_PATH) -> Session:
+def cache_session_scope(db_path: str = DATA_FILE_PATH) -> Iterator[Session]:
     """
     Provide a transactional scope around a series of database operations.
 
@@ -1,8 +1,26 @@
 from mongoengine import DoesNotExist
 
+from otter_welcome_buddy.common.utils.database import upsert_document
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.cache.announcements_config_cache_model import (
+    AnnouncementsConfigCacheModel,
+)
 from otter_welcome_buddy.database.models.external.announcements_config_model import (
     AnnouncementsConfigModel,
 )
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+
+
+_announcements_config_cache: ConfigCache[AnnouncementsConfigModel] = ConfigCache(
+    "announcements_config",
+    replica=ConfigReplica(
+        "announcements_config",
+        AnnouncementsConfigModel,
+        AnnouncementsConfigCacheModel,
+    ),
+)
 
 
 class DbAnnouncementsConfigHandler:
@@ -13,6 +31,14 @@ class DbAnnouncementsConfigHandler:
         guild_id: int,
     ) -> AnnouncementsConfigModel | None:
         """Static method to get an announcement config by its guild_id"""
+        return _announcements_config_cache.get(
+            guild_id,
+            DbAnnouncementsConfigHandler._fetch_announcements_config,
+        )
+
+    @staticmethod
+    def _fetch_announcements_config(guild_id: int) -> AnnouncementsConfigModel | None:
+        """Static method to read the announcements config from the database"""
         try:
             announcements_config_model: AnnouncementsConfigModel = AnnouncementsConfigModel.objects(
                 guild=guild_id,
@@ -23,27 +49,95 @@ class DbAnnouncementsConfigHandler:
 
     @staticmethod
     def get_all_announcements_configs() -> list[AnnouncementsConfigModel]:
-        """Static method to get all the interview matches for a day"""
+        """Static method to get all the announcement configs"""
+        return _announcements_config_cache.get_all(
+            DbAnnouncementsConfigHandler._fetch_all_announcements_configs,
+        )
+
+    @staticmethod
+    def _fetch_all_announcements_configs() -> list[AnnouncementsConfigModel]:
+        """Static method to read all the announcement configs without dereferencing the guild"""
         announcements_config_models: list[AnnouncementsConfigModel] = list(
-            AnnouncementsConfigModel.objects(),
+            AnnouncementsConfigModel.objects().no_dereference(),
         )
         return announcements_config_models
 
+    @staticmethod
+    def refresh_announcements_configs() -> list[AnnouncementsConfigModel]:
+        """Static method to reload all the announcements configs into the cache and the replica"""
+        return _announcements_config_cache.refresh(
+            DbAnnouncementsConfigHandler._fetch_all_announcements_configs,
+        )
+
+    @staticmethod
+    def get_announcements_config_views() -> list[ChannelConfigView]:
+        """Static method to get a read-only view of all the announcements configs"""
+        return _announcements_config_cache.get_all_views(
+            DbAnnouncementsConfigHandler._fetch_announcements_config_views,
+            ChannelConfigView.from_document,
+        )
+
+    @staticmethod
+    def _fetch_announcements_config_views() -> list[ChannelConfigView]:
+        """Static method to read the announcements configs projected into read-only views"""
+        return [
+            ChannelConfigView.from_son(son)
+            for son in AnnouncementsConfigModel.objects().only("channel_id").as_pymongo()
+        ]
+
     @staticmethod
     def insert_announcements_config(
         announcements_config_model: AnnouncementsConfigModel,
     ) -> AnnouncementsConfigModel:
         """Static method to insert (or update) an announcement config record"""
-        announcements_config_model = announcements_config_model.save()
+        announcements_config_model = _announcements_config_cache.write_through(
+            announcements_config_model,
+            upsert_document,
+        )
         return announcements_config_model
 
     @staticmethod
     def delete_announcements_config(guild_id: int) -> None:
         """Static method to delete an announcement config record by a guild_id"""
-        announcements_config_model: AnnouncementsConfigModel | None = (
-            AnnouncementsConfigModel.objects(
-                guild=guild_id,
-            ).first()
+        AnnouncementsConfigModel.objects(guild=guild_id).delete()
+        _announcements_config_cache.put(guild_id, None)
+
+
+class AsyncDbAnnouncementsConfigHandler:
+    """Awaitable version of DbAnnouncementsConfigHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_announcements_config(guild_id: int) -> AnnouncementsConfigModel | None:
+        """Static method to get an announcement config by its guild_id"""
+        return await run_db_operation(
+            DbAnnouncementsConfigHandler.get_announcements_config,
+            guild_id=guild_id,
+        )
+
+    @staticmethod
+    async def get_all_announcements_configs() -> list[AnnouncementsConfigModel]:
+        """Static method to get all the announcement configs"""
+        return await run_db_operation(DbAnnouncementsConfigHandler.get_all_announcements_configs)
+
+    @staticmethod
+    async def get_announcements_config_views() -> list[ChannelConfigView]:
+        """Static method to get a read-only view of all the announcements configs"""
+        return await run_db_operation(DbAnnouncementsConfigHandler.get_announcements_config_views)
+
+    @staticmethod
+    async def insert_announcements_config(
+        announcements_config_model: AnnouncementsConfigModel,
+    ) -> AnnouncementsConfigModel:
+        """Static method to insert (or update) an announcement config record"""
+        return await run_db_operation(
+            DbAnnouncementsConfigHandler.insert_announcements_config,
+            announcements_config_model=announcements_config_model,
+        )
+
+    @staticmethod
+    async def delete_announcements_config(guild_id: int) -> None:
+        """Static method to delete an announcement config record by a guild_id"""
+        await run_db_operation(
+            DbAnnouncementsConfigHandler.delete_announcements_config,
+            guild_id=guild_id,
         )
-        if announcements_config_model:
-            announcements_config_model.delete()
@@ -1,6 +1,41 @@
+import logging
+from collections.abc import Collection
+from typing import Any
+
+from mongoengine import Document
 from mongoengine import DoesNotExist
+from pymongo import UpdateOne
+from pymongo.errors import ConnectionFailure
 
+from otter_welcome_buddy.common.utils.database import upsert_document
+from otter_welcome_buddy.database.config_cache import remove_guild_configs
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.config_replica import is_config_replica_enabled
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.cache.guild_cache_model import GuildCacheModel
+from otter_welcome_buddy.database.models.external.announcements_config_model import (
+    AnnouncementsConfigModel,
+)
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.leetcode_config_model import (
+    LeetcodeConfigModel,
+)
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.view.guild_overview_view import GuildOverviewView
+
+
+logger = logging.getLogger(__name__)
+
+_guild_replica: ConfigReplica[GuildModel] = ConfigReplica("guild", GuildModel, GuildCacheModel)
+
+# Every config uses the guild as its primary key, so each one is joined by _id
+_GUILD_OVERVIEW_CONFIGS: dict[str, type[Document]] = {
+    "announcements_config": AnnouncementsConfigModel,
+    "leetcode_config": LeetcodeConfigModel,
+    "interview_match": InterviewMatchModel,
+    "base_role_config": BaseRoleConfigModel,
+}
 
 
 class DbGuildHandler:
@@ -14,16 +49,140 @@ class DbGuildHandler:
             return guild_model
         except DoesNotExist:
             return None
+        except ConnectionFailure as ex:
+            if not is_config_replica_enabled():
+                raise
+            logger.warning("Reading the guild %s from the local replica: %s", guild_id, ex)
+            return _guild_replica.get(guild_id)
+
+    @staticmethod
+    def refresh_guilds() -> list[GuildModel]:
+        """Static method to reload all the guilds into the replica"""
+        guild_models: list[GuildModel] = list(GuildModel.objects())
+        _guild_replica.store_all(guild_models)
+        return guild_models
 
     @staticmethod
     def insert_guild(guild_model: GuildModel) -> GuildModel:
-        """Static method to insert a guild record"""
-        guild_model = guild_model.save()
+        """Static method to insert a guild record, doing nothing if it already exists"""
+        guild_model = upsert_document(guild_model)
+        _guild_replica.store(guild_model.guild_id, guild_model)
         return guild_model
 
     @staticmethod
     def delete_guild(guild_id: int) -> None:
-        """Static method to delete an interview match record by a guild_id"""
-        guild_model: GuildModel | None = GuildModel.objects(guild_id=guild_id).first()
-        if guild_model:
-            guild_model.delete()
+        """Static method to delete a guild record by its id"""
+        GuildModel.objects(guild_id=guild_id).delete()
+        _guild_replica.store(guild_id, None)
+        # The configs of the guild are removed in cascade
+        remove_guild_configs(guild_id)
+
+    @staticmethod
+    def get_existing_guild_ids(guild_ids: Collection[int]) -> set[int]:
+        """Static method to get which of the guild ids are stored, in a single query"""
+        existing_guild_ids: list[int] = GuildModel.objects(
+            guild_id__in=list(guild_ids),
+        ).scalar("guild_id")
+        return set(existing_guild_ids)
+
+    @staticmethod
+    def insert_guilds(guild_ids: Collection[int]) -> None:
+        """
+        Static method to insert several guild records in a single unordered bulk write, skipping
+        the ones that already exist, e.g. when a guild is inserted by a join event meanwhile
+        """
+        if not guild_ids:
+            return
+        GuildModel._get_collection().bulk_write(  # pylint: disable=protected-access
+            [
+                UpdateOne({"_id": guild_id}, {"$setOnInsert": {"_id": guild_id}}, upsert=True)
+                for guild_id in guild_ids
+            ],
+            ordered=False,
+        )
+        _guild_replica.store_many([GuildModel(guild_id=guild_id) for guild_id in guild_ids])
+
+    @staticmethod
+    def delete_guilds_not_in(guild_ids: Collection[int]) -> set[int]:
+        """Static method to delete the guild records not included in the ids, returning them"""
+        stale_guild_ids: set[int] = set(
+            GuildModel.objects(guild_id__nin=list(guild_ids)).scalar("guild_id"),
+        )
+        if not stale_guild_ids:
+            return stale_guild_ids
+        GuildModel.objects(guild_id__in=list(stale_guild_ids)).delete()
+        _guild_replica.remove_many(stale_guild_ids)
+        for guild_id in stale_guild_ids:
+            remove_guild_configs(guild_id)
+        return stale_guild_ids
+
+    @staticmethod
+    def get_guild_overview(guild_ids: Collection[int]) -> list[GuildOverviewView]:
+        """Static method to get the guilds with the config of every feature, in a single query"""
+        if not guild_ids:
+            return []
+        pipeline: list[dict[str, Any]] = []
+        for field_name, config_model in _GUILD_OVERVIEW_CONFIGS.items():
+            # pylint: disable-next=protected-access
+            collection_name: str = config_model._get_collection_name()
+            pipeline.append(
+                {
+                    "$lookup": {
+                        "from": collection_name,
+                        "localField": "_id",
+                        "foreignField": "_id",
+                        "as": field_name,
+                    },
+                },
+            )
+        pipeline.append(
+            {
+                "$project": {
+                    field_name: {"$arrayElemAt": [f"${field_name}", 0]}
+                    for field_name in _GUILD_OVERVIEW_CONFIGS
+                },
+            },
+        )
+        return [
+            GuildOverviewView.from_son(son)
+            for son in GuildModel.objects(guild_id__in=list(guild_ids)).aggregate(pipeline)
+        ]
+
+
+class AsyncDbGuildHandler:
+    """Awaitable version of DbGuildHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_guild(guild_id: int) -> GuildModel | None:
+        """Static method to get a guild by its id"""
+        return await run_db_operation(DbGuildHandler.get_guild, guild_id=guild_id)
+
+    @staticmethod
+    async def insert_guild(guild_model: GuildModel) -> GuildModel:
+        """Static method to insert a guild record, doing nothing if it already exists"""
+        return await run_db_operation(DbGuildHandler.insert_guild, guild_model=guild_model)
+
+    @staticmethod
+    async def delete_guild(guild_id: int) -> None:
+        """Static method to delete a guild record by its id"""
+        await run_db_operation(DbGuildHandler.delete_guild, guild_id=guild_id)
+
+    @staticmethod
+    async def get_existing_guild_ids(guild_ids: Collection[int]) -> set[int]:
+        """Static method to get which of the guild ids are stored, in a single query"""
+        return await run_db_operation(DbGuildHandler.get_existing_guild_ids, guild_ids=guild_ids)
+
+    @staticmethod
+    async def insert_guilds(guild_ids: Collection[int]) -> None:
+        """Static method to insert several guild records in a single bulk insert"""
+        await run_db_operation(DbGuildHandler.insert_guilds, guild_ids=guild_ids)
+
+    @staticmethod
+    async def delete_guilds_not_in(guild_ids: Collection[int]) -> set[int]:
+        """Static method to delete the guild records not included in the ids, returning them"""
+        return await run_db_operation(DbGuildHandler.delete_guilds_not_in, guild_ids=guild_ids)
+
+    @staticmethod
+    async def get_guild_overview(guild_ids: Collection[int]) -> list[GuildOverviewView]:
+        """Static method to get the guilds with the config of every feature, in a single query"""
+        return await run_db_operation(DbGuildHandler.get_guild_overview, guild_ids=guild_ids)
@@ -1,6 +1,22 @@
+from functools import partial
+
 from mongoengine import DoesNotExist
 
+from otter_welcome_buddy.common.utils.database import upsert_document
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.cache.interview_match_cache_model import (
+    InterviewMatchCacheModel,
+)
 from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
+
+
+_interview_match_cache: ConfigCache[InterviewMatchModel] = ConfigCache(
+    "interview_match",
+    replica=ConfigReplica("interview_match", InterviewMatchModel, InterviewMatchCacheModel),
+)
 
 
 class DbInterviewMatchHandler:
@@ -11,6 +27,11 @@ class DbInterviewMatchHandler:
         guild_id: int,
     ) -> InterviewMatchModel | None:
         """Static method to get an interview match by its guild_id"""
+        return _interview_match_cache.get(guild_id, DbInterviewMatchHandler._fetch_interview_match)
+
+    @staticmethod
+    def _fetch_interview_match(guild_id: int) -> InterviewMatchModel | None:
+        """Static method to read the interview match from the database"""
         try:
             interview_match_model: InterviewMatchModel = InterviewMatchModel.objects(
                 guild=guild_id,
@@ -24,22 +45,149 @@ class DbInterviewMatchHandler:
         weekday: int,
     ) -> list[InterviewMatchModel]:
         """Static method to get all the interview matches for a day"""
+        return [
+            interview_match_model
+            for interview_match_model in _interview_match_cache.get_all(
+                DbInterviewMatchHandler._fetch_all_interview_matches,
+            )
+            if interview_match_model.day_of_the_week == weekday
+        ]
+
+    @staticmethod
+    def _fetch_all_interview_matches() -> list[InterviewMatchModel]:
+        """Static method to read all the interview matches without dereferencing the guild"""
         interview_match_models: list[InterviewMatchModel] = list(
-            InterviewMatchModel.objects(day_of_the_week=weekday),
+            InterviewMatchModel.objects().no_dereference(),
         )
         return interview_match_models
 
+    @staticmethod
+    def refresh_interview_matches() -> list[InterviewMatchModel]:
+        """Static method to reload all the interview matches into the cache and the replica"""
+        return _interview_match_cache.refresh(DbInterviewMatchHandler._fetch_all_interview_matches)
+
+    @staticmethod
+    def get_day_interview_match_views(weekday: int) -> list[InterviewMatchView]:
+        """Static method to get a read-only view of all the interview matches for a day"""
+        return [
+            interview_match_view
+            for interview_match_view in _interview_match_cache.get_all_views(
+                partial(DbInterviewMatchHandler._fetch_day_interview_match_views, weekday),
+                InterviewMatchView.from_document,
+            )
+            if interview_match_view.day_of_the_week == weekday
+        ]
+
+    @staticmethod
+    def get_interview_match_views() -> list[InterviewMatchView]:
+        """Static method to get a read-only view of all the interview matches"""
+        return _interview_match_cache.get_all_views(
+            DbInterviewMatchHandler._fetch_interview_match_views,
+            InterviewMatchView.from_document,
+        )
+
+    @staticmethod
+    def _fetch_interview_match_views() -> list[InterviewMatchView]:
+        """Static method to read all the interview matches projected into read-only views"""
+        return [
+            InterviewMatchView.from_son(son) for son in InterviewMatchModel.objects().as_pymongo()
+        ]
+
+    @staticmethod
+    def _fetch_day_interview_match_views(weekday: int) -> list[InterviewMatchView]:
+        """Static method to read the interview matches of a day projected into read-only views"""
+        return [
+            InterviewMatchView.from_son(son)
+            for son in InterviewMatchModel.objects(day_of_the_week=weekday).as_pymongo()
+        ]
+
     @staticmethod
     def insert_interview_match(interview_match_model: InterviewMatchModel) -> InterviewMatchModel:
         """Static method to insert (or update) an interview match record"""
-        interview_match_model = interview_match_model.save()
+        interview_match_model = _interview_match_cache.write_through(
+            interview_match_model,
+            upsert_document,
+        )
+        return interview_match_model
+
+    @staticmethod
+    def update_interview_match_message(
+        guild_id: int,
+        message_id: int,
+    ) -> InterviewMatchModel | None:
+        """Static method to set the message of the activity without touching the rest of fields"""
+        interview_match_model: InterviewMatchModel | None = _interview_match_cache.update(
+            guild_id,
+            partial(
+                InterviewMatchModel.objects(guild=guild_id).modify,
+                new=True,
+                set__message_id=message_id,
+            ),
+        )
         return interview_match_model
 
     @staticmethod
     def delete_interview_match(guild_id: int) -> None:
         """Static method to delete an interview match record by a guild_id"""
-        interview_match_model: InterviewMatchModel | None = InterviewMatchModel.objects(
-            guild=guild_id,
-        ).first()
-        if interview_match_model:
-            interview_match_model.delete()
+        InterviewMatchModel.objects(guild=guild_id).delete()
+        _interview_match_cache.put(guild_id, None)
+
+
+class AsyncDbInterviewMatchHandler:
+    """Awaitable version of DbInterviewMatchHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_interview_match(guild_id: int) -> InterviewMatchModel | None:
+        """Static method to get an interview match by its guild_id"""
+        return await run_db_operation(
+            DbInterviewMatchHandler.get_interview_match,
+            guild_id=guild_id,
+        )
+
+    @staticmethod
+    async def get_day_interview_matches(weekday: int) -> list[InterviewMatchModel]:
+        """Static method to get all the interview matches for a day"""
+        return await run_db_operation(
+            DbInterviewMatchHandler.get_day_interview_matches,
+            weekday=weekday,
+        )
+
+    @staticmethod
+    async def get_day_interview_match_views(weekday: int) -> list[InterviewMatchView]:
+        """Static method to get a read-only view of all the interview matches for a day"""
+        return await run_db_operation(
+            DbInterviewMatchHandler.get_day_interview_match_views,
+            weekday=weekday,
+        )
+
+    @staticmethod
+    async def get_interview_match_views() -> list[InterviewMatchView]:
+        """Static method to get a read-only view of all the interview matches"""
+        return await run_db_operation(DbInterviewMatchHandler.get_interview_match_views)
+
+    @staticmethod
+    async def insert_interview_match(
+        interview_match_model: InterviewMatchModel,
+    ) -> InterviewMatchModel:
+        """Static method to insert (or update) an interview match record"""
+        return await run_db_operation(
+            DbInterviewMatchHandler.insert_interview_match,
+            interview_match_model=interview_match_model,
+        )
+
+    @staticmethod
+    async def update_interview_match_message(
+        guild_id: int,
+        message_id: int,
+    ) -> InterviewMatchModel | None:
+        """Static method to set the message of the activity without touching the rest of fields"""
+        return await run_db_operation(
+            DbInterviewMatchHandler.update_interview_match_message,
+            guild_id=guild_id,
+            message_id=message_id,
+        )
+
+    @staticmethod
+    async def delete_interview_match(guild_id: int) -> None:
+        """Static method to delete an interview match record by a guild_id"""
+        await run_db_operation(DbInterviewMatchHandler.delete_interview_match, guild_id=guild_id)
@@ -0,0 +1,214 @@
+from collections.abc import Collection
+
+from sqlalchemy import delete
+from sqlalchemy import select
+from sqlalchemy import update
+
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.dbconn import cache_session_scope
+from otter_welcome_buddy.database.models.cache.interview_match_participant_cache_model import (
+    InterviewMatchParticipantCacheModel,
+)
+from otter_welcome_buddy.database.models.cache.interview_match_tracking_cache_model import (
+    InterviewMatchTrackingCacheModel,
+)
+
+
+class DbInterviewMatchParticipantHandler:
+    """
+    Class to interact with the local tables interview_match_participant and
+    interview_match_tracking via static methods
+    """
+
+    @staticmethod
+    def start_tracking(guild_id: int, message_id: int) -> None:
+        """Static method to record the reactions of a new weekly message, forgetting the last one"""
+        with cache_session_scope() as session:
+            session.execute(
+                delete(InterviewMatchParticipantCacheModel).where(
+                    InterviewMatchParticipantCacheModel.guild_id == guild_id,  # type: ignore
+                    InterviewMatchParticipantCacheModel.message_id != message_id,  # type: ignore
+                ),
+            )
+            session.execute(
+                delete(InterviewMatchTrackingCacheModel).where(
+                    InterviewMatchTrackingCacheModel.guild_id == guild_id,  # type: ignore
+                ),
+            )
+            session.add(
+                InterviewMatchTrackingCacheModel(
+                    message_id=message_id,
+                    guild_id=guild_id,
+                    is_complete=True,
+                ),
+            )
+
+    @staticmethod
+    def stop_tracking(guild_id: int) -> None:
+        """Static method to forget the weekly message of a guild and its participants"""
+        with cache_session_scope() as session:
+            session.execute(
+                delete(InterviewMatchParticipantCacheModel).where(
+                    InterviewMatchParticipantCacheModel.guild_id == guild_id,  # type: ignore
+                ),
+            )
+            session.execute(
+                delete(InterviewMatchTrackingCacheModel).where(
+                    InterviewMatchTrackingCacheModel.guild_id == guild_id,  # type: ignore
+                ),
+            )
+
+    @staticmethod
+    def mark_tracking_incomplete() -> None:
+        """Static method to flag every weekly message as possibly missing reactions"""
+        with cache_session_scope() as session:
+            session.execute(update(InterviewMatchTrackingCacheModel).values(is_complete=False))
+
+    @staticmethod
+    def add_participant(guild_id: int, message_id: int, user_id: int) -> None:
+        """Static method to record a reaction to a weekly message"""
+        with cache_session_scope() as session:
+            session.merge(
+                InterviewMatchParticipantCacheModel(
+                    message_id=message_id,
+                    user_id=user_id,
+                    guild_id=guild_id,
+                ),
+            )
+
+    @staticmethod
+    def remove_participant(message_id: int, user_id: int) -> None:
+        """Static method to forget a reaction removed from a weekly message"""
+        with cache_session_scope() as session:
+            session.execute(
+                delete(InterviewMatchParticipantCacheModel).where(
+                    InterviewMatchParticipantCacheModel.message_id == message_id,  # type: ignore
+                    InterviewMatchParticipantCacheModel.user_id == user_id,  # type: ignore
+                ),
+            )
+
+    @staticmethod
+    def get_participant_ids(message_id: int) -> list[int] | None:
+        """
+        Static method to get the users that reacted to a weekly message, or None when its
+        reactions are not fully recorded
+        """
+        with cache_session_scope() as session:
+            tracking: InterviewMatchTrackingCacheModel | None = session.get(
+                InterviewMatchTrackingCacheModel,
+                message_id,
+            )
+            if tracking is None or not tracking.is_complete:
+                return None
+            user_ids: list[int] = list(
+                session.scalars(
+                    select(InterviewMatchParticipantCacheModel.user_id).where(
+                        InterviewMatchParticipantCacheModel.message_id  # type: ignore
+                        == message_id,
+                    ),
+                ),
+            )
+            return user_ids
+
+    @staticmethod
+    def replace_participants(guild_id: int, message_id: int, user_ids: Collection[int]) -> None:
+        """
+        Static method to store the users that reacted to a weekly message, read from discord,
+        marking its reactions as fully recorded
+        """
+        with cache_session_scope() as session:
+            session.execute(
+                delete(InterviewMatchParticipantCacheModel).where(
+                    InterviewMatchParticipantCacheModel.guild_id == guild_id,  # type: ignore
+                ),
+            )
+            session.execute(
+                delete(InterviewMatchTrackingCacheModel).where(
+                    InterviewMatchTrackingCacheModel.guild_id == guild_id,  # type: ignore
+                ),
+            )
+            session.add(
+                InterviewMatchTrackingCacheModel(
+                    message_id=message_id,
+                    guild_id=guild_id,
+                    is_complete=True,
+                ),
+            )
+            session.add_all(
+                InterviewMatchParticipantCacheModel(
+                    message_id=message_id,
+                    user_id=user_id,
+                    guild_id=guild_id,
+                )
+                for user_id in set(user_ids)
+            )
+
+
+class AsyncDbInterviewMatchParticipantHandler:
+    """Awaitable version of DbInterviewMatchParticipantHandler that runs in the database executor"""
+
+    @staticmethod
+    async def start_tracking(guild_id: int, message_id: int) -> None:
+        """Static method to record the reactions of a new weekly message, forgetting the last one"""
+        await run_db_operation(
+            DbInterviewMatchParticipantHandler.start_tracking,
+            guild_id=guild_id,
+            message_id=message_id,
+        )
+
+    @staticmethod
+    async def stop_tracking(guild_id: int) -> None:
+        """Static method to forget the weekly message of a guild and its participants"""
+        await run_db_operation(DbInterviewMatchParticipantHandler.stop_tracking, guild_id=guild_id)
+
+    @staticmethod
+    async def mark_tracking_incomplete() -> None:
+        """Static method to flag every weekly message as possibly missing reactions"""
+        await run_db_operation(DbInterviewMatchParticipantHandler.mark_tracking_incomplete)
+
+    @staticmethod
+    async def add_participant(guild_id: int, message_id: int, user_id: int) -> None:
+        """Static method to record a reaction to a weekly message"""
+        await run_db_operation(
+            DbInterviewMatchParticipantHandler.add_participant,
+            guild_id=guild_id,
+            message_id=message_id,
+            user_id=user_id,
+        )
+
+    @staticmethod
+    async def remove_participant(message_id: int, user_id: int) -> None:
+        """Static method to forget a reaction removed from a weekly message"""
+        await run_db_operation(
+            DbInterviewMatchParticipantHandler.remove_participant,
+            message_id=message_id,
+            user_id=user_id,
+        )
+
+    @staticmethod
+    async def get_participant_ids(message_id: int) -> list[int] | None:
+        """
+        Static method to get the users that reacted to a weekly message, or None when its
+        reactions are not fully recorded
+        """
+        return await run_db_operation(
+            DbInterviewMatchParticipantHandler.get_participant_ids,
+            message_id=message_id,
+        )
+
+    @staticmethod
+    async def replace_participants(
+        guild_id: int,
+        message_id: int,
+        user_ids: Collection[int],
+    ) -> None:
+        """
+        Static method to store the users that reacted to a weekly message, read from discord,
+        marking its reactions as fully recorded
+        """
+        await run_db_operation(
+            DbInterviewMatchParticipantHandler.replace_participants,
+            guild_id=guild_id,
+            message_id=message_id,
+            user_ids=user_ids,
+        )
@@ -1,8 +1,22 @@
 from mongoengine import DoesNotExist
 
+from otter_welcome_buddy.common.utils.database import upsert_document
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.cache.leetcode_config_cache_model import (
+    LeetcodeConfigCacheModel,
+)
 from otter_welcome_buddy.database.models.external.leetcode_config_model import (
     LeetcodeConfigModel,
 )
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+
+
+_leetcode_config_cache: ConfigCache[LeetcodeConfigModel] = ConfigCache(
+    "leetcode_config",
+    replica=ConfigReplica("leetcode_config", LeetcodeConfigModel, LeetcodeConfigCacheModel),
+)
 
 
 class DbLeetcodeConfigHandler:
@@ -13,6 +27,11 @@ class DbLeetcodeConfigHandler:
         guild_id: int,
     ) -> LeetcodeConfigModel | None:
         """Static method to get a leetcode config by its guild_id"""
+        return _leetcode_config_cache.get(guild_id, DbLeetcodeConfigHandler._fetch_leetcode_config)
+
+    @staticmethod
+    def _fetch_leetcode_config(guild_id: int) -> LeetcodeConfigModel | None:
+        """Static method to read the leetcode config from the database"""
         try:
             leetcode_config_model: LeetcodeConfigModel = LeetcodeConfigModel.objects(
                 guild=guild_id,
@@ -23,25 +42,88 @@ class DbLeetcodeConfigHandler:
 
     @staticmethod
     def get_all_leetcode_configs() -> list[LeetcodeConfigModel]:
-        """Static method to get all the interview matches for a day"""
+        """Static method to get all the leetcode configs"""
+        return _leetcode_config_cache.get_all(DbLeetcodeConfigHandler._fetch_all_leetcode_configs)
+
+    @staticmethod
+    def _fetch_all_leetcode_configs() -> list[LeetcodeConfigModel]:
+        """Static method to read all the leetcode configs without dereferencing the guild"""
         leetcode_config_models: list[LeetcodeConfigModel] = list(
-            LeetcodeConfigModel.objects(),
+            LeetcodeConfigModel.objects().no_dereference(),
         )
         return leetcode_config_models
 
+    @staticmethod
+    def refresh_leetcode_configs() -> list[LeetcodeConfigModel]:
+        """Static method to reload all the leetcode configs into the cache and the replica"""
+        return _leetcode_config_cache.refresh(DbLeetcodeConfigHandler._fetch_all_leetcode_configs)
+
+    @staticmethod
+    def get_leetcode_config_views() -> list[ChannelConfigView]:
+        """Static method to get a read-only view of all the leetcode configs"""
+        return _leetcode_config_cache.get_all_views(
+            DbLeetcodeConfigHandler._fetch_leetcode_config_views,
+            ChannelConfigView.from_document,
+        )
+
+    @staticmethod
+    def _fetch_leetcode_config_views() -> list[ChannelConfigView]:
+        """Static method to read the leetcode configs projected into read-only views"""
+        return [
+            ChannelConfigView.from_son(son)
+            for son in LeetcodeConfigModel.objects().only("channel_id").as_pymongo()
+        ]
+
     @staticmethod
     def insert_leetcode_config(
         leetcode_config_model: LeetcodeConfigModel,
     ) -> LeetcodeConfigModel:
         """Static method to insert (or update) a leetcode config record"""
-        leetcode_config_model = leetcode_config_model.save()
+        leetcode_config_model = _leetcode_config_cache.write_through(
+            leetcode_config_model,
+            upsert_document,
+        )
         return leetcode_config_model
 
     @staticmethod
     def delete_leetcode_config(guild_id: int) -> None:
         """Static method to delete a leetcode config record by a guild_id"""
-        leetcode_config_model: LeetcodeConfigModel | None = LeetcodeConfigModel.objects(
-            guild=guild_id,
-        ).first()
-        if leetcode_config_model:
-            leetcode_config_model.delete()
+        LeetcodeConfigModel.objects(guild=guild_id).delete()
+        _leetcode_config_cache.put(guild_id, None)
+
+
+class AsyncDbLeetcodeConfigHandler:
+    """Awaitable version of DbLeetcodeConfigHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_leetcode_config(guild_id: int) -> LeetcodeConfigModel | None:
+        """Static method to get a leetcode config by its guild_id"""
+        return await run_db_operation(
+            DbLeetcodeConfigHandler.get_leetcode_config,
+            guild_id=guild_id,
+        )
+
+    @staticmethod
+    async def get_all_leetcode_configs() -> list[LeetcodeConfigModel]:
+        """Static method to get all the leetcode configs"""
+        return await run_db_operation(DbLeetcodeConfigHandler.get_all_leetcode_configs)
+
+    @staticmethod
+    async def get_leetcode_config_views() -> list[ChannelConfigView]:
+        """Static method to get a read-only view of all the leetcode configs"""
+        return await run_db_operation(DbLeetcodeConfigHandler.get_leetcode_config_views)
+
+    @staticmethod
+    async def insert_leetcode_config(
+        leetcode_config_model: LeetcodeConfigModel,
+    ) -> LeetcodeConfigModel:
+        """Static method to insert (or update) a leetcode config record"""
+        return await run_db_operation(
+            DbLeetcodeConfigHandler.insert_leetcode_config,
+            leetcode_config_model=leetcode_config_model,
+        )
+
+    @staticmethod
+    async def delete_leetcode_config(guild_id: int) -> None:
+        """Static method to delete a leetcode config record by a guild_id"""
+        await run_db_operation(DbLeetcodeConfigHandler.delete_leetcode_config, guild_id=guild_id)
@@ -0,0 +1,40 @@
+from collections.abc import Collection
+
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.external.member_join_model import MemberJoinModel
+
+
+class DbMemberJoinHandler:
+    """Class to interact with the table member_join via static methods"""
+
+    @staticmethod
+    def get_member_joins(guild_id: int) -> list[MemberJoinModel]:
+        """Static method to get the joins of a guild ordered by time, without dereferencing it"""
+        member_join_models: list[MemberJoinModel] = list(
+            MemberJoinModel.objects(guild=guild_id).order_by("joined_at").no_dereference(),
+        )
+        return member_join_models
+
+    @staticmethod
+    def insert_member_joins(member_join_models: Collection[MemberJoinModel]) -> None:
+        """Static method to insert several member joins in a single bulk insert"""
+        if not member_join_models:
+            return
+        MemberJoinModel.objects.insert(list(member_join_models), load_bulk=False)
+
+
+class AsyncDbMemberJoinHandler:
+    """Awaitable version of DbMemberJoinHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_member_joins(guild_id: int) -> list[MemberJoinModel]:
+        """Static method to get the joins of a guild ordered by time, without dereferencing it"""
+        return await run_db_operation(DbMemberJoinHandler.get_member_joins, guild_id=guild_id)
+
+    @staticmethod
+    async def insert_member_joins(member_join_models: Collection[MemberJoinModel]) -> None:
+        """Static method to insert several member joins in a single bulk insert"""
+        await run_db_operation(
+            DbMemberJoinHandler.insert_member_joins,
+            member_join_models=member_join_models,
+        )
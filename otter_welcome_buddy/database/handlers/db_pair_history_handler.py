@@ -0,0 +1,122 @@
+import datetime
+from collections.abc import Collection
+
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.external.pair_history_model import PairHistoryModel
+
+
+def get_week_start(moment: datetime.datetime) -> datetime.datetime:
+    """Return the start of the week of a moment, monday at midnight in UTC"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return datetime.datetime.combine(
+        moment.date() - datetime.timedelta(days=moment.weekday()),
+        datetime.time(),
+    )
+
+
+class DbPairHistoryHandler:
+    """Class to interact with the table pair_history via static methods"""
+
+    @staticmethod
+    def get_recent_pairs(guild_id: int, weeks: int) -> dict[tuple[int, int], int]:
+        """
+        Static method to get the pairs of a guild made in the last weeks, with the weeks since
+        each pair last met (1 being the last pairs made)
+        """
+        week_start: datetime.datetime = get_week_start(datetime.datetime.utcnow())
+        recent_pairs: dict[tuple[int, int], int] = {}
+        for son in (
+            PairHistoryModel.objects(
+                guild=guild_id,
+                week__gt=week_start - datetime.timedelta(weeks=weeks),
+            )
+            .only("week", "member_a", "member_b")
+            .as_pymongo()
+        ):
+            key = (son["member_a"], son["member_b"])
+            weeks_ago: int = max((week_start - son["week"]).days // 7, 0) + 1
+            recent_pairs[key] = min(weeks_ago, recent_pairs.get(key, weeks_ago))
+        return recent_pairs
+
+    @staticmethod
+    def have_met(guild_id: int, member_id: int, other_member_id: int, weeks: int) -> bool:
+        """Static method to check if two members were paired in the last weeks"""
+        week_start: datetime.datetime = get_week_start(datetime.datetime.utcnow())
+        pair_history_son = (
+            PairHistoryModel.objects(
+                guild=guild_id,
+                member_a=min(member_id, other_member_id),
+                member_b=max(member_id, other_member_id),
+                week__gt=week_start - datetime.timedelta(weeks=weeks),
+            )
+            .only("week")
+            .exclude("id")
+            .as_pymongo()
+            .first()
+        )
+        return pair_history_son is not None
+
+    @staticmethod
+    def insert_pairs(
+        guild_id: int,
+        week: datetime.datetime,
+        pairs: Collection[tuple[int, int]],
+    ) -> None:
+        """Static method to store the pairs made in a week with a single bulk insert"""
+        if not pairs:
+            return
+        week_start: datetime.datetime = get_week_start(week)
+        PairHistoryModel.objects.insert(
+            [
+                PairHistoryModel(
+                    guild=guild_id,
+                    week=week_start,
+                    member_a=min(first, second),
+                    member_b=max(first, second),
+                )
+                for first, second in pairs
+            ],
+            load_bulk=False,
+        )
+
+
+class AsyncDbPairHistoryHandler:
+    """Awaitable version of DbPairHistoryHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_recent_pairs(guild_id: int, weeks: int) -> dict[tuple[int, int], int]:
+        """
+        Static method to get the pairs of a guild made in the last weeks, with the weeks since
+        each pair last met (1 being the last pairs made)
+        """
+        return await run_db_operation(
+            DbPairHistoryHandler.get_recent_pairs,
+            guild_id=guild_id,
+            weeks=weeks,
+        )
+
+    @staticmethod
+    async def have_met(guild_id: int, member_id: int, other_member_id: int, weeks: int) -> bool:
+        """Static method to check if two members were paired in the last weeks"""
+        return await run_db_operation(
+            DbPairHistoryHandler.have_met,
+            guild_id=guild_id,
+            member_id=member_id,
+            other_member_id=other_member_id,
+            weeks=weeks,
+        )
+
+    @staticmethod
+    async def insert_pairs(
+        guild_id: int,
+        week: datetime.datetime,
+        pairs: Collection[tuple[int, int]],
+    ) -> None:
+        """Static method to store the pairs made in a week with a single bulk insert"""
+        await run_db_operation(
+            DbPairHistoryHandler.insert_pairs,
+            guild_id=guild_id,
+            week=week,
+            pairs=pairs,
+        )
@@ -1,6 +1,29 @@
+from functools import partial
+
 from mongoengine import DoesNotExist
+from mongoengine import NotUniqueError
 
+from otter_welcome_buddy.common.utils.database import upsert_document
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.models.cache.role_config_cache_model import (
+    BaseRoleConfigCacheModel,
+)
 from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.external.role_config_model import ReactionRoleModel
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+
+
+_base_role_config_cache: ConfigCache[BaseRoleConfigModel] = ConfigCache(
+    "base_role_config",
+    replica=ConfigReplica("base_role_config", BaseRoleConfigModel, BaseRoleConfigCacheModel),
+)
+
+
+def _get_reaction_role_key(reaction_role_model: ReactionRoleModel) -> dict[str, int | str]:
+    """Return the fields that identify a reaction role within a config"""
+    return {"message_id": reaction_role_model.message_id, "emoji": reaction_role_model.emoji}
 
 
 class DbRoleConfigHandler:
@@ -11,6 +34,11 @@ class DbRoleConfigHandler:
         guild_id: int,
     ) -> BaseRoleConfigModel | None:
         """Static method to get the base role config by its guild_id"""
+        return _base_role_config_cache.get(guild_id, DbRoleConfigHandler._fetch_base_role_config)
+
+    @staticmethod
+    def _fetch_base_role_config(guild_id: int) -> BaseRoleConfigModel | None:
+        """Static method to read the base role config from the database"""
         try:
             base_role_config_model: BaseRoleConfigModel = BaseRoleConfigModel.objects(
                 guild=guild_id,
@@ -22,40 +50,284 @@ class DbRoleConfigHandler:
     @staticmethod
     def get_all_base_role_configs() -> list[BaseRoleConfigModel]:
         """Static method to get all the base role configs in the database"""
-        base_role_config_models: list[BaseRoleConfigModel] = list(BaseRoleConfigModel.objects())
+        return _base_role_config_cache.get_all(DbRoleConfigHandler._fetch_all_base_role_configs)
+
+    @staticmethod
+    def _fetch_all_base_role_configs() -> list[BaseRoleConfigModel]:
+        """Static method to read all the base role configs without dereferencing the guild"""
+        base_role_config_models: list[BaseRoleConfigModel] = list(
+            BaseRoleConfigModel.objects().no_dereference(),
+        )
         return base_role_config_models
 
+    @staticmethod
+    def refresh_base_role_configs() -> list[BaseRoleConfigModel]:
+        """Static method to reload all the base role configs into the cache and the replica"""
+        return _base_role_config_cache.refresh(DbRoleConfigHandler._fetch_all_base_role_configs)
+
+    @staticmethod
+    def get_base_role_config_views() -> list[BaseRoleConfigView]:
+        """Static method to get a read-only view of all the base role configs"""
+        return _base_role_config_cache.get_all_views(
+            DbRoleConfigHandler._fetch_base_role_config_views,
+            BaseRoleConfigView.from_document,
+        )
+
+    @staticmethod
+    def _fetch_base_role_config_views() -> list[BaseRoleConfigView]:
+        """Static method to read the base role configs projected into read-only views"""
+        return [
+            BaseRoleConfigView.from_son(son)
+            for son in BaseRoleConfigModel.objects()
+            .only("message_ids", "reaction_roles")
+            .as_pymongo()
+        ]
+
     @staticmethod
     def insert_base_role_config(base_role_config_model: BaseRoleConfigModel) -> BaseRoleConfigModel:
         """Static method to insert (or update) a base role config record"""
-        base_role_config_model = base_role_config_model.save()
+        base_role_config_model = _base_role_config_cache.write_through(
+            base_role_config_model,
+            upsert_document,
+        )
         return base_role_config_model
 
     @staticmethod
     def delete_base_role_config(guild_id: int) -> None:
         """Static method to delete a base role config record by a guild_id"""
+        BaseRoleConfigModel.objects(guild=guild_id).delete()
+        _base_role_config_cache.put(guild_id, None)
+
+    @staticmethod
+    def delete_welcome_messages(guild_id: int) -> BaseRoleConfigModel | None:
+        """
+        Static method to remove all the welcome messages of a guild, deleting the base role
+        config only when it has no reaction roles either
+        """
+        base_role_config_model: BaseRoleConfigModel | None = _base_role_config_cache.update(
+            guild_id,
+            partial(DbRoleConfigHandler._clear_welcome_messages, guild_id),
+        )
+        return base_role_config_model
+
+    @staticmethod
+    def _clear_welcome_messages(guild_id: int) -> BaseRoleConfigModel | None:
+        """Static method to empty the welcome messages and delete the config if nothing is left"""
         base_role_config_model: BaseRoleConfigModel | None = BaseRoleConfigModel.objects(
             guild=guild_id,
-        ).first()
-        if base_role_config_model:
-            base_role_config_model.delete()
+        ).modify(new=True, set__message_ids=[])
+        if base_role_config_model is None or base_role_config_model.reaction_roles:
+            return base_role_config_model
+        # A reaction role added meanwhile keeps the config
+        if BaseRoleConfigModel.objects(
+            guild=guild_id,
+            message_ids__size=0,
+            reaction_roles__size=0,
+        ).delete():
+            return None
+        return DbRoleConfigHandler._fetch_base_role_config(guild_id)
+
+    @staticmethod
+    def add_messages_to_base_role_config(
+        guild_id: int,
+        input_message_ids: list[int],
+    ) -> BaseRoleConfigModel | None:
+        """Static method to add messages to the base role config, creating it if needed"""
+        base_role_config_model: BaseRoleConfigModel | None = _base_role_config_cache.update(
+            guild_id,
+            partial(
+                BaseRoleConfigModel.objects(guild=guild_id).modify,
+                upsert=True,
+                new=True,
+                add_to_set__message_ids=input_message_ids,
+            ),
+        )
+        return base_role_config_model
 
     @staticmethod
     def delete_message_from_base_role_config(
         guild_id: int,
         input_message_id: int,
     ) -> BaseRoleConfigModel | None:
-        """Static method to delete a base role config record by a guild_id"""
+        """Static method to delete a message from the base role config of a guild"""
+        base_role_config_model: BaseRoleConfigModel | None = _base_role_config_cache.update(
+            guild_id,
+            partial(
+                BaseRoleConfigModel.objects(guild=guild_id).modify,
+                new=True,
+                pull__message_ids=input_message_id,
+            ),
+        )
+        return base_role_config_model
+
+    @staticmethod
+    def set_reaction_role(
+        guild_id: int,
+        reaction_role_model: ReactionRoleModel,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to set the role given by a reaction, replacing the previous one"""
+        return _base_role_config_cache.update(
+            guild_id,
+            partial(DbRoleConfigHandler._replace_reaction_role, guild_id, reaction_role_model),
+        )
+
+    @staticmethod
+    def _replace_reaction_role(
+        guild_id: int,
+        reaction_role_model: ReactionRoleModel,
+    ) -> BaseRoleConfigModel | None:
+        """
+        Static method to replace the reaction role with the same message and emoji, or add it
+        if there is none. Each step is a single update, so concurrent calls never duplicate it
+        """
+        base_role_config_model: BaseRoleConfigModel | None = (
+            DbRoleConfigHandler._update_reaction_role(guild_id, reaction_role_model)
+        )
+        if base_role_config_model is not None:
+            return base_role_config_model
+        try:
+            base_role_config_model = BaseRoleConfigModel.objects(
+                guild=guild_id,
+                __raw__={
+                    "reaction_roles": {
+                        "$not": {"$elemMatch": _get_reaction_role_key(reaction_role_model)},
+                    },
+                },
+            ).modify(upsert=True, new=True, push__reaction_roles=reaction_role_model)
+        except NotUniqueError:
+            # The config got the reaction role meanwhile, so the upsert tried to insert it again
+            base_role_config_model = DbRoleConfigHandler._update_reaction_role(
+                guild_id,
+                reaction_role_model,
+            )
+        return base_role_config_model
+
+    @staticmethod
+    def _update_reaction_role(
+        guild_id: int,
+        reaction_role_model: ReactionRoleModel,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to overwrite the reaction role with the same message and emoji, if any"""
         base_role_config_model: BaseRoleConfigModel | None = BaseRoleConfigModel.objects(
             guild=guild_id,
-        ).first()
+            __raw__={"reaction_roles": {"$elemMatch": _get_reaction_role_key(reaction_role_model)}},
+        ).modify(
+            new=True,
+            __raw__={"$set": {"reaction_roles.$": reaction_role_model.to_mongo().to_dict()}},
+        )
+        return base_role_config_model
 
-        if not base_role_config_model:
-            return None
+    @staticmethod
+    def delete_reaction_role(
+        guild_id: int,
+        message_id: int,
+        emoji: str | None = None,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to delete the reaction roles of a message, or only the one of an emoji"""
+        reaction_role_filter: dict[str, int | str] = {"message_id": message_id}
+        if emoji is not None:
+            reaction_role_filter["emoji"] = emoji
+        base_role_config_model: BaseRoleConfigModel | None = _base_role_config_cache.update(
+            guild_id,
+            partial(
+                BaseRoleConfigModel.objects(guild=guild_id).modify,
+                new=True,
+                __raw__={"$pull": {"reaction_roles": reaction_role_filter}},
+            ),
+        )
+        return base_role_config_model
 
-        base_role_config_model.message_ids = [
-            message_id
-            for message_id in base_role_config_model.message_ids
-            if message_id != input_message_id
-        ]
-        return DbRoleConfigHandler.insert_base_role_config(base_role_config_model)
+
+class AsyncDbRoleConfigHandler:
+    """Awaitable version of DbRoleConfigHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_base_role_config(guild_id: int) -> BaseRoleConfigModel | None:
+        """Static method to get the base role config by its guild_id"""
+        return await run_db_operation(DbRoleConfigHandler.get_base_role_config, guild_id=guild_id)
+
+    @staticmethod
+    async def get_all_base_role_configs() -> list[BaseRoleConfigModel]:
+        """Static method to get all the base role configs in the database"""
+        return await run_db_operation(DbRoleConfigHandler.get_all_base_role_configs)
+
+    @staticmethod
+    async def get_base_role_config_views() -> list[BaseRoleConfigView]:
+        """Static method to get a read-only view of all the base role configs"""
+        return await run_db_operation(DbRoleConfigHandler.get_base_role_config_views)
+
+    @staticmethod
+    async def insert_base_role_config(
+        base_role_config_model: BaseRoleConfigModel,
+    ) -> BaseRoleConfigModel:
+        """Static method to insert (or update) a base role config record"""
+        return await run_db_operation(
+            DbRoleConfigHandler.insert_base_role_config,
+            base_role_config_model=base_role_config_model,
+        )
+
+    @staticmethod
+    async def delete_base_role_config(guild_id: int) -> None:
+        """Static method to delete a base role config record by a guild_id"""
+        await run_db_operation(DbRoleConfigHandler.delete_base_role_config, guild_id=guild_id)
+
+    @staticmethod
+    async def delete_welcome_messages(guild_id: int) -> BaseRoleConfigModel | None:
+        """
+        Static method to remove all the welcome messages of a guild, deleting the base role
+        config only when it has no reaction roles either
+        """
+        return await run_db_operation(
+            DbRoleConfigHandler.delete_welcome_messages,
+            guild_id=guild_id,
+        )
+
+    @staticmethod
+    async def add_messages_to_base_role_config(
+        guild_id: int,
+        input_message_ids: list[int],
+    ) -> BaseRoleConfigModel | None:
+        """Static method to add messages to the base role config, creating it if needed"""
+        return await run_db_operation(
+            DbRoleConfigHandler.add_messages_to_base_role_config,
+            guild_id=guild_id,
+            input_message_ids=input_message_ids,
+        )
+
+    @staticmethod
+    async def delete_message_from_base_role_config(
+        guild_id: int,
+        input_message_id: int,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to delete a message from the base role config of a guild"""
+        return await run_db_operation(
+            DbRoleConfigHandler.delete_message_from_base_role_config,
+            guild_id=guild_id,
+            input_message_id=input_message_id,
+        )
+
+    @staticmethod
+    async def set_reaction_role(
+        guild_id: int,
+        reaction_role_model: ReactionRoleModel,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to set the role given by a reaction, replacing the previous one"""
+        return await run_db_operation(
+            DbRoleConfigHandler.set_reaction_role,
+            guild_id=guild_id,
+            reaction_role_model=reaction_role_model,
+        )
+
+    @staticmethod
+    async def delete_reaction_role(
+        guild_id: int,
+        message_id: int,
+        emoji: str | None = None,
+    ) -> BaseRoleConfigModel | None:
+        """Static method to delete the reaction roles of a message, or only the one of an emoji"""
+        return await run_db_operation(
+            DbRoleConfigHandler.delete_reaction_role,
+            guild_id=guild_id,
+            message_id=message_id,
+            emoji=emoji,
+        )
@@ -0,0 +1,77 @@
+from sqlalchemy import delete
+
+from otter_welcome_buddy.database.db_executor import run_db_operation
+from otter_welcome_buddy.database.dbconn import cache_session_scope
+from otter_welcome_buddy.database.models.cache.welcome_reconciliation_cache_model import (
+    WelcomeReconciliationCacheModel,
+)
+from otter_welcome_buddy.database.models.view.welcome_reconciliation_view import (
+    WelcomeReconciliationView,
+)
+
+
+class DbWelcomeReconciliationHandler:
+    """Class to interact with the local table welcome_reconciliation via static methods"""
+
+    @staticmethod
+    def get_checkpoint(message_id: int) -> WelcomeReconciliationView | None:
+        """Static method to get the progress of the reconciliation of a welcome message"""
+        with cache_session_scope() as session:
+            row: WelcomeReconciliationCacheModel | None = session.get(
+                WelcomeReconciliationCacheModel,
+                message_id,
+            )
+            return WelcomeReconciliationView.from_row(row) if row is not None else None
+
+    @staticmethod
+    def save_checkpoint(checkpoint: WelcomeReconciliationView) -> None:
+        """Static method to store the progress of the reconciliation of a welcome message"""
+        with cache_session_scope() as session:
+            session.merge(
+                WelcomeReconciliationCacheModel(
+                    message_id=checkpoint.message_id,
+                    guild_id=checkpoint.guild_id,
+                    channel_id=checkpoint.channel_id,
+                    emoji=checkpoint.emoji,
+                    last_user_id=checkpoint.last_user_id,
+                    done_emojis=list(checkpoint.done_emojis),
+                ),
+            )
+
+    @staticmethod
+    def delete_checkpoint(message_id: int) -> None:
+        """Static method to delete the progress of a welcome message fully reconciled"""
+        with cache_session_scope() as session:
+            session.execute(
+                delete(WelcomeReconciliationCacheModel).where(
+                    WelcomeReconciliationCacheModel.message_id == message_id,  # type: ignore
+                ),
+            )
+
+
+class AsyncDbWelcomeReconciliationHandler:
+    """Awaitable version of DbWelcomeReconciliationHandler that runs in the database executor"""
+
+    @staticmethod
+    async def get_checkpoint(message_id: int) -> WelcomeReconciliationView | None:
+        """Static method to get the progress of the reconciliation of a welcome message"""
+        return await run_db_operation(
+            DbWelcomeReconciliationHandler.get_checkpoint,
+            message_id=message_id,
+        )
+
+    @staticmethod
+    async def save_checkpoint(checkpoint: WelcomeReconciliationView) -> None:
+        """Static method to store the progress of the reconciliation of a welcome message"""
+        await run_db_operation(
+            DbWelcomeReconciliationHandler.save_checkpoint,
+            checkpoint=checkpoint,
+        )
+
+    @staticmethod
+    async def delete_checkpoint(message_id: int) -> None:
+        """Static method to delete the progress of a welcome message fully reconciled"""
+        await run_db_operation(
+            DbWelcomeReconciliationHandler.delete_checkpoint,
+            message_id=message_id,
+        )
@@ -0,0 +1,58 @@
+"""
+Maintenance commands of the database, using the MONGO_URI of the environment.
+
+Run them with:
+    poetry run python -m otter_welcome_buddy.database.migrations migrate
+    poetry run python -m otter_welcome_buddy.database.migrations indexes
+    poetry run python -m otter_welcome_buddy.database.migrations audit
+"""
+import argparse
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+from mongoengine import connect as mongo_connect
+from mongoengine import disconnect as mongo_disconnect
+
+from otter_welcome_buddy.database.migrations.audit import audit_queries
+from otter_welcome_buddy.database.migrations.runner import ensure_model_indexes
+from otter_welcome_buddy.database.migrations.runner import get_schema_version
+from otter_welcome_buddy.database.migrations.runner import run_migrations
+
+
+def main() -> int:
+    """Entry point of the maintenance commands, returns the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "command",
+        choices=["migrate", "indexes", "audit"],
+        help="migrate: apply the pending migrations and create the missing indexes, "
+        "indexes: only create the missing indexes, "
+        "audit: flag the handler queries that scan a whole collection",
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    mongo_connect(host=os.environ["MONGO_URI"])
+    try:
+        if args.command == "audit":
+            query_audits = audit_queries()
+            for query_audit in query_audits:
+                status = "COLLSCAN" if query_audit.is_collection_scan else "ok"
+                print(f"{status:<8} {query_audit.name}: {' <- '.join(query_audit.stages)}")
+            return 1 if any(query_audit.is_collection_scan for query_audit in query_audits) else 0
+
+        ensure_model_indexes()
+        if args.command == "migrate":
+            run_migrations(batch_size=args.batch_size)
+        print(f"Schema version: {get_schema_version()}")
+        return 0
+    finally:
+        mongo_disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import datetime
+import logging
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from mongoengine import QuerySet
+
+from otter_welcome_buddy.database.models.external.announcements_config_model import (
+    AnnouncementsConfigModel,
+)
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.leetcode_config_model import (
+    LeetcodeConfigModel,
+)
+from otter_welcome_buddy.database.models.external.member_join_model import MemberJoinModel
+from otter_welcome_buddy.database.models.external.pair_history_model import PairHistoryModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+
+
+logger = logging.getLogger(__name__)
+
+_COLLECTION_SCAN_STAGE: str = "COLLSCAN"
+_SAMPLE_ID: int = 0
+
+# The filtered queries issued by the handlers, the ones reading a whole collection scan it
+# on purpose and are left out
+AUDITED_QUERIES: dict[str, Callable[[], QuerySet]] = {
+    "DbGuildHandler.get_guild": lambda: GuildModel.objects(guild_id=_SAMPLE_ID),
+    "DbGuildHandler.get_existing_guild_ids": lambda: GuildModel.objects(
+        guild_id__in=[_SAMPLE_ID],
+    ),
+    "DbAnnouncementsConfigHandler.get_announcements_config": lambda: (
+        AnnouncementsConfigModel.objects(guild=_SAMPLE_ID)
+    ),
+    "DbLeetcodeConfigHandler.get_leetcode_config": lambda: LeetcodeConfigModel.objects(
+        guild=_SAMPLE_ID,
+    ),
+    "DbInterviewMatchHandler.get_interview_match": lambda: InterviewMatchModel.objects(
+        guild=_SAMPLE_ID,
+    ),
+    "DbInterviewMatchHandler.get_day_interview_match_views": lambda: InterviewMatchModel.objects(
+        day_of_the_week=_SAMPLE_ID,
+    ),
+    "DbMemberJoinHandler.get_member_joins": lambda: MemberJoinModel.objects(guild=_SAMPLE_ID),
+    "DbPairHistoryHandler.have_met": lambda: PairHistoryModel.objects(
+        guild=_SAMPLE_ID,
+        member_a=_SAMPLE_ID,
+        member_b=_SAMPLE_ID,
+        week__gt=datetime.datetime(1970, 1, 1),
+    ),
+    "DbPairHistoryHandler.get_recent_pairs": lambda: PairHistoryModel.objects(
+        guild=_SAMPLE_ID,
+        week__gt=datetime.datetime(1970, 1, 1),
+    ),
+    "DbRoleConfigHandler.get_base_role_config": lambda: BaseRoleConfigModel.objects(
+        guild=_SAMPLE_ID,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class QueryAudit:
+    """
+    Plan chosen by the database for a handler query.
+
+    Attributes:
+        name (str):                 Handler method that issues the query
+        stages (tuple[str, ...]):   Stages of the winning plan, from the root to the leaves
+    """
+
+    name: str
+    stages: tuple[str, ...]
+
+    @property
+    def is_collection_scan(self) -> bool:
+        """Whether the query reads the whole collection instead of using an index"""
+        return _COLLECTION_SCAN_STAGE in self.stages
+
+
+def audit_queries(
+    queries: Mapping[str, Callable[[], QuerySet]] | None = None,
+) -> list[QueryAudit]:
+    """Run explain() on every handler query, logging the ones that scan the whole collection"""
+    query_audits: list[QueryAudit] = []
+    for name, build_query in (queries if queries is not None else AUDITED_QUERIES).items():
+        explanation: Mapping[str, Any] = build_query().explain()
+        winning_plan: Mapping[str, Any] = explanation.get("queryPlanner", {}).get(
+            "winningPlan",
+            {},
+        )
+        query_audit = QueryAudit(name=name, stages=tuple(_iter_stages(winning_plan)))
+        if query_audit.is_collection_scan:
+            logger.warning("Collection scan in %s: %s", name, " <- ".join(query_audit.stages))
+        query_audits.append(query_audit)
+    return query_audits
+
+
+def _iter_stages(plan: Mapping[str, Any]) -> Iterator[str]:
+    """Walk the plan tree, which nests the child stages under inputStage(s)"""
+    if "stage" in plan:
+        yield plan["stage"]
+    # Newer servers wrap the plan of the query engine under queryPlan
+    for key in ("queryPlan", "inputStage"):
+        if key in plan:
+            yield from _iter_stages(plan[key])
+    for input_stage in plan.get("inputStages", []):
+        yield from _iter_stages(input_stage)
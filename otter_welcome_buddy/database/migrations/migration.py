@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from mongoengine import Document
+
+
+@dataclass(frozen=True)
+class BatchedUpdate:
+    """
+    A change applied to every document of a collection that matches the filter. The documents
+    are read in batches ordered by their id and updated with a single bulk write per batch, so
+    the step can be resumed from the last batch if it is interrupted.
+
+    Attributes:
+        document_type (type[Document]):     Model of the collection to update
+        build_update (Callable):            Returns the update to apply to a matched document
+        filter (Mapping[str, Any]):         Raw query that selects the documents to update
+        projection (list[str] | None):      Fields that build_update needs, all of them if None
+    """
+
+    document_type: type[Document]
+    build_update: Callable[[Mapping[str, Any]], Mapping[str, Any]]
+    filter: Mapping[str, Any] = field(default_factory=dict)
+    projection: list[str] | None = None
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    An ordered change of the schema, applied once.
+
+    Attributes:
+        version (int):                      Position of the migration, starting at 1
+        description (str):                  What the migration changes
+        steps (tuple[BatchedUpdate, ...]):  Updates to run in order
+    """
+
+    version: int
+    description: str
+    steps: tuple[BatchedUpdate, ...] = ()
@@ -0,0 +1,147 @@
+import importlib
+import inspect
+import logging
+import pkgutil
+from collections.abc import Callable
+from collections.abc import Mapping
+from typing import Any
+
+from mongoengine import Document
+from pymongo import UpdateOne
+
+from otter_welcome_buddy.database.migrations.migration import BatchedUpdate
+from otter_welcome_buddy.database.migrations.migration import Migration
+from otter_welcome_buddy.database.migrations.versions import MIGRATIONS
+from otter_welcome_buddy.database.models import external
+from otter_welcome_buddy.database.models.external.schema_version_model import SchemaVersionModel
+
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_NAME: str = "otter_welcome_buddy"
+_DEFAULT_BATCH_SIZE: int = 500
+
+
+def get_external_models() -> list[type[Document]]:
+    """Return every model declared in database/models/external"""
+    models: dict[str, type[Document]] = {}
+    for module_info in pkgutil.iter_modules(external.__path__, f"{external.__name__}."):
+        module = importlib.import_module(module_info.name)
+        for _, value in inspect.getmembers(module, inspect.isclass):
+            if issubclass(value, Document) and value.__module__ == module.__name__:
+                models[value.__name__] = value
+    return sorted(models.values(), key=lambda model: model.__name__)
+
+
+def ensure_model_indexes() -> None:
+    """Create the missing indexes of every model, logging the ones no longer declared"""
+    for model in get_external_models():
+        model.ensure_indexes()
+        extra_indexes: list[Any] = model.compare_indexes()["extra"]
+        if extra_indexes:
+            logger.warning("Indexes not declared in %s: %s", model.__name__, extra_indexes)
+
+
+def get_schema_version() -> int:
+    """Return the version of the last migration fully applied"""
+    schema_version_model: SchemaVersionModel | None = SchemaVersionModel.objects(
+        name=_SCHEMA_NAME,
+    ).first()
+    if schema_version_model is None:
+        return 0
+    version: int = schema_version_model.version
+    return version
+
+
+def run_migrations(
+    migrations: list[Migration] | None = None,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+) -> list[int]:
+    """
+    Apply in order the migrations newer than the stored version, returning the versions applied.
+
+    The progress is stored after every batch, so an interrupted migration resumes from the
+    last batch written instead of starting over.
+    """
+    migrations = sorted(
+        migrations if migrations is not None else MIGRATIONS,
+        key=lambda migration: migration.version,
+    )
+    schema_version_model: SchemaVersionModel = SchemaVersionModel.objects(
+        name=_SCHEMA_NAME,
+    ).modify(upsert=True, new=True, set_on_insert__version=0)
+
+    applied_versions: list[int] = []
+    for migration in migrations:
+        if migration.version <= schema_version_model.version:
+            continue
+        resume_step: int = 0
+        resume_after: Any = None
+        if schema_version_model.pending_version == migration.version:
+            resume_step = schema_version_model.pending_step or 0
+            resume_after = schema_version_model.last_id
+            logger.info("Resuming migration %s from step %s", migration.version, resume_step)
+        else:
+            logger.info("Applying migration %s: %s", migration.version, migration.description)
+
+        for step_index in range(resume_step, len(migration.steps)):
+            _run_batched_update(
+                migration.steps[step_index],
+                batch_size=batch_size,
+                start_after=resume_after if step_index == resume_step else None,
+                on_batch=_checkpoint(migration.version, step_index),
+            )
+
+        schema_version_model = SchemaVersionModel.objects(name=_SCHEMA_NAME).modify(
+            new=True,
+            set__version=migration.version,
+            unset__pending_version=True,
+            unset__pending_step=True,
+            unset__last_id=True,
+        )
+        applied_versions.append(migration.version)
+    return applied_versions
+
+
+def _checkpoint(version: int, step_index: int) -> Callable[[Any], None]:
+    """Return the callback that stores the progress of a step after each batch"""
+
+    def _store_checkpoint(last_id: Any) -> None:
+        SchemaVersionModel.objects(name=_SCHEMA_NAME).update_one(
+            set__pending_version=version,
+            set__pending_step=step_index,
+            set__last_id=last_id,
+        )
+
+    return _store_checkpoint
+
+
+def _run_batched_update(
+    step: BatchedUpdate,
+    batch_size: int,
+    start_after: Any,
+    on_batch: Callable[[Any], None],
+) -> None:
+    """Update the matched documents in batches ordered by id, with one bulk write per batch"""
+    collection = step.document_type._get_collection()  # pylint: disable=protected-access
+    last_id: Any = start_after
+    while True:
+        query: Mapping[str, Any] = (
+            {"$and": [step.filter, {"_id": {"$gt": last_id}}]}
+            if last_id is not None
+            else step.filter
+        )
+        batch: list[Mapping[str, Any]] = list(
+            collection.find(query, projection=step.projection).sort("_id", 1).limit(batch_size),
+        )
+        if not batch:
+            return
+        collection.bulk_write(
+            [
+                UpdateOne({"_id": document["_id"]}, step.build_update(document))
+                for document in batch
+            ],
+            ordered=False,
+        )
+        last_id = batch[-1]["_id"]
+        on_batch(last_id)
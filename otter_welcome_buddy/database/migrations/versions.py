@@ -0,0 +1,19 @@
+from otter_welcome_buddy.database.migrations.migration import BatchedUpdate
+from otter_welcome_buddy.database.migrations.migration import Migration
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+
+# Append new migrations at the end with the next version, never edit the applied ones
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="Store an empty list of welcome messages in the base role configs without it",
+        steps=(
+            BatchedUpdate(
+                document_type=BaseRoleConfigModel,
+                filter={"message_ids": {"$exists": False}},
+                build_update=lambda _: {"$set": {"message_ids": []}},
+                projection=[],
+            ),
+        ),
+    ),
+]
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class AnnouncementsConfigCacheModel(BaseModel):
+    """
+    Local copy of the announcements config of the guilds.
+
+    Attributes:
+        guild_id (int):     Identifier of the guild that the config belongs to
+        channel_id (int):   Channel identifier where to send the announcement
+    """
+
+    __tablename__ = "announcements_config"
+
+    guild_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    channel_id = Column(BigInteger, nullable=False)
@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class GuildCacheModel(BaseModel):
+    """
+    Local copy of the guilds stored in the database.
+
+    Attributes:
+        guild_id (int): The identifier for the guild, taken from discord records
+    """
+
+    __tablename__ = "guild"
+
+    guild_id = Column(BigInteger, primary_key=True, autoincrement=False)
@@ -0,0 +1,29 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class InterviewMatchCacheModel(BaseModel):
+    """
+    Local copy of the interview match activities of the guilds.
+
+    Attributes:
+        guild_id (int):         Identifier of the guild that the activity belongs to
+        author_id (int):        Extra user (usually the owner) used when odd number of participants
+        channel_id (int):       Channel identifier where the activity takes place
+        day_of_the_week (int):  Number identifying where the activity is run where 0 is Sunday
+        emoji (str):            Emoji that should be used to react to take part of the activity
+        message_id (int):       Identifier of the message that will be processed for the activity
+    """
+
+    __tablename__ = "interview_match"
+
+    guild_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    author_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False)
+    day_of_the_week = Column(Integer, nullable=False)
+    emoji = Column(String)
+    message_id = Column(BigInteger)
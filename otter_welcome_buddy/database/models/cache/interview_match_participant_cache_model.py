@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class InterviewMatchParticipantCacheModel(BaseModel):
+    """
+    A user that reacted to the weekly message of the interview match activity, recorded as
+    the reactions are added and removed.
+
+    Attributes:
+        message_id (int):   Identifier of the weekly message
+        user_id (int):      Identifier of the user that reacted
+        guild_id (int):     Identifier of the guild of the message
+    """
+
+    __tablename__ = "interview_match_participant"
+
+    message_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    user_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    guild_id = Column(BigInteger, nullable=False, index=True)
@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Boolean
+from sqlalchemy import Column
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class InterviewMatchTrackingCacheModel(BaseModel):
+    """
+    The weekly message of the interview match activity whose reactions are being recorded.
+
+    Attributes:
+        message_id (int):       Identifier of the weekly message
+        guild_id (int):         Identifier of the guild of the message, one message per guild
+        is_complete (bool):     Whether every reaction since the message was sent is recorded,
+                                reactions may have been missed while the bot was offline
+    """
+
+    __tablename__ = "interview_match_tracking"
+
+    message_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    guild_id = Column(BigInteger, nullable=False, unique=True)
+    is_complete = Column(Boolean, nullable=False, default=False)
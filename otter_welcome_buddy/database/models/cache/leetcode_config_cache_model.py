@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class LeetcodeConfigCacheModel(BaseModel):
+    """
+    Local copy of the Leetcode config of the guilds.
+
+    Attributes:
+        guild_id (int):     Identifier of the guild that the config belongs to
+        channel_id (int):   Channel identifier where to send the announcements
+    """
+
+    __tablename__ = "leetcode_config"
+
+    guild_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    channel_id = Column(BigInteger, nullable=False)
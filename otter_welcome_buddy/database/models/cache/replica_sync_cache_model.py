@@ -0,0 +1,20 @@
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import String
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class ReplicaSyncCacheModel(BaseModel):
+    """
+    Keeps track of the replicas that were fully synced with the database at least once.
+
+    Attributes:
+        name (str):             Name of the replica
+        synced_at (datetime):   Last time that the whole replica was refreshed
+    """
+
+    __tablename__ = "replica_sync"
+
+    name = Column(String, primary_key=True)
+    synced_at = Column(DateTime(timezone=True), nullable=False)
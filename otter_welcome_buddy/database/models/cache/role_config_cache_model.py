@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import JSON
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class BaseRoleConfigCacheModel(BaseModel):
+    """
+    Local copy of the configuration to get the base role of the guilds.
+
+    Attributes:
+        guild_id (int):         Identifier of the guild that the config belongs to
+        message_ids (list):     List of message identifiers that the user needs to react to
+        reaction_roles (list):  Roles given when reacting to a message with an emoji
+    """
+
+    __tablename__ = "base_role_config"
+
+    guild_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    message_ids = Column(JSON, nullable=False, default=list)
+    reaction_roles = Column(JSON, nullable=True)
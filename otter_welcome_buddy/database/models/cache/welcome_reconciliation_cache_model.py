@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import JSON
+from sqlalchemy import String
+
+from otter_welcome_buddy.database.dbconn import BaseModel
+
+
+class WelcomeReconciliationCacheModel(BaseModel):
+    """
+    Progress of the reconciliation of the reactions on a welcome message, kept until the whole
+    message is processed so an interrupted run resumes from the last page.
+
+    Attributes:
+        message_id (int):       Identifier of the welcome message
+        guild_id (int):         Identifier of the guild of the message
+        channel_id (int):       Identifier of the channel of the message, once found
+        emoji (str):            Emoji of the reaction being processed
+        last_user_id (int):     Last user processed of the reaction
+        done_emojis (list):     Emojis of the reactions already processed
+    """
+
+    __tablename__ = "welcome_reconciliation"
+
+    message_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    guild_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=True)
+    emoji = Column(String, nullable=True)
+    last_user_id = Column(BigInteger, nullable=True)
+    done_emojis = Column(JSON, nullable=False, default=list)
@@ -0,0 +1,24 @@
+from mongoengine import CASCADE
+from mongoengine import DateTimeField
+from mongoengine import Document
+from mongoengine import IntField
+from mongoengine import ReferenceField
+
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+
+
+class MemberJoinModel(Document):
+    """
+    A model that represents a member joining a guild in the database.
+
+    Attributes:
+        guild (GuildModel):     Reference to the guild that the member joined
+        member_id (int):        Identifier of the member
+        joined_at (datetime):   Moment when the member joined the guild
+    """
+
+    guild = ReferenceField(GuildModel, reverse_delete_rule=CASCADE, required=True)
+    member_id = IntField(required=True)
+    joined_at = DateTimeField(required=True)
+
+    meta = {"indexes": [{"fields": ["guild", "joined_at"]}]}
@@ -0,0 +1,39 @@
+import datetime
+
+from mongoengine import CASCADE
+from mongoengine import DateTimeField
+from mongoengine import Document
+from mongoengine import IntField
+from mongoengine import ReferenceField
+
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+
+
+# The pairs older than a year are not avoided anymore, so the database removes them
+PAIR_HISTORY_TTL: datetime.timedelta = datetime.timedelta(weeks=52)
+
+
+class PairHistoryModel(Document):
+    """
+    A model that represents a pair made by the interview match activity in the database.
+
+    Attributes:
+        guild (GuildModel):     Reference to the guild where the pair was made
+        week (datetime):        Start (monday at midnight UTC) of the week the pair was made
+        member_a (int):         Identifier of the member of the pair with the lowest id
+        member_b (int):         Identifier of the member of the pair with the highest id
+    """
+
+    guild = ReferenceField(GuildModel, reverse_delete_rule=CASCADE, required=True)
+    week = DateTimeField(required=True)
+    member_a = IntField(required=True)
+    member_b = IntField(required=True)
+
+    meta = {
+        "indexes": [
+            {"fields": ["guild", "week"]},
+            # Whether two members met in the last weeks is answered from the index alone
+            {"fields": ["guild", "member_a", "member_b", "-week"]},
+            {"fields": ["week"], "expireAfterSeconds": int(PAIR_HISTORY_TTL.total_seconds())},
+        ],
+    }
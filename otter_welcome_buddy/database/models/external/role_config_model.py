@@ -1,12 +1,30 @@
 from mongoengine import CASCADE
 from mongoengine import Document
+from mongoengine import EmbeddedDocument
+from mongoengine import EmbeddedDocumentListField
 from mongoengine import IntField
 from mongoengine import ListField
 from mongoengine import ReferenceField
+from mongoengine import StringField
 
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 
 
+class ReactionRoleModel(EmbeddedDocument):
+    """
+    A model that represents a role given when reacting to a message with an emoji.
+
+    Attributes:
+        message_id (int):   Identifier of the message to react to
+        emoji (str):        Emoji of the reaction, as discord formats it in a message
+        role_id (int):      Identifier of the role given
+    """
+
+    message_id = IntField(required=True)
+    emoji = StringField(required=True)
+    role_id = IntField(required=True)
+
+
 class BaseRoleConfigModel(Document):
     """
     A model that represents the configuration to get the base role for the server in the database.
@@ -14,7 +32,9 @@ class BaseRoleConfigModel(Document):
     Attributes:
         guild (GuildModel):     Reference to the guild that the activity belongs to
         message_ids (int):      List of message identifiers that the user needs to react to
+        reaction_roles (list):  Roles given when reacting to a message with an emoji
     """
 
     guild = ReferenceField(GuildModel, reverse_delete_rule=CASCADE, primary_key=True)
     message_ids = ListField(IntField(required=True))
+    reaction_roles = EmbeddedDocumentListField(ReactionRoleModel)
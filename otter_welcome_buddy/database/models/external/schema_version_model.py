@@ -0,0 +1,23 @@
+from mongoengine import Document
+from mongoengine import DynamicField
+from mongoengine import IntField
+from mongoengine import StringField
+
+
+class SchemaVersionModel(Document):
+    """
+    A model that keeps track of the migrations applied to the database.
+
+    Attributes:
+        name (str):             Identifier of the schema, there is a single one for the bot
+        version (int):          Version of the last migration fully applied
+        pending_version (int):  Version of the migration being applied, if it was interrupted
+        pending_step (int):     Step of the pending migration being applied
+        last_id (Any):          Identifier of the last document migrated by the pending step
+    """
+
+    name = StringField(primary_key=True, required=True)
+    version = IntField(required=True, default=0)
+    pending_version = IntField()
+    pending_step = IntField()
+    last_id = DynamicField()
@@ -0,0 +1,30 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from mongoengine import Document
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelConfigView:
+    """
+    Read-only view of a config that only points to a channel of the guild, like the
+    announcements and the leetcode ones.
+
+    Attributes:
+        guild_id (int):     Identifier of the guild that the config belongs to
+        channel_id (int):   Channel identifier where to send the messages
+    """
+
+    guild_id: int
+    channel_id: int
+
+    @classmethod
+    def from_son(cls, son: Mapping[str, Any]) -> "ChannelConfigView":
+        """Build the view from the raw document returned by the database"""
+        return cls(guild_id=son["_id"], channel_id=son["channel_id"])
+
+    @classmethod
+    def from_document(cls, document: Document) -> "ChannelConfigView":
+        """Build the view from a document, without dereferencing the guild"""
+        return cls.from_son(document.to_mongo())
@@ -0,0 +1,51 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+
+
+@dataclass(frozen=True, slots=True)
+class GuildOverviewView:
+    """
+    Read-only view of a guild with the configuration of every feature, None when the feature
+    is not configured.
+
+    Attributes:
+        guild_id (int):                                 Identifier of the guild
+        announcements_config (ChannelConfigView):       Where to send the announcements
+        leetcode_config (ChannelConfigView):            Where to send the leetcode challenges
+        interview_match (InterviewMatchView):           Interview match activity
+        base_role_config (BaseRoleConfigView):          Messages that give the base role
+    """
+
+    guild_id: int
+    announcements_config: ChannelConfigView | None
+    leetcode_config: ChannelConfigView | None
+    interview_match: InterviewMatchView | None
+    base_role_config: BaseRoleConfigView | None
+
+    @classmethod
+    def from_son(cls, son: Mapping[str, Any]) -> "GuildOverviewView":
+        """Build the view from the raw document returned by the overview aggregation"""
+        announcements_config: Mapping[str, Any] | None = son.get("announcements_config")
+        leetcode_config: Mapping[str, Any] | None = son.get("leetcode_config")
+        interview_match: Mapping[str, Any] | None = son.get("interview_match")
+        base_role_config: Mapping[str, Any] | None = son.get("base_role_config")
+        return cls(
+            guild_id=son["_id"],
+            announcements_config=(
+                ChannelConfigView.from_son(announcements_config) if announcements_config else None
+            ),
+            leetcode_config=ChannelConfigView.from_son(leetcode_config)
+            if leetcode_config
+            else None,
+            interview_match=(
+                InterviewMatchView.from_son(interview_match) if interview_match else None
+            ),
+            base_role_config=(
+                BaseRoleConfigView.from_son(base_role_config) if base_role_config else None
+            ),
+        )
@@ -0,0 +1,44 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from mongoengine import Document
+
+
+@dataclass(frozen=True, slots=True)
+class InterviewMatchView:
+    """
+    Read-only view of an interview match activity.
+
+    Attributes:
+        guild_id (int):           Identifier of the guild that the activity belongs to
+        author_id (int):          Extra user (usually the owner) for an odd number of participants
+        channel_id (int):         Channel identifier where the activity takes place
+        day_of_the_week (int):    Number identifying where the activity is run where 0 is Sunday
+        emoji (str | None):       Emoji that should be used to react to take part of the activity
+        message_id (int | None):  Identifier of the message that will be processed for the activity
+    """
+
+    guild_id: int
+    author_id: int
+    channel_id: int
+    day_of_the_week: int
+    emoji: str | None
+    message_id: int | None
+
+    @classmethod
+    def from_son(cls, son: Mapping[str, Any]) -> "InterviewMatchView":
+        """Build the view from the raw document returned by the database"""
+        return cls(
+            guild_id=son["_id"],
+            author_id=son["author_id"],
+            channel_id=son["channel_id"],
+            day_of_the_week=son["day_of_the_week"],
+            emoji=son.get("emoji"),
+            message_id=son.get("message_id"),
+        )
+
+    @classmethod
+    def from_document(cls, document: Document) -> "InterviewMatchView":
+        """Build the view from a document, without dereferencing the guild"""
+        return cls.from_son(document.to_mongo())
@@ -0,0 +1,59 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from mongoengine import Document
+
+
+@dataclass(frozen=True, slots=True)
+class ReactionRoleView:
+    """
+    Read-only view of a role given when reacting to a message with an emoji.
+
+    Attributes:
+        message_id (int):   Identifier of the message to react to
+        emoji (str):        Emoji of the reaction, as discord formats it in a message
+        role_id (int):      Identifier of the role given
+    """
+
+    message_id: int
+    emoji: str
+    role_id: int
+
+    @classmethod
+    def from_son(cls, son: Mapping[str, Any]) -> "ReactionRoleView":
+        """Build the view from the raw embedded document"""
+        return cls(message_id=son["message_id"], emoji=son["emoji"], role_id=son["role_id"])
+
+
+@dataclass(frozen=True, slots=True)
+class BaseRoleConfigView:
+    """
+    Read-only view of the configuration to get the base role of a guild.
+
+    Attributes:
+        guild_id (int):                 Identifier of the guild that the config belongs to
+        message_ids (tuple[int, ...]):  Message identifiers that the user needs to react to
+        reaction_roles (tuple):         Roles given when reacting to a message with an emoji
+    """
+
+    guild_id: int
+    message_ids: tuple[int, ...]
+    reaction_roles: tuple[ReactionRoleView, ...] = ()
+
+    @classmethod
+    def from_son(cls, son: Mapping[str, Any]) -> "BaseRoleConfigView":
+        """Build the view from the raw document returned by the database"""
+        return cls(
+            guild_id=son["_id"],
+            message_ids=tuple(son.get("message_ids", ())),
+            reaction_roles=tuple(
+                ReactionRoleView.from_son(reaction_role)
+                for reaction_role in son.get("reaction_roles", ())
+            ),
+        )
+
+    @classmethod
+    def from_document(cls, document: Document) -> "BaseRoleConfigView":
+        """Build the view from a document, without dereferencing the guild"""
+        return cls.from_son(document.to_mongo())
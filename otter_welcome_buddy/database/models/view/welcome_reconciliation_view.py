@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class WelcomeReconciliationView:
+    """
+    Read-only view of the progress of the reconciliation of a welcome message.
+
+    Attributes:
+        message_id (int):               Identifier of the welcome message
+        guild_id (int):                 Identifier of the guild of the message
+        channel_id (int | None):        Identifier of the channel of the message, once found
+        emoji (str | None):             Emoji of the reaction being processed
+        last_user_id (int | None):      Last user processed of the reaction
+        done_emojis (tuple[str, ...]):  Emojis of the reactions already processed
+    """
+
+    message_id: int
+    guild_id: int
+    channel_id: int | None = None
+    emoji: str | None = None
+    last_user_id: int | None = None
+    done_emojis: tuple[str, ...] = ()
+
+    @classmethod
+    def from_row(cls, row: Any) -> "WelcomeReconciliationView":
+        """Build the view from a row of the local cache"""
+        return cls(
+            message_id=row.message_id,
+            guild_id=row.guild_id,
+            channel_id=row.channel_id,
+            emoji=row.emoji,
+            last_user_id=row.last_user_id,
+            done_emojis=tuple(row.done_emojis),
+        )
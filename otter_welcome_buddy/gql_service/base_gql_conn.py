@@ -7,7 +7,9 @@ from gql import Client
 from gql import gql
 from gql.client import AsyncClientSession
 from graphql import GraphQLError
+from graphql import GraphQLSchema
 
+from otter_welcome_buddy.common.utils.cpu_executor import CPU_EXECUTOR
 from otter_welcome_buddy.gql_service.gql_utils import get_schema
 from otter_welcome_buddy.gql_service.gql_utils import get_transport
 
@@ -24,6 +26,7 @@ class BaseGqlConn(ABC):
     Attributes:
         _client (Client): The GraphQL client instance.
         _session (AsyncClientSession): The asynchronous client session.
+        _schemas (dict[str, GraphQLSchema]): The schemas already built, by filename.
 
     Abstract Properties:
         _GRAPHQL_URL (str): The URL of the GraphQL API used.
@@ -46,6 +49,7 @@ class BaseGqlConn(ABC):
 
     _client: Client
     _session: AsyncClientSession
+    _schemas: dict[str, GraphQLSchema] = {}
 
     @classmethod  # type: ignore
     @property
@@ -63,7 +67,12 @@ class BaseGqlConn(ABC):
 
     async def __aenter__(self) -> "BaseGqlConn":
         transport = get_transport(url=self._GRAPHQL_URL)
-        schema = get_schema(schema_filename=self._SCHEMA_FILENAME)
+        schema: GraphQLSchema | None = BaseGqlConn._schemas.get(self._SCHEMA_FILENAME)
+        if schema is None:
+            # Building the schema is pure Python, but the schema can't be pickled back from a
+            # process, so it's built once in a thread and kept for the next connections
+            schema = await CPU_EXECUTOR.run_in_thread(get_schema, self._SCHEMA_FILENAME)
+            BaseGqlConn._schemas[self._SCHEMA_FILENAME] = schema
         self._client = Client(transport=transport, schema=schema, fetch_schema_from_transport=False)
         self._session = await self._client.__aenter__()
         return self
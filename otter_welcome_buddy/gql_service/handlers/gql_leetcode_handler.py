@@ -1,5 +1,6 @@
 from typing import Any
 
+from otter_welcome_buddy.common.utils.cpu_executor import CPU_EXECUTOR
 from otter_welcome_buddy.gql_service.gql_utils import get_deserialized_data
 from otter_welcome_buddy.gql_service.leetcode_gql_conn import LeetcodeGqlConn
 from otter_welcome_buddy.gql_service.models.gql_leetcode_model import LeetcodeDailyChallengeModel
@@ -31,7 +32,11 @@ class GqlLeetcodeHandler:
 
         if response is None:
             return None
-        return get_deserialized_data(LeetcodeUserModel, response["matchedUser"])
+        return await CPU_EXECUTOR.run_in_thread(
+            get_deserialized_data,
+            LeetcodeUserModel,
+            response["matchedUser"],
+        )
 
     @staticmethod
     async def gen_daily_challenge() -> LeetcodeDailyChallengeModel | None:
@@ -46,7 +51,8 @@ class GqlLeetcodeHandler:
 
         if response is None:
             return None
-        return get_deserialized_data(
+        return await CPU_EXECUTOR.run_in_thread(
+            get_deserialized_data,
             LeetcodeDailyChallengeModel,
             response["activeDailyCodingChallengeQuestion"],
         )
@@ -1,6 +1,27 @@
+import os
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
 BOT_TIMEZONE: str = "America/Mexico_City"
+
+# Connection pool of the local cache database (SQLite)
+CACHE_POOL_SIZE: int = int(os.getenv("CACHE_POOL_SIZE", "5"))
+CACHE_MAX_OVERFLOW: int = int(os.getenv("CACHE_MAX_OVERFLOW", "10"))
+CACHE_POOL_TIMEOUT: float = float(os.getenv("CACHE_POOL_TIMEOUT", "30"))
+
+# Time to wait for MongoDB before failing over to the local replica
+MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+
+# Without chunking the guilds at startup, only the members the bot works with are cached, in
+# an LRU of MEMBER_CACHE_SIZE members, and the rest are requested to discord when needed
+LOW_MEMORY_MEMBER_CACHE: bool = os.getenv("LOW_MEMORY_MEMBER_CACHE", "false").lower() == "true"
+MEMBER_CACHE_SIZE: int = int(os.getenv("MEMBER_CACHE_SIZE", "1000"))
+
+# Workers of the CPU executor, the threads run the work that releases the GIL and the processes
+# the pure Python one, without processes that work runs in the threads too
+CPU_THREAD_WORKERS: int = int(os.getenv("CPU_THREAD_WORKERS", "2"))
+CPU_PROCESS_WORKERS: int = int(os.getenv("CPU_PROCESS_WORKERS", "1"))
+CPU_TASK_TIMEOUT: float = float(os.getenv("CPU_TASK_TIMEOUT", "60"))
@@ -1,24 +1,160 @@
+import importlib
+import logging
 import os
+import pkgutil
 
 from discord.ext.commands import Bot
 from dotenv import load_dotenv
 from mongoengine import connect as mongo_connect
 from pymongo import monitoring
+from pymongo.errors import ConnectionFailure
+from sqlalchemy import Engine
+from sqlalchemy import inspect
+from sqlalchemy import Table
 
 from otter_welcome_buddy.common.constants import DATA_FILE_PATH
 from otter_welcome_buddy.common.utils.database import get_cache_engine
+from otter_welcome_buddy.database.config_cache import warm_config_caches
+from otter_welcome_buddy.database.config_replica import enable_config_replicas
 from otter_welcome_buddy.database.dbconn import BaseModel
+from otter_welcome_buddy.database.handlers.db_announcements_config_handler import (
+    DbAnnouncementsConfigHandler,
+)
 from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
-from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.handlers.db_interview_match_handler import (
+    DbInterviewMatchHandler,
+)
+from otter_welcome_buddy.database.handlers.db_leetcode_config_handler import (
+    DbLeetcodeConfigHandler,
+)
+from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
+from otter_welcome_buddy.database.migrations.runner import ensure_model_indexes
+from otter_welcome_buddy.database.migrations.runner import run_migrations
+from otter_welcome_buddy.database.models import cache
+from otter_welcome_buddy.database.models.cache.replica_sync_cache_model import ReplicaSyncCacheModel
 from otter_welcome_buddy.log.dblogger import DbCommandLogger
+from otter_welcome_buddy.settings import MONGO_SERVER_SELECTION_TIMEOUT_MS
 
 
-def init_guild_table(bot: Bot) -> None:
-    """Verify that all the guilds that the bot is part of are in the database"""
-    for guild in bot.guilds:
-        if DbGuildHandler.get_guild(guild_id=guild.id) is None:
-            guild_model: GuildModel = GuildModel(guild_id=guild.id)
-            DbGuildHandler.insert_guild(guild_model=guild_model)
+logger = logging.getLogger(__name__)
+
+
+# Guild ids known to be stored, used to skip the reconciliation when nothing changed. It is
+# updated in place and stays empty until the first reconciliation
+_synced_guild_ids: set[int] = set()
+
+
+class _StartupState:
+    """Holds the steps of the startup that are done only once since the bot started"""
+
+    # Whether the local replica was refreshed from the database
+    are_replicas_synced: bool = False
+    # Whether the indexes and migrations were checked
+    is_schema_upgraded: bool = False
+
+
+def create_cache_tables(engine: Engine) -> None:
+    """
+    Create the tables of the local cache. The ones whose columns changed since they were
+    created are dropped first, together with the replica sync marks, so every replica is
+    filled again from the database instead of being read without the new columns.
+    """
+    # The models are added to the metadata when imported, and the cogs that import some of
+    # them are loaded after the database is initialized
+    for module_info in pkgutil.iter_modules(cache.__path__, f"{cache.__name__}."):
+        importlib.import_module(module_info.name)
+    inspector = inspect(engine)
+    outdated_tables: list[Table] = [
+        table
+        for table in BaseModel.metadata.sorted_tables
+        if inspector.has_table(table.name)
+        and {column["name"] for column in inspector.get_columns(table.name)}
+        != {column.name for column in table.columns}
+    ]
+    if outdated_tables:
+        logger.info(
+            "Rebuilding the outdated cache tables %s",
+            [table.name for table in outdated_tables],
+        )
+        BaseModel.metadata.drop_all(
+            engine,
+            tables=[*outdated_tables, ReplicaSyncCacheModel.__table__],
+        )
+    BaseModel.metadata.create_all(engine)
+
+
+def init_guild_table(bot: Bot, prune: bool = False) -> None:
+    """
+    Verify that all the guilds that the bot is part of are in the database, inserting the
+    missing ones in bulk. When prune is set, the guilds that the bot has left are removed.
+    Nothing is done if the guilds didn't change since the last time, e.g. on reconnections.
+    """
+    guild_ids: frozenset[int] = frozenset(guild.id for guild in bot.guilds)
+    if guild_ids == _synced_guild_ids and not prune:
+        return
+
+    missing_guild_ids: frozenset[int] = guild_ids - DbGuildHandler.get_existing_guild_ids(guild_ids)
+    DbGuildHandler.insert_guilds(missing_guild_ids)
+    if prune:
+        stale_guild_ids: set[int] = DbGuildHandler.delete_guilds_not_in(guild_ids)
+        if stale_guild_ids:
+            logger.info("Removed %s guilds that the bot is no longer part of", len(stale_guild_ids))
+
+    _synced_guild_ids.clear()
+    _synced_guild_ids.update(guild_ids)
+
+
+def mark_guild_synced(guild_id: int, is_stored: bool) -> None:
+    """Keep track of the guilds stored after a join or leave event, if already reconciled"""
+    if not _synced_guild_ids:
+        return
+    if is_stored:
+        _synced_guild_ids.add(guild_id)
+    else:
+        _synced_guild_ids.discard(guild_id)
+
+
+def upgrade_database_schema() -> None:
+    """
+    Create the missing indexes and apply the pending migrations. It is done only once, unless
+    the database was unreachable, and always before reloading the configs from the database.
+    """
+    if _StartupState.is_schema_upgraded:
+        return
+
+    try:
+        ensure_model_indexes()
+        applied_versions: list[int] = run_migrations()
+    except ConnectionFailure as ex:
+        logger.warning("Database unreachable, the schema will be checked on the next ready: %s", ex)
+        return
+
+    if applied_versions:
+        logger.info("Applied the migrations %s", applied_versions)
+    _StartupState.is_schema_upgraded = True
+
+
+def sync_config_replicas() -> bool:
+    """
+    Reload the guilds and their configs from the database into the caches and the local
+    replica, picking up the changes done while the bot was offline. It is done only once,
+    unless the database was unreachable, returning whether anything was reloaded.
+    """
+    if _StartupState.are_replicas_synced:
+        return False
+
+    try:
+        DbGuildHandler.refresh_guilds()
+        DbAnnouncementsConfigHandler.refresh_announcements_configs()
+        DbLeetcodeConfigHandler.refresh_leetcode_configs()
+        DbInterviewMatchHandler.refresh_interview_matches()
+        DbRoleConfigHandler.refresh_base_role_configs()
+    except ConnectionFailure as ex:
+        logger.warning("Database unreachable, serving the configs from the local replica: %s", ex)
+        return False
+
+    _StartupState.are_replicas_synced = True
+    return True
 
 
 async def init_database() -> None:
@@ -27,8 +163,14 @@ async def init_database() -> None:
 
     # Initialize local database used as cache - Sqlite3
     engine = get_cache_engine(db_path=DATA_FILE_PATH)
-    BaseModel.metadata.create_all(engine)
+    create_cache_tables(engine)
+    # The configs are read from the local replica until they are synced with MongoDB
+    enable_config_replicas(db_path=DATA_FILE_PATH)
+    warm_config_caches()
 
     # Connect to global database - MongoDB
     monitoring.register(DbCommandLogger())
-    mongo_connect(host=os.environ["MONGO_URI"])
+    mongo_connect(
+        host=os.environ["MONGO_URI"],
+        serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    )
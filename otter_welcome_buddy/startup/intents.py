@@ -1,5 +1,8 @@
 """An intent allows a bot to subscribe to specific buckets of events"""
 from discord import Intents
+from discord import MemberCacheFlags
+
+from otter_welcome_buddy.settings import LOW_MEMORY_MEMBER_CACHE
 
 
 def get_registered_intents() -> Intents:
@@ -10,3 +13,16 @@ def get_registered_intents() -> Intents:
     intents.members = True  # Detect new members
     intents.reactions = True  # Process reactions
     return intents
+
+
+def get_member_cache_flags() -> MemberCacheFlags:
+    """Returns which members are kept by discord.py"""
+    if LOW_MEMORY_MEMBER_CACHE:
+        # The members needed are cached on demand by common.utils.member_cache
+        return MemberCacheFlags.none()
+    return MemberCacheFlags.from_intents(get_registered_intents())
+
+
+def should_chunk_guilds() -> bool:
+    """Returns whether every member of the guilds is requested at startup"""
+    return not LOW_MEMORY_MEMBER_CACHE
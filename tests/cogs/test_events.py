@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
-from unittest.mock import patch
 
 import pytest
 from discord import Guild
@@ -14,6 +13,8 @@ from discord.types.emoji import PartialEmoji as PartialEmojiType
 from pytest_mock import MockFixture
 
 from otter_welcome_buddy.cogs import events
+from otter_welcome_buddy.common.constants import WELCOME_MESSAGES_FEATURE
+from otter_welcome_buddy.common.utils.reaction_router import ReactionRouter
 from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 
@@ -41,35 +42,38 @@ async def test_onReady_printMessage(
 ) -> None:
     # Arrange
     cog = events.BotEvents(mock_bot, mock_debug_fmt)
+    mock_upgrade_schema = mocker.patch("otter_welcome_buddy.cogs.events.upgrade_database_schema")
     mock_init_guild = mocker.patch("otter_welcome_buddy.cogs.events.init_guild_table")
+    mock_sync_replicas = mocker.patch(
+        "otter_welcome_buddy.cogs.events.sync_config_replicas",
+        return_value=True,
+    )
+    mock_init_welcome_messages = mocker.patch.object(events.Roles, "init_welcome_messages")
+    mock_start_reconciliation = mocker.patch.object(events.Roles, "start_welcome_reconciliation")
 
     # Act
     await cog.on_ready()
 
     # Assert
+    mock_upgrade_schema.assert_called_once()
     mock_init_guild.assert_called_once()
+    mock_sync_replicas.assert_called_once()
+    mock_init_welcome_messages.assert_called_once()
+    mock_start_reconciliation.assert_called_once_with(mock_bot)
     assert mock_debug_fmt.bot_is_ready.called
 
 
-@pytest.mark.asyncio
-@patch("otter_welcome_buddy.cogs.events.WELCOME_MESSAGES", new={111: [111]})
-async def test_onRawReactionAdd_addRole(
+def _make_reaction_payload(
     mocker: MockFixture,
-    mock_bot: Bot,
-    mock_guild: Guild,
     mock_member: Member,
-    mock_role: Role,
-    mock_debug_fmt: MagicMock,
-) -> None:
-    # Arrange
-    mock_guild.id = 111
-    mock_bot.guilds = [mock_guild]  # type: ignore
-    cog = events.BotEvents(mock_bot, mock_debug_fmt)
+    guild_id: int,
+    message_id: int,
+) -> RawReactionActionEvent:
     data: MessageReactionAddEvent = {
         "user_id": 111,
         "channel_id": 111,
-        "message_id": 111,
-        "guild_id": 111,
+        "message_id": message_id,
+        "guild_id": guild_id,
         "emoji": mocker.Mock(spec=PartialEmojiType),
         "type": 0,
         "burst": False,
@@ -80,49 +84,78 @@ async def test_onRawReactionAdd_addRole(
         event_type="REACTION_ADD",
     )
     payload.member = mock_member
+    return payload
 
-    mock_get_role = mocker.patch("discord.utils.get", return_value=mock_role)
-    mock_add_roles = mocker.patch.object(Member, "add_roles")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "guild_id, message_id, is_role_added",
+    [
+        (111, 111, True),
+        (111, 222, False),
+        # Guild without welcome messages configured
+        (222, 222, True),
+    ],
+)
+async def test_onRawReactionAdd_addRole(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+    mock_member: Member,
+    mock_role: Role,
+    mock_debug_fmt: MagicMock,
+    guild_id: int,
+    message_id: int,
+    is_role_added: bool,
+) -> None:
+    # Arrange
+    reaction_router = ReactionRouter()
+    mocker.patch("otter_welcome_buddy.cogs.events.REACTION_ROUTER", reaction_router)
+    reaction_router.watch(WELCOME_MESSAGES_FEATURE, 111, [111])
+    mock_guild.id = guild_id
+    mock_member.guild = mock_guild
+    cog = events.BotEvents(mock_bot, mock_debug_fmt)
+    payload = _make_reaction_payload(mocker, mock_member, guild_id, message_id)
+
+    mock_get_role = mocker.patch.object(events.ROLE_RESOLVER, "get_role", return_value=mock_role)
+    mock_submit = mocker.patch.object(events.ROLE_GRANT_QUEUE, "submit")
+    mock_put_member = mocker.patch.object(events.MEMBER_CACHE, "put")
 
     # Act
     await cog.on_raw_reaction_add(payload)
 
     # Assert
-    mock_get_role.assert_called_once()
-    mock_add_roles.assert_called_once()
+    assert mock_get_role.called is is_role_added
+    if is_role_added:
+        mock_submit.assert_called_once_with(mock_member, mock_role)
+        mock_put_member.assert_called_once_with(mock_member)
+    else:
+        mock_submit.assert_not_called()
+        mock_put_member.assert_not_called()
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("is_new_guild", [True, False])
 async def test_onGuildJoin_insertDb(
     mocker: MockFixture,
     mock_bot: Bot,
     mock_guild: Guild,
     mock_debug_fmt: MagicMock,
-    mock_guild_model: GuildModel,
-    is_new_guild: bool,
 ) -> None:
     # Arrange
     mock_guild.id = 111
     mock_bot.guilds = [mock_guild]  # type: ignore
     cog = events.BotEvents(mock_bot, mock_debug_fmt)
 
-    mock_get_guild = mocker.patch.object(
-        DbGuildHandler,
-        "get_guild",
-        return_value=None if is_new_guild else mock_guild_model,
-    )
+    mock_get_guild = mocker.patch.object(DbGuildHandler, "get_guild")
     mock_insert_guild = mocker.patch.object(DbGuildHandler, "insert_guild")
 
     # Act
     await cog.on_guild_join(mock_guild)
 
     # Assert
-    mock_get_guild.assert_called_once_with(guild_id=mock_guild.id)
-    if is_new_guild:
-        mock_insert_guild.assert_called_once()
-    else:
-        mock_insert_guild.assert_not_called()
+    mock_get_guild.assert_not_called()
+    mock_insert_guild.assert_called_once()
+    assert mock_insert_guild.call_args.kwargs["guild_model"].guild_id == mock_guild.id
 
 
 @pytest.mark.asyncio
@@ -145,3 +178,41 @@ async def test_onGuildRemove_deleteDb(
 
     # Assert
     mock_delete_guild.assert_called_once_with(guild_id=mock_guild.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "new_name, new_position, is_invalidated",
+    [
+        ("Renamed", 1, True),
+        ("Role", 2, True),
+        ("Role", 1, False),
+    ],
+)
+async def test_onGuildRoleUpdate_invalidateRoles(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_debug_fmt: MagicMock,
+    new_name: str,
+    new_position: int,
+    is_invalidated: bool,
+) -> None:
+    # Arrange
+    mock_before = MagicMock(spec=Role)
+    mock_before.name = "Role"
+    mock_before.position = 1
+    mock_after = MagicMock(spec=Role)
+    mock_after.name = new_name
+    mock_after.position = new_position
+    mock_after.guild.id = 111
+    cog = events.BotEvents(mock_bot, mock_debug_fmt)
+    mock_invalidate = mocker.patch.object(events.ROLE_RESOLVER, "invalidate")
+
+    # Act
+    await cog.on_guild_role_update(mock_before, mock_after)
+
+    # Assert
+    if is_invalidated:
+        mock_invalidate.assert_called_once_with(111)
+    else:
+        mock_invalidate.assert_not_called()
@@ -3,8 +3,10 @@ from unittest.mock import MagicMock
 
 import pytest
 from discord.ext.commands import Bot
+from pytest_mock import MockFixture
 
 from otter_welcome_buddy.cogs import hiring_timelines
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
 
 
 @pytest.mark.asyncio
@@ -30,3 +32,29 @@ def test_call_formatter(mock_bot: Bot) -> None:
 
     # Assert
     assert mock_timeline_fmt.get_hiring_events_for.called
+
+
+@pytest.mark.asyncio
+async def test_sendMessageOnChannel_renderOnce(mocker: MockFixture, mock_bot: Bot) -> None:
+    # Arrange
+    mocker.patch.object(hiring_timelines, "AsyncIOScheduler")
+    mock_timeline_fmt = MagicMock()
+    mock_timeline_fmt.get_hiring_events_for = MagicMock(return_value="Events")
+    config_views = [
+        ChannelConfigView(guild_id=1, channel_id=10),
+        ChannelConfigView(guild_id=2, channel_id=20),
+    ]
+    mocker.patch.object(
+        hiring_timelines.AsyncDbAnnouncementsConfigHandler,
+        "get_announcements_config_views",
+        return_value=config_views,
+    )
+    mock_broadcast = mocker.patch.object(hiring_timelines.BROADCAST_ENGINE, "broadcast")
+    system_under_test = hiring_timelines.Timelines(mock_bot, mock_timeline_fmt)
+
+    # Act
+    await system_under_test._send_message_on_channel()
+
+    # Assert
+    mock_timeline_fmt.get_hiring_events_for.assert_called_once()
+    mock_broadcast.assert_awaited_once_with(mock_bot, config_views, content="Events")
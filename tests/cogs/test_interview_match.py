@@ -0,0 +1,398 @@
+import asyncio
+import io
+from collections.abc import Callable
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+from discord import Member
+from discord.ext.commands import Bot
+from pytest_mock import MockFixture
+
+from otter_welcome_buddy.cogs import interview_match
+from otter_welcome_buddy.common.constants import INTERVIEW_MATCH_FEATURE
+from otter_welcome_buddy.common.utils.broadcast import BroadcastStatus
+from otter_welcome_buddy.common.utils.dm_dispatcher import DmDeliveryReport
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.common.utils.reaction_router import ReactionRouter
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
+
+
+@pytest.fixture
+def reaction_router(mocker: MockFixture) -> ReactionRouter:
+    mocked_reaction_router = ReactionRouter()
+    mocker.patch.object(interview_match, "REACTION_ROUTER", mocked_reaction_router)
+    return mocked_reaction_router
+
+
+@pytest.fixture
+def participant_handler(mocker: MockFixture) -> Mock:
+    return mocker.patch.object(interview_match, "AsyncDbInterviewMatchParticipantHandler")
+
+
+@pytest.fixture
+def cog(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    reaction_router: ReactionRouter,
+) -> interview_match.InterviewMatch:
+    mocker.patch.object(interview_match, "AsyncIOScheduler")
+    return interview_match.InterviewMatch(mock_bot)
+
+
+def _make_message(reactions: list[Mock]) -> Mock:
+    mocked_message = Mock(spec=discord.Message)
+    mocked_message.id = 10
+    mocked_message.guild = Mock(id=1)
+    mocked_message.reactions = reactions
+    return mocked_message
+
+
+def _make_reaction(emoji: str, users: list[Mock]) -> Mock:
+    async def _users():
+        for user in users:
+            yield user
+
+    mocked_reaction = Mock()
+    mocked_reaction.emoji = emoji
+    mocked_reaction.users = Mock(side_effect=_users)
+    return mocked_reaction
+
+
+@pytest.mark.asyncio
+async def test_cogLoad_watchWeeklyMessages(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    reaction_router: ReactionRouter,
+) -> None:
+    # Arrange
+    mocker.patch.object(
+        interview_match.AsyncDbInterviewMatchHandler,
+        "get_interview_match_views",
+        return_value=[
+            InterviewMatchView(1, 2, 3, 0, "👍", 10),
+            InterviewMatchView(4, 5, 6, 0, "👍", None),
+        ],
+    )
+
+    # Act
+    await cog.cog_load()
+
+    # Assert
+    assert reaction_router.get_watched_messages(INTERVIEW_MATCH_FEATURE) == {1: frozenset({10})}
+    assert reaction_router.route(1, 10) == [cog._track_participant]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "event_type, emoji, is_bot, expected_call",
+    [
+        ("REACTION_ADD", "👍", False, "add_participant"),
+        ("REACTION_REMOVE", "👍", False, "remove_participant"),
+        ("REACTION_ADD", "👍", True, None),
+        ("REACTION_ADD", "🎉", False, None),
+    ],
+)
+async def test_trackParticipant_recordReaction(
+    cog: interview_match.InterviewMatch,
+    participant_handler: Mock,
+    event_type: str,
+    emoji: str,
+    is_bot: bool,
+    expected_call: str | None,
+) -> None:
+    # Arrange
+    participant_handler.add_participant = AsyncMock()
+    participant_handler.remove_participant = AsyncMock()
+    cog._watch_weekly_message(1, 10, "👍")
+    payload = Mock(
+        guild_id=1,
+        message_id=10,
+        user_id=100,
+        emoji=emoji,
+        event_type=event_type,
+        member=Mock(bot=is_bot) if event_type == "REACTION_ADD" else None,
+    )
+
+    # Act
+    await cog._track_participant(payload)
+
+    # Assert
+    for call_name in ("add_participant", "remove_participant"):
+        assert getattr(participant_handler, call_name).called is (call_name == expected_call)
+
+
+@pytest.mark.asyncio
+async def test_trackParticipant_keepEventOrder(
+    cog: interview_match.InterviewMatch,
+    participant_handler: Mock,
+) -> None:
+    # Arrange
+    applied_writes: list[str] = []
+
+    async def _add_participant(**_: int) -> None:
+        # Slower than the removal, that would be applied first without the lock
+        await asyncio.sleep(0.01)
+        applied_writes.append("add")
+
+    async def _remove_participant(**_: int) -> None:
+        applied_writes.append("remove")
+
+    participant_handler.add_participant = AsyncMock(side_effect=_add_participant)
+    participant_handler.remove_participant = AsyncMock(side_effect=_remove_participant)
+    cog._watch_weekly_message(1, 10, "👍")
+    payloads = [
+        Mock(
+            guild_id=1,
+            message_id=10,
+            user_id=100,
+            emoji="👍",
+            event_type=event_type,
+            member=Mock(bot=False) if event_type == "REACTION_ADD" else None,
+        )
+        for event_type in ("REACTION_ADD", "REACTION_REMOVE")
+    ]
+
+    # Act
+    await asyncio.gather(*(cog._track_participant(payload) for payload in payloads))
+
+    # Assert
+    assert applied_writes == ["add", "remove"]
+
+
+@pytest.mark.asyncio
+async def test_getWeeklyPool_readTrackedParticipants(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    participant_handler: Mock,
+) -> None:
+    # Arrange
+    participant_handler.get_participant_ids = AsyncMock(return_value=[100, 101])
+    mock_resolve_members = mocker.patch.object(
+        interview_match.MEMBER_CACHE,
+        "resolve_members",
+        return_value=["member"],
+    )
+    reaction = _make_reaction("👍", [])
+    message = _make_message([reaction])
+
+    # Act
+    result = await cog._get_weekly_pool(message=message, emoji="👍")
+
+    # Assert
+    assert result == ["member"]
+    reaction.users.assert_not_called()
+    users = mock_resolve_members.call_args.args[1]
+    assert [user.id for user in users] == [100, 101]
+
+
+@pytest.mark.asyncio
+async def test_getWeeklyPool_reconcileUntrackedMessage(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    participant_handler: Mock,
+) -> None:
+    # Arrange
+    participant_handler.get_participant_ids = AsyncMock(return_value=None)
+    participant_handler.replace_participants = AsyncMock()
+    mock_resolve_members = mocker.patch.object(
+        interview_match.MEMBER_CACHE,
+        "resolve_members",
+        return_value=["member"],
+    )
+    user = Mock(id=100, bot=False)
+    message = _make_message(
+        [
+            _make_reaction("👍", [user, Mock(id=200, bot=True)]),
+            _make_reaction("🎉", [Mock(id=101, bot=False)]),
+        ],
+    )
+
+    # Act
+    result = await cog._get_weekly_pool(message=message, emoji="👍")
+
+    # Assert
+    assert result == ["member"]
+    participant_handler.replace_participants.assert_awaited_once_with(
+        guild_id=1,
+        message_id=10,
+        user_ids=[100],
+    )
+    mock_resolve_members.assert_awaited_once_with(message.guild, [user])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_placeholder_in_pool", [False, True])
+async def test_makePairs_oddPool(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    make_mock_member: Callable[[int, str], Member],
+    is_placeholder_in_pool: bool,
+) -> None:
+    # Arrange
+    mocker.patch.object(interview_match.ROLE_RESOLVER, "has_role_class", return_value=False)
+    placeholder = make_mock_member(99, "Placeholder")
+    week_otter_pool = [make_mock_member(otter_id, f"Otter {otter_id}") for otter_id in range(4)]
+    if is_placeholder_in_pool:
+        week_otter_pool.append(placeholder)
+    else:
+        week_otter_pool.pop()
+
+    # Act
+    result = await cog._make_pairs(week_otter_pool, placeholder, past_pairs={(0, 1): 1}, seed=3)
+
+    # Assert
+    paired_otters = [otter for pair in result for otter in pair]
+    assert len(paired_otters) == 4
+    assert (placeholder in paired_otters) is not is_placeholder_in_pool
+    assert {result[0][0].id, result[0][1].id} != {0, 1}
+    assert {result[1][0].id, result[1][1].id} != {0, 1}
+
+
+@pytest.mark.asyncio
+async def test_processWeeklyMessage_sendImagePages(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    make_mock_member: Callable[[int, str], Member],
+) -> None:
+    # Arrange
+    mocker.patch.object(
+        interview_match.AsyncDbPairHistoryHandler,
+        "get_recent_pairs",
+        return_value={},
+    )
+    mocker.patch.object(cog, "_store_pairs")
+    mock_dispatch = mocker.patch.object(
+        interview_match.DM_DISPATCHER,
+        "dispatch",
+        return_value=DmDeliveryReport(
+            sent=4,
+            failed=0,
+            blocked_ids=(),
+            retries=0,
+            elapsed=0.1,
+            average_latency=0.05,
+            max_latency=0.08,
+        ),
+    )
+    mock_render = mocker.patch.object(
+        interview_match,
+        "render_match_images",
+        return_value=[
+            io.BytesIO(b"page") for _ in range(interview_match.MAX_IMAGES_PER_MESSAGE + 1)
+        ],
+    )
+    placeholder = make_mock_member(99, "Placeholder")
+    placeholder.send = AsyncMock()
+    week_otter_pool = [make_mock_member(otter_id, f"Otter {otter_id}") for otter_id in range(4)]
+    mocker.patch.object(
+        cog,
+        "_make_pairs",
+        return_value=[tuple(week_otter_pool[:2]), tuple(week_otter_pool[2:])],
+    )
+    channel = AsyncMock()
+
+    # Act
+    await cog._process_weekly_message(channel, week_otter_pool, placeholder)
+
+    # Assert
+    mock_render.assert_awaited_once()
+    sent_messages = list(mock_dispatch.await_args.args[0])
+    assert [otter.id for otter, _message in sent_messages] == [0, 1, 2, 3]
+    placeholder.send.assert_awaited_once()
+    assert channel.send.await_count == 2
+    first_files = channel.send.await_args_list[0].kwargs["files"]
+    second_files = channel.send.await_args_list[1].kwargs["files"]
+    assert len(first_files) == interview_match.MAX_IMAGES_PER_MESSAGE
+    assert len(second_files) == 1
+    assert second_files[0].filename == "interview_match_11.png"
+
+
+@pytest.mark.asyncio
+async def test_sendDeliverySummary_mentionBlocked(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    mock_guild: discord.Guild,
+) -> None:
+    # Arrange
+    moderator = Mock()
+    moderator.send = AsyncMock()
+    spy_outbound_send = mocker.spy(interview_match.OUTBOUND_SCHEDULER, "send")
+    delivery_report = DmDeliveryReport(
+        sent=3,
+        failed=1,
+        blocked_ids=(7, 8),
+        retries=2,
+        elapsed=1.5,
+        average_latency=0.5,
+        max_latency=1.0,
+    )
+
+    # Act
+    await cog._send_delivery_summary(mock_guild, moderator, delivery_report)
+
+    # Assert
+    spy_outbound_send.assert_called_once()
+    assert spy_outbound_send.call_args.args[:2] == (OutboundLane.BULK, moderator)
+    summary: str = moderator.send.await_args.args[0]
+    assert "Delivered: 3, failed: 1, with direct messages closed: 2" in summary
+    assert "<@7>, <@8>" in summary
+
+
+@pytest.mark.asyncio
+async def test_checkWeeklyMessage_skipMissingMessage(
+    mocker: MockFixture,
+    cog: interview_match.InterviewMatch,
+    mock_bot: Bot,
+    make_mock_member: Callable[[int, str], Member],
+) -> None:
+    # Arrange
+    entries = [
+        InterviewMatchView(
+            guild_id=guild_id,
+            author_id=99,
+            channel_id=guild_id * 10,
+            day_of_the_week=0,
+            emoji="👍",
+            message_id=guild_id * 100,
+        )
+        for guild_id in (1, 2)
+    ]
+    mocker.patch.object(
+        interview_match.AsyncDbInterviewMatchHandler,
+        "get_day_interview_match_views",
+        return_value=entries,
+    )
+    channels = {}
+    for entry in entries:
+        channel = Mock(spec=discord.TextChannel)
+        channel.guild = Mock(id=entry.guild_id)
+        channel.send = AsyncMock()
+        channels[entry.channel_id] = channel
+    mock_bot.get_channel = Mock(side_effect=channels.get)
+    placeholder = make_mock_member(99, "Placeholder")
+    weekly_message = Mock(spec=discord.Message)
+    mocker.patch.object(
+        cog,
+        "_get_weekly_message",
+        side_effect=[None, (weekly_message, placeholder)],
+    )
+    week_otter_pool = [make_mock_member(1, "Otter 1"), make_mock_member(2, "Otter 2")]
+    mocker.patch.object(cog, "_get_weekly_pool", return_value=week_otter_pool)
+    mock_process = mocker.patch.object(cog, "_process_weekly_message")
+
+    # Act
+    report = await cog._check_weekly_message(weekday=0)
+
+    # Assert
+    assert report is not None
+    assert [result.status for result in report.results] == [
+        BroadcastStatus.SKIPPED,
+        BroadcastStatus.SENT,
+    ]
+    mock_process.assert_awaited_once_with(
+        channel=channels[20],
+        week_otter_pool=week_otter_pool,
+        placeholder=placeholder,
+    )
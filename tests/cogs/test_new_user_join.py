@@ -1,10 +1,16 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
+from discord import Guild
+from discord import Member
 from discord.ext.commands import Bot
+from pytest_mock import MockFixture
 
 from otter_welcome_buddy.cogs import new_user_joins
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
 
 
 @pytest.mark.asyncio
@@ -26,3 +32,103 @@ def test_commandMessage_correctMessage(mock_bot: Bot, mock_msg_fmt: MagicMock) -
 
     # Assert
     assert mock_msg_fmt.welcome_message.called
+
+
+def _make_joining_member(mock_guild: Guild, member_id: int, bot: bool = False) -> Member:
+    mocked_member = Mock()
+    mocked_member.id = member_id
+    mocked_member.bot = bot
+    mocked_member.mention = f"<@{member_id}>"
+    mocked_member.guild = mock_guild
+    return mocked_member
+
+
+@pytest.mark.asyncio
+async def test_onMemberJoin_batchWindow(
+    mock_bot: Bot,
+    mock_msg_fmt: MagicMock,
+    mock_guild: Guild,
+    mocker: MockFixture,
+) -> None:
+    # Arrange
+    mocker.patch.object(new_user_joins, "_JOIN_BATCH_WINDOW", 0)
+    mocked_insert_member_joins = mocker.patch.object(
+        new_user_joins.AsyncDbMemberJoinHandler,
+        "insert_member_joins",
+    )
+    mock_msg_fmt.welcome_message.return_value = "Welcome"
+    mock_guild.id = 1
+    mock_guild.system_channel.send = AsyncMock()
+    spy_outbound_send = mocker.spy(new_user_joins.OUTBOUND_SCHEDULER, "send")
+    cog = new_user_joins.Greetings(mock_bot, mock_msg_fmt)
+
+    # Act
+    for member_id in range(120):
+        await cog.on_member_join(_make_joining_member(mock_guild, member_id))
+    await cog.on_member_join(_make_joining_member(mock_guild, 999, bot=True))
+    await asyncio.gather(*cog._flush_tasks.values())
+
+    # Assert
+    mock_msg_fmt.welcome_message.assert_called_once()
+    mocked_insert_member_joins.assert_awaited_once()
+    member_join_models = mocked_insert_member_joins.call_args.kwargs["member_join_models"]
+    assert [model.member_id for model in member_join_models] == list(range(120))
+    assert mock_guild.system_channel.send.await_count == 3
+    assert {call.args[0] for call in spy_outbound_send.call_args_list} == {OutboundLane.BULK}
+    first_message: str = mock_guild.system_channel.send.call_args_list[0].args[0]
+    assert first_message.startswith("Welcome")
+    assert "<@0>" in first_message and "<@50>" not in first_message
+    assert "<@999>" not in mock_guild.system_channel.send.call_args.args[0]
+    assert not cog._pending_joins and not cog._flush_tasks
+
+
+@pytest.mark.asyncio
+async def test_onMemberJoin_surgeSummary(
+    mock_bot: Bot,
+    mock_msg_fmt: MagicMock,
+    mock_guild: Guild,
+    mocker: MockFixture,
+) -> None:
+    # Arrange
+    mocker.patch.object(new_user_joins, "_JOIN_BATCH_WINDOW", 0)
+    mocker.patch.object(new_user_joins.AsyncDbMemberJoinHandler, "insert_member_joins")
+    mock_msg_fmt.welcome_message.return_value = "Welcome"
+    mock_guild.id = 1
+    mock_guild.system_channel.send = AsyncMock()
+    cog = new_user_joins.Greetings(mock_bot, mock_msg_fmt)
+
+    # Act
+    for member_id in range(1000):
+        await cog.on_member_join(_make_joining_member(mock_guild, member_id))
+    await asyncio.gather(*cog._flush_tasks.values())
+
+    # Assert
+    mock_guild.system_channel.send.assert_awaited_once()
+    assert "1000 new members" in mock_guild.system_channel.send.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_cogUnload_flushPendingJoins(
+    mock_bot: Bot,
+    mock_msg_fmt: MagicMock,
+    mock_guild: Guild,
+    mocker: MockFixture,
+) -> None:
+    # Arrange
+    mocked_insert_member_joins = mocker.patch.object(
+        new_user_joins.AsyncDbMemberJoinHandler,
+        "insert_member_joins",
+        side_effect=Exception("Database down"),
+    )
+    mock_guild.id = 1
+    mock_guild.system_channel.send = AsyncMock()
+    cog = new_user_joins.Greetings(mock_bot, mock_msg_fmt)
+    await cog.on_member_join(_make_joining_member(mock_guild, 1))
+
+    # Act
+    await cog.cog_unload()
+
+    # Assert
+    mocked_insert_member_joins.assert_awaited_once()
+    mock_guild.system_channel.send.assert_awaited_once()
+    assert not cog._pending_joins and not cog._flush_tasks
@@ -0,0 +1,326 @@
+from unittest.mock import AsyncMock
+from unittest.mock import call
+from unittest.mock import Mock
+
+import discord
+import pytest
+from discord import Guild
+from discord import Role
+from discord.ext.commands import Bot
+from discord.ext.commands import Context
+from pytest_mock import MockFixture
+
+from otter_welcome_buddy.cogs import roles
+from otter_welcome_buddy.common.constants import WELCOME_MESSAGES_FEATURE
+from otter_welcome_buddy.common.utils.reaction_roles import ReactionRoleIndex
+from otter_welcome_buddy.common.utils.reaction_router import ReactionRouter
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.external.role_config_model import ReactionRoleModel
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+from otter_welcome_buddy.database.models.view.role_config_view import ReactionRoleView
+from otter_welcome_buddy.database.models.view.welcome_reconciliation_view import (
+    WelcomeReconciliationView,
+)
+
+
+def _make_user(user_id: int, has_role: bool = False, is_member: bool = True) -> Mock:
+    mocked_user = Mock(spec=discord.Member if is_member else discord.User)
+    mocked_user.id = user_id
+    mocked_user.bot = False
+    mocked_user.get_role = Mock(return_value=Mock() if has_role else None)
+    return mocked_user
+
+
+def _make_reaction(emoji: str, users: list[Mock]) -> Mock:
+    async def _users(limit=None, after=None):
+        for user in users:
+            if after is None or user.id > after.id:
+                yield user
+
+    mocked_reaction = Mock()
+    mocked_reaction.emoji = emoji
+    mocked_reaction.users = Mock(side_effect=_users)
+    return mocked_reaction
+
+
+@pytest.mark.asyncio
+async def test_reconcileWelcomeReactions_resumeFromCheckpoint(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+    mock_role: Role,
+) -> None:
+    # Arrange
+    reaction_router = ReactionRouter()
+    reaction_router.watch(WELCOME_MESSAGES_FEATURE, 111, [222])
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROUTER", reaction_router)
+    mocker.patch.object(roles.ROLE_RESOLVER, "get_role", return_value=mock_role)
+    mock_submit = mocker.patch.object(roles.ROLE_GRANT_QUEUE, "submit", return_value=True)
+
+    mock_guild.id = 111
+    mock_bot.get_guild = Mock(return_value=mock_guild)
+    pending_user = _make_user(3)
+    done_reaction = _make_reaction("🎉", [_make_user(1)])
+    resumed_reaction = _make_reaction(
+        "👍",
+        [_make_user(1), _make_user(2), pending_user, _make_user(4, has_role=True)],
+    )
+    mock_channel = Mock(spec=discord.TextChannel)
+    mock_channel.id = 333
+    mock_channel.fetch_message = AsyncMock(
+        return_value=Mock(channel=mock_channel, reactions=[done_reaction, resumed_reaction]),
+    )
+    mock_guild.get_channel = Mock(return_value=mock_channel)
+
+    handler = roles.AsyncDbWelcomeReconciliationHandler
+    mocker.patch.object(
+        handler,
+        "get_checkpoint",
+        return_value=WelcomeReconciliationView(
+            message_id=222,
+            guild_id=111,
+            channel_id=333,
+            emoji="👍",
+            last_user_id=2,
+            done_emojis=("🎉",),
+        ),
+    )
+    mock_save_checkpoint = mocker.patch.object(handler, "save_checkpoint")
+    mock_delete_checkpoint = mocker.patch.object(handler, "delete_checkpoint")
+
+    # Act
+    result = await roles.Roles.reconcile_welcome_reactions(mock_bot)
+
+    # Assert
+    assert result == 1
+    mock_submit.assert_called_once_with(pending_user, mock_role)
+    done_reaction.users.assert_not_called()
+    assert resumed_reaction.users.call_args.kwargs["after"].id == 2
+    saved_checkpoint = mock_save_checkpoint.call_args.kwargs["checkpoint"]
+    assert saved_checkpoint.done_emojis == ("🎉", "👍")
+    mock_delete_checkpoint.assert_called_once_with(message_id=222)
+
+
+@pytest.mark.asyncio
+async def test_reconcileWelcomeReactions_searchMessageChannel(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+    mock_role: Role,
+) -> None:
+    # Arrange
+    reaction_router = ReactionRouter()
+    reaction_router.watch(WELCOME_MESSAGES_FEATURE, 111, [222])
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROUTER", reaction_router)
+    mocker.patch.object(roles.ROLE_RESOLVER, "get_role", return_value=mock_role)
+    mock_submit = mocker.patch.object(roles.ROLE_GRANT_QUEUE, "submit", return_value=True)
+
+    mock_guild.id = 111
+    mock_guild.get_member = Mock(return_value=None)
+    # The user that is not a Member left the guild, the member of the user is not cached
+    uncached_member = _make_user(3)
+    mock_guild.query_members = AsyncMock(return_value=[uncached_member])
+    mock_bot.get_guild = Mock(return_value=mock_guild)
+    user = _make_user(1)
+    other_channel = Mock(spec=discord.TextChannel)
+    other_channel.fetch_message = AsyncMock(side_effect=discord.NotFound(Mock(status=404), ""))
+    welcome_channel = Mock(spec=discord.TextChannel)
+    welcome_channel.id = 333
+    welcome_channel.fetch_message = AsyncMock(
+        return_value=Mock(
+            channel=welcome_channel,
+            reactions=[
+                _make_reaction(
+                    "👍",
+                    [user, _make_user(2, is_member=False), _make_user(3, is_member=False)],
+                ),
+            ],
+        ),
+    )
+    mock_guild.text_channels = [other_channel, welcome_channel]
+
+    handler = roles.AsyncDbWelcomeReconciliationHandler
+    mocker.patch.object(handler, "get_checkpoint", return_value=None)
+    mock_save_checkpoint = mocker.patch.object(handler, "save_checkpoint")
+    mocker.patch.object(handler, "delete_checkpoint")
+
+    # Act
+    result = await roles.Roles.reconcile_welcome_reactions(mock_bot)
+
+    # Assert
+    assert result == 2
+    assert mock_submit.call_args_list == [call(user, mock_role), call(uncached_member, mock_role)]
+    mock_guild.query_members.assert_awaited_once_with(user_ids=[2, 3], limit=2, cache=False)
+    assert mock_save_checkpoint.call_args.kwargs["checkpoint"].channel_id == 333
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "event_type, emoji, expected_revoke",
+    [
+        ("REACTION_ADD", "👍", False),
+        ("REACTION_REMOVE", "👍", True),
+        ("REACTION_ADD", "🎉", None),
+    ],
+)
+async def test_applyReactionRole_submitGrant(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+    mock_role: Role,
+    event_type: str,
+    emoji: str,
+    expected_revoke: bool | None,
+) -> None:
+    # Arrange
+    reaction_role_index = ReactionRoleIndex()
+    reaction_role_index.set_guild(111, [ReactionRoleView(message_id=222, emoji="👍", role_id=333)])
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROLES", reaction_role_index)
+    mock_submit = mocker.patch.object(roles.ROLE_GRANT_QUEUE, "submit")
+    member = _make_user(1)
+    mock_guild.get_member = Mock(return_value=member)
+    mock_guild.get_role = Mock(return_value=mock_role)
+    mock_bot.get_guild = Mock(return_value=mock_guild)
+    cog = roles.Roles(mock_bot)
+    payload = Mock(
+        guild_id=111,
+        message_id=222,
+        user_id=1,
+        member=None,
+        emoji=emoji,
+        event_type=event_type,
+    )
+
+    # Act
+    await cog._apply_reaction_role(payload)
+
+    # Assert
+    if expected_revoke is None:
+        mock_submit.assert_not_called()
+    else:
+        mock_submit.assert_called_once_with(member, mock_role, revoke=expected_revoke)
+        mock_guild.get_role.assert_called_once_with(333)
+
+
+@pytest.mark.asyncio
+async def test_startWelcomeReconciliation_onlyOnce(mocker: MockFixture, mock_bot: Bot) -> None:
+    # Arrange
+    mocker.patch.object(roles._ReconciliationState, "task", None)
+    mock_reconcile = mocker.patch.object(
+        roles.Roles,
+        "reconcile_welcome_reactions",
+        side_effect=[RuntimeError("failed"), 0],
+    )
+
+    # Act
+    is_first_started = roles.Roles.start_welcome_reconciliation(mock_bot)
+    await roles._ReconciliationState.task
+    # The first run failed, so the next ready starts it again
+    is_retry_started = roles.Roles.start_welcome_reconciliation(mock_bot)
+    await roles._ReconciliationState.task
+    is_reconnection_started = roles.Roles.start_welcome_reconciliation(mock_bot)
+
+    # Assert
+    assert is_first_started and is_retry_started
+    assert is_reconnection_started is False
+    assert mock_reconcile.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_welcomeRemove_keepReactionRoles(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_ctx: Context,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROUTER", ReactionRouter())
+    mocker.patch.object(roles, "send_plain_message")
+    BaseRoleConfigModel(
+        guild=mock_guild_model,
+        message_ids=[111],
+        reaction_roles=[ReactionRoleModel(message_id=222, emoji="👍", role_id=333)],
+    ).save()
+    mock_ctx.guild.id = mock_guild_model.guild_id
+    cog = roles.Roles(mock_bot)
+
+    # Act
+    await cog.remove.callback(cog, mock_ctx, None)
+
+    # Assert
+    base_role_config_model = BaseRoleConfigModel.objects(guild=mock_guild_model.guild_id).get()
+    assert base_role_config_model.message_ids == []
+    assert [reaction_role.role_id for reaction_role in base_role_config_model.reaction_roles] == [
+        333,
+    ]
+
+
+def test_initWelcomeMessages_keepEmptyWelcomeMessages(mocker: MockFixture) -> None:
+    # Arrange
+    reaction_router = ReactionRouter()
+    welcome_handler = AsyncMock()
+    reaction_router.register(
+        WELCOME_MESSAGES_FEATURE,
+        welcome_handler,
+        handle_unconfigured_guilds=True,
+    )
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROUTER", reaction_router)
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROLES", ReactionRoleIndex())
+    mocker.patch.object(
+        roles.DbRoleConfigHandler,
+        "get_base_role_config_views",
+        return_value=[
+            BaseRoleConfigView(guild_id=1, message_ids=(10,)),
+            # Config whose welcome messages were removed, keeping a reaction role
+            BaseRoleConfigView(
+                guild_id=2,
+                message_ids=(),
+                reaction_roles=(ReactionRoleView(message_id=20, emoji="👍", role_id=30),),
+            ),
+        ],
+    )
+
+    # Act
+    roles.Roles.init_welcome_messages()
+
+    # Assert
+    assert reaction_router.get_watched_messages(WELCOME_MESSAGES_FEATURE) == {
+        1: frozenset({10}),
+        2: frozenset(),
+    }
+    assert reaction_router.route(1, 99) == []
+    assert reaction_router.route(2, 99) == []
+    # Guild without config
+    assert reaction_router.route(3, 99) == [welcome_handler]
+
+
+@pytest.mark.asyncio
+async def test_welcomeRemove_sameAsRestart(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_ctx: Context,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    reaction_router = ReactionRouter()
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROUTER", reaction_router)
+    mocker.patch("otter_welcome_buddy.cogs.roles.REACTION_ROLES", ReactionRoleIndex())
+    mocker.patch.object(roles, "send_plain_message")
+    BaseRoleConfigModel(
+        guild=mock_guild_model,
+        message_ids=[111],
+        reaction_roles=[ReactionRoleModel(message_id=222, emoji="👍", role_id=333)],
+    ).save()
+    mock_ctx.guild.id = mock_guild_model.guild_id
+    cog = roles.Roles(mock_bot)
+    roles.Roles.init_welcome_messages()
+
+    # Act
+    await cog.remove.callback(cog, mock_ctx, 111)
+    watched_at_runtime = reaction_router.get_watched_messages(WELCOME_MESSAGES_FEATURE)
+    roles.Roles.init_welcome_messages()
+    watched_after_restart = reaction_router.get_watched_messages(WELCOME_MESSAGES_FEATURE)
+
+    # Assert
+    assert watched_at_runtime == watched_after_restart == {mock_guild_model.guild_id: frozenset()}
@@ -3,6 +3,7 @@ from collections.abc import Callable
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import Mock
+from unittest.mock import patch
 
 import pytest
 from discord import Guild
@@ -13,7 +14,14 @@ from discord.ext.commands import Context
 from mongoengine import connect as mongo_connect
 from mongoengine import disconnect as mongo_disconnect
 from mongomock import MongoClient
-
+from mongomock.collection import Collection
+
+from otter_welcome_buddy.common.utils.database import dispose_cache_engines
+from otter_welcome_buddy.common.utils.database import get_cache_engine
+from otter_welcome_buddy.database.config_cache import clear_config_caches
+from otter_welcome_buddy.database.config_replica import disable_config_replicas
+from otter_welcome_buddy.database.config_replica import enable_config_replicas
+from otter_welcome_buddy.database.dbconn import BaseModel
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 
 
@@ -82,9 +90,20 @@ def mock_cache_session():
 @pytest.fixture()
 def temporary_cache():
     db_path = "test.db"
+    dispose_cache_engines()
     yield db_path
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    dispose_cache_engines()
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.fixture()
+def temporary_replica(temporary_cache):
+    BaseModel.metadata.create_all(get_cache_engine(temporary_cache))
+    enable_config_replicas(temporary_cache)
+    yield temporary_cache
+    disable_config_replicas()
 
 
 @pytest.fixture()
@@ -94,8 +113,10 @@ def temporary_mongo_connection():
         host="mongodb://localhost",
         mongo_client_class=MongoClient,
     )
+    clear_config_caches()
     yield mock_mongo_connection
     mongo_disconnect()
+    clear_config_caches()
 
 
 @pytest.fixture()
@@ -105,3 +126,17 @@ def mock_guild_model(temporary_mongo_connection) -> GuildModel:
     )
     mocked_guild_model.save()
     return mocked_guild_model
+
+
+@pytest.fixture()
+def mongo_find_counter(temporary_mongo_connection):
+    """Records the collection of every find issued, dereferencing included"""
+    collection_names: list[str] = []
+    original_find = Collection.find
+
+    def _counting_find(self, *args, **kwargs):
+        collection_names.append(self.name)
+        return original_find(self, *args, **kwargs)
+
+    with patch.object(Collection, "find", _counting_find):
+        yield collection_names
@@ -119,3 +119,22 @@ def test_delete_announcements_config_invalid_id(temporary_mongo_connection: Mong
     # Assert
     with pytest.raises(DoesNotExist):
         AnnouncementsConfigModel.objects(guild=123).get()
+
+
+def test_get_all_announcements_configs_no_dereference(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_ids: list[int] = [1, 2, 3]
+    for mocked_guild_id in mocked_guild_ids:
+        GuildModel(guild_id=mocked_guild_id).save()
+        AnnouncementsConfigModel(guild=mocked_guild_id, channel_id=123).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbAnnouncementsConfigHandler.get_all_announcements_configs()
+    result_guild_ids = [result.guild.id for result in results]
+
+    # Assert
+    assert sorted(result_guild_ids) == mocked_guild_ids
+    assert mongo_find_counter == [AnnouncementsConfigModel._get_collection_name()]
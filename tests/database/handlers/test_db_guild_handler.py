@@ -2,9 +2,21 @@ import pytest
 from mongoengine import DoesNotExist
 from mongoengine import ValidationError
 from mongomock import MongoClient
+from mongomock.collection import Collection
+from pytest_mock import MockFixture
 
+from otter_welcome_buddy.database.handlers.db_guild_handler import AsyncDbGuildHandler
 from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.leetcode_config_model import (
+    LeetcodeConfigModel,
+)
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+from otter_welcome_buddy.database.models.view.guild_overview_view import GuildOverviewView
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
 
 
 def test_get_guild_succeed(temporary_mongo_connection: MongoClient) -> None:
@@ -78,3 +90,131 @@ def test_delete_guild_invalid_id(temporary_mongo_connection: MongoClient) -> Non
     # Assert
     with pytest.raises(DoesNotExist):
         GuildModel.objects(guild_id=123).get()
+
+
+@pytest.mark.asyncio
+async def test_async_get_guild_succeed(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    mocked_guild_model: GuildModel = GuildModel(
+        guild_id=mocked_guild_id,
+    )
+    mocked_guild_model.save()
+
+    # Act
+    result = await AsyncDbGuildHandler.get_guild(guild_id=mocked_guild_id)
+
+    # Assert
+    assert result is not None
+    assert result.id == mocked_guild_id
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_delete_guild(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    mocked_guild_model: GuildModel = GuildModel(
+        guild_id=mocked_guild_id,
+    )
+
+    # Act
+    await AsyncDbGuildHandler.insert_guild(guild_model=mocked_guild_model)
+    inserted = GuildModel.objects(guild_id=mocked_guild_id).first()
+    await AsyncDbGuildHandler.delete_guild(guild_id=mocked_guild_id)
+
+    # Assert
+    assert inserted is not None
+    with pytest.raises(DoesNotExist):
+        GuildModel.objects(guild_id=mocked_guild_id).get()
+
+
+def test_get_existing_guild_ids(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    GuildModel(guild_id=1).save()
+    GuildModel(guild_id=2).save()
+
+    # Act
+    result = DbGuildHandler.get_existing_guild_ids(guild_ids=[1, 3])
+
+    # Assert
+    assert result == {1}
+
+
+def test_insert_guilds(temporary_mongo_connection: MongoClient) -> None:
+    # Act
+    DbGuildHandler.insert_guilds(guild_ids={1, 2})
+
+    # Assert
+    assert sorted(GuildModel.objects.scalar("guild_id")) == [1, 2]
+
+
+def test_insert_guilds_skipExisting(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    # Inserted by a join event after the missing guilds were read
+    GuildModel(guild_id=2).save()
+
+    # Act
+    DbGuildHandler.insert_guilds(guild_ids={1, 2, 3})
+
+    # Assert
+    assert sorted(GuildModel.objects.scalar("guild_id")) == [1, 2, 3]
+
+
+def test_delete_guilds_not_in(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    for guild_id in [1, 2, 3]:
+        GuildModel(guild_id=guild_id).save()
+
+    # Act
+    result = DbGuildHandler.delete_guilds_not_in(guild_ids={2})
+
+    # Assert
+    assert result == {1, 3}
+    assert list(GuildModel.objects.scalar("guild_id")) == [2]
+
+
+def test_get_guild_overview(temporary_mongo_connection: MongoClient, mocker: MockFixture) -> None:
+    # Arrange
+    for guild_id in (1, 2, 3):
+        GuildModel(guild_id=guild_id).save()
+    LeetcodeConfigModel(guild=1, channel_id=10).save()
+    BaseRoleConfigModel(guild=1, message_ids=[11, 12]).save()
+    InterviewMatchModel(guild=2, author_id=20, channel_id=21, day_of_the_week=3).save()
+    aggregate_spy = mocker.spy(Collection, "aggregate")
+
+    # Act
+    result = DbGuildHandler.get_guild_overview(guild_ids=[1, 2])
+
+    # Assert
+    aggregate_spy.assert_called_once()
+    assert sorted(result, key=lambda overview: overview.guild_id) == [
+        GuildOverviewView(
+            guild_id=1,
+            announcements_config=None,
+            leetcode_config=ChannelConfigView(guild_id=1, channel_id=10),
+            interview_match=None,
+            base_role_config=BaseRoleConfigView(guild_id=1, message_ids=(11, 12)),
+        ),
+        GuildOverviewView(
+            guild_id=2,
+            announcements_config=None,
+            leetcode_config=None,
+            interview_match=InterviewMatchView(
+                guild_id=2,
+                author_id=20,
+                channel_id=21,
+                day_of_the_week=3,
+                emoji=None,
+                message_id=None,
+            ),
+            base_role_config=None,
+        ),
+    ]
+
+
+def test_get_guild_overview_no_guild_ids(temporary_mongo_connection: MongoClient) -> None:
+    # Act
+    result = DbGuildHandler.get_guild_overview(guild_ids=[])
+
+    # Assert
+    assert result == []
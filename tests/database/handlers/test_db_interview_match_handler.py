@@ -6,6 +6,7 @@ from mongomock import MongoClient
 from otter_welcome_buddy.database.handlers.db_interview_match_handler import DbInterviewMatchHandler
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.view.interview_match_view import InterviewMatchView
 
 
 def test_get_interview_match_succeed(
@@ -101,3 +102,116 @@ def test_delete_interview_match_invalid_id(temporary_mongo_connection: MongoClie
     # Assert
     with pytest.raises(DoesNotExist):
         InterviewMatchModel.objects(guild=123).get()
+
+
+def test_get_day_interview_matches_no_dereference(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_ids: list[int] = [1, 2, 3]
+    for mocked_guild_id in mocked_guild_ids:
+        GuildModel(guild_id=mocked_guild_id).save()
+        InterviewMatchModel(
+            guild=mocked_guild_id,
+            author_id=123,
+            channel_id=123,
+            day_of_the_week=0,
+        ).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbInterviewMatchHandler.get_day_interview_matches(weekday=0)
+    result_guild_ids = [result.guild.id for result in results]
+
+    # Assert
+    assert sorted(result_guild_ids) == mocked_guild_ids
+    assert mongo_find_counter == [InterviewMatchModel._get_collection_name()]
+
+
+def test_get_day_interview_match_views(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    for mocked_guild_id, mocked_weekday in [(1, 0), (2, 0), (3, 1)]:
+        GuildModel(guild_id=mocked_guild_id).save()
+        InterviewMatchModel(
+            guild=mocked_guild_id,
+            author_id=123,
+            channel_id=456,
+            day_of_the_week=mocked_weekday,
+            emoji="👍",
+        ).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbInterviewMatchHandler.get_day_interview_match_views(weekday=0)
+
+    # Assert
+    assert sorted(results, key=lambda result: result.guild_id) == [
+        InterviewMatchView(
+            guild_id=mocked_guild_id,
+            author_id=123,
+            channel_id=456,
+            day_of_the_week=0,
+            emoji="👍",
+            message_id=None,
+        )
+        for mocked_guild_id in (1, 2)
+    ]
+    assert mongo_find_counter == [InterviewMatchModel._get_collection_name()]
+
+
+def test_get_day_interview_match_views_from_snapshot(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    InterviewMatchModel(guild=123, author_id=1, channel_id=2, day_of_the_week=3).save()
+    DbInterviewMatchHandler.get_day_interview_matches(weekday=3)
+    InterviewMatchModel.drop_collection()
+
+    # Act
+    results = DbInterviewMatchHandler.get_day_interview_match_views(weekday=3)
+
+    # Assert
+    assert [result.guild_id for result in results] == [123]
+
+
+def test_update_interview_match_message(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+    InterviewMatchModel(
+        guild=mocked_guild_id,
+        author_id=123,
+        channel_id=123,
+        day_of_the_week=0,
+    ).save()
+
+    # Act
+    result = DbInterviewMatchHandler.update_interview_match_message(
+        guild_id=mocked_guild_id,
+        message_id=456,
+    )
+
+    # Assert
+    assert result is not None
+    assert result.message_id == 456
+    assert result.channel_id == 123
+    assert InterviewMatchModel.objects(guild=mocked_guild_id).get().message_id == 456
+
+
+def test_update_interview_match_message_not_found(
+    temporary_mongo_connection: MongoClient,
+) -> None:
+    # Act
+    result = DbInterviewMatchHandler.update_interview_match_message(
+        guild_id=123,
+        message_id=456,
+    )
+
+    # Assert
+    assert result is None
+    assert InterviewMatchModel.objects(guild=123).first() is None
@@ -0,0 +1,96 @@
+from functools import partial
+
+import pytest
+from pytest_mock import MockFixture
+
+from otter_welcome_buddy.common.utils.database import get_cache_engine
+from otter_welcome_buddy.database.dbconn import BaseModel
+from otter_welcome_buddy.database.dbconn import cache_session_scope
+from otter_welcome_buddy.database.handlers.db_interview_match_participant_handler import (
+    DbInterviewMatchParticipantHandler,
+)
+
+
+@pytest.fixture
+def participant_cache(mocker: MockFixture, temporary_cache: str) -> str:
+    BaseModel.metadata.create_all(get_cache_engine(temporary_cache))
+    mocker.patch(
+        "otter_welcome_buddy.database.handlers.db_interview_match_participant_handler"
+        ".cache_session_scope",
+        partial(cache_session_scope, db_path=temporary_cache),
+    )
+    return temporary_cache
+
+
+def test_add_and_remove_participants(participant_cache: str) -> None:
+    # Arrange
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=1, message_id=10)
+
+    # Act
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=101)
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+    DbInterviewMatchParticipantHandler.remove_participant(message_id=10, user_id=101)
+
+    # Assert
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=10) == [100]
+
+
+def test_get_participant_ids_not_tracked(participant_cache: str) -> None:
+    # Arrange
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=2, message_id=20)
+
+    # Act
+    DbInterviewMatchParticipantHandler.mark_tracking_incomplete()
+
+    # Assert
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=10) is None
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=20) is None
+
+
+def test_start_tracking_forget_last_message(participant_cache: str) -> None:
+    # Arrange
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=1, message_id=10)
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+    # A reaction recorded before the tracking of the new message started
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=11, user_id=101)
+
+    # Act
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=1, message_id=11)
+
+    # Assert
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=10) is None
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=11) == [101]
+
+
+def test_replace_participants_complete_tracking(participant_cache: str) -> None:
+    # Arrange
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=1, message_id=10)
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+    DbInterviewMatchParticipantHandler.mark_tracking_incomplete()
+
+    # Act
+    DbInterviewMatchParticipantHandler.replace_participants(
+        guild_id=1,
+        message_id=10,
+        user_ids=[101, 102, 101],
+    )
+
+    # Assert
+    assert sorted(DbInterviewMatchParticipantHandler.get_participant_ids(message_id=10) or []) == [
+        101,
+        102,
+    ]
+
+
+def test_stop_tracking(participant_cache: str) -> None:
+    # Arrange
+    DbInterviewMatchParticipantHandler.start_tracking(guild_id=1, message_id=10)
+    DbInterviewMatchParticipantHandler.add_participant(guild_id=1, message_id=10, user_id=100)
+
+    # Act
+    DbInterviewMatchParticipantHandler.stop_tracking(guild_id=1)
+
+    # Assert
+    assert DbInterviewMatchParticipantHandler.get_participant_ids(message_id=10) is None
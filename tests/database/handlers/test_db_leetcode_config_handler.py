@@ -0,0 +1,89 @@
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.handlers.db_leetcode_config_handler import (
+    DbLeetcodeConfigHandler,
+)
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.leetcode_config_model import (
+    LeetcodeConfigModel,
+)
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+
+
+def test_get_leetcode_config_succeed(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+    LeetcodeConfigModel(guild=mocked_guild_id, channel_id=123).save()
+
+    # Act
+    result = DbLeetcodeConfigHandler.get_leetcode_config(guild_id=mocked_guild_id)
+
+    # Assert
+    assert result is not None
+    assert result.channel_id == 123
+
+
+def test_get_leetcode_config_not_found(temporary_mongo_connection: MongoClient) -> None:
+    # Act
+    result = DbLeetcodeConfigHandler.get_leetcode_config(guild_id=123)
+
+    # Assert
+    assert result is None
+
+
+def test_get_all_leetcode_configs_no_dereference(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_ids: list[int] = [1, 2, 3]
+    for mocked_guild_id in mocked_guild_ids:
+        GuildModel(guild_id=mocked_guild_id).save()
+        LeetcodeConfigModel(guild=mocked_guild_id, channel_id=123).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbLeetcodeConfigHandler.get_all_leetcode_configs()
+    result_guild_ids = [result.guild.id for result in results]
+
+    # Assert
+    assert sorted(result_guild_ids) == mocked_guild_ids
+    assert mongo_find_counter == [LeetcodeConfigModel._get_collection_name()]
+
+
+def test_get_leetcode_config_views(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_ids: list[int] = [1, 2, 3]
+    for mocked_guild_id in mocked_guild_ids:
+        GuildModel(guild_id=mocked_guild_id).save()
+        LeetcodeConfigModel(guild=mocked_guild_id, channel_id=mocked_guild_id * 10).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbLeetcodeConfigHandler.get_leetcode_config_views()
+
+    # Assert
+    assert sorted(results, key=lambda result: result.guild_id) == [
+        ChannelConfigView(guild_id=mocked_guild_id, channel_id=mocked_guild_id * 10)
+        for mocked_guild_id in mocked_guild_ids
+    ]
+    assert mongo_find_counter == [LeetcodeConfigModel._get_collection_name()]
+
+
+def test_delete_leetcode_config(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+    LeetcodeConfigModel(guild=mocked_guild_id, channel_id=123).save()
+
+    # Act
+    DbLeetcodeConfigHandler.delete_leetcode_config(guild_id=mocked_guild_id)
+
+    # Assert
+    assert LeetcodeConfigModel.objects(guild=mocked_guild_id).first() is None
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.handlers.db_member_join_handler import AsyncDbMemberJoinHandler
+from otter_welcome_buddy.database.handlers.db_member_join_handler import DbMemberJoinHandler
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.member_join_model import MemberJoinModel
+
+
+def test_insert_member_joins_succeed(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    GuildModel(guild_id=mocked_guild_id).save()
+    mocked_member_join_models: list[MemberJoinModel] = [
+        MemberJoinModel(
+            guild=mocked_guild_id,
+            member_id=member_id,
+            joined_at=datetime(2024, 1, 1, minute=60 - member_id),
+        )
+        for member_id in range(1, 4)
+    ]
+
+    # Act
+    DbMemberJoinHandler.insert_member_joins(member_join_models=mocked_member_join_models)
+    DbMemberJoinHandler.insert_member_joins(member_join_models=[])
+
+    # Assert
+    result = DbMemberJoinHandler.get_member_joins(guild_id=mocked_guild_id)
+    assert [model.member_id for model in result] == [3, 2, 1]
+    assert DbMemberJoinHandler.get_member_joins(guild_id=456) == []
+
+
+def test_delete_guild_cascade_member_joins(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    mocked_guild_model: GuildModel = GuildModel(guild_id=mocked_guild_id)
+    mocked_guild_model.save()
+    MemberJoinModel(guild=mocked_guild_id, member_id=1, joined_at=datetime(2024, 1, 1)).save()
+
+    # Act
+    mocked_guild_model.delete()
+
+    # Assert
+    assert MemberJoinModel.objects.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_insert_member_joins(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    GuildModel(guild_id=mocked_guild_id).save()
+
+    # Act
+    await AsyncDbMemberJoinHandler.insert_member_joins(
+        member_join_models=[
+            MemberJoinModel(guild=mocked_guild_id, member_id=1, joined_at=datetime(2024, 1, 1)),
+        ],
+    )
+
+    # Assert
+    result = await AsyncDbMemberJoinHandler.get_member_joins(guild_id=mocked_guild_id)
+    assert len(result) == 1
@@ -0,0 +1,102 @@
+import datetime
+
+import pytest
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.handlers.db_pair_history_handler import DbPairHistoryHandler
+from otter_welcome_buddy.database.handlers.db_pair_history_handler import get_week_start
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.pair_history_model import PAIR_HISTORY_TTL
+from otter_welcome_buddy.database.models.external.pair_history_model import PairHistoryModel
+
+
+@pytest.fixture
+def week_start() -> datetime.datetime:
+    return get_week_start(datetime.datetime.utcnow())
+
+
+@pytest.mark.parametrize(
+    "moment, expected_week_start",
+    [
+        (datetime.datetime(2024, 5, 15, 18, 30), datetime.datetime(2024, 5, 13)),
+        (datetime.datetime(2024, 5, 13), datetime.datetime(2024, 5, 13)),
+        (datetime.datetime(2024, 5, 19, 23, 59), datetime.datetime(2024, 5, 13)),
+        (
+            datetime.datetime(
+                2024,
+                5,
+                19,
+                20,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=-6)),
+            ),
+            datetime.datetime(2024, 5, 20),
+        ),
+    ],
+)
+def test_get_week_start(moment: datetime.datetime, expected_week_start: datetime.datetime) -> None:
+    # Act / Assert
+    assert get_week_start(moment) == expected_week_start
+
+
+def test_insert_and_get_recent_pairs(
+    temporary_mongo_connection: MongoClient,
+    week_start: datetime.datetime,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    GuildModel(guild_id=mocked_guild_id).save()
+
+    # Act
+    DbPairHistoryHandler.insert_pairs(
+        guild_id=mocked_guild_id,
+        week=week_start - datetime.timedelta(weeks=20),
+        pairs=[(5, 6)],
+    )
+    DbPairHistoryHandler.insert_pairs(
+        guild_id=mocked_guild_id,
+        week=week_start - datetime.timedelta(weeks=2, days=-3),
+        pairs=[(2, 1), (3, 4)],
+    )
+    DbPairHistoryHandler.insert_pairs(
+        guild_id=mocked_guild_id,
+        week=week_start + datetime.timedelta(hours=5),
+        pairs=[(1, 2)],
+    )
+    DbPairHistoryHandler.insert_pairs(guild_id=mocked_guild_id, week=week_start, pairs=[])
+
+    # Assert
+    assert PairHistoryModel.objects.count() == 4
+    assert PairHistoryModel.objects(member_a=1, week=week_start).count() == 1
+    assert DbPairHistoryHandler.get_recent_pairs(guild_id=mocked_guild_id, weeks=12) == {
+        (1, 2): 1,
+        (3, 4): 3,
+    }
+    assert DbPairHistoryHandler.get_recent_pairs(guild_id=456, weeks=12) == {}
+
+
+def test_have_met(temporary_mongo_connection: MongoClient, week_start: datetime.datetime) -> None:
+    # Arrange
+    mocked_guild_id: int = 123
+    GuildModel(guild_id=mocked_guild_id).save()
+    DbPairHistoryHandler.insert_pairs(
+        guild_id=mocked_guild_id,
+        week=week_start - datetime.timedelta(weeks=3),
+        pairs=[(2, 1)],
+    )
+
+    # Act / Assert
+    assert DbPairHistoryHandler.have_met(mocked_guild_id, 1, 2, weeks=4) is True
+    assert DbPairHistoryHandler.have_met(mocked_guild_id, 2, 1, weeks=4) is True
+    assert DbPairHistoryHandler.have_met(mocked_guild_id, 1, 2, weeks=3) is False
+    assert DbPairHistoryHandler.have_met(mocked_guild_id, 1, 3, weeks=4) is False
+    assert DbPairHistoryHandler.have_met(456, 1, 2, weeks=4) is False
+
+
+def test_pair_history_indexes(temporary_mongo_connection: MongoClient) -> None:
+    # Act
+    PairHistoryModel.ensure_indexes()
+
+    # Assert
+    index_information = PairHistoryModel._get_collection().index_information()
+    assert "guild_1_member_a_1_member_b_1_week_-1" in index_information
+    assert index_information["week_1"]["expireAfterSeconds"] == PAIR_HISTORY_TTL.total_seconds()
@@ -2,10 +2,14 @@ import pytest
 from mongoengine import DoesNotExist
 from mongoengine import ValidationError
 from mongomock import MongoClient
+from pytest_mock import MockFixture
 
 from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.external.role_config_model import ReactionRoleModel
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+from otter_welcome_buddy.database.models.view.role_config_view import ReactionRoleView
 
 
 @pytest.fixture
@@ -119,6 +123,53 @@ def test_delete_base_role_config_invalid_id(temporary_mongo_connection: MongoCli
         BaseRoleConfigModel.objects(guild=123).get()
 
 
+def test_delete_welcome_messages_delete_config(
+    temporary_mongo_connection: MongoClient,
+    mock_base_role_config_model: BaseRoleConfigModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_base_role_config_model.guild.id
+    mock_base_role_config_model.save()
+
+    # Act
+    result = DbRoleConfigHandler.delete_welcome_messages(guild_id=mocked_guild_id)
+
+    # Assert
+    assert result is None
+    with pytest.raises(DoesNotExist):
+        BaseRoleConfigModel.objects(guild=mocked_guild_id).get()
+
+
+def test_delete_welcome_messages_keep_reaction_roles(
+    temporary_mongo_connection: MongoClient,
+    mock_base_role_config_model: BaseRoleConfigModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_base_role_config_model.guild.id
+    mock_base_role_config_model.reaction_roles = [
+        ReactionRoleModel(message_id=456, emoji="👍", role_id=789),
+    ]
+    mock_base_role_config_model.save()
+
+    # Act
+    result = DbRoleConfigHandler.delete_welcome_messages(guild_id=mocked_guild_id)
+
+    # Assert
+    assert result is not None
+    assert result.message_ids == []
+    stored_config = BaseRoleConfigModel.objects(guild=mocked_guild_id).get()
+    assert stored_config.message_ids == []
+    assert [reaction_role.role_id for reaction_role in stored_config.reaction_roles] == [789]
+
+
+def test_delete_welcome_messages_not_found(temporary_mongo_connection: MongoClient) -> None:
+    # Act
+    result = DbRoleConfigHandler.delete_welcome_messages(guild_id=123)
+
+    # Assert
+    assert result is None
+
+
 def test_delete_message_from_base_role_config_valid_id(
     temporary_mongo_connection: MongoClient,
     mock_base_role_config_model: BaseRoleConfigModel,
@@ -159,3 +210,219 @@ def test_delete_message_from_base_role_config_invalid_id(
     assert result is not None
     assert result.guild.id == mocked_guild_id
     assert len(result.message_ids) == 3
+
+
+def test_get_all_base_role_configs_no_dereference(
+    mongo_find_counter: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_ids: list[int] = [1, 2, 3]
+    for mocked_guild_id in mocked_guild_ids:
+        GuildModel(guild_id=mocked_guild_id).save()
+        BaseRoleConfigModel(guild=mocked_guild_id, message_ids=[123]).save()
+    mongo_find_counter.clear()
+
+    # Act
+    results = DbRoleConfigHandler.get_all_base_role_configs()
+    result_guild_ids = [result.guild.id for result in results]
+
+    # Assert
+    assert sorted(result_guild_ids) == mocked_guild_ids
+    assert mongo_find_counter == [BaseRoleConfigModel._get_collection_name()]
+
+
+def test_add_messages_to_base_role_config_new(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Act
+    result = DbRoleConfigHandler.add_messages_to_base_role_config(
+        guild_id=mock_guild_model.id,
+        input_message_ids=[123, 456],
+    )
+
+    # Assert
+    assert result is not None
+    assert sorted(result.message_ids) == [123, 456]
+
+
+def test_add_messages_to_base_role_config_existing(
+    temporary_mongo_connection: MongoClient,
+    mock_base_role_config_model: BaseRoleConfigModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_base_role_config_model.guild.id
+    mock_base_role_config_model.save()
+
+    # Act
+    result = DbRoleConfigHandler.add_messages_to_base_role_config(
+        guild_id=mocked_guild_id,
+        input_message_ids=[123, 456],
+    )
+
+    # Assert
+    assert result is not None
+    assert sorted(result.message_ids) == [123, 456]
+    assert DbRoleConfigHandler.get_base_role_config(guild_id=mocked_guild_id) is result
+
+
+def test_delete_message_from_base_role_config_no_config(
+    temporary_mongo_connection: MongoClient,
+) -> None:
+    # Act
+    result = DbRoleConfigHandler.delete_message_from_base_role_config(
+        guild_id=123,
+        input_message_id=123,
+    )
+
+    # Assert
+    assert result is None
+
+
+def test_insert_base_role_config_keeps_single_record(
+    temporary_mongo_connection: MongoClient,
+    mock_base_role_config_model: BaseRoleConfigModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_base_role_config_model.guild.id
+    DbRoleConfigHandler.insert_base_role_config(
+        base_role_config_model=mock_base_role_config_model,
+    )
+
+    # Act
+    DbRoleConfigHandler.insert_base_role_config(
+        base_role_config_model=BaseRoleConfigModel(guild=mocked_guild_id, message_ids=[456]),
+    )
+
+    # Assert
+    assert BaseRoleConfigModel.objects(guild=mocked_guild_id).count() == 1
+    assert BaseRoleConfigModel.objects(guild=mocked_guild_id).get().message_ids == [456]
+
+
+def test_get_base_role_config_views(
+    temporary_mongo_connection: MongoClient,
+    mock_base_role_config_model: BaseRoleConfigModel,
+) -> None:
+    # Arrange
+    mock_base_role_config_model.save()
+
+    # Act
+    results = DbRoleConfigHandler.get_base_role_config_views()
+
+    # Assert
+    assert results == [
+        BaseRoleConfigView(
+            guild_id=mock_base_role_config_model.guild.id,
+            message_ids=tuple(mock_base_role_config_model.message_ids),
+        ),
+    ]
+
+
+def test_set_reaction_role_replaces_emoji(mock_guild_model: GuildModel) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+
+    # Act
+    DbRoleConfigHandler.set_reaction_role(
+        guild_id=mocked_guild_id,
+        reaction_role_model=ReactionRoleModel(message_id=1, emoji="👍", role_id=10),
+    )
+    DbRoleConfigHandler.set_reaction_role(
+        guild_id=mocked_guild_id,
+        reaction_role_model=ReactionRoleModel(message_id=1, emoji="🎉", role_id=11),
+    )
+    DbRoleConfigHandler.set_reaction_role(
+        guild_id=mocked_guild_id,
+        reaction_role_model=ReactionRoleModel(message_id=1, emoji="👍", role_id=12),
+    )
+    results = DbRoleConfigHandler.get_base_role_config_views()
+
+    # Assert
+    assert results == [
+        BaseRoleConfigView(
+            guild_id=mocked_guild_id,
+            message_ids=(),
+            reaction_roles=(
+                ReactionRoleView(message_id=1, emoji="👍", role_id=12),
+                ReactionRoleView(message_id=1, emoji="🎉", role_id=11),
+            ),
+        ),
+    ]
+
+
+def test_set_reaction_role_added_concurrently(
+    mocker: MockFixture,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+    BaseRoleConfigModel(
+        guild=mock_guild_model,
+        reaction_roles=[ReactionRoleModel(message_id=1, emoji="👍", role_id=10)],
+    ).save()
+    update_reaction_role = DbRoleConfigHandler._update_reaction_role
+    lookups: list[int] = []
+
+    def _update_after_other_call(
+        guild_id: int,
+        reaction_role_model: ReactionRoleModel,
+    ) -> BaseRoleConfigModel | None:
+        # The first lookup ran before another call stored the same reaction role
+        lookups.append(guild_id)
+        if len(lookups) == 1:
+            return None
+        return update_reaction_role(guild_id, reaction_role_model)
+
+    mocker.patch.object(
+        DbRoleConfigHandler,
+        "_update_reaction_role",
+        side_effect=_update_after_other_call,
+    )
+
+    # Act
+    result = DbRoleConfigHandler.set_reaction_role(
+        guild_id=mocked_guild_id,
+        reaction_role_model=ReactionRoleModel(message_id=1, emoji="👍", role_id=12),
+    )
+
+    # Assert
+    assert result is not None
+    assert [(role.emoji, role.role_id) for role in result.reaction_roles] == [("👍", 12)]
+    assert len(lookups) == 2
+
+
+@pytest.mark.parametrize(
+    "emoji, expected_emojis",
+    [
+        ("👍", ["🎉", "👀"]),
+        (None, ["👀"]),
+    ],
+)
+def test_delete_reaction_role(
+    mock_guild_model: GuildModel,
+    emoji: str | None,
+    expected_emojis: list[str],
+) -> None:
+    # Arrange
+    mocked_guild_id: int = mock_guild_model.guild_id
+    for message_id, reaction_emoji in [(1, "👍"), (1, "🎉"), (2, "👀")]:
+        DbRoleConfigHandler.set_reaction_role(
+            guild_id=mocked_guild_id,
+            reaction_role_model=ReactionRoleModel(
+                message_id=message_id,
+                emoji=reaction_emoji,
+                role_id=10,
+            ),
+        )
+
+    # Act
+    result = DbRoleConfigHandler.delete_reaction_role(
+        guild_id=mocked_guild_id,
+        message_id=1,
+        emoji=emoji,
+    )
+
+    # Assert
+    assert result is not None
+    assert [reaction_role.emoji for reaction_role in result.reaction_roles] == expected_emojis
+    assert DbRoleConfigHandler.get_base_role_config(guild_id=mocked_guild_id) == result
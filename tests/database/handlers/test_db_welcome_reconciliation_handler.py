@@ -0,0 +1,68 @@
+from dataclasses import replace
+from functools import partial
+
+import pytest
+from pytest_mock import MockFixture
+
+from otter_welcome_buddy.common.utils.database import get_cache_engine
+from otter_welcome_buddy.database.dbconn import BaseModel
+from otter_welcome_buddy.database.dbconn import cache_session_scope
+from otter_welcome_buddy.database.handlers.db_welcome_reconciliation_handler import (
+    DbWelcomeReconciliationHandler,
+)
+from otter_welcome_buddy.database.models.view.welcome_reconciliation_view import (
+    WelcomeReconciliationView,
+)
+
+
+@pytest.fixture
+def reconciliation_cache(mocker: MockFixture, temporary_cache: str) -> str:
+    BaseModel.metadata.create_all(get_cache_engine(temporary_cache))
+    mocker.patch(
+        "otter_welcome_buddy.database.handlers.db_welcome_reconciliation_handler"
+        ".cache_session_scope",
+        partial(cache_session_scope, db_path=temporary_cache),
+    )
+    return temporary_cache
+
+
+def test_save_and_get_checkpoint(reconciliation_cache: str) -> None:
+    # Arrange
+    checkpoint = WelcomeReconciliationView(
+        message_id=1,
+        guild_id=2,
+        channel_id=3,
+        emoji="👍",
+        last_user_id=4,
+        done_emojis=("🎉",),
+    )
+
+    # Act
+    DbWelcomeReconciliationHandler.save_checkpoint(checkpoint=checkpoint)
+    DbWelcomeReconciliationHandler.save_checkpoint(
+        checkpoint=replace(checkpoint, emoji=None, done_emojis=("🎉", "👍")),
+    )
+    result = DbWelcomeReconciliationHandler.get_checkpoint(message_id=1)
+
+    # Assert
+    assert result is not None
+    assert (result.guild_id, result.channel_id, result.emoji, result.last_user_id) == (
+        2,
+        3,
+        None,
+        4,
+    )
+    assert result.done_emojis == ("🎉", "👍")
+
+
+def test_delete_checkpoint(reconciliation_cache: str) -> None:
+    # Arrange
+    DbWelcomeReconciliationHandler.save_checkpoint(
+        checkpoint=WelcomeReconciliationView(message_id=1, guild_id=2),
+    )
+
+    # Act
+    DbWelcomeReconciliationHandler.delete_checkpoint(message_id=1)
+
+    # Assert
+    assert DbWelcomeReconciliationHandler.get_checkpoint(message_id=1) is None
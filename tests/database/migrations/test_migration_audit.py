@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.migrations.audit import audit_queries
+from otter_welcome_buddy.database.migrations.audit import AUDITED_QUERIES
+
+
+def _make_query(winning_plan: dict) -> MagicMock:
+    mock_query = MagicMock()
+    mock_query.explain.return_value = {"queryPlanner": {"winningPlan": winning_plan}}
+    return MagicMock(return_value=mock_query)
+
+
+def test_audit_queries_flags_collection_scans() -> None:
+    # Arrange
+    queries = {
+        "indexed": _make_query({"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}),
+        "by_id": _make_query({"queryPlan": {"stage": "IDHACK"}}),
+        "scan": _make_query({"stage": "SUBPLAN", "inputStages": [{"stage": "COLLSCAN"}]}),
+    }
+
+    # Act
+    result = audit_queries(queries)
+
+    # Assert
+    assert [(audit.name, audit.stages) for audit in result] == [
+        ("indexed", ("FETCH", "IXSCAN")),
+        ("by_id", ("IDHACK",)),
+        ("scan", ("SUBPLAN", "COLLSCAN")),
+    ]
+    assert [audit.is_collection_scan for audit in result] == [False, False, True]
+
+
+def test_audited_queries_build(temporary_mongo_connection: MongoClient) -> None:
+    # Act / Assert
+    for build_query in AUDITED_QUERIES.values():
+        assert build_query()._query
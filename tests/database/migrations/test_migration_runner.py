@@ -0,0 +1,88 @@
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.migrations import runner
+from otter_welcome_buddy.database.migrations.migration import BatchedUpdate
+from otter_welcome_buddy.database.migrations.migration import Migration
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.external.schema_version_model import SchemaVersionModel
+
+
+def test_get_external_models() -> None:
+    # Act
+    result = runner.get_external_models()
+
+    # Assert
+    assert GuildModel in result
+    assert InterviewMatchModel in result
+    assert SchemaVersionModel in result
+    assert len(result) == len(set(result))
+
+
+def test_ensure_model_indexes(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    InterviewMatchModel.drop_collection()
+
+    # Act
+    runner.ensure_model_indexes()
+
+    # Assert
+    assert "day_of_the_week_1" in InterviewMatchModel._get_collection().index_information()
+
+
+def test_run_migrations_applies_pending_once(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    BaseRoleConfigModel._get_collection().insert_many([{"_id": 1}, {"_id": 2, "message_ids": [3]}])
+
+    # Act
+    first_result = runner.run_migrations()
+    second_result = runner.run_migrations()
+
+    # Assert
+    assert first_result == [1]
+    assert second_result == []
+    assert runner.get_schema_version() == 1
+    assert BaseRoleConfigModel.objects(guild=1).get().message_ids == []
+    assert BaseRoleConfigModel.objects(guild=2).get().message_ids == [3]
+
+
+def test_run_migrations_resumes_interrupted_step(temporary_mongo_connection: MongoClient) -> None:
+    # Arrange
+    GuildModel._get_collection().insert_many([{"_id": guild_id} for guild_id in range(1, 6)])
+    migrated_ids: list[int] = []
+    failing_ids: set[int] = {3}
+
+    def _build_update(document: Mapping[str, Any]) -> Mapping[str, Any]:
+        if document["_id"] in failing_ids:
+            raise RuntimeError("Interrupted")
+        migrated_ids.append(document["_id"])
+        return {"$set": {"migrated": True}}
+
+    migrations = [
+        Migration(
+            version=1,
+            description="Mark the guilds",
+            steps=(BatchedUpdate(document_type=GuildModel, build_update=_build_update),),
+        ),
+    ]
+
+    # Act
+    with pytest.raises(RuntimeError):
+        runner.run_migrations(migrations=migrations, batch_size=2)
+    interrupted_state = SchemaVersionModel.objects().get()
+    failing_ids.clear()
+    result = runner.run_migrations(migrations=migrations, batch_size=2)
+
+    # Assert
+    assert interrupted_state.version == 0
+    assert interrupted_state.pending_version == 1
+    assert interrupted_state.last_id == 2
+    assert result == [1]
+    assert migrated_ids == [1, 2, 3, 4, 5]
+    assert GuildModel._get_collection().count_documents({"migrated": True}) == 5
+    assert SchemaVersionModel.objects().get().pending_version is None
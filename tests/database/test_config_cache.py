@@ -0,0 +1,150 @@
+from unittest.mock import MagicMock
+
+import pytest
+from mongomock import MongoClient
+
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_cache import get_config_cache_stats
+from otter_welcome_buddy.database.config_cache import get_document_id
+from otter_welcome_buddy.database.config_cache import invalidate_guild_configs
+from otter_welcome_buddy.database.handlers.db_leetcode_config_handler import (
+    DbLeetcodeConfigHandler,
+)
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.leetcode_config_model import (
+    LeetcodeConfigModel,
+)
+
+
+@pytest.fixture
+def config_cache() -> ConfigCache:
+    return ConfigCache("test_config", max_size=2)
+
+
+def test_get_reads_through_once(config_cache: ConfigCache) -> None:
+    # Arrange
+    mock_config = MagicMock()
+    mock_loader = MagicMock(return_value=mock_config)
+
+    # Act
+    first_result = config_cache.get(1, mock_loader)
+    second_result = config_cache.get(1, mock_loader)
+
+    # Assert
+    assert first_result is mock_config
+    assert second_result is mock_config
+    mock_loader.assert_called_once_with(1)
+    assert config_cache.stats().hits == 1
+    assert config_cache.stats().misses == 1
+
+
+def test_get_caches_missing_configs(config_cache: ConfigCache) -> None:
+    # Arrange
+    mock_loader = MagicMock(return_value=None)
+
+    # Act
+    config_cache.get(1, mock_loader)
+    result = config_cache.get(1, mock_loader)
+
+    # Assert
+    assert result is None
+    mock_loader.assert_called_once()
+
+
+def test_get_evicts_least_recently_used(config_cache: ConfigCache) -> None:
+    # Arrange
+    mock_loader = MagicMock(side_effect=lambda guild_id: guild_id)
+    config_cache.get(1, mock_loader)
+    config_cache.get(2, mock_loader)
+    config_cache.get(1, mock_loader)
+
+    # Act
+    config_cache.get(3, mock_loader)
+    config_cache.get(1, mock_loader)
+    config_cache.get(2, mock_loader)
+
+    # Assert
+    assert mock_loader.call_count == 4
+    assert config_cache.stats().evictions == 2
+    assert config_cache.stats().size == 2
+
+
+def test_put_and_invalidate(config_cache: ConfigCache) -> None:
+    # Arrange
+    mock_loader = MagicMock(return_value="database")
+
+    # Act
+    config_cache.put(1, "memory")
+    cached_result = config_cache.get(1, mock_loader)
+    config_cache.invalidate(1)
+    loaded_result = config_cache.get(1, mock_loader)
+
+    # Assert
+    assert cached_result == "memory"
+    assert loaded_result == "database"
+    mock_loader.assert_called_once()
+
+
+def test_write_through_invalidates_on_failure(config_cache: ConfigCache) -> None:
+    # Arrange
+    mock_document = MagicMock()
+    mock_document.to_mongo.return_value = {"_id": 1}
+    config_cache.put(1, mock_document)
+    mock_writer = MagicMock(side_effect=ValueError)
+    mock_loader = MagicMock(return_value=None)
+
+    # Act
+    with pytest.raises(ValueError):
+        config_cache.write_through(mock_document, mock_writer)
+    result = config_cache.get(1, mock_loader)
+
+    # Assert
+    assert result is None
+    mock_loader.assert_called_once_with(1)
+
+
+def test_get_config_cache_stats(config_cache: ConfigCache) -> None:
+    # Act
+    result = get_config_cache_stats()
+
+    # Assert
+    assert result["test_config"] == config_cache.stats()
+
+
+def test_handler_serves_reads_from_memory(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    DbLeetcodeConfigHandler.insert_leetcode_config(
+        leetcode_config_model=LeetcodeConfigModel(guild=mock_guild_model, channel_id=1),
+    )
+    LeetcodeConfigModel.objects(guild=mock_guild_model.id).update(channel_id=2)
+
+    # Act
+    result = DbLeetcodeConfigHandler.get_leetcode_config(guild_id=mock_guild_model.id)
+    results = DbLeetcodeConfigHandler.get_all_leetcode_configs()
+
+    # Assert
+    assert result is not None
+    assert result.channel_id == 1
+    assert len(results) == 1
+    assert get_document_id(results[0]) == mock_guild_model.id
+
+
+def test_handler_delete_guild_invalidates(
+    temporary_mongo_connection: MongoClient,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    DbLeetcodeConfigHandler.insert_leetcode_config(
+        leetcode_config_model=LeetcodeConfigModel(guild=mock_guild_model, channel_id=1),
+    )
+
+    # Act
+    LeetcodeConfigModel.objects(guild=mock_guild_model.id).delete()
+    invalidate_guild_configs(mock_guild_model.id)
+    result = DbLeetcodeConfigHandler.get_leetcode_config(guild_id=mock_guild_model.id)
+
+    # Assert
+    assert result is None
@@ -0,0 +1,179 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from otter_welcome_buddy.database.config_cache import clear_config_caches
+from otter_welcome_buddy.database.config_cache import ConfigCache
+from otter_welcome_buddy.database.config_cache import warm_config_caches
+from otter_welcome_buddy.database.config_replica import ConfigReplica
+from otter_welcome_buddy.database.config_replica import disable_config_replicas
+from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
+from otter_welcome_buddy.database.handlers.db_role_config_handler import DbRoleConfigHandler
+from otter_welcome_buddy.database.models.cache.interview_match_cache_model import (
+    InterviewMatchCacheModel,
+)
+from otter_welcome_buddy.database.models.cache.role_config_cache_model import (
+    BaseRoleConfigCacheModel,
+)
+from otter_welcome_buddy.database.models.external.guild_model import GuildModel
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
+from otter_welcome_buddy.database.models.external.role_config_model import BaseRoleConfigModel
+from otter_welcome_buddy.database.models.view.role_config_view import BaseRoleConfigView
+
+
+@pytest.fixture
+def role_config_replica(temporary_replica) -> ConfigReplica[BaseRoleConfigModel]:
+    return ConfigReplica("test_base_role_config", BaseRoleConfigModel, BaseRoleConfigCacheModel)
+
+
+def test_store_and_get_round_trip(temporary_replica) -> None:
+    # Arrange
+    replica = ConfigReplica("test_interview_match", InterviewMatchModel, InterviewMatchCacheModel)
+    interview_match_model = InterviewMatchModel(
+        guild=123,
+        author_id=1,
+        channel_id=2,
+        day_of_the_week=3,
+        emoji="👍",
+    )
+
+    # Act
+    replica.store(123, interview_match_model)
+    result = replica.get(123)
+
+    # Assert
+    assert result is not None
+    assert result.guild.id == 123
+    assert result.channel_id == 2
+    assert result.day_of_the_week == 3
+    assert result.emoji == "👍"
+    assert result.message_id is None
+
+
+def test_store_none_deletes_row(role_config_replica: ConfigReplica[BaseRoleConfigModel]) -> None:
+    # Arrange
+    role_config_replica.store(123, BaseRoleConfigModel(guild=123, message_ids=[1, 2]))
+
+    # Act
+    role_config_replica.store(123, None)
+
+    # Assert
+    assert role_config_replica.get(123) is None
+
+
+def test_get_all_only_after_synced(role_config_replica: ConfigReplica[BaseRoleConfigModel]) -> None:
+    # Arrange
+    role_config_replica.store(1, BaseRoleConfigModel(guild=1, message_ids=[1]))
+
+    # Act
+    before_sync = role_config_replica.get_all()
+    role_config_replica.store_all(
+        [
+            BaseRoleConfigModel(guild=2, message_ids=[2]),
+            BaseRoleConfigModel(guild=3, message_ids=[3, 4]),
+        ],
+    )
+    after_sync = role_config_replica.get_all()
+
+    # Assert
+    assert before_sync is None
+    assert after_sync is not None
+    assert {model.guild.id: model.message_ids for model in after_sync} == {2: [2], 3: [3, 4]}
+
+
+def test_disabled_replica_does_nothing(temporary_replica) -> None:
+    # Arrange
+    replica = ConfigReplica("test_base_role_config", BaseRoleConfigModel, BaseRoleConfigCacheModel)
+    disable_config_replicas()
+
+    # Act
+    replica.store(1, BaseRoleConfigModel(guild=1, message_ids=[1]))
+
+    # Assert
+    assert replica.get(1) is None
+    assert replica.get_all() is None
+
+
+def test_cache_falls_back_to_replica(
+    role_config_replica: ConfigReplica[BaseRoleConfigModel],
+) -> None:
+    # Arrange
+    config_cache: ConfigCache[BaseRoleConfigModel] = ConfigCache(
+        "test_base_role_config",
+        replica=role_config_replica,
+    )
+    config_cache.put(1, BaseRoleConfigModel(guild=1, message_ids=[1]))
+    role_config_replica.store_all([BaseRoleConfigModel(guild=1, message_ids=[1])])
+    config_cache.clear()
+    mock_loader = MagicMock(side_effect=ServerSelectionTimeoutError("unreachable"))
+
+    # Act
+    result = config_cache.get(1, mock_loader)
+    results = config_cache.get_all(mock_loader)
+
+    # Assert
+    assert result is not None and result.message_ids == [1]
+    assert [model.guild.id for model in results] == [1]
+    # The values of the replica are not cached, the database is tried again on the next read
+    assert mock_loader.call_count == 2
+
+
+def test_cache_without_replica_raises() -> None:
+    # Arrange
+    config_cache: ConfigCache[BaseRoleConfigModel] = ConfigCache("test_base_role_config")
+    mock_loader = MagicMock(side_effect=ServerSelectionTimeoutError("unreachable"))
+
+    # Act / Assert
+    with pytest.raises(ServerSelectionTimeoutError):
+        config_cache.get_all(mock_loader)
+
+
+def test_handler_writes_are_replicated(temporary_replica, mock_guild_model: GuildModel) -> None:
+    # Act
+    DbRoleConfigHandler.add_messages_to_base_role_config(guild_id=123, input_message_ids=[1, 2])
+    DbRoleConfigHandler.delete_message_from_base_role_config(guild_id=123, input_message_id=1)
+    DbRoleConfigHandler.refresh_base_role_configs()
+    clear_config_caches()
+    warm_config_caches()
+
+    # Assert
+    BaseRoleConfigModel.drop_collection()
+    result = DbRoleConfigHandler.get_all_base_role_configs()
+    assert [(model.guild.id, model.message_ids) for model in result] == [(123, [2])]
+
+
+def test_delete_guild_removes_replicated_configs(
+    temporary_replica,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    DbRoleConfigHandler.add_messages_to_base_role_config(guild_id=123, input_message_ids=[1])
+    DbRoleConfigHandler.refresh_base_role_configs()
+    DbGuildHandler.refresh_guilds()
+
+    # Act
+    DbGuildHandler.delete_guild(guild_id=123)
+    clear_config_caches()
+    warm_config_caches()
+
+    # Assert
+    assert DbRoleConfigHandler.get_all_base_role_configs() == []
+
+
+def test_cache_views_fall_back_to_replica(
+    role_config_replica: ConfigReplica[BaseRoleConfigModel],
+) -> None:
+    # Arrange
+    config_cache: ConfigCache[BaseRoleConfigModel] = ConfigCache(
+        "test_base_role_config",
+        replica=role_config_replica,
+    )
+    role_config_replica.store_all([BaseRoleConfigModel(guild=1, message_ids=[1, 2])])
+    mock_loader = MagicMock(side_effect=ServerSelectionTimeoutError("unreachable"))
+
+    # Act
+    results = config_cache.get_all_views(mock_loader, BaseRoleConfigView.from_document)
+
+    # Assert
+    assert results == [BaseRoleConfigView(guild_id=1, message_ids=(1, 2))]
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from otter_welcome_buddy.database import db_executor
+
+
+@pytest.fixture
+def fresh_db_executor():
+    db_executor.shutdown_db_executor()
+    yield
+    db_executor.shutdown_db_executor()
+
+
+def test_get_db_executor_singleton(fresh_db_executor) -> None:
+    # Act
+    first_executor = db_executor.get_db_executor()
+    second_executor = db_executor.get_db_executor()
+
+    # Assert
+    assert first_executor is second_executor
+
+
+@pytest.mark.asyncio
+async def test_run_db_operation_off_loop(fresh_db_executor) -> None:
+    # Arrange
+    loop_thread: threading.Thread = threading.current_thread()
+
+    def _operation(value: int, increment: int = 0) -> tuple[int, threading.Thread]:
+        return value + increment, threading.current_thread()
+
+    # Act
+    result, operation_thread = await db_executor.run_db_operation(_operation, 1, increment=2)
+
+    # Assert
+    assert result == 3
+    assert operation_thread is not loop_thread
+
+
+@pytest.mark.asyncio
+async def test_run_db_operation_propagates_exceptions(fresh_db_executor) -> None:
+    # Arrange
+    def _operation() -> None:
+        raise ValueError("Database failure")
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        await db_executor.run_db_operation(_operation)
+
+
+def test_shutdown_db_executor_recreates(fresh_db_executor) -> None:
+    # Arrange
+    first_executor = db_executor.get_db_executor()
+
+    # Act
+    db_executor.shutdown_db_executor()
+
+    # Assert
+    assert db_executor.get_db_executor() is not first_executor
@@ -31,6 +31,7 @@ def mock_transport(mocker: MockFixture) -> mock.Mock:
 @pytest.fixture
 def mock_schema(mocker: MockFixture) -> mock.Mock:
     schema = mock.Mock(spec=GraphQLSchema)
+    mocker.patch.object(BaseGqlConn, "_schemas", {})
     return mocker.patch.object(
         base_gql_conn,
         "get_schema",
@@ -66,6 +67,21 @@ async def test_context_manager(
     mock_client[1].assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_context_manager_reuse_schema(
+    mock_transport: mock.Mock,
+    mock_schema: mock.Mock,
+    mock_client: tuple[mock.Mock, mock.Mock],
+) -> None:
+    async with TestBaseGqlConn() as first_conn:
+        first_schema = first_conn._client.schema  # noqa: SLF001
+    async with TestBaseGqlConn() as second_conn:
+        second_schema = second_conn._client.schema  # noqa: SLF001
+
+    mock_schema.assert_called_once_with(TestBaseGqlConn._SCHEMA_FILENAME)
+    assert first_schema is second_schema
+
+
 @pytest.mark.asyncio
 async def test_execute_success(
     mock_transport: mock.Mock,
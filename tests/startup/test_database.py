@@ -1,4 +1,6 @@
 import os
+from datetime import datetime
+from datetime import timezone
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -6,9 +8,22 @@ import pytest
 from discord import Guild
 from discord.ext.commands import Bot
 from pymongo import monitoring
+from pymongo.errors import ServerSelectionTimeoutError
 from pytest_mock import MockFixture
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import text
 
+from otter_welcome_buddy.common.utils.database import get_cache_engine
+from otter_welcome_buddy.database.dbconn import BaseModel
+from otter_welcome_buddy.database.dbconn import cache_session_scope
 from otter_welcome_buddy.database.handlers.db_guild_handler import DbGuildHandler
+from otter_welcome_buddy.database.models.cache.guild_cache_model import GuildCacheModel
+from otter_welcome_buddy.database.models.cache.replica_sync_cache_model import ReplicaSyncCacheModel
+from otter_welcome_buddy.database.models.cache.role_config_cache_model import (
+    BaseRoleConfigCacheModel,
+)
 from otter_welcome_buddy.database.models.external.guild_model import GuildModel
 from otter_welcome_buddy.startup import database
 
@@ -18,7 +33,6 @@ def test_initGuildTable(
     mocker: MockFixture,
     mock_bot: Bot,
     mock_guild: Guild,
-    mock_guild_model: GuildModel,
     is_new_guild: bool,
 ) -> None:
     # Arrange
@@ -27,30 +41,75 @@ def test_initGuildTable(
     mock_guild.id = mocked_guild_id
     mock_guild.name = mocked_guild_name
     mock_bot.guilds = [mock_guild]
+    mocker.patch.object(database, "_synced_guild_ids", set())
 
-    mock_get_guild = mocker.patch.object(
+    mock_get_existing_guild_ids = mocker.patch.object(
         DbGuildHandler,
-        "get_guild",
-        return_value=None if is_new_guild else mock_guild_model,
+        "get_existing_guild_ids",
+        return_value=set() if is_new_guild else {mocked_guild_id},
     )
-    mock_insert_guild = mocker.patch.object(DbGuildHandler, "insert_guild")
+    mock_insert_guilds = mocker.patch.object(DbGuildHandler, "insert_guilds")
+    mock_delete_guilds_not_in = mocker.patch.object(DbGuildHandler, "delete_guilds_not_in")
 
     # Act
     database.init_guild_table(bot=mock_bot)
 
     # Assert
-    mock_get_guild.assert_called_once_with(guild_id=mocked_guild_id)
-    if is_new_guild:
-        mock_insert_guild.assert_called_once()
-    else:
-        mock_insert_guild.assert_not_called()
+    mock_get_existing_guild_ids.assert_called_once_with(frozenset({mocked_guild_id}))
+    mock_insert_guilds.assert_called_once_with({mocked_guild_id} if is_new_guild else set())
+    mock_delete_guilds_not_in.assert_not_called()
+
+
+def test_initGuildTable_skipUnchanged(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+) -> None:
+    # Arrange
+    mock_guild.id = 123
+    mock_bot.guilds = [mock_guild]
+    mocker.patch.object(database, "_synced_guild_ids", set())
+
+    mock_get_existing_guild_ids = mocker.patch.object(
+        DbGuildHandler,
+        "get_existing_guild_ids",
+        return_value=set(),
+    )
+    mocker.patch.object(DbGuildHandler, "insert_guilds")
+
+    # Act
+    database.init_guild_table(bot=mock_bot)
+    database.init_guild_table(bot=mock_bot)
+    database.mark_guild_synced(456, is_stored=True)
+    database.init_guild_table(bot=mock_bot)
+
+    # Assert
+    assert mock_get_existing_guild_ids.call_count == 2
+
+
+def test_initGuildTable_prune(
+    mocker: MockFixture,
+    mock_bot: Bot,
+    mock_guild: Guild,
+    mock_guild_model: GuildModel,
+) -> None:
+    # Arrange
+    mock_guild.id = 456
+    mock_bot.guilds = [mock_guild]
+    mocker.patch.object(database, "_synced_guild_ids", set())
+
+    # Act
+    database.init_guild_table(bot=mock_bot, prune=True)
+
+    # Assert
+    assert list(GuildModel.objects.scalar("guild_id")) == [456]
 
 
 @pytest.mark.asyncio
-@patch("otter_welcome_buddy.startup.database.BaseModel.metadata.create_all")
-async def test_initDatabase(mock_create_all: MagicMock, mocker: MockFixture) -> None:
+async def test_initDatabase(mocker: MockFixture) -> None:
     # Arrange
     mock_engine = MagicMock()
+    mock_create_tables = mocker.patch.object(database, "create_cache_tables")
 
     mock_get_cache_engine = mocker.patch.object(
         database,
@@ -59,6 +118,8 @@ async def test_initDatabase(mock_create_all: MagicMock, mocker: MockFixture) ->
     )
     mock_monitoring_register = mocker.patch.object(monitoring, "register")
     mock_mongo_engine = mocker.patch.object(database, "mongo_connect")
+    mock_enable_replicas = mocker.patch.object(database, "enable_config_replicas")
+    mock_warm_caches = mocker.patch.object(database, "warm_config_caches")
     mocker.patch.dict(os.environ, {"MONGO_URI": "mongodb://localhost:27020"})
 
     # Act
@@ -66,6 +127,97 @@ async def test_initDatabase(mock_create_all: MagicMock, mocker: MockFixture) ->
 
     # Assert
     mock_get_cache_engine.assert_called_once()
-    mock_create_all.assert_called_once_with(mock_engine)
+    mock_create_tables.assert_called_once_with(mock_engine)
+    mock_enable_replicas.assert_called_once()
+    mock_warm_caches.assert_called_once()
     mock_monitoring_register.assert_called_once()
     mock_mongo_engine.assert_called_once()
+
+
+def test_createCacheTables_rebuildOutdated(temporary_cache: str) -> None:
+    # Arrange
+    engine = get_cache_engine(temporary_cache)
+    BaseModel.metadata.create_all(
+        engine,
+        tables=[GuildCacheModel.__table__, ReplicaSyncCacheModel.__table__],
+    )
+    with engine.begin() as connection:
+        # Table created before the reaction_roles column existed
+        connection.execute(
+            text("CREATE TABLE base_role_config (guild_id BIGINT PRIMARY KEY, message_ids JSON)"),
+        )
+        connection.execute(text("INSERT INTO base_role_config VALUES (1, '[1]')"))
+    with cache_session_scope(db_path=temporary_cache) as session:
+        session.add(ReplicaSyncCacheModel(name="guild", synced_at=datetime.now(timezone.utc)))
+        session.add(GuildCacheModel(guild_id=1))
+
+    # Act
+    database.create_cache_tables(engine)
+
+    # Assert
+    columns = {column["name"] for column in inspect(engine).get_columns("base_role_config")}
+    assert "reaction_roles" in columns
+    with cache_session_scope(db_path=temporary_cache) as session:
+        assert session.scalar(select(func.count()).select_from(BaseRoleConfigCacheModel)) == 0
+        # The replicas have to be synced again, the tables up to date are kept
+        assert session.scalar(select(func.count()).select_from(ReplicaSyncCacheModel)) == 0
+        assert session.get(GuildCacheModel, 1) is not None
+
+
+@patch("otter_welcome_buddy.startup.database._StartupState.are_replicas_synced", new=False)
+def test_syncConfigReplicas_onlyOnce(temporary_replica, mock_guild_model: GuildModel) -> None:
+    # Act
+    first_result = database.sync_config_replicas()
+    second_result = database.sync_config_replicas()
+
+    # Assert
+    assert first_result is True
+    assert second_result is False
+
+
+@patch("otter_welcome_buddy.startup.database._StartupState.are_replicas_synced", new=False)
+def test_syncConfigReplicas_databaseUnreachable(mocker: MockFixture) -> None:
+    # Arrange
+    mocker.patch.object(
+        database.DbGuildHandler,
+        "refresh_guilds",
+        side_effect=ServerSelectionTimeoutError("unreachable"),
+    )
+
+    # Act
+    result = database.sync_config_replicas()
+
+    # Assert
+    assert result is False
+    assert database._StartupState.are_replicas_synced is False
+
+
+@patch("otter_welcome_buddy.startup.database._StartupState.is_schema_upgraded", new=False)
+def test_upgradeDatabaseSchema_onlyOnce(mocker: MockFixture) -> None:
+    # Arrange
+    mock_ensure_indexes = mocker.patch.object(database, "ensure_model_indexes")
+    mock_run_migrations = mocker.patch.object(database, "run_migrations", return_value=[1])
+
+    # Act
+    database.upgrade_database_schema()
+    database.upgrade_database_schema()
+
+    # Assert
+    mock_ensure_indexes.assert_called_once()
+    mock_run_migrations.assert_called_once()
+
+
+@patch("otter_welcome_buddy.startup.database._StartupState.is_schema_upgraded", new=False)
+def test_upgradeDatabaseSchema_databaseUnreachable(mocker: MockFixture) -> None:
+    # Arrange
+    mocker.patch.object(
+        database,
+        "ensure_model_indexes",
+        side_effect=ServerSelectionTimeoutError("unreachable"),
+    )
+
+    # Act
+    database.upgrade_database_schema()
+
+    # Assert
+    assert database._StartupState.is_schema_upgraded is False
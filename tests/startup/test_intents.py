@@ -1,3 +1,6 @@
+import pytest
+from pytest_mock import MockFixture
+
 from otter_welcome_buddy.startup import intents
 
 
@@ -9,3 +12,19 @@ def test_getRegisteredIntents_messageNMembers() -> None:
     assert registered_intents.messages is True
     assert registered_intents.members is True
     assert registered_intents.reactions is True
+
+
+@pytest.mark.parametrize("low_memory_member_cache", [False, True])
+def test_getMemberCacheFlags_lowMemoryMode(
+    mocker: MockFixture,
+    low_memory_member_cache: bool,
+) -> None:
+    # Arrange
+    mocker.patch.object(intents, "LOW_MEMORY_MEMBER_CACHE", low_memory_member_cache)
+
+    # Act
+    member_cache_flags = intents.get_member_cache_flags()
+
+    # Assert
+    assert member_cache_flags.joined is not low_memory_member_cache
+    assert intents.should_chunk_guilds() is not low_memory_member_cache
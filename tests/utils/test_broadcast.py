@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+from discord.ext.commands import Bot
+
+from otter_welcome_buddy.common.utils.broadcast import BroadcastEngine
+from otter_welcome_buddy.common.utils.broadcast import BroadcastStatus
+from otter_welcome_buddy.database.models.view.channel_config_view import ChannelConfigView
+
+
+def _make_channel(channel_id: int) -> Mock:
+    mocked_channel = Mock(spec=discord.TextChannel)
+    mocked_channel.id = channel_id
+    mocked_channel.send = AsyncMock()
+    return mocked_channel
+
+
+def _make_http_exception(exception_type: type[discord.HTTPException], status: int) -> Exception:
+    response = Mock()
+    response.status = status
+    response.reason = "Error"
+    return exception_type(response, "Error")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_resolveChannels(mock_bot: Bot) -> None:
+    # Arrange
+    cached_channel = _make_channel(10)
+    fetched_channel = _make_channel(20)
+    mock_bot.get_channel = Mock(side_effect=lambda channel_id: {10: cached_channel}.get(channel_id))
+    mock_bot.fetch_channel = AsyncMock(return_value=fetched_channel)
+    embed = discord.Embed(title="Test")
+    targets = [
+        ChannelConfigView(guild_id=1, channel_id=10),
+        ChannelConfigView(guild_id=2, channel_id=20),
+    ]
+
+    # Act
+    report = await BroadcastEngine().broadcast(mock_bot, targets, content="Hello", embed=embed)
+
+    # Assert
+    cached_channel.send.assert_awaited_once_with("Hello", embed=embed)
+    fetched_channel.send.assert_awaited_once_with("Hello", embed=embed)
+    mock_bot.fetch_channel.assert_awaited_once_with(20)
+    assert [result.guild_id for result in report.results] == [1, 2]
+    assert report.count(BroadcastStatus.SENT) == 2
+
+
+@pytest.mark.asyncio
+async def test_broadcast_isolateFailures(mock_bot: Bot) -> None:
+    # Arrange
+    forbidden_channel = _make_channel(10)
+    forbidden_channel.send.side_effect = _make_http_exception(discord.Forbidden, 403)
+    failing_channel = _make_channel(20)
+    failing_channel.send.side_effect = ValueError("Test error")
+    voice_channel = Mock(spec=discord.VoiceChannel)
+    sent_channel = _make_channel(40)
+    channels = {10: forbidden_channel, 20: failing_channel, 30: voice_channel, 40: sent_channel}
+    mock_bot.get_channel = Mock(side_effect=channels.get)
+    mock_bot.fetch_channel = AsyncMock(
+        side_effect=_make_http_exception(discord.NotFound, 404),
+    )
+    targets = [
+        ChannelConfigView(guild_id=guild_id, channel_id=channel_id)
+        for guild_id, channel_id in enumerate((10, 20, 30, 40, 50))
+    ]
+
+    # Act
+    report = await BroadcastEngine().broadcast(mock_bot, targets, content="Hello")
+
+    # Assert
+    sent_channel.send.assert_awaited_once_with("Hello")
+    assert [result.status for result in report.results] == [
+        BroadcastStatus.FORBIDDEN,
+        BroadcastStatus.FAILED,
+        BroadcastStatus.INVALID_CHANNEL,
+        BroadcastStatus.SENT,
+        BroadcastStatus.CHANNEL_NOT_FOUND,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_boundedConcurrency(mock_bot: Bot) -> None:
+    # Arrange
+    mock_bot.get_channel = Mock(side_effect=_make_channel)
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _job(_channel: discord.TextChannel, target: ChannelConfigView) -> BroadcastStatus:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return BroadcastStatus.SKIPPED if target.guild_id % 2 else BroadcastStatus.SENT
+
+    targets = [ChannelConfigView(guild_id=guild_id, channel_id=guild_id) for guild_id in range(8)]
+
+    # Act
+    report = await BroadcastEngine(max_concurrency=3).run(mock_bot, targets, _job)
+
+    # Assert
+    assert max_in_flight == 3
+    assert report.count(BroadcastStatus.SENT) == 4
+    assert report.count(BroadcastStatus.SKIPPED) == 4
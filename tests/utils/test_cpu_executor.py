@@ -0,0 +1,116 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from otter_welcome_buddy.common.utils.cpu_executor import CpuExecutor
+
+
+def _get_worker(value: int) -> tuple[int, int, str]:
+    return value * 2, os.getpid(), threading.current_thread().name
+
+
+def _fail() -> None:
+    raise ValueError("Test error")
+
+
+@pytest.mark.asyncio
+async def test_runInThread_offLoop() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=1, process_workers=0)
+
+    # Act
+    result, _pid, thread_name = await cpu_executor.run_in_thread(_get_worker, 2)
+    stats = cpu_executor.stats()
+    cpu_executor.shutdown()
+
+    # Assert
+    assert result == 4
+    assert thread_name != threading.current_thread().name
+    assert (stats.completed, stats.failed, stats.timed_out, stats.in_flight) == (1, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_runInProcess_otherProcess() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=1, process_workers=1)
+
+    # Act
+    result, pid, _thread_name = await cpu_executor.run_in_process(_get_worker, 3)
+    cpu_executor.shutdown()
+
+    # Assert
+    assert result == 6
+    assert pid != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_runInProcess_threadsWithoutProcesses() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=1, process_workers=0)
+
+    # Act
+    _result, pid, thread_name = await cpu_executor.run_in_process(_get_worker, 3)
+    cpu_executor.shutdown()
+
+    # Assert
+    assert pid == os.getpid()
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_runInThread_propagateException() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=1, process_workers=0)
+
+    # Act
+    with pytest.raises(ValueError):
+        await cpu_executor.run_in_thread(_fail)
+    stats = cpu_executor.stats()
+    cpu_executor.shutdown()
+
+    # Assert
+    assert (stats.completed, stats.failed) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_runInThread_timeoutHoldsWorker() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=1, process_workers=0)
+    release = threading.Event()
+
+    # Act
+    with pytest.raises(asyncio.TimeoutError):
+        await cpu_executor.run_in_thread(release.wait, timeout=0.01)
+    queued_task = asyncio.create_task(cpu_executor.run_in_thread(_get_worker, 1))
+    await asyncio.sleep(0.01)
+    stats_while_blocked = cpu_executor.stats()
+    release.set()
+    result, _pid, _thread_name = await queued_task
+    stats = cpu_executor.stats()
+    cpu_executor.shutdown()
+
+    # Assert
+    assert stats_while_blocked.thread_queue_depth == 1
+    assert stats_while_blocked.in_flight == 1
+    assert result == 2
+    assert (stats.completed, stats.timed_out, stats.in_flight) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_runInThread_queueOnBusyWorkers() -> None:
+    # Arrange
+    cpu_executor = CpuExecutor(thread_workers=2, process_workers=0)
+
+    # Act
+    await asyncio.gather(*(cpu_executor.run_in_thread(time.sleep, 0.02) for _ in range(4)))
+    stats = cpu_executor.stats()
+    cpu_executor.shutdown()
+
+    # Assert
+    assert stats.completed == 4
+    assert stats.max_wait >= 0.01
+    assert stats.max_latency >= stats.max_wait
+    assert stats.thread_queue_depth == 0
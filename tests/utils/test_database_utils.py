@@ -1,8 +1,11 @@
 from unittest.mock import MagicMock
 
+import pytest
+from mongoengine import ValidationError
 from pytest_mock import MockFixture
 
 from otter_welcome_buddy.common.utils import database
+from otter_welcome_buddy.database.models.external.interview_match_model import InterviewMatchModel
 
 
 def test_get_cache_connection_string() -> None:
@@ -32,13 +35,21 @@ def test_get_cache_engine(
         "create_engine",
         return_value=mock_engine,
     )
+    mock_event = mocker.patch.object(database, "event")
+    database.dispose_cache_engines()
 
     # Act
-    database.get_cache_engine("test.db")
+    first_engine = database.get_cache_engine("test.db")
+    second_engine = database.get_cache_engine("test.db")
 
     # Assert
+    assert first_engine is second_engine is mock_engine
     mock_connection_string.assert_called_once()
     mock_create_engine.assert_called_once()
+    mock_event.listen.assert_called_once()
+
+    database.dispose_cache_engines()
+    mock_engine.dispose.assert_called_once()
 
 
 def test_create_cache_session(
@@ -58,10 +69,56 @@ def test_create_cache_session(
         "sessionmaker",
         return_value=mock_session_maker,
     )
+    database.dispose_cache_engines()
 
     # Act
     database.create_cache_session("test.db")
+    database.create_cache_session("test.db")
 
     # Assert
     mock_get_cache_engine.assert_called_once()
     mock_sessionmaker.assert_called_once()
+    assert mock_session_maker.call_count == 2
+
+    database.dispose_cache_engines()
+
+
+def test_get_cache_engine_sqlite_pragmas(temporary_cache) -> None:
+    # Act
+    engine = database.get_cache_engine(temporary_cache)
+    with engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+
+    # Assert
+    assert journal_mode == "wal"
+    # NORMAL
+    assert synchronous == 1
+
+
+def test_upsert_document(temporary_mongo_connection) -> None:
+    # Arrange
+    InterviewMatchModel(
+        guild=123,
+        author_id=1,
+        channel_id=1,
+        day_of_the_week=0,
+        emoji="👍",
+        message_id=1,
+    ).save()
+
+    # Act
+    result = database.upsert_document(
+        InterviewMatchModel(guild=123, author_id=2, channel_id=2, day_of_the_week=1),
+    )
+
+    # Assert
+    stored = InterviewMatchModel._get_collection().find_one({"_id": 123})
+    assert result.channel_id == 2
+    assert stored == {"_id": 123, "author_id": 2, "channel_id": 2, "day_of_the_week": 1}
+
+
+def test_upsert_document_invalid(mock_guild_model) -> None:
+    # Act / Assert
+    with pytest.raises(ValidationError):
+        database.upsert_document(InterviewMatchModel(guild=mock_guild_model.id))
@@ -0,0 +1,92 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+
+from otter_welcome_buddy.common.utils.dm_dispatcher import DmDispatcher
+
+
+def _make_recipient(recipient_id: int, side_effect: list | None = None) -> Mock:
+    mocked_recipient = Mock()
+    mocked_recipient.id = recipient_id
+    mocked_recipient.send = AsyncMock(side_effect=side_effect)
+    return mocked_recipient
+
+
+def _make_http_exception(
+    status: int,
+    exception_type: type[discord.HTTPException] = discord.HTTPException,
+) -> discord.HTTPException:
+    response = Mock()
+    response.status = status
+    response.reason = "Error"
+    return exception_type(response, "Error")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reportDelivery() -> None:
+    # Arrange
+    dm_dispatcher = DmDispatcher(retry_delay=0.0)
+    sent_recipient = _make_recipient(1)
+    retried_recipient = _make_recipient(2, side_effect=[_make_http_exception(500), None])
+    blocked_recipient = _make_recipient(
+        3,
+        side_effect=[_make_http_exception(403, discord.Forbidden)],
+    )
+    failed_recipient = _make_recipient(4, side_effect=[_make_http_exception(400)])
+
+    # Act
+    report = await dm_dispatcher.dispatch(
+        (recipient, f"Hello {recipient.id}")
+        for recipient in (sent_recipient, retried_recipient, blocked_recipient, failed_recipient)
+    )
+
+    # Assert
+    sent_recipient.send.assert_awaited_once_with("Hello 1")
+    assert retried_recipient.send.await_count == 2
+    blocked_recipient.send.assert_awaited_once()
+    failed_recipient.send.assert_awaited_once()
+    assert (report.sent, report.failed, report.blocked_ids, report.retries) == (2, 1, (3,), 1)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_giveUpAfterRetries() -> None:
+    # Arrange
+    dm_dispatcher = DmDispatcher(max_retries=2, retry_delay=0.0)
+    recipient = _make_recipient(1, side_effect=[_make_http_exception(503)] * 3)
+
+    # Act
+    report = await dm_dispatcher.dispatch([(recipient, "Hello")])
+
+    # Assert
+    assert recipient.send.await_count == 3
+    assert (report.sent, report.failed, report.retries) == (0, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_boundedConcurrency() -> None:
+    # Arrange
+    dm_dispatcher = DmDispatcher(max_concurrency=3)
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _send(_content: str) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    recipients = [_make_recipient(recipient_id) for recipient_id in range(10)]
+    for recipient in recipients:
+        recipient.send.side_effect = _send
+
+    # Act
+    report = await dm_dispatcher.dispatch((recipient, "Hello") for recipient in recipients)
+
+    # Assert
+    assert report.sent == 10
+    assert max_in_flight == 3
+    assert report.max_latency >= 0.01
@@ -2,8 +2,8 @@ from collections.abc import Callable
 
 import pytest
 from discord import Member
+from PIL import Image
 from PIL import ImageFont
-from PIL.Image import Image
 from PIL.ImageFont import FreeTypeFont
 from pytest_mock import MockFixture
 
@@ -33,7 +33,50 @@ def test__get_size(font_size: int, expected_width: int, expected_height: int) ->
     assert result_height == expected_height
 
 
-def test_create_match_image(
+def test_create_match_image() -> None:
+    # Arrange
+    name_pairs: list[tuple[str, str]] = [("Test1", "Test2"), ("Test3", "Test4")]
+
+    # Act
+    result = image.create_match_image(name_pairs)
+
+    # Assert
+    with Image.open(result) as result_image:
+        assert result_image.format == "PNG"
+        assert result_image.width > 0
+        assert result_image.height > 0
+
+
+def test_createMatchImages_paginatePairs() -> None:
+    # Arrange
+    name_pairs: list[tuple[str, str]] = [(f"Test{i}", f"Other{i}") for i in range(5)]
+
+    # Act
+    result = image.create_match_images(name_pairs, pairs_per_image=2)
+
+    # Assert
+    assert len(result) == 3
+    with Image.open(result[0]) as first_page, Image.open(result[-1]) as last_page:
+        assert first_page.height > last_page.height
+
+
+def test_getFont_loadedOnce(mocker: MockFixture) -> None:
+    # Arrange
+    image._get_font.cache_clear()
+    mock_truetype = mocker.patch.object(image.ImageFont, "truetype")
+
+    # Act
+    first_font = image._get_font()
+    second_font = image._get_font()
+
+    # Assert
+    mock_truetype.assert_called_once_with(FONT_PATH, image._FONT_SIZE)
+    assert first_font is second_font
+    image._get_font.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_renderMatchImages_useDisplayNames(
     mocker: MockFixture,
     make_mock_member: Callable[[int, str], Member],
 ) -> None:
@@ -42,13 +85,11 @@ def test_create_match_image(
         (make_mock_member(1, "Test1"), make_mock_member(2, "Test2")),
         (make_mock_member(3, "Test3"), make_mock_member(4, "Test4")),
     ]
-
-    mock_save_image = mocker.patch.object(Image, "save")
+    spy_create_match_images = mocker.spy(image, "create_match_images")
 
     # Act
-    result_image, result_path = image.create_match_image(mocked_member_list)
+    result = await image.render_match_images(mocked_member_list)
 
     # Assert
-    mock_save_image.assert_called_once()
-    assert result_image is not None
-    assert "otter_welcome_buddy/common/utils/image.jpg" in result_path
+    assert len(result) == 1
+    spy_create_match_images.assert_called_once_with([("Test1", "Test2"), ("Test3", "Test4")])
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+from discord import Guild
+from discord import Member
+
+from otter_welcome_buddy.common.utils.member_cache import MemberCache
+
+
+def _make_member(guild: Guild, member_id: int) -> Member:
+    mocked_member = Mock(spec=discord.Member)
+    mocked_member.id = member_id
+    mocked_member.guild = guild
+    return mocked_member
+
+
+def _make_user(user_id: int) -> discord.User:
+    mocked_user = Mock(spec=discord.User)
+    mocked_user.id = user_id
+    return mocked_user
+
+
+@pytest.fixture
+def guild() -> Guild:
+    mocked_guild = Mock()
+    mocked_guild.id = 1
+    # Members not cached by discord.py, as in the low memory mode
+    mocked_guild.get_member = Mock(return_value=None)
+    return mocked_guild
+
+
+def test_put_evictLeastRecentlyUsed(guild: Guild) -> None:
+    # Arrange
+    member_cache = MemberCache(max_size=2)
+    first_member = _make_member(guild, 1)
+    member_cache.put(first_member)
+    member_cache.put(_make_member(guild, 2))
+
+    # Act
+    member_cache.get(guild, 1)
+    member_cache.put(_make_member(guild, 3))
+
+    # Assert
+    assert member_cache.get(guild, 1) is first_member
+    assert member_cache.get(guild, 2) is None
+    assert member_cache.stats().size == 2
+
+
+def test_get_preferGuildCache(guild: Guild) -> None:
+    # Arrange
+    member_cache = MemberCache()
+    guild_member = _make_member(guild, 1)
+    guild.get_member = Mock(return_value=guild_member)
+
+    # Act
+    result = member_cache.get(guild, 1)
+
+    # Assert
+    assert result is guild_member
+    assert member_cache.stats().size == 0
+    assert member_cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_getMember_fetchFallback(guild: Guild) -> None:
+    # Arrange
+    member_cache = MemberCache()
+    fetched_member = _make_member(guild, 1)
+    guild.fetch_member = AsyncMock(
+        side_effect=[fetched_member, discord.NotFound(Mock(status=404), "")],
+    )
+
+    # Act
+    first_result = await member_cache.get_member(guild, 1)
+    cached_result = await member_cache.get_member(guild, 1)
+    missing_result = await member_cache.get_member(guild, 2)
+
+    # Assert
+    assert first_result is fetched_member
+    assert cached_result is fetched_member
+    assert missing_result is None
+    assert guild.fetch_member.await_count == 2
+    stats = member_cache.stats()
+    assert (stats.hits, stats.misses, stats.not_found) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_resolveMembers_queryMissingUsers(guild: Guild) -> None:
+    # Arrange
+    member_cache = MemberCache()
+    member = _make_member(guild, 1)
+    cached_member = _make_member(guild, 2)
+    member_cache.put(cached_member)
+    queried_members = [_make_member(guild, user_id) for user_id in range(3, 150)]
+    guild.query_members = AsyncMock(
+        side_effect=[queried_members[:100], queried_members[100:], asyncio.TimeoutError()],
+    )
+    users = [member, _make_user(2), member, *[_make_user(user_id) for user_id in range(3, 152)]]
+
+    # Act
+    result = await member_cache.resolve_members(guild, users)
+
+    # Assert
+    assert result == [member, cached_member, *queried_members]
+    assert guild.query_members.await_count == 2
+    assert guild.query_members.call_args.kwargs["user_ids"] == list(range(103, 152))
+    assert member_cache.stats().not_found == 2
+
+
+def test_forgetGuild_dropGuildMembers(guild: Guild) -> None:
+    # Arrange
+    member_cache = MemberCache()
+    other_guild = Mock(id=2, get_member=Mock(return_value=None))
+    member_cache.put(_make_member(guild, 1))
+    member_cache.put(_make_member(other_guild, 1))
+
+    # Act
+    member_cache.forget_guild(guild.id)
+
+    # Assert
+    assert member_cache.get(guild, 1) is None
+    assert member_cache.get(other_guild, 1) is not None
@@ -0,0 +1,196 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+
+from otter_welcome_buddy.common.utils.outbound_scheduler import get_route
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundLane
+from otter_welcome_buddy.common.utils.outbound_scheduler import OutboundScheduler
+from otter_welcome_buddy.common.utils.outbound_scheduler import TokenBucket
+
+
+async def _hold_turn(
+    outbound_scheduler: OutboundScheduler,
+    lane: OutboundLane,
+    route: str,
+    release: asyncio.Event,
+    order: list[str],
+) -> None:
+    async with outbound_scheduler.turn(lane, route):
+        order.append(route)
+        await release.wait()
+
+
+def test_tokenBucket_refill() -> None:
+    # Arrange
+    token_bucket = TokenBucket(rate=2.0, capacity=2.0)
+    now: float = token_bucket._updated_at
+
+    # Act
+    token_bucket.take(now)
+    token_bucket.take(now)
+    delay = token_bucket.get_delay(now)
+    delay_later = token_bucket.get_delay(now + 0.5)
+
+    # Assert
+    assert delay == pytest.approx(0.5)
+    assert delay_later == 0.0
+    assert not token_bucket.is_full(now + 0.5)
+    assert token_bucket.is_full(now + 1.0)
+
+
+@pytest.mark.asyncio
+async def test_turn_interactiveReservedSlots() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler(max_in_flight=2, bulk_max_in_flight=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    # Act
+    bulk_tasks = [
+        asyncio.create_task(
+            _hold_turn(outbound_scheduler, OutboundLane.BULK, f"bulk:{index}", release, order),
+        )
+        for index in range(2)
+    ]
+    await asyncio.sleep(0)
+    interactive_task = asyncio.create_task(
+        _hold_turn(outbound_scheduler, OutboundLane.INTERACTIVE, "interactive", release, order),
+    )
+    await asyncio.sleep(0)
+    order_while_busy = list(order)
+    bulk_stats = outbound_scheduler.stats(OutboundLane.BULK)
+    release.set()
+    await asyncio.gather(*bulk_tasks, interactive_task)
+
+    # Assert
+    assert order_while_busy == ["bulk:0", "interactive"]
+    assert bulk_stats.queue_depth == 1 and bulk_stats.in_flight == 1
+    assert outbound_scheduler.stats(OutboundLane.INTERACTIVE).sent == 1
+    assert outbound_scheduler.stats(OutboundLane.BULK).sent == 2
+
+
+@pytest.mark.asyncio
+async def test_turn_interactiveBeforeQueuedBulk() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler(max_in_flight=1, bulk_max_in_flight=1)
+    first_release = asyncio.Event()
+    release = asyncio.Event()
+    release.set()
+    order: list[str] = []
+
+    # Act
+    first_task = asyncio.create_task(
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "bulk:0", first_release, order),
+    )
+    await asyncio.sleep(0)
+    queued_tasks = [
+        asyncio.create_task(
+            _hold_turn(outbound_scheduler, OutboundLane.BULK, "bulk:1", release, order),
+        ),
+        asyncio.create_task(
+            _hold_turn(outbound_scheduler, OutboundLane.INTERACTIVE, "interactive", release, order),
+        ),
+    ]
+    await asyncio.sleep(0)
+    first_release.set()
+    await asyncio.gather(first_task, *queued_tasks)
+
+    # Assert
+    assert order == ["bulk:0", "interactive", "bulk:1"]
+
+
+@pytest.mark.asyncio
+async def test_turn_throttleRoute() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler(route_rate=50.0, route_burst=1.0)
+    release = asyncio.Event()
+    release.set()
+    order: list[str] = []
+
+    # Act
+    await asyncio.gather(
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "channel:1", release, order),
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "channel:1", release, order),
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "channel:2", release, order),
+    )
+    stats = outbound_scheduler.stats(OutboundLane.BULK)
+
+    # Assert
+    assert order == ["channel:1", "channel:2", "channel:1"]
+    assert stats.throttled == 1
+    assert stats.max_wait >= 0.015
+    assert stats.queue_depth == 0 and stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_turn_cancelWaiting() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler(max_in_flight=1, bulk_max_in_flight=1)
+    release = asyncio.Event()
+    order: list[str] = []
+    first_task = asyncio.create_task(
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "bulk:0", release, order),
+    )
+    await asyncio.sleep(0)
+    waiting_task = asyncio.create_task(
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "bulk:1", release, order),
+    )
+    await asyncio.sleep(0)
+
+    # Act
+    waiting_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+    release.set()
+    await first_task
+
+    # Assert
+    stats = outbound_scheduler.stats(OutboundLane.BULK)
+    assert order == ["bulk:0"]
+    assert stats.queue_depth == 0 and stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_turn_cancelAfterWoken() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler(max_in_flight=1, bulk_max_in_flight=1)
+    holding_turn = outbound_scheduler.turn(OutboundLane.BULK, "bulk:0")
+    await holding_turn.__aenter__()
+    release = asyncio.Event()
+    order: list[str] = []
+    waiting_task = asyncio.create_task(
+        _hold_turn(outbound_scheduler, OutboundLane.BULK, "bulk:1", release, order),
+    )
+    await asyncio.sleep(0)
+
+    # Act
+    waiting_task.cancel()
+    # The waiter is woken before the cancelled task gets to run again
+    await holding_turn.__aexit__(None, None, None)
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+
+    # Assert
+    stats = outbound_scheduler.stats(OutboundLane.BULK)
+    assert order == []
+    assert stats.queue_depth == 0 and stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_send_useDestinationRoute() -> None:
+    # Arrange
+    outbound_scheduler = OutboundScheduler()
+    member = Mock(spec=discord.Member)
+    member.id = 5
+    member.send = AsyncMock(return_value="message")
+
+    # Act
+    result = await outbound_scheduler.send(OutboundLane.BULK, member, "Hello", embed=None)
+
+    # Assert
+    member.send.assert_awaited_once_with("Hello", embed=None)
+    assert result == "message"
+    assert get_route(member) == "dm:5"
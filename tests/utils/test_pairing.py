@@ -0,0 +1,71 @@
+import pytest
+
+from otter_welcome_buddy.common.utils.pairing import pair_participants
+
+
+def _flatten(pairs: list[tuple[int, int]]) -> list[int]:
+    return sorted(participant_id for pair in pairs for participant_id in pair)
+
+
+def test_pairParticipants_everyoneOnce() -> None:
+    # Arrange
+    participant_ids = list(range(20))
+
+    # Act
+    result = pair_participants(participant_ids, staff_ids={0, 1, 2}, seed=1)
+
+    # Assert
+    assert len(result) == 10
+    assert _flatten(result) == participant_ids
+
+
+@pytest.mark.parametrize("staff_ids", [set(), {0, 1, 2, 3, 4, 5}, {0}])
+def test_pairParticipants_preferMixedPairs(staff_ids: set[int]) -> None:
+    # Arrange
+    participant_ids = list(range(12))
+
+    # Act
+    result = pair_participants(participant_ids, staff_ids=staff_ids, seed=1)
+
+    # Assert
+    mixed_pairs = sum(
+        1 for first, second in result if (first in staff_ids) != (second in staff_ids)
+    )
+    assert mixed_pairs == min(len(staff_ids), len(participant_ids) - len(staff_ids))
+
+
+def test_pairParticipants_avoidRecentRepeats() -> None:
+    # Arrange
+    participant_ids = list(range(6))
+    # Every pair met except (0, 5), (1, 4) and (2, 3), the older meetings are cheaper
+    past_pairs = {
+        (first, second): 1
+        for first in participant_ids
+        for second in participant_ids
+        if first < second and first + second != 5
+    }
+
+    # Act
+    result = pair_participants(participant_ids, staff_ids=set(), past_pairs=past_pairs, seed=7)
+
+    # Assert
+    assert sorted(tuple(sorted(pair)) for pair in result) == [(0, 5), (1, 4), (2, 3)]
+
+
+def test_pairParticipants_reproducibleSeed() -> None:
+    # Arrange
+    participant_ids = list(range(50))
+
+    # Act
+    first_result = pair_participants(participant_ids, staff_ids={1, 2}, seed=42)
+    second_result = pair_participants(participant_ids, staff_ids={1, 2}, seed=42)
+
+    # Assert
+    assert first_result == second_result
+
+
+def test_pairParticipants_oddParticipants() -> None:
+    # Act / Assert
+    assert pair_participants([], staff_ids=set()) == []
+    with pytest.raises(ValueError):
+        pair_participants([1, 2, 3, 3], staff_ids=set())
@@ -0,0 +1,32 @@
+from otter_welcome_buddy.common.utils.reaction_roles import ReactionRoleIndex
+from otter_welcome_buddy.database.models.view.role_config_view import ReactionRoleView
+
+
+def test_setGuild_replaceReactionRoles() -> None:
+    # Arrange
+    reaction_role_index = ReactionRoleIndex()
+    reaction_role_index.set_guild(
+        1,
+        [ReactionRoleView(message_id=10, emoji="👍", role_id=100)],
+    )
+    reaction_role_index.set_guild(
+        2,
+        [ReactionRoleView(message_id=10, emoji="👍", role_id=200)],
+    )
+
+    # Act
+    message_ids = reaction_role_index.set_guild(
+        1,
+        [
+            ReactionRoleView(message_id=11, emoji="👍", role_id=101),
+            ReactionRoleView(message_id=11, emoji="🎉", role_id=102),
+        ],
+    )
+
+    # Assert
+    assert message_ids == frozenset({11})
+    assert reaction_role_index.get_role_id(1, 10, "👍") is None
+    assert reaction_role_index.get_role_id(1, 11, "👍") == 101
+    assert reaction_role_index.get_role_id(1, 11, "🎉") == 102
+    assert reaction_role_index.get_role_id(1, 11, "👀") is None
+    assert reaction_role_index.get_role_id(2, 10, "👍") == 200
@@ -0,0 +1,134 @@
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import pytest
+
+from otter_welcome_buddy.common.utils.reaction_router import ReactionRouter
+
+
+@pytest.fixture
+def reaction_router() -> ReactionRouter:
+    return ReactionRouter()
+
+
+def test_route_onlyWatchedMessages(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_handler = AsyncMock()
+    reaction_router.register("welcome", mock_handler)
+    reaction_router.watch("welcome", 1, [10, 11])
+
+    # Act / Assert
+    assert reaction_router.route(1, 10) == [mock_handler]
+    assert reaction_router.route(1, 12) == []
+    assert reaction_router.route(2, 10) == []
+
+
+def test_watch_replacesGuildMessages(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_welcome_handler = AsyncMock()
+    mock_other_handler = AsyncMock()
+    reaction_router.register("welcome", mock_welcome_handler)
+    reaction_router.register("other", mock_other_handler)
+    reaction_router.watch("welcome", 1, [10, 11])
+    reaction_router.watch("other", 1, [11])
+
+    # Act
+    reaction_router.watch("welcome", 1, [12])
+
+    # Assert
+    assert reaction_router.route(1, 10) == []
+    assert reaction_router.route(1, 11) == [mock_other_handler]
+    assert reaction_router.route(1, 12) == [mock_welcome_handler]
+
+
+def test_route_unconfiguredGuilds(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_handler = AsyncMock()
+    reaction_router.register("welcome", mock_handler, handle_unconfigured_guilds=True)
+    reaction_router.watch("welcome", 1, [10])
+    reaction_router.watch("welcome", 2, [])
+
+    # Act / Assert
+    assert reaction_router.route(1, 10) == [mock_handler]
+    assert reaction_router.route(1, 11) == []
+    # Configured without messages, the reactions are ignored
+    assert reaction_router.route(2, 10) == []
+    assert reaction_router.route(3, 10) == [mock_handler]
+
+
+def test_route_unconfiguredGuildWatchedByOtherFeature(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_welcome_handler = AsyncMock()
+    mock_other_handler = AsyncMock()
+    reaction_router.register("welcome", mock_welcome_handler, handle_unconfigured_guilds=True)
+    reaction_router.register("other", mock_other_handler)
+    reaction_router.watch("other", 1, [10])
+
+    # Act / Assert
+    assert reaction_router.route(1, 10) == [mock_other_handler, mock_welcome_handler]
+    assert reaction_router.route(1, 11) == [mock_welcome_handler]
+
+
+def test_reset_forgetsMissingGuilds(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_handler = AsyncMock()
+    reaction_router.register("welcome", mock_handler, handle_unconfigured_guilds=True)
+    reaction_router.watch("welcome", 1, [10])
+    reaction_router.watch("welcome", 2, [20])
+
+    # Act
+    reaction_router.reset("welcome", {2: [20, 21]})
+
+    # Assert
+    assert reaction_router.route(1, 11) == [mock_handler]
+    assert reaction_router.route(2, 20) == [mock_handler]
+    assert reaction_router.route(2, 21) == [mock_handler]
+    assert reaction_router.route(2, 22) == []
+
+
+def test_forgetGuild_stopsWatching(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_handler = AsyncMock()
+    reaction_router.register("welcome", mock_handler)
+    reaction_router.watch("welcome", 1, [10])
+
+    # Act
+    reaction_router.forget_guild(1)
+
+    # Assert
+    assert reaction_router.route(1, 10) == []
+
+
+def test_unwatch_handlesGuildAsUnconfigured(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_handler = AsyncMock()
+    reaction_router.register("welcome", mock_handler, handle_unconfigured_guilds=True)
+    reaction_router.watch("welcome", 1, [])
+
+    # Act
+    routed_before = reaction_router.route(1, 10)
+    reaction_router.unwatch("welcome", 1)
+
+    # Assert
+    assert routed_before == []
+    assert reaction_router.route(1, 10) == [mock_handler]
+    assert reaction_router.get_watched_messages("welcome") == {}
+
+
+@pytest.mark.asyncio
+async def test_dispatch_handlerErrorDoesNotStopOthers(reaction_router: ReactionRouter) -> None:
+    # Arrange
+    mock_failing_handler = AsyncMock(side_effect=RuntimeError("failed"))
+    mock_handler = AsyncMock()
+    reaction_router.register("failing", mock_failing_handler)
+    reaction_router.register("other", mock_handler)
+    reaction_router.watch("failing", 1, [10])
+    reaction_router.watch("other", 1, [10])
+    payload = Mock(guild_id=1, message_id=10)
+
+    # Act
+    await reaction_router.dispatch(payload)
+
+    # Assert
+    mock_failing_handler.assert_awaited_once_with(payload)
+    mock_handler.assert_awaited_once_with(payload)
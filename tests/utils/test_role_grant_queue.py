@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+import discord
+import pytest
+from discord import Member
+from discord import Role
+
+from otter_welcome_buddy.common.utils.role_grant_queue import RoleGrantQueue
+
+
+def _make_member(member_id: int, has_role: bool = False, guild_id: int = 1) -> Member:
+    mocked_member = Mock()
+    mocked_member.id = member_id
+    mocked_member.guild.id = guild_id
+    mocked_member.get_role = Mock(return_value=Mock() if has_role else None)
+    mocked_member.add_roles = AsyncMock()
+    return mocked_member
+
+
+def _make_http_exception(status: int) -> discord.HTTPException:
+    response = Mock()
+    response.status = status
+    response.reason = "Error"
+    return discord.HTTPException(response, "Error")
+
+
+@pytest.fixture
+def role() -> Role:
+    mocked_role = Mock()
+    mocked_role.id = 10
+    return mocked_role
+
+
+@pytest.mark.asyncio
+async def test_submit_skipAndDeduplicate(role: Role) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue()
+    member = _make_member(1)
+    member_with_role = _make_member(2, has_role=True)
+
+    # Act
+    queued = [
+        role_grant_queue.submit(member, role),
+        role_grant_queue.submit(member, role),
+        role_grant_queue.submit(member_with_role, role),
+    ]
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    assert queued == [True, False, False]
+    member.add_roles.assert_awaited_once_with(role)
+    member_with_role.add_roles.assert_not_awaited()
+    assert (stats.granted, stats.skipped, stats.deduplicated) == (1, 1, 1)
+    assert stats.queue_depth == 0 and stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_grant_retryWhenRateLimited(role: Role) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue(retry_delay=0)
+    member = _make_member(1)
+    member.add_roles.side_effect = [_make_http_exception(429), None]
+
+    # Act
+    role_grant_queue.submit(member, role)
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    assert member.add_roles.await_count == 2
+    assert (stats.granted, stats.retries, stats.failed) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_grant_rateLimitedGuildDoesNotBlockOthers(role: Role) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue(max_concurrency=1)
+    limited_member = _make_member(1, guild_id=1)
+    limited_member.add_roles.side_effect = [discord.RateLimited(0.2), None]
+    other_member = _make_member(2, guild_id=2)
+
+    # Act
+    role_grant_queue.submit(limited_member, role)
+    role_grant_queue.submit(other_member, role)
+    await asyncio.sleep(0.05)
+    stats_while_limited = role_grant_queue.stats()
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    other_member.add_roles.assert_awaited_once_with(role)
+    assert (stats_while_limited.granted, stats_while_limited.deferred) == (1, 1)
+    assert limited_member.add_roles.await_count == 2
+    assert (stats.granted, stats.retries, stats.deferred) == (2, 1, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exception, expected_calls",
+    [
+        (_make_http_exception(429), 3),
+        (_make_http_exception(400), 1),
+    ],
+)
+async def test_grant_giveUp(
+    role: Role,
+    exception: discord.HTTPException,
+    expected_calls: int,
+) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue(max_retries=2, retry_delay=0)
+    member = _make_member(1)
+    member.add_roles.side_effect = exception
+
+    # Act
+    role_grant_queue.submit(member, role)
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    assert member.add_roles.await_count == expected_calls
+    assert (stats.granted, stats.failed) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_submit_revokeRole(role: Role) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue()
+    member = _make_member(1, has_role=True)
+    member.remove_roles = AsyncMock()
+    member_without_role = _make_member(2)
+
+    # Act
+    queued = [
+        role_grant_queue.submit(member, role, revoke=True),
+        role_grant_queue.submit(member_without_role, role, revoke=True),
+    ]
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    assert queued == [True, False]
+    member.remove_roles.assert_awaited_once_with(role)
+    member.add_roles.assert_not_awaited()
+    assert (stats.granted, stats.skipped) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_submit_lastRequestWins(role: Role) -> None:
+    # Arrange
+    role_grant_queue = RoleGrantQueue()
+    member = _make_member(1)
+    member.remove_roles = AsyncMock()
+
+    # Act
+    role_grant_queue.submit(member, role)
+    # Reaction removed before the grant was sent, the member ends without the role
+    role_grant_queue.submit(member, role, revoke=True)
+    await role_grant_queue.join()
+    stats = role_grant_queue.stats()
+    await role_grant_queue.close()
+
+    # Assert
+    member.add_roles.assert_not_awaited()
+    member.remove_roles.assert_not_awaited()
+    assert (stats.granted, stats.skipped, stats.deduplicated) == (0, 1, 1)
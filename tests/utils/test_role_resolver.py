@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+import pytest
+from discord import Guild
+from discord import Member
+from discord import Role
+
+from otter_welcome_buddy.common.constants import OTTER_ADMIN
+from otter_welcome_buddy.common.constants import OTTER_MODERATOR
+from otter_welcome_buddy.common.constants import OTTER_ROLE
+from otter_welcome_buddy.common.constants import RoleClass
+from otter_welcome_buddy.common.utils.role_resolver import RoleResolver
+
+
+def _make_role(role_id: int, name: str) -> Role:
+    mocked_role = Mock()
+    mocked_role.id = role_id
+    mocked_role.name = name
+    return mocked_role
+
+
+def _make_member(guild: Guild, role_ids: list[int]) -> Member:
+    mocked_member = Mock()
+    mocked_member.guild = guild
+    mocked_member.get_role = lambda role_id: Mock() if role_id in role_ids else None
+    return mocked_member
+
+
+@pytest.fixture
+def guild() -> Guild:
+    mocked_guild = Mock()
+    mocked_guild.id = 1
+    mocked_guild.roles = [
+        _make_role(10, "@everyone"),
+        _make_role(11, OTTER_ROLE),
+        _make_role(12, OTTER_MODERATOR),
+        _make_role(13, OTTER_ADMIN),
+        _make_role(14, OTTER_ROLE),
+    ]
+    return mocked_guild
+
+
+def test_getRole_firstRoleWithName(guild: Guild) -> None:
+    # Arrange
+    role_resolver = RoleResolver()
+
+    # Act
+    role = role_resolver.get_role(guild, OTTER_ROLE)
+    missing_role = role_resolver.get_role(guild, "Missing")
+
+    # Assert
+    assert role is not None and role.id == 11
+    assert missing_role is None
+
+
+def test_hasRoleClass_classifyMembers(guild: Guild) -> None:
+    # Arrange
+    role_resolver = RoleResolver()
+
+    # Act / Assert
+    assert role_resolver.has_role_class(_make_member(guild, [10, 12]), RoleClass.STAFF)
+    assert role_resolver.has_role_class(_make_member(guild, [13]), RoleClass.STAFF)
+    assert not role_resolver.has_role_class(_make_member(guild, [10, 11]), RoleClass.STAFF)
+    assert role_resolver.get_role_class_ids(guild, RoleClass.MEMBER) == frozenset({11, 14})
+
+
+def test_invalidate_reindexGuild(guild: Guild) -> None:
+    # Arrange
+    role_resolver = RoleResolver()
+    role_resolver.get_role(guild, OTTER_ROLE)
+    guild.roles = [_make_role(20, OTTER_ROLE)]  # type: ignore
+
+    # Act
+    stale_role = role_resolver.get_role(guild, OTTER_ROLE)
+    role_resolver.invalidate(guild.id)
+    role = role_resolver.get_role(guild, OTTER_ROLE)
+
+    # Assert
+    assert stale_role is not None and stale_role.id == 11
+    assert role is not None and role.id == 20